@@ -5,10 +5,10 @@ import json
 from typing import List, Dict, Any, Optional
 
 # Import dari PyDB
-from src.PyDB import (
-    Database, Table, ColumnDefinition as Column, 
+from pydb import (
+    Database, Table, Column, Expr,
     DatabaseColumnError, DatabaseTypeError, DatabaseTableError,
-    DatabaseError, PasswordValueError
+    DatabaseError, DatabaseValidationError, PasswordValueError
 )
 
 class PyDBCLI:
@@ -164,34 +164,19 @@ class PyDBCLI:
             print(f"❌ Error: Format definisi kolom tidak valid - {e}")
             sys.exit(1)
     
-    def _create_condition_function(self, where_clause: str) -> callable:
-        """Membuat fungsi kondisi dari string where clause"""
+    def _create_condition_function(self, where_clause: str, table: Table) -> Expr:
+        """
+        Membuat kondisi dari string where clause
+        
+        Mendukung perbandingan (= != <> < <= > >=), AND/OR/NOT, IN, BETWEEN,
+        LIKE dan IS [NOT] NULL, misalnya "umur >= 30 AND kota IN ('Bandung', 'Bogor')".
+        Format lama "kolom=value" tetap diterima. Konstanta dikonversi ke tipe
+        kolom dan kondisi memakai index/primary key jika cocok; klausa yang
+        tidak valid menghentikan perintah (tidak pernah berarti "semua baris").
+        """
         try:
-            # Sederhana: asumsikan format "kolom=value"
-            if '=' in where_clause:
-                col, value = where_clause.split('=', 1)
-                col = col.strip()
-                value = value.strip()
-                
-                # Coba parse value sebagai number/boolean
-                if value.lower() == 'true':
-                    value = True
-                elif value.lower() == 'false':
-                    value = False
-                elif value.isdigit():
-                    value = int(value)
-                elif value.replace('.', '').isdigit():
-                    value = float(value)
-                elif value.lower() == 'null':
-                    value = None
-                
-                return lambda row: row.get(col) == value
-            
-            # Untuk kondisi yang lebih kompleks, bisa dikembangkan
-            print("⚠️  Peringatan: Format WHERE sederhana, gunakan 'kolom=value'")
-            return lambda row: True
-            
-        except Exception as e:
+            return table.parse_where(where_clause)
+        except DatabaseValidationError as e:
             print(f"❌ Error: Format WHERE tidak valid - {e}")
             sys.exit(1)
     
@@ -265,6 +250,7 @@ class PyDBCLI:
             data = self._parse_json_data(args.data)
             table = db.get_table(args.table)
             row_id = table.insert_data(**data)
+            db.save()
             
             print(f"✅ Data berhasil disisipkan (ID: {row_id})")
             
@@ -287,7 +273,7 @@ class PyDBCLI:
             # Parse condition
             condition = None
             if args.where:
-                condition = self._create_condition_function(args.where)
+                condition = self._create_condition_function(args.where, table)
             
             # Get data
             data = table.select_data(condition=condition, columns=columns)
@@ -317,9 +303,10 @@ class PyDBCLI:
         try:
             table = db.get_table(args.table)
             data = self._parse_json_data(args.data)
-            condition = self._create_condition_function(args.where)
+            condition = self._create_condition_function(args.where, table)
             
             updated_count = table.update_data(condition, **data)
+            db.save()
             print(f"✅ {updated_count} baris berhasil diperbarui")
             
         except Exception as e:
@@ -332,9 +319,10 @@ class PyDBCLI:
         
         try:
             table = db.get_table(args.table)
-            condition = self._create_condition_function(args.where)
+            condition = self._create_condition_function(args.where, table)
             
             deleted_count = table.delete_data(condition)
+            db.save()
             print(f"✅ {deleted_count} baris berhasil dihapus")
             
         except Exception as e:
@@ -1,12 +1,41 @@
 import os
 import ast
+import time
 import copy
 import json
 import base64
-from typing import Dict, List, Any, Optional, Union, Callable, Tuple
+from functools import partial
+from operator import itemgetter
+from itertools import chain, islice, repeat
+from contextlib import contextmanager
+from typing import Dict, List, Any, Optional, Union, Callable, Iterable, Iterator, Sequence, Set, Tuple
 from enum import Enum
 from datetime import datetime
-from .encrypted import TextEncryptor, encrypt, decrypt, save, load
+from .encrypted import (
+    TextEncryptor, encrypt, decrypt, save, load, load_bytes, read_header, evict_key,
+    CIPHERS, DEFAULT_CIPHER, COMPRESSIONS, COMPRESSION_NONE, is_stream_file
+)
+from .wal import WriteAheadLog, WAL_SUFFIX
+from .storage import (
+    SegmentedFile, StreamedFile, is_segmented_file, DEFAULT_SEGMENT_ROWS, MAX_GARBAGE_RATIO
+)
+from .codec import (
+    ROW_ENCODINGS, ROW_ENCODING_JSON, ROW_ENCODING_BINARY,
+    encode_database, decode_database, is_binary_payload
+)
+from .index import HashIndex, OrderedIndex, Index, INDEX_TYPES, ORDERED_TYPES
+from .query import Expr, And, col
+from .planner import (
+    ColumnStats, QueryPlan, analyze_column, analyze_values, sample_positions, plan_query,
+    normalize_order, sort_rows, ACCESS_FULL_SCAN, STATS_STALE_RATIO, STATS_MIN_CHANGES
+)
+from .aggregate import build_specs, aggregate_rows
+from .columnar import ColumnStore
+from .join import JOIN_TYPES, parse_on, build_projection, build_lookup, hash_join
+from .cache import LRUCache, ResultCache, MISSING, freeze, copy_rows
+from .sql import parse_where, parse_statement, Statement, SelectStatement
+from .fulltext import FullTextIndex, DEFAULT_TOKENIZER
+from .zonemap import ZoneMap, may_match, DEFAULT_ZONE_ROWS, DEFAULT_ERROR_RATE
 from .__type__ import String, Number, Integer, Float, Boolean
 
 # =============================================================================
@@ -239,6 +268,40 @@ class Column:
         """Validasi nilai (publik interface)"""
         return self._validate_single_value(value)
     
+    def validate_values(self, values: List[Any]) -> bool:
+        """
+        Validasi banyak nilai yang sudah dinormalisasi ke tipe kolom (tanpa None)
+        
+        Hasilnya sama dengan validate_value untuk setiap nilai, tetapi batas
+        panjang/rentang diperiksa sekali dengan min() dan max().
+        """
+        if not values:
+            return True
+        
+        try:
+            if self.data_type in (String, str):
+                if self.min_length > 0 or self.max_length > 0:
+                    lengths = list(map(len, values))
+                    if min(lengths) < self.min_length:
+                        return False
+                    if self.max_length > 0 and max(lengths) > self.max_length:
+                        return False
+            
+            elif self.data_type in (Integer, int, Float, float, Number):
+                low, high = min(values), max(values)
+                if low != low or high != high:
+                    # NaN mengacaukan min/max: periksa per nilai
+                    return all(map(self._validate_single_value, values))
+                if float(low) < self.min_length:
+                    return False
+                if self.max_length > 0 and float(high) > self.max_length:
+                    return False
+            
+            return True
+            
+        except Exception:
+            return False
+    
     def get_default_value(self) -> Any:
         """Mengembalikan nilai default yang sudah dinormalisasi"""
         if self.default_value is not None:
@@ -315,11 +378,37 @@ class Column:
 # TABLE CLASS
 # =============================================================================
 
+# Penanda kolom yang belum ada di baris sebelum update (untuk undo)
+_MISSING = object()
+
+
+def _normalize_number(value: Any) -> Any:
+    try:
+        return Number(int(value)).value
+    except (ValueError, TypeError):
+        return Number(float(value)).value
+
+
+# Konversi nilai (bukan None) ke tipe data kolom, setara String(str(value)),
+# Integer(int(value)), dst. Instance dibuat langsung lewat __new__ karena
+# __init__ kelas tipe tidak menambah apa pun (dua kali lebih cepat untuk
+# map() atas satu kolom penuh di insert_many).
+_VALUE_NORMALIZERS: Dict[Any, Callable[[Any], Any]] = {
+    String: partial(str.__new__, String),
+    Integer: partial(int.__new__, Integer),
+    Float: partial(float.__new__, Float),
+    Boolean: bool,
+    Number: _normalize_number,
+}
+
 class Table:
     """
     Kelas untuk representasi tabel dalam database
     """
     
+    # Tata letak data di memori: satu dictionary per baris
+    layout = 'row'
+    
     def __init__(self, name: str, columns: Dict[str, Column]):
         # Validasi nama tabel
         if not isinstance(name, str) or not name.strip():
@@ -335,9 +424,117 @@ class Table:
         
         self.name = name.strip()
         self.columns = columns.copy()
-        self.data: List[Dict[str, Any]] = []
+        self._data: List[Dict[str, Any]] = []
         self._auto_increment = 1
+        
+        # Baris yang sudah dihapus lewat delete_by_id tetapi masih ada di _data
+        # (id(baris) -> baris); dibuang sekaligus saat data berikutnya diakses
+        self._tombstones: Dict[int, Dict[str, Any]] = {}
         self._created_at = datetime.now()
+        
+        # Callback journal (WAL) yang dipasang oleh Database
+        self._journal: Optional[Callable[[str, str, Dict[str, Any]], None]] = None
+        
+        # Loader data lazy (format tersegmentasi), dipanggil saat data pertama kali diakses
+        self._data_loader: Optional[Callable[[], List[Dict[str, Any]]]] = None
+        self._lazy_row_count = 0
+        
+        # Undo log transaksi yang dipasang oleh Database.transaction()
+        self._undo_log: Optional[List[Tuple[Any, str, Any]]] = None
+        
+        # True jika tabel berubah sejak terakhir dimuat/disimpan (tabel baru selalu kotor)
+        self._dirty = True
+        
+        # Index per kolom; dibangun ulang saat dibutuhkan jika ditandai basi
+        self._indexes: Dict[str, Index] = {}
+        self._indexes_stale = False
+        
+        # Peta primary key (id -> baris) untuk tabel dengan kolom 'id';
+        # dirawat bersama index lain tetapi tidak disimpan ke file
+        self._primary_index: Optional[HashIndex] = HashIndex('id') if 'id' in self.columns else None
+        
+        # Index full-text per kolom (dirawat bersama index lain) dan posting
+        # list tersimpan yang berlaku selama versi data belum berubah
+        self._fulltext: Dict[str, FullTextIndex] = {}
+        self._fulltext_states: Dict[str, Dict[str, Any]] = {}
+        self._fulltext_version: Optional[int] = None
+        
+        # Zone map (ringkasan per segmen baris) untuk melewati segmen saat full
+        # scan; pembaca segmen file dipasang Database untuk tabel lazy
+        self._zone_map: Optional[ZoneMap] = None
+        self._segment_reader: Optional[Callable[..., Tuple[List[Dict[str, Any]], int, int]]] = None
+        # Pembaca baris berurutan dari file stream; dipakai selama tabel lazy
+        # belum dimuat sehingga iterasi tidak pernah memuat seluruh tabel
+        self._row_stream: Optional[Callable[[], Iterator[Dict[str, Any]]]] = None
+        # (segmen dipindai, jumlah segmen) pada scan terakhir, untuk explain
+        self._last_pruning: Optional[Tuple[int, int]] = None
+        
+        # Nomor versi data (naik pada setiap mutasi) dan statistik kolom untuk planner
+        self._version = 0
+        self._stats: Dict[str, ColumnStats] = {}
+        
+        # Cache LRU hasil select_data/count_data (opt-in lewat enable_cache)
+        self._result_cache: Optional[ResultCache] = None
+    
+    @property
+    def data(self) -> List[Dict[str, Any]]:
+        """Baris data tabel (didekripsi saat pertama kali diakses jika lazy)"""
+        data = self._loaded_data()
+        if self._tombstones:
+            self._compact()
+            data = self._data
+        return data
+    
+    @data.setter
+    def data(self, rows: List[Dict[str, Any]]) -> None:
+        self._data_loader = None
+        self._data = rows
+        self._tombstones = {}
+        self._dirty = True
+        self._indexes_stale = True
+        self._version += 1
+    
+    def _set_lazy_data(self, data_loader: Callable[[], List[Dict[str, Any]]], row_count: int) -> None:
+        """Menunda pemuatan data sampai tabel benar-benar diakses"""
+        self._data_loader = data_loader
+        self._lazy_row_count = row_count
+        self._indexes_stale = True
+    
+    @property
+    def is_loaded(self) -> bool:
+        """True jika data tabel sudah berada di memori"""
+        return self._data_loader is None
+    
+    @property
+    def is_dirty(self) -> bool:
+        """True jika tabel berubah sejak terakhir dimuat atau disimpan"""
+        return self._dirty
+    
+    def _row_count(self) -> int:
+        """Jumlah baris tanpa memaksa dekripsi tabel lazy"""
+        if self._data_loader is not None:
+            return self._lazy_row_count
+        return len(self._data) - len(self._tombstones)
+    
+    def _loaded_data(self) -> List[Dict[str, Any]]:
+        """_data setelah loader lazy dijalankan, tanpa memadatkan baris bertanda hapus"""
+        if self._data_loader is not None:
+            data_loader = self._data_loader
+            self._data_loader = None
+            self._data = data_loader()
+        return self._data
+    
+    def _compact(self) -> None:
+        """Membuang semua baris bertanda hapus dari _data dalam satu lintasan"""
+        tombstones = self._tombstones
+        self._record_undo('compact', (self._data, tombstones))
+        self._data = [row for row in self._data if id(row) not in tombstones]
+        self._tombstones = {}
+    
+    def _delete_row(self, row: Dict[str, Any]) -> None:
+        """Menandai satu baris sebagai terhapus dalam O(1) (dipadatkan belakangan)"""
+        self._index_remove(row)
+        self._tombstones[id(row)] = row
     
     def _normalize_row_data(self, row_data: Dict[str, Any]) -> Dict[str, Any]:
         """Normalisasi data baris ke tipe data yang sesuai"""
@@ -345,26 +542,13 @@ class Table:
         
         for col_name, value in row_data.items():
             if col_name in self.columns:
-                col_def = self.columns[col_name]
+                normalizer = _VALUE_NORMALIZERS.get(self.columns[col_name].data_type)
                 
                 # Normalisasi value berdasarkan tipe data kolom
-                if value is None:
-                    normalized_data[col_name] = None
-                elif col_def.data_type == String:
-                    normalized_data[col_name] = String(str(value))
-                elif col_def.data_type == Integer:
-                    normalized_data[col_name] = Integer(int(value))
-                elif col_def.data_type == Float:
-                    normalized_data[col_name] = Float(float(value))
-                elif col_def.data_type == Boolean:
-                    normalized_data[col_name] = Boolean(bool(value)).value
-                elif col_def.data_type == Number:
-                    try:
-                        normalized_data[col_name] = Number(int(value)).value
-                    except (ValueError, TypeError):
-                        normalized_data[col_name] = Number(float(value)).value
-                else:
+                if value is None or normalizer is None:
                     normalized_data[col_name] = value
+                else:
+                    normalized_data[col_name] = normalizer(value)
             else:
                 normalized_data[col_name] = value
         
@@ -398,19 +582,141 @@ class Table:
         
         return complete_data
     
+    def _record_change(self, op: str, **payload) -> None:
+        """Menandai tabel kotor dan meneruskan mutasi ke journal database jika terpasang"""
+        self._dirty = True
+        zone_map = self._zone_map
+        if zone_map is not None and op in ('insert', 'insert_many') and zone_map.version == self._version:
+            # Insert menambah baris di akhir: cukup perbarui segmen terakhir
+            for row in ([payload['row']] if op == 'insert' else payload['rows']):
+                zone_map.append(row)
+            zone_map.version = self._version + 1
+        self._version += 1
+        if self._journal is not None:
+            self._journal(self.name, op, payload)
+    
+    def _record_undo(self, op: str, info: Any) -> None:
+        """Mencatat informasi pembatalan mutasi jika transaksi aktif"""
+        if self._undo_log is not None:
+            self._undo_log.append((self, op, info))
+    
+    def _revert_change(self, op: str, info: Any) -> None:
+        """
+        Membatalkan satu mutasi dari undo log transaksi
+        
+        Args:
+            op: Jenis mutasi ('insert', 'update', 'delete', 'delete_row' atau 'compact')
+            info: Informasi yang dicatat oleh _record_undo
+        """
+        # Memakai _data langsung agar rollback tidak memicu pemadatan baru
+        if op == 'insert':
+            self._data.pop()
+            self._auto_increment = info
+        elif op == 'insert_many':
+            count, self._auto_increment = info
+            del self._data[-count:]
+        elif op == 'create_index':
+            del self._indexes[info]
+        elif op == 'drop_index':
+            self._indexes[info.column] = info
+        elif op == 'create_fulltext_index':
+            del self._fulltext[info]
+        elif op == 'drop_fulltext_index':
+            self._fulltext[info.column] = info
+        elif op == 'zone_map':
+            self._zone_map = info
+        elif op == 'update':
+            for row, old_values in reversed(info):
+                for col_name, value in old_values.items():
+                    if value is _MISSING:
+                        row.pop(col_name, None)
+                    else:
+                        row[col_name] = value
+        elif op == 'delete':
+            self.data = info
+        elif op == 'delete_row':
+            self._tombstones.pop(id(info), None)
+        elif op == 'compact':
+            self._data, self._tombstones = info
+        else:
+            raise DatabaseError(f"Operasi undo tidak dikenal: {op}")
+        self._indexes_stale = True
+        self._version += 1
+    
+    def _apply_change(self, op: str, payload: Dict[str, Any]) -> None:
+        """
+        Menerapkan ulang mutasi dari record journal (replay WAL)
+        
+        Args:
+            op: Jenis mutasi ('insert', 'update', 'delete', 'update_id', 'delete_id', ...)
+            payload: Isi record yang ditulis oleh _record_change
+        """
+        self._dirty = True
+        self._version += 1
+        if op == 'insert':
+            row = payload['row']
+            self._loaded_data().append(row)
+            self._index_add(row)
+            self._auto_increment = payload['auto_increment']
+        elif op == 'insert_many':
+            rows = payload['rows']
+            self.data.extend(rows)
+            self._index_extend(rows)
+            self._auto_increment = payload['auto_increment']
+        elif op == 'create_index':
+            self._define_index(payload['column'], payload['kind'], payload['unique'])
+        elif op == 'drop_index':
+            self._indexes.pop(payload['column'], None)
+        elif op == 'create_fulltext_index':
+            self._fulltext[payload['column']] = FullTextIndex(payload['column'], payload['tokenizer'])
+            self._indexes_stale = True
+        elif op == 'drop_fulltext_index':
+            self._fulltext.pop(payload['column'], None)
+        elif op == 'create_zone_map':
+            self._zone_map = ZoneMap(
+                self.columns, payload['segment_rows'], payload['bloom_columns'], payload['error_rate']
+            )
+        elif op == 'drop_zone_map':
+            self._zone_map = None
+        elif op == 'update':
+            for position in payload['positions']:
+                self.data[position].update(payload['updates'])
+            self._indexes_stale = True
+        elif op == 'delete':
+            removed = set(payload['positions'])
+            self.data = [row for position, row in enumerate(self.data) if position not in removed]
+        elif op == 'update_id':
+            # Mutasi per id menjaga index tetap terbarui (tanpa rebuild per record)
+            for row in self._rows_by_id(payload['id']):
+                self._index_remove(row)
+                row.update(payload['updates'])
+                self._index_add(row)
+        elif op == 'delete_id':
+            for row in self._rows_by_id(payload['id']):
+                self._delete_row(row)
+        else:
+            raise DatabaseError(f"Operasi journal tidak dikenal: {op}")
+    
     # =========================================================================
     # CRUD OPERATIONS
     # =========================================================================
     
-    def insert_data(self, **data) -> int:
+    def _prepare_insert(self, data: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
         """
-        Menyisipkan data baru ke dalam tabel
+        Normalisasi, auto increment, default dan validasi baris baru
+        
+        Returns:
+            Tuple (baris lengkap, auto_increment sebelum insert)
         """
         # Normalisasi data input
         normalized_data = self._normalize_row_data(data)
+        previous_auto_increment = self._auto_increment
         
         # Auto increment untuk primary key jika ada kolom 'id'
         if 'id' in self.columns and 'id' not in normalized_data:
+            # Lewati id yang sudah dipakai baris yang disisipkan dengan id eksplisit
+            while self._id_taken(self._auto_increment):
+                self._auto_increment += 1
             normalized_data['id'] = Integer(self._auto_increment)
             self._auto_increment += 1
         
@@ -419,27 +725,279 @@ class Table:
         
         # Validasi data
         if not self._validate_row_data(complete_data):
+            self._auto_increment = previous_auto_increment
             raise DatabaseValidationError(f"Validasi data gagal untuk tabel {self.name}")
         
-        self.data.append(complete_data.copy())
-        return complete_data.get('id', len(self.data))
+        return complete_data, previous_auto_increment
+    
+    def _inserted_ids(self, records: List[Dict[str, Any]], start: int) -> List[Any]:
+        """Nilai kembalian insert_many: id baris, atau posisi baris jika tabel tanpa kolom 'id'"""
+        if 'id' in self.columns:
+            return list(map(itemgetter('id'), records))
+        return list(range(start + 1, start + len(records) + 1))
+    
+    def _prepare_many(
+        self,
+        rows: Iterable[Union[Dict[str, Any], Sequence[Any]]],
+        columns: Optional[List[str]]
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Seperti _prepare_insert untuk banyak baris sekaligus
+        
+        Setiap kolom dinormalisasi dan divalidasi sekali untuk seluruh batch
+        (_normalize_column), lalu id dan default ditambahkan per baris.
+        Hasilnya sama dengan _prepare_insert per baris, termasuk urutan kunci.
+        Id yang diberikan atau dibuat di batch ikut dihitung saat melewati id
+        terpakai dan saat memeriksa id duplikat. Auto increment baru diubah
+        setelah semua baris lolos validasi.
+        
+        Returns:
+            Tuple (baris lengkap, auto_increment sebelum insert)
+        
+        Raises:
+            DatabaseColumnError: Jika columns memuat kolom yang tidak ada
+            DatabaseValidationError: Jika ada baris yang tidak valid atau id duplikat
+        """
+        if columns is None:
+            # Sama seperti INSERT SQL tanpa daftar kolom: id dibuat otomatis
+            columns = [col_name for col_name in self.columns if col_name != 'id']
+        else:
+            for col_name in columns:
+                if col_name not in self.columns:
+                    raise DatabaseColumnError(f"Kolom '{col_name}' tidak ada di tabel {self.name}")
+        
+        # Salinan baris (tuple dipetakan ke columns); urutan kunci input dipertahankan
+        prepared: List[Dict[str, Any]] = []
+        for position, record in enumerate(rows, 1):
+            if isinstance(record, dict):
+                row = dict(record)
+                unknown = row.keys() - self.columns.keys()
+                if unknown:
+                    raise DatabaseValidationError(
+                        f"Validasi data gagal untuk tabel {self.name}: kolom '{unknown.pop()}' tidak ada (baris {position})"
+                    )
+            elif len(record) != len(columns):
+                raise DatabaseValidationError(
+                    f"Baris {position}: {len(record)} nilai untuk {len(columns)} kolom di tabel {self.name}"
+                )
+            else:
+                row = dict(zip(columns, record))
+            prepared.append(row)
+        
+        for col_name in self.columns:
+            positions = [position for position, row in enumerate(prepared) if col_name in row]
+            if not positions:
+                continue
+            present = prepared if len(positions) == len(prepared) else [prepared[p] for p in positions]
+            values = self._normalize_column(col_name, [row[col_name] for row in present], positions)
+            for row, value in zip(present, values):
+                row[col_name] = value
+        
+        # Id dibagikan menurut urutan baris, seperti insert_data berturut-turut
+        previous_auto_increment = next_id = self._auto_increment
+        if 'id' in self.columns:
+            make_id = _VALUE_NORMALIZERS[Integer]
+            id_taken = self._id_taken
+            batch_ids: Set[Any] = set()
+            for row in prepared:
+                row_id = row.get('id', _MISSING)
+                if row_id is _MISSING:
+                    while next_id in batch_ids or id_taken(next_id):
+                        next_id += 1
+                    row_id = row['id'] = make_id(next_id)
+                    next_id += 1
+                elif row_id is not None and (row_id in batch_ids or id_taken(row_id)):
+                    raise DatabaseValidationError(f"id {row_id!r} sudah ada di tabel {self.name}")
+                batch_ids.add(row_id)
+        
+        # Default sama untuk semua baris: cukup divalidasi sekali
+        for col_name, col_def in self.columns.items():
+            missing = [row for row in prepared if col_name not in row]
+            if not missing:
+                continue
+            default = col_def.get_default_value()
+            if not col_def.validate_value(default):
+                raise DatabaseValidationError(f"Validasi data gagal untuk tabel {self.name}: kolom '{col_name}'")
+            for row in missing:
+                row[col_name] = default
+        
+        self._auto_increment = next_id
+        return prepared, previous_auto_increment
+    
+    def _normalize_column(self, col_name: str, values: List[Any], positions: List[int]) -> List[Any]:
+        """
+        Normalisasi dan validasi nilai satu kolom dari banyak baris
+        
+        Jalur cepat mengonversi seluruh nilai dengan map() dan memeriksa
+        batas kolom sekali (Column.validate_values). Jika gagal, nilai
+        diperiksa satu per satu untuk menemukan baris yang salah.
+        
+        Args:
+            col_name: Nama kolom
+            values: Nilai kolom per baris
+            positions: Posisi baris di batch (untuk pesan error)
+            
+        Raises:
+            DatabaseValidationError: Jika ada nilai yang tidak valid
+        """
+        col_def = self.columns[col_name]
+        normalizer = _VALUE_NORMALIZERS.get(col_def.data_type)
+        
+        has_null = None in values
+        if normalizer is not None and (col_def.nullable or not has_null):
+            present = [value for value in values if value is not None] if has_null else values
+            try:
+                normalized = list(map(normalizer, present))
+                valid = col_def.validate_values(normalized)
+            except (ValueError, TypeError, OverflowError):
+                valid = False
+            if valid:
+                if has_null:
+                    converted = iter(normalized)
+                    normalized = [None if value is None else next(converted) for value in values]
+                return normalized
+        
+        normalized = []
+        for position, value in zip(positions, values):
+            if value is not None and normalizer is not None:
+                try:
+                    value = normalizer(value)
+                except (ValueError, TypeError) as e:
+                    raise DatabaseValidationError(
+                        f"Validasi data gagal untuk tabel {self.name}: kolom '{col_name}' baris {position + 1} ({e})"
+                    )
+            if not col_def.validate_value(value):
+                raise DatabaseValidationError(
+                    f"Validasi data gagal untuk tabel {self.name}: kolom '{col_name}' baris {position + 1}"
+                )
+            normalized.append(value)
+        return normalized
+    
+    def insert_data(self, **data) -> int:
+        """
+        Menyisipkan data baru ke dalam tabel
+        """
+        complete_data, previous_auto_increment = self._prepare_insert(data)
+        
+        row = complete_data.copy()
+        try:
+            self._index_check(row)
+            self._check_primary_key(row.get('id'))
+        except DatabaseValidationError:
+            # Insert gagal tidak boleh menghabiskan nilai auto increment
+            self._auto_increment = previous_auto_increment
+            raise
+        # Append tidak memicu pemadatan sehingga selang-seling hapus/tambah tetap O(1)
+        self._loaded_data().append(row)
+        self._index_add(row)
+        self._record_undo('insert', previous_auto_increment)
+        self._record_change('insert', row=complete_data, auto_increment=self._auto_increment)
+        return complete_data.get('id', self._row_count())
     
     # Alias untuk insert_data
     tambah_data = insert_data
     
+    def insert_many(
+        self,
+        rows: Iterable[Union[Dict[str, Any], Sequence[Any]]],
+        columns: Optional[List[str]] = None
+    ) -> List[Any]:
+        """
+        Menyisipkan banyak baris sekaligus
+        
+        Lebih cepat daripada insert_data per baris untuk impor besar:
+        konversi dan validasi per kolom disiapkan sekali, semua baris
+        divalidasi (termasuk id dan kolom unik) sebelum ada yang disisipkan,
+        lalu index, zone map dan journal diperbarui satu kali. Jika satu
+        baris gagal, tidak ada baris yang disisipkan.
+        
+        Example:
+            >>> users.insert_many([{'name': 'Budi', 'age': 30}, {'name': 'Ani', 'age': 25}])
+            >>> users.insert_many([('Budi', 30), ('Ani', 25)], columns=['name', 'age'])
+        
+        Args:
+            rows: Iterable dictionary, atau tuple/list nilai sesuai columns
+            columns: Urutan kolom untuk baris tuple (None = semua kolom kecuali 'id')
+            
+        Returns:
+            List id baris yang disisipkan (posisi baris jika tabel tanpa kolom 'id')
+            
+        Raises:
+            DatabaseColumnError: Jika columns memuat kolom yang tidak ada
+            DatabaseValidationError: Jika ada baris yang tidak valid atau melanggar keunikan
+        """
+        records, previous_auto_increment = self._prepare_many(rows, columns)
+        if not records:
+            return []
+        
+        try:
+            self._index_check_many(records)
+        except DatabaseValidationError:
+            self._auto_increment = previous_auto_increment
+            raise
+        
+        data = self.data
+        start = len(data)
+        data.extend(records)
+        self._index_extend(records)
+        self._record_undo('insert_many', (len(records), previous_auto_increment))
+        self._record_change('insert_many', rows=records, auto_increment=self._auto_increment)
+        return self._inserted_ids(records, start)
+    
+    # Alias untuk insert_many
+    tambah_banyak = insert_many
+    
     def select_data(
         self, 
-        condition: Optional[Callable[[Dict[str, Any]], bool]] = None,
-        columns: Optional[List[str]] = None
+        condition: Optional[Union[Callable[[Dict[str, Any]], bool], Expr]] = None,
+        columns: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[Any] = None,
+        offset: int = 0
     ) -> List[Dict[str, Any]]:
         """
         Memilih data dari tabel dengan kondisi opsional
+        
+        Kondisi dapat berupa lambda atau ekspresi col(); ekspresi memakai index
+        untuk konjungsi kesamaan/isin pada kolom ber-index (urutan hasil
+        mengikuti index) dan dievaluasi sebagai satu loop terkompilasi.
+        
+        Example:
+            >>> users.select_data((col('age') > 30) & (col('country') == 'ID'))
+            >>> users.select_data(col('active') == True, limit=10)
+            >>> scores.select_data(order_by=[('score', 'desc'), 'name'], limit=20)
+        
+        Args:
+            condition: Lambda atau ekspresi col() (None = semua baris)
+            columns: Kolom yang diambil (None = semua kolom)
+            limit: Jumlah maksimum baris; pencarian berhenti begitu tercapai
+            order_by: 'kolom', ('kolom', 'asc'|'desc') atau list keduanya
+            offset: Jumlah baris hasil yang dilewati
         """
-        filtered_data = self.data.copy()
+        compute = partial(self._select_data, condition, columns, limit, order_by, offset)
+        return self._cached_query(compute, copy_rows, 'select', condition, columns, limit, order_by, offset)
+    
+    # Alias untuk select_data
+    ambil_data = select_data
+    
+    def _select_data(
+        self,
+        condition: Optional[Union[Callable[[Dict[str, Any]], bool], Expr]],
+        columns: Optional[List[str]],
+        limit: Optional[int],
+        order_by: Optional[Any],
+        offset: int
+    ) -> List[Dict[str, Any]]:
+        """Isi select_data tanpa cache"""
+        if limit is not None or order_by is not None or offset:
+            return list(self.iter_data(condition, columns, limit, offset, order_by))
         
-        # Terapkan kondisi jika ada
-        if condition is not None:
-            filtered_data = [row for row in filtered_data if condition(row)]
+        if condition is None:
+            filtered_data = self.data.copy()
+        elif isinstance(condition, Expr):
+            filtered_data = self._select_expr(condition)
+        else:
+            filtered_data = [row for row in self.data if condition(row)]
         
         # Pilih kolom tertentu jika diminta
         if columns is not None:
@@ -454,165 +1012,2082 @@ class Table:
         
         return filtered_data
     
-    # Alias untuk select_data
-    ambil_data = select_data
+    def iter_data(
+        self,
+        condition: Optional[Union[Callable[[Dict[str, Any]], bool], Expr]] = None,
+        columns: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        order_by: Optional[Any] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Mengiterasi baris secara lazy tanpa menyalin tabel
+        
+        Baris diperiksa satu per satu saat iterator dikonsumsi, sehingga
+        halaman kecil (limit/offset) tidak membayar biaya seluruh tabel.
+        Tabel tidak boleh diubah selama iterator masih dipakai.
+        
+        Dengan order_by, index terurut pada kolom urutan (satu kolom) dibaca
+        langsung sesuai urutannya; tanpa index, hasil diurutkan dengan top-k
+        (heapq, O(n log k)) jika limit diberikan. None dianggap paling besar.
+        
+        Example:
+            >>> for user in users.iter_data(col('active') == True, ['id', 'name'], limit=20, offset=40):
+            ...     print(user)
+        
+        Args:
+            condition: Lambda atau ekspresi col() (None = semua baris)
+            columns: Kolom yang diambil (None = semua kolom)
+            limit: Jumlah maksimum baris (None = tanpa batas)
+            offset: Jumlah baris hasil yang dilewati
+            order_by: 'kolom', ('kolom', 'asc'|'desc') atau list keduanya
+            
+        Returns:
+            Iterator baris (proyeksi diterapkan jika columns diberikan)
+            
+        Raises:
+            DatabaseValidationError: Jika limit, offset atau order_by tidak valid
+        """
+        self._check_window(limit, offset)
+        
+        if order_by is not None:
+            # Offset dan limit sudah diterapkan saat mengurutkan
+            rows = self._ordered_rows(condition, order_by, limit, offset)
+        else:
+            if condition is None:
+                rows = self._iter_rows()
+            elif isinstance(condition, Expr):
+                rows = self._scan_unloaded(condition)
+                if rows is None:
+                    rows = self._iterate_plan(self._plan(condition))
+            else:
+                rows = filter(condition, self._iter_rows())
+            
+            if offset or limit is not None:
+                rows = islice(rows, offset, None if limit is None else offset + limit)
+        
+        if columns is None:
+            return rows
+        return ({col: row[col] for col in columns if col in row} for row in rows)
+    
+    # Alias untuk iter_data
+    iterasi_data = iter_data
+    
+    def _ordered_rows(
+        self,
+        condition: Optional[Union[Callable[[Dict[str, Any]], bool], Expr]],
+        order_by: Any,
+        limit: Optional[int],
+        offset: int
+    ) -> Iterator[Dict[str, Any]]:
+        """Baris terurut dengan offset/limit (index terurut atau top-k)"""
+        try:
+            order = normalize_order(order_by)
+        except (TypeError, ValueError) as e:
+            raise DatabaseValidationError(str(e))
+        for column, _ in order:
+            if column not in self.columns:
+                raise DatabaseColumnError(f"Kolom '{column}' tidak ada di tabel {self.name}")
+        
+        end = None if limit is None else offset + limit
+        # Tabel stream yang belum dimuat diurutkan langsung dari file (top-k
+        # dengan limit) tanpa planner dan index, yang membutuhkan seluruh data
+        streaming = self._streaming()
+        plan = self._plan(condition) if isinstance(condition, Expr) and not streaming else None
+        
+        if len(order) == 1 and not streaming:
+            column, descending = order[0]
+            index = self._ordered_index(column)
+            # Index terurut dipakai kecuali planner menemukan akses yang lebih sempit
+            if index is not None and (plan is None or plan.access.kind == ACCESS_FULL_SCAN):
+                rows = index.ordered(descending)
+                if plan is not None:
+                    rows = plan.iterate(rows)
+                elif condition is not None:
+                    rows = filter(condition, rows)
+                return islice(rows, offset, end)
+        
+        if plan is not None:
+            rows = self._execute_plan(plan)
+        elif condition is not None:
+            rows = filter(condition, self._iter_rows())
+        else:
+            rows = self._iter_rows()
+        
+        try:
+            ordered = sort_rows(rows, order, end)
+        except TypeError as e:
+            raise DatabaseTypeError(f"Nilai kolom urutan tidak dapat dibandingkan: {e}")
+        return iter(ordered[offset:end])
+    
+    @staticmethod
+    def _check_window(limit: Optional[int], offset: int) -> None:
+        """Validasi limit dan offset"""
+        if limit is not None and (not isinstance(limit, int) or limit < 0):
+            raise DatabaseValidationError(f"limit harus bilangan bulat >= 0, bukan {limit!r}")
+        if not isinstance(offset, int) or offset < 0:
+            raise DatabaseValidationError(f"offset harus bilangan bulat >= 0, bukan {offset!r}")
     
     def update_data(
         self, 
-        condition: Callable[[Dict[str, Any]], bool], 
+        condition: Union[Callable[[Dict[str, Any]], bool], Expr], 
         **updates
     ) -> int:
         """
-        Memperbarui data berdasarkan kondisi
+        Memperbarui data berdasarkan kondisi (lambda atau ekspresi col())
         """
+        condition = self._compile_condition(condition)
+        
         # Normalisasi data update
         normalized_updates = self._normalize_row_data(updates)
         
-        updated_count = 0
-        
-        for row in self.data:
-            if condition(row):
-                # Buat salinan sementara untuk validasi
-                temp_row = row.copy()
-                temp_row.update(normalized_updates)
-                
-                # Validasi data yang diupdate
-                if self._validate_row_data(temp_row):
-                    row.update(normalized_updates)
-                    updated_count += 1
-                else:
-                    raise DatabaseValidationError(f"Validasi update gagal untuk data di tabel {self.name}")
+        updated_positions = []
+        old_values = []
+        indexes = self._active_indexes(normalized_updates)
         
-        return updated_count
+        try:
+            for position, row in enumerate(self.data):
+                if condition(row):
+                    # Buat salinan sementara untuk validasi
+                    temp_row = row.copy()
+                    temp_row.update(normalized_updates)
+                    
+                    # Validasi data yang diupdate
+                    if self._validate_row_data(temp_row):
+                        for index in indexes:
+                            self._check_index(index, temp_row, row)
+                        if 'id' in normalized_updates:
+                            self._check_primary_key(temp_row['id'], row)
+                        if self._undo_log is not None:
+                            old_values.append((row, {
+                                col_name: row.get(col_name, _MISSING) for col_name in normalized_updates
+                            }))
+                        for index in indexes:
+                            index.remove(row)
+                        row.update(normalized_updates)
+                        for index in indexes:
+                            index.add(row)
+                        updated_positions.append(position)
+                    else:
+                        raise DatabaseValidationError(f"Validasi update gagal untuk data di tabel {self.name}")
+        finally:
+            # Baris yang sudah terlanjur diubah tetap dicatat ke journal
+            if updated_positions:
+                self._record_undo('update', old_values)
+                self._record_change('update', positions=updated_positions, updates=normalized_updates)
+        
+        return len(updated_positions)
     
     # Alias untuk update_data
     perbarui_data = update_data
     
-    def delete_data(self, condition: Callable[[Dict[str, Any]], bool]) -> int:
+    def delete_data(self, condition: Union[Callable[[Dict[str, Any]], bool], Expr]) -> int:
         """
-        Menghapus data berdasarkan kondisi
+        Menghapus data berdasarkan kondisi (lambda atau ekspresi col())
         """
-        initial_count = len(self.data)
-        self.data = [row for row in self.data if not condition(row)]
-        return initial_count - len(self.data)
+        condition = self._compile_condition(condition)
+        kept_rows = []
+        deleted_positions = []
+        previous_rows = self.data
+        
+        for position, row in enumerate(previous_rows):
+            if condition(row):
+                deleted_positions.append(position)
+            else:
+                kept_rows.append(row)
+        
+        if deleted_positions:
+            indexes_ready = bool(self._all_indexes()) and not self._indexes_stale
+            self.data = kept_rows
+            if indexes_ready and len(deleted_positions) * 2 < len(previous_rows):
+                # Hapus dari index satu per satu; delete besar membangun ulang index
+                self._indexes_stale = False
+                for position in deleted_positions:
+                    self._index_remove(previous_rows[position])
+            self._record_undo('delete', previous_rows)
+            self._record_change('delete', positions=deleted_positions)
+        return len(deleted_positions)
     
     # Alias untuk delete_data
     hapus_data = delete_data
     
     # =========================================================================
-    # UTILITY METHODS
+    # KONDISI
     # =========================================================================
     
-    def get_table_info(self) -> Dict[str, Any]:
-        """Mengembalikan informasi tabel"""
-        return {
-            'name': self.name,
-            'column_count': len(self.columns),
-            'data_count': len(self.data),
-            'columns': {name: str(col_def) for name, col_def in self.columns.items()},
-            'created_at': self._created_at.isoformat()
-        }
+    def _check_expr(self, expr: Expr) -> None:
+        """Memastikan semua kolom dalam ekspresi ada di tabel"""
+        unknown = expr.columns() - set(self.columns)
+        if unknown:
+            raise DatabaseColumnError(
+                f"Kolom {', '.join(sorted(unknown))} tidak ada di tabel {self.name}"
+            )
     
-    def get_column_names(self) -> List[str]:
-        """Mengembalikan daftar nama kolom"""
-        return list(self.columns.keys())
+    def _compile_condition(
+        self, condition: Union[Callable[[Dict[str, Any]], bool], Expr]
+    ) -> Callable[[Dict[str, Any]], bool]:
+        """Predikat baris dari lambda atau ekspresi (ekspresi dikompilasi)"""
+        if isinstance(condition, Expr):
+            self._check_expr(condition)
+            return condition.compile()
+        return condition
     
-    def count_data(self, condition: Optional[Callable[[Dict], bool]] = None) -> int:
-        """Menghitung jumlah data yang memenuhi kondisi"""
-        if condition is None:
-            return len(self.data)
-        return len([row for row in self.data if condition(row)])
+    def _column_stats(self, column: str) -> ColumnStats:
+        """Statistik kolom untuk planner (dihitung ulang jika tabel banyak berubah)"""
+        stats = self._stats.get(column)
+        if stats is not None:
+            threshold = max(STATS_MIN_CHANGES, stats.row_count * STATS_STALE_RATIO)
+            if (self._version - stats.version <= threshold
+                    and abs(self._row_count() - stats.row_count) <= threshold):
+                return stats
+        
+        stats = self._analyze_column(column)
+        stats.version = self._version
+        self._stats[column] = stats
+        return stats
     
-    def __repr__(self) -> str:
-        parts = [f"name='{self.name}'"]
+    def _analyze_column(self, column: str) -> ColumnStats:
+        """Statistik baru satu kolom dari data tabel"""
+        return analyze_column(self.data, column)
+    
+    def _plan(self, expr: Optional[Expr]) -> QueryPlan:
+        """Rencana eksekusi untuk ekspresi (None = semua baris)"""
+        if expr is not None:
+            self._check_expr(expr)
+        self._active_indexes()
+        return plan_query(expr, self._row_count(), self._column_stats, self._indexes, self._primary_index)
+    
+    def _select_expr(self, expr: Expr) -> List[Dict[str, Any]]:
+        """Baris yang memenuhi ekspresi menurut rencana planner"""
+        rows = self._scan_unloaded(expr)
+        if rows is not None:
+            return rows if isinstance(rows, list) else list(rows)
+        return self._execute_plan(self._plan(expr))
+    
+    def _execute_plan(self, plan: QueryPlan) -> List[Dict[str, Any]]:
+        """Menjalankan rencana atas data tabel"""
+        return plan.execute(self._scan_rows(plan))
+    
+    def _iterate_plan(self, plan: QueryPlan) -> Iterator[Dict[str, Any]]:
+        """Menjalankan rencana secara lazy atas data tabel"""
+        return plan.iterate(self._scan_rows(plan))
+    
+    def _streaming(self) -> bool:
+        """True jika baris dibaca langsung dari file stream (tabel lazy yang belum dimuat)"""
+        return self._data_loader is not None and self._row_stream is not None
+    
+    def _iter_rows(self) -> Iterator[Dict[str, Any]]:
+        """Iterator seluruh baris tabel (tanpa memuat tabel stream yang belum dimuat)"""
+        if self._streaming():
+            return self._row_stream()
+        return iter(self.data)
+    
+    def _column_types(self) -> Dict[str, str]:
+        """Nama tipe per kolom (Column.get_data_type())"""
+        return {name: col_def.get_data_type() for name, col_def in self.columns.items()}
+    
+    def parse_where(self, clause: str) -> Expr:
+        """
+        Mengubah teks klausa WHERE menjadi ekspresi col() untuk tabel ini
         
-        # Tambahkan informasi kolom jika ada
-        if self.columns:
-            parts.append(f"columns={len(self.columns)}")
+        Konstanta dikonversi ke tipe kolom dan kolom yang tidak dikenal
+        ditolak; hasilnya dapat dipakai di select_data/update_data/delete_data
+        sehingga index dan primary key tetap dimanfaatkan.
         
-        # Tambahkan informasi data
-        parts.append(f"data={len(self.data)}")
+        Example:
+            >>> users.delete_data(users.parse_where("id IN (3, 5) OR email LIKE '%@old.example'"))
+            
+        Args:
+            clause: Klausa WHERE, lihat pydb.sql untuk tata bahasanya
+            
+        Returns:
+            Ekspresi kondisi
+            
+        Raises:
+            DatabaseValidationError: Jika sintaks, kolom atau konstanta tidak valid
+        """
+        try:
+            return parse_where(clause, self._column_types())
+        except ValueError as e:
+            raise DatabaseValidationError(f"Klausa WHERE tidak valid untuk tabel {self.name}: {e}")
+    
+    # Alias untuk parse_where
+    urai_kondisi = parse_where
+    
+    def analyze(self, columns: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Menghitung ulang statistik kolom yang dipakai planner
         
-        # Tambahkan auto_increment jika lebih dari 1
-        if self._auto_increment > 1:
-            parts.append(f"auto_increment={self._auto_increment}")
+        Statistik juga dihitung otomatis saat dibutuhkan; method ini berguna
+        setelah perubahan data besar atau untuk melihat isi statistik.
         
-        return f"Table({', '.join(parts)})"
-
-# Sisanya tetap sama...
-# [Kode Database class dan lainnya tetap tidak berubah]
-
-# =============================================================================
-# DATABASE CLASS WITH ENCRYPTION
-# =============================================================================
-
-class Database:
-    """
-    Kelas utama untuk manajemen database dengan enkripsi
-    """
+        Args:
+            columns: Kolom yang dianalisis (None = semua kolom)
+            
+        Returns:
+            Statistik per kolom (row_count, distinct, null_count, min, max, sampled)
+        """
+        columns = list(self.columns) if columns is None else columns
+        for column in columns:
+            if column not in self.columns:
+                raise DatabaseColumnError(f"Kolom '{column}' tidak ada di tabel {self.name}")
+            self._stats.pop(column, None)
+        return {column: self._column_stats(column).to_dict() for column in columns}
     
-    def __init__(self, name: str, password: str, storage_path: str = ".", create_new: bool = False):
+    def explain(
+        self, condition: Optional[Union[Callable[[Dict[str, Any]], bool], Expr]] = None
+    ) -> Dict[str, Any]:
         """
-        Inisialisasi database dengan password
+        Menjalankan query dan menjelaskan rencana eksekusinya
+        
+        Example:
+            >>> users.explain((col('email') == 'a@b.c') & (col('age') > 30))
+            {'table': 'users', 'access': 'index_lookup', 'column': 'email', ...}
         
         Args:
-            name: Nama database
-            password: Password untuk enkripsi/dekripsi
-            storage_path: Path penyimpanan
-            create_new: True untuk membuat database baru (overwrite jika ada)
+            condition: Kondisi seperti pada select_data; lambda selalu full scan
+            
+        Returns:
+            Dictionary berisi jalur akses terpilih ('access', 'column', 'index',
+            'condition'), 'filters' sisa sesuai urutan evaluasi, 'estimated_rows'
+            dibanding 'actual_rows', jalur yang dipertimbangkan ('considered')
+            dan waktu eksekusi ('time_ms')
         """
-        # Validasi parameter
-        if not isinstance(name, str) or not name.strip():
-            raise DatabaseError("Nama database harus string tidak kosong")
+        started = time.perf_counter()
+        self._last_pruning = None
+        if condition is None or isinstance(condition, Expr):
+            plan = self._plan(condition)
+            rows = self._execute_plan(plan)
+            elapsed = time.perf_counter() - started
+            info = plan.describe()
+            if self._last_pruning is not None:
+                info['segments'] = {'scanned': self._last_pruning[0], 'total': self._last_pruning[1]}
+        else:
+            rows = [row for row in self.data if condition(row)]
+            elapsed = time.perf_counter() - started
+            row_count = len(self.data)
+            info = {
+                'access': 'full_scan', 'rows': row_count, 'cost': row_count,
+                'filters': [getattr(condition, '__name__', repr(condition))],
+                'estimated_rows': None, 'considered': [],
+            }
         
-        if not name.endswith(".pydb"):
-            name += ".pydb"
-            
-        if not password:
-            raise PasswordValueError("Password harus disediakan")
+        info['actual_rows'] = len(rows)
+        info['time_ms'] = round(elapsed * 1000, 3)
+        return {'table': self.name, **info}
+    
+    # =========================================================================
+    # INDEX
+    # =========================================================================
+    
+    def _all_indexes(self) -> List[Index]:
+        """Index kolom beserta peta primary key (jika ada) dan index full-text"""
+        indexes = list(self._indexes.values())
+        if self._primary_index is not None:
+            indexes.append(self._primary_index)
+        indexes.extend(self._fulltext.values())
+        return indexes
+    
+    def _define_index(self, column: str, kind: str = HashIndex.kind, unique: bool = False) -> Index:
+        """Mendaftarkan index tanpa membangunnya (dibangun saat dibutuhkan)"""
+        if column not in self.columns:
+            raise DatabaseColumnError(f"Kolom '{column}' tidak ada di tabel {self.name}")
+        if kind not in INDEX_TYPES:
+            raise DatabaseError(f"Jenis index tidak didukung: {kind}")
+        if kind == OrderedIndex.kind and self.columns[column].get_data_type() not in ORDERED_TYPES:
+            raise DatabaseTypeError(
+                f"Index terurut hanya untuk kolom {', '.join(ORDERED_TYPES)}, bukan '{column}'"
+            )
         
-        storage_path = str(os.path.abspath(storage_path))
+        index = INDEX_TYPES[kind](column, unique)
+        self._indexes[column] = index
+        self._indexes_stale = True
+        return index
+    
+    def _active_indexes(self, columns: Optional[Dict[str, Any]] = None) -> List[Index]:
+        """
+        Index yang siap dipakai (dibangun ulang jika basi)
         
-        if not isinstance(storage_path, str) or not storage_path.strip():
-            raise DatabasePathError("Path penyimpanan harus string tidak kosong")
+        Args:
+            columns: Jika diberikan, hanya index untuk kolom-kolom ini
+        """
+        indexes = self._all_indexes()
+        if not indexes:
+            return []
         
-        # Cek dan buat path jika tidak ada
-        if not os.path.exists(storage_path):
+        if self._indexes_stale:
+            rows = self.data
+            states = self._saved_fulltext_states()
             try:
-                os.makedirs(storage_path, exist_ok=True)
-            except Exception as e:
-                raise DatabasePathError(f"Tidak dapat membuat path: {e}")
+                for index in indexes:
+                    if index.column in states and index.kind == FullTextIndex.kind:
+                        self._restore_fulltext(index, states[index.column], rows)
+                    else:
+                        index.build(rows)
+            except ValueError as e:
+                raise DatabaseValidationError(f"Gagal membangun index tabel {self.name}: {e}")
+            self._indexes_stale = False
+            # Posting list tersimpan sudah dipindahkan ke index
+            self._fulltext_states = {}
+        
+        if columns is None:
+            return indexes
+        return [index for index in indexes if index.column in columns]
+    
+    @staticmethod
+    def _check_index(index: Index, new_row: Dict[str, Any], row: Any = None) -> None:
+        """Validasi keunikan satu index untuk nilai baru"""
+        try:
+            index.check(new_row.get(index.column), row)
+        except ValueError as e:
+            raise DatabaseValidationError(str(e))
+    
+    def _index_check(self, row: Dict[str, Any]) -> None:
+        """Validasi keunikan semua index untuk baris baru"""
+        for index in self._active_indexes():
+            self._check_index(index, row)
+    
+    def _index_check_many(self, rows: List[Dict[str, Any]]) -> None:
+        """Validasi keunikan semua index untuk banyak baris baru (termasuk antar baris baru)"""
+        for index in self._active_indexes():
+            if not index.unique:
+                continue
+            seen = set()
+            for row in rows:
+                value = row.get(index.column)
+                if value is None:
+                    continue
+                self._check_index(index, row)
+                if value in seen:
+                    raise DatabaseValidationError(f"Nilai duplikat untuk kolom unik '{index.column}': {value!r}")
+                seen.add(value)
+    
+    def _index_add(self, row: Dict[str, Any]) -> None:
+        """Menambahkan baris baru ke semua index"""
+        if not self._indexes_stale:
+            for index in self._all_indexes():
+                index.add(row)
+    
+    def _index_extend(self, rows: List[Dict[str, Any]]) -> None:
+        """Menambahkan banyak baris baru ke semua index sekaligus"""
+        if not self._indexes_stale:
+            for index in self._all_indexes():
+                index.extend(rows)
+    
+    def _index_remove(self, row: Dict[str, Any]) -> None:
+        """Menghapus baris dari semua index"""
+        if not self._indexes_stale:
+            for index in self._all_indexes():
+                index.remove(row)
+    
+    def create_index(self, column: str, unique: bool = False, ordered: bool = False) -> None:
+        """
+        Membuat index pada kolom
         
-        if not os.access(storage_path, os.W_OK):
-            raise DatabasePathError(f"Path tidak dapat ditulisi: {storage_path}")
+        Index diperbarui otomatis pada setiap insert/update/delete, disimpan
+        (sebagai definisi) bersama metadata tabel, dan dipakai oleh find().
+        Index terurut (ordered=True) juga dipakai oleh find_range(),
+        order_by(), min_value() dan max_value().
         
-        self.name = name.strip()
-        self.password = password
+        Args:
+            column: Nama kolom
+            unique: True untuk menolak nilai duplikat (selain None)
+            ordered: False untuk index hash (kesamaan O(1)), True untuk index
+                     terurut (kolom Integer, Float, Number atau String)
+            
+        Raises:
+            DatabaseColumnError: Jika kolom tidak ada
+            DatabaseTypeError: Jika index terurut diminta untuk tipe kolom lain
+            DatabaseValidationError: Jika unique=True dan data sudah berisi duplikat
+        """
+        kind = OrderedIndex.kind if ordered else HashIndex.kind
+        existing = self._indexes.get(column)
+        if existing is not None:
+            if existing.unique == unique and existing.kind == kind:
+                return
+            raise DatabaseError(
+                f"Index untuk kolom '{column}' sudah ada ({existing.kind}, unique={existing.unique})"
+            )
+        
+        index = self._define_index(column, kind, unique)
+        try:
+            self._active_indexes()
+        except DatabaseValidationError:
+            del self._indexes[column]
+            raise
+        
+        self._record_undo('create_index', column)
+        self._record_change('create_index', column=column, kind=index.kind, unique=unique)
+    
+    # Alias untuk create_index
+    buat_index = create_index
+    
+    def drop_index(self, column: str) -> bool:
+        """
+        Menghapus index pada kolom
+        
+        Args:
+            column: Nama kolom
+            
+        Returns:
+            True jika index ada dan dihapus
+        """
+        index = self._indexes.pop(column, None)
+        if index is None:
+            return False
+        
+        self._record_undo('drop_index', index)
+        self._record_change('drop_index', column=column)
+        return True
+    
+    # Alias untuk drop_index
+    hapus_index = drop_index
+    
+    def get_indexes(self) -> Dict[str, Dict[str, Any]]:
+        """Mengembalikan definisi index per kolom"""
+        return {column: index.definition() for column, index in self._indexes.items()}
+    
+    def _lookup_indexes(self, columns: Any) -> List[Index]:
+        """Index siap pakai yang mendukung pencarian per nilai (tanpa full-text)"""
+        return [index for index in self._active_indexes(columns) if index.kind != FullTextIndex.kind]
+    
+    def _key_lookup(self, column: str) -> Optional[Callable[[Any], List[Dict[str, Any]]]]:
+        """Pencarian baris per nilai kolom dari index yang ada (untuk join), atau None"""
+        indexes = self._lookup_indexes((column,))
+        return indexes[0].lookup if indexes else None
+    
+    def find(self, **criteria) -> List[Dict[str, Any]]:
+        """
+        Mencari baris dengan kesamaan nilai kolom (kolom=nilai)
+        
+        Jika salah satu kolom memiliki index, pencarian memakai index tersebut
+        (O(1) untuk index hash) lalu menyaring kriteria lainnya; tanpa index,
+        seluruh baris dipindai.
+        
+        Example:
+            >>> users.find(email="a@b.c")
+            >>> users.find(city="Bandung", active=True)
+        
+        Returns:
+            List baris yang cocok
+        """
+        for column in criteria:
+            if column not in self.columns:
+                raise DatabaseColumnError(f"Kolom '{column}' tidak ada di tabel {self.name}")
+        
+        indexed = self._lookup_indexes(criteria)
+        if not indexed:
+            rows = self.data
+        else:
+            # Pilih index dengan kandidat paling sedikit
+            index = min(indexed, key=lambda idx: idx.count(criteria[idx.column]))
+            rows = index.lookup(criteria[index.column])
+        
+        items = list(criteria.items())
+        return [row for row in rows if all(row.get(column) == value for column, value in items)]
+    
+    # Alias untuk find
+    cari = find
+    
+    def _ordered_index(self, column: str) -> Optional[OrderedIndex]:
+        """Index terurut siap pakai untuk kolom, atau None"""
+        if column not in self.columns:
+            raise DatabaseColumnError(f"Kolom '{column}' tidak ada di tabel {self.name}")
+        
+        index = self._indexes.get(column)
+        if index is None or index.kind != OrderedIndex.kind:
+            return None
+        self._active_indexes()
+        return index
+    
+    def find_range(
+        self,
+        column: str,
+        low: Any = None,
+        high: Any = None,
+        include_low: bool = True,
+        include_high: bool = True,
+        descending: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Mencari baris dengan nilai kolom di antara low dan high, terurut
+        
+        Dengan index terurut pada kolom, batas rentang dicari dengan bisect
+        (O(log n + k)); tanpa index, baris dipindai lalu diurutkan.
+        
+        Example:
+            >>> logs.find_range('created_at', low=start, high=end, descending=True)
+        
+        Args:
+            column: Nama kolom
+            low: Batas bawah (None = tanpa batas)
+            high: Batas atas (None = tanpa batas)
+            include_low: True untuk >=, False untuk >
+            include_high: True untuk <=, False untuk <
+            descending: True untuk urutan menurun
+            
+        Returns:
+            List baris dalam rentang (baris bernilai None tidak ikut)
+        """
+        index = self._ordered_index(column)
+        if index is not None:
+            return index.range(low, high, include_low, include_high, descending)
+        
+        def in_range(value: Any) -> bool:
+            if value is None:
+                return False
+            if low is not None and (value < low if include_low else value <= low):
+                return False
+            if high is not None and (value > high if include_high else value >= high):
+                return False
+            return True
+        
+        rows = [row for row in self.data if in_range(row.get(column))]
+        rows.sort(key=lambda row: row[column], reverse=descending)
+        return rows
+    
+    # Alias untuk find_range
+    cari_rentang = find_range
+    
+    def order_by(self, column: str, descending: bool = False) -> List[Dict[str, Any]]:
+        """
+        Mengembalikan semua baris terurut menurut kolom
+        
+        Dengan index terurut, baris diambil langsung dari index tanpa sort.
+        Nilai None dianggap paling besar (di akhir untuk urutan menaik).
+        
+        Args:
+            column: Nama kolom
+            descending: True untuk urutan menurun
+            
+        Returns:
+            List baris terurut
+        """
+        index = self._ordered_index(column)
+        if index is not None:
+            return list(index.ordered(descending))
+        
+        rows = [row for row in self.data if row.get(column) is not None]
+        nulls = [row for row in self.data if row.get(column) is None]
+        rows.sort(key=lambda row: row[column], reverse=descending)
+        return nulls + rows if descending else rows + nulls
+    
+    # Alias untuk order_by
+    urutkan = order_by
+    
+    def min_value(self, column: str) -> Any:
+        """
+        Nilai terkecil (bukan None) pada kolom; O(1) dengan index terurut
+        
+        Returns:
+            Nilai terkecil atau None jika tidak ada
+        """
+        index = self._ordered_index(column)
+        if index is not None:
+            return index.min()
+        return min((row[column] for row in self.data if row.get(column) is not None), default=None)
+    
+    def max_value(self, column: str) -> Any:
+        """
+        Nilai terbesar (bukan None) pada kolom; O(1) dengan index terurut
+        
+        Returns:
+            Nilai terbesar atau None jika tidak ada
+        """
+        index = self._ordered_index(column)
+        if index is not None:
+            return index.max()
+        return max((row[column] for row in self.data if row.get(column) is not None), default=None)
+    
+    # =========================================================================
+    # FULL-TEXT
+    # =========================================================================
+    
+    def create_fulltext_index(self, column: str, tokenizer: Union[str, Callable[[str], List[str]]] = DEFAULT_TOKENIZER) -> None:
+        """
+        Membuat index full-text (inverted index) pada kolom teks
+        
+        Setiap nilai dipecah menjadi token, lalu token -> baris yang memuatnya
+        disimpan sehingga search() tidak memindai tabel. Index diperbarui pada
+        setiap insert/update/delete dan posting list-nya disimpan terenkripsi
+        bersama metadata tabel, sehingga tidak perlu dibangun ulang saat
+        database dibuka.
+        
+        Example:
+            >>> notes.create_fulltext_index('body')
+            >>> notes.search('body', 'enkripsi data*', limit=10)
+        
+        Args:
+            column: Nama kolom (String)
+            tokenizer: Nama atau fungsi tokenizer di pydb.fulltext.TOKENIZERS
+                       ('simple' = kata alfanumerik huruf kecil, 'whitespace')
+            
+        Raises:
+            DatabaseColumnError: Jika kolom tidak ada
+            DatabaseTypeError: Jika kolom bukan String
+            DatabaseValidationError: Jika tokenizer tidak terdaftar
+        """
+        if column not in self.columns:
+            raise DatabaseColumnError(f"Kolom '{column}' tidak ada di tabel {self.name}")
+        if self.columns[column].get_data_type() not in ('String', 'str'):
+            raise DatabaseTypeError(f"Index full-text hanya untuk kolom String, bukan '{column}'")
+        try:
+            index = FullTextIndex(column, tokenizer)
+        except ValueError as e:
+            raise DatabaseValidationError(str(e))
+        
+        existing = self._fulltext.get(column)
+        if existing is not None:
+            if existing.tokenizer == index.tokenizer:
+                return
+            raise DatabaseError(f"Index full-text untuk kolom '{column}' sudah ada (tokenizer={existing.tokenizer})")
+        
+        if self._indexes_stale:
+            self._fulltext[column] = index
+            self._active_indexes()
+        else:
+            index.build(self.data)
+            self._fulltext[column] = index
+        
+        self._record_undo('create_fulltext_index', column)
+        self._record_change('create_fulltext_index', column=column, tokenizer=index.tokenizer)
+    
+    # Alias untuk create_fulltext_index
+    buat_index_teks = create_fulltext_index
+    
+    def drop_fulltext_index(self, column: str) -> bool:
+        """
+        Menghapus index full-text pada kolom
+        
+        Returns:
+            True jika index ada dan dihapus
+        """
+        index = self._fulltext.pop(column, None)
+        if index is None:
+            return False
+        
+        self._fulltext_states.pop(column, None)
+        self._record_undo('drop_fulltext_index', index)
+        self._record_change('drop_fulltext_index', column=column)
+        return True
+    
+    # Alias untuk drop_fulltext_index
+    hapus_index_teks = drop_fulltext_index
+    
+    def get_fulltext_indexes(self) -> Dict[str, Dict[str, Any]]:
+        """Mengembalikan definisi index full-text per kolom"""
+        return {column: index.definition() for column, index in self._fulltext.items()}
+    
+    def search(
+        self,
+        column: str,
+        query: str,
+        mode: str = 'and',
+        limit: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+        with_scores: bool = False
+    ) -> List[Any]:
+        """
+        Mencari baris dengan index full-text, terurut menurut relevansi (BM25)
+        
+        Query dipecah dengan tokenizer index; kata berakhiran '*' dicari
+        sebagai prefix. Pencarian tidak peka huruf besar-kecil untuk tokenizer
+        bawaan.
+        
+        Example:
+            >>> notes.search('body', 'kunci sesi')                # kedua kata
+            >>> notes.search('body', 'enkrip* aes', mode='or')    # salah satu
+        
+        Args:
+            column: Kolom yang memiliki index full-text
+            query: Kata-kata yang dicari
+            mode: 'and' (semua kata) atau 'or' (salah satu kata)
+            limit: Jumlah hasil teratas (None = semua)
+            columns: Kolom hasil (None = semua)
+            with_scores: True untuk hasil berupa (skor, baris)
+            
+        Returns:
+            List baris (atau (skor, baris)), paling relevan lebih dulu
+            
+        Raises:
+            DatabaseError: Jika kolom tidak memiliki index full-text
+            DatabaseValidationError: Jika query, mode atau limit tidak valid
+        """
+        index = self._fulltext.get(column)
+        if index is None:
+            raise DatabaseError(f"Kolom '{column}' di tabel {self.name} tidak memiliki index full-text")
+        if not isinstance(query, str):
+            raise DatabaseValidationError(f"Query pencarian harus string, bukan {type(query).__name__}")
+        if limit is not None and (isinstance(limit, bool) or not isinstance(limit, int) or limit < 0):
+            raise DatabaseValidationError(f"limit harus bilangan bulat tidak negatif, bukan {limit!r}")
+        
+        self._active_indexes()
+        try:
+            results = index.search(query, mode, limit)
+        except ValueError as e:
+            raise DatabaseValidationError(str(e))
+        
+        if columns is not None:
+            results = [(score, {name: row[name] for name in columns if name in row}) for score, row in results]
+        if with_scores:
+            return results
+        return [row for _, row in results]
+    
+    # Alias untuk search
+    cari_teks = search
+    
+    def _saved_fulltext_states(self) -> Dict[str, Dict[str, Any]]:
+        """Posting list tersimpan yang masih sesuai dengan versi data saat ini"""
+        if self._fulltext_version != self._version:
+            self._fulltext_states = {}
+        return self._fulltext_states
+    
+    def _restore_fulltext(self, index: FullTextIndex, state: Dict[str, Any], rows: List[Dict[str, Any]]) -> None:
+        """Memulihkan index dari posting list tersimpan, atau membangunnya jika tidak cocok"""
+        try:
+            index.restore(state, rows)
+        except (ValueError, IndexError, KeyError, TypeError):
+            index.build(rows)
+    
+    def _load_fulltext_states(self, states: Dict[str, Dict[str, Any]]) -> None:
+        """Mencatat posting list dari file untuk data yang baru dimuat (dipakai saat index dibangun)"""
+        self._fulltext_states = dict(states)
+        self._fulltext_version = self._version
+    
+    def _dump_fulltext(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Definisi dan posting list index full-text untuk metadata tabel
+        
+        Posting list dari file yang belum dipakai (misalnya tabel lazy yang
+        belum dimuat) ditulis ulang apa adanya tanpa membangun index.
+        """
+        states = self._saved_fulltext_states()
+        if any(column not in states for column in self._fulltext):
+            self._active_indexes()
+            rows = self.data
+            states = {column: index.dump(rows) for column, index in self._fulltext.items()}
+        return {
+            column: {**index.definition(), **states[column]}
+            for column, index in self._fulltext.items()
+        }
+    
+    # =========================================================================
+    # ZONE MAP
+    # =========================================================================
+    
+    def create_zone_map(
+        self,
+        segment_rows: int = DEFAULT_ZONE_ROWS,
+        bloom_columns: Optional[List[str]] = None,
+        error_rate: float = DEFAULT_ERROR_RATE
+    ) -> None:
+        """
+        Membuat zone map: ringkasan min/max/None per kolom untuk setiap segmen baris
+        
+        Kondisi col() yang dijalankan sebagai full scan hanya memindai segmen
+        yang ringkasannya mungkin memuat baris cocok (rentang, kesamaan, IN,
+        BETWEEN, startswith), sehingga tabel time-series/log yang diurutkan
+        menurut waktu hanya membayar rentang yang dicari. Bloom filter pada
+        bloom_columns membantu kesamaan pada kolom dengan banyak nilai berbeda.
+        
+        Pada format 'segmented', ringkasan juga disimpan di setiap segmen file;
+        query pada tabel yang belum dimuat hanya mendekripsi segmen yang
+        mungkin cocok. Zone map yang sudah ada diganti.
+        
+        Example:
+            >>> logs.create_zone_map(bloom_columns=['request_id'])
+            >>> logs.select_data(col('timestamp').between(t0, t1))
+        
+        Args:
+            segment_rows: Jumlah baris per segmen di memori (segmen file
+                          mengikuti segment_rows database)
+            bloom_columns: Kolom yang mendapat Bloom filter
+            error_rate: Peluang positif palsu Bloom filter
+            
+        Raises:
+            DatabaseColumnError: Jika kolom bloom tidak ada
+            DatabaseValidationError: Jika segment_rows atau error_rate tidak valid
+        """
+        bloom_columns = list(bloom_columns or [])
+        for column in bloom_columns:
+            if column not in self.columns:
+                raise DatabaseColumnError(f"Kolom '{column}' tidak ada di tabel {self.name}")
+        try:
+            zone_map = ZoneMap(self.columns, segment_rows, bloom_columns, error_rate)
+        except (TypeError, ValueError) as e:
+            raise DatabaseValidationError(str(e))
+        
+        self._record_undo('zone_map', self._zone_map)
+        self._zone_map = zone_map
+        self._record_change('create_zone_map', **zone_map.definition())
+    
+    # Alias untuk create_zone_map
+    buat_zone_map = create_zone_map
+    
+    def drop_zone_map(self) -> bool:
+        """
+        Menghapus zone map
+        
+        Returns:
+            True jika zone map ada dan dihapus
+        """
+        if self._zone_map is None:
+            return False
+        
+        self._record_undo('zone_map', self._zone_map)
+        self._zone_map = None
+        self._record_change('drop_zone_map')
+        return True
+    
+    # Alias untuk drop_zone_map
+    hapus_zone_map = drop_zone_map
+    
+    def get_zone_map(self) -> Optional[Dict[str, Any]]:
+        """Definisi zone map (None jika tidak ada)"""
+        return self._zone_map.definition() if self._zone_map is not None else None
+    
+    def _scan_rows(self, plan: QueryPlan) -> List[Dict[str, Any]]:
+        """Baris yang dipindai rencana: full scan hanya membaca segmen zone map yang mungkin cocok"""
+        zone_map = self._zone_map
+        if zone_map is None or plan.expr is None or plan.access.kind != ACCESS_FULL_SCAN:
+            return self.data
+        
+        data = self.data
+        if zone_map.version != self._version:
+            zone_map.build(data)
+            zone_map.version = self._version
+        
+        ranges = zone_map.ranges(plan.expr)
+        size = zone_map.segment_rows
+        self._last_pruning = (sum((end - start + size - 1) // size for start, end in ranges), len(zone_map))
+        if ranges == [(0, len(data))]:
+            return data
+        return list(chain.from_iterable(data[start:end] for start, end in ranges))
+    
+    def _scan_unloaded(self, expr: Expr) -> Optional[Iterable[Dict[str, Any]]]:
+        """
+        Baris yang memenuhi ekspresi langsung dari file, tanpa memuat tabel
+        
+        Tabel stream yang belum dimuat disaring baris demi baris (iterator
+        lazy); tabel tersegmentasi dengan zone map hanya membaca segmen yang
+        mungkin cocok. None jika tidak berlaku.
+        """
+        if self._streaming():
+            self._check_expr(expr)
+            return filter(expr, self._row_stream())
+        if self._data_loader is None or self._segment_reader is None or self._zone_map is None:
+            return None
+        self._check_expr(expr)
+        rows, scanned, total = self._segment_reader(partial(may_match, expr))
+        self._last_pruning = (scanned, total)
+        return expr.filter(rows)
+    
+    # =========================================================================
+    # PRIMARY KEY
+    # =========================================================================
+    
+    def _normalize_id(self, row_id: Any) -> Any:
+        """Normalisasi id ke tipe kolom 'id'"""
+        if 'id' not in self.columns:
+            raise DatabaseColumnError(f"Tabel {self.name} tidak memiliki kolom 'id'")
+        try:
+            return self._normalize_row_data({'id': row_id})['id']
+        except (TypeError, ValueError):
+            raise DatabaseTypeError(f"id tidak valid untuk tabel {self.name}: {row_id!r}")
+    
+    def _rows_by_id(self, row_id: Any) -> List[Dict[str, Any]]:
+        """Baris dengan id tertentu melalui peta primary key"""
+        self._active_indexes()
+        return self._primary_index.lookup(row_id)
+    
+    def _id_taken(self, row_id: Any) -> bool:
+        """True jika id sudah dipakai (untuk melewati id pada auto increment)"""
+        self._active_indexes()
+        return bool(self._primary_index.count(row_id))
+    
+    def _check_primary_key(self, row_id: Any, row: Any = None) -> None:
+        """
+        Memastikan id belum dipakai baris lain
+        
+        Raises:
+            DatabaseValidationError: Jika id duplikat
+        """
+        if row_id is None or self._primary_index is None:
+            return
+        if any(existing is not row for existing in self._rows_by_id(row_id)):
+            raise DatabaseValidationError(f"id {row_id!r} sudah ada di tabel {self.name}")
+    
+    def get_by_id(self, row_id: Any) -> Optional[Dict[str, Any]]:
+        """
+        Mengambil satu baris berdasarkan id dalam O(1)
+        
+        Args:
+            row_id: Nilai kolom 'id'
+            
+        Returns:
+            Baris dengan id tersebut, atau None jika tidak ada
+            
+        Raises:
+            DatabaseColumnError: Jika tabel tidak memiliki kolom 'id'
+        """
+        rows = self._rows_by_id(self._normalize_id(row_id))
+        return rows[0] if rows else None
+    
+    # Alias untuk get_by_id
+    ambil_id = get_by_id
+    
+    def has_id(self, row_id: Any) -> bool:
+        """Cek apakah id sudah dipakai (pengecekan duplikat sebelum insert)"""
+        return bool(self._rows_by_id(self._normalize_id(row_id)))
+    
+    def get_duplicate_ids(self) -> List[Any]:
+        """
+        Mencari id yang dipakai lebih dari satu baris
+        
+        Insert dan update menolak id duplikat, tetapi data lama dari file
+        versi sebelumnya bisa saja sudah berisi duplikat.
+        
+        Returns:
+            List id duplikat (kosong jika semua id unik)
+        """
+        if self._primary_index is None:
+            raise DatabaseColumnError(f"Tabel {self.name} tidak memiliki kolom 'id'")
+        self._active_indexes()
+        return [row_id for row_id, rows in self._primary_index._map.items() if len(rows) > 1]
+    
+    def update_by_id(self, row_id: Any, **updates) -> bool:
+        """
+        Memperbarui satu baris berdasarkan id tanpa memindai tabel
+        
+        Args:
+            row_id: Nilai kolom 'id'
+            **updates: Nilai kolom baru
+            
+        Returns:
+            True jika baris ditemukan dan diperbarui
+            
+        Raises:
+            DatabaseValidationError: Jika data baru tidak valid atau melanggar keunikan
+        """
+        row_id = self._normalize_id(row_id)
+        rows = self._rows_by_id(row_id)
+        if not rows:
+            return False
+        
+        normalized_updates = self._normalize_row_data(updates)
+        indexes = self._active_indexes(normalized_updates)
+        old_values = []
+        
+        for row in rows:
+            temp_row = row.copy()
+            temp_row.update(normalized_updates)
+            if not self._validate_row_data(temp_row):
+                raise DatabaseValidationError(f"Validasi update gagal untuk data di tabel {self.name}")
+            for index in indexes:
+                self._check_index(index, temp_row, row)
+            if 'id' in normalized_updates:
+                self._check_primary_key(temp_row['id'], row)
+        
+        for row in rows:
+            if self._undo_log is not None:
+                old_values.append((row, {
+                    col_name: row.get(col_name, _MISSING) for col_name in normalized_updates
+                }))
+            for index in indexes:
+                index.remove(row)
+            row.update(normalized_updates)
+            for index in indexes:
+                index.add(row)
+        
+        self._record_undo('update', old_values)
+        self._record_change('update_id', id=row_id, updates=normalized_updates)
+        return True
+    
+    # Alias untuk update_by_id
+    perbarui_id = update_by_id
+    
+    def delete_by_id(self, row_id: Any) -> bool:
+        """
+        Menghapus satu baris berdasarkan id tanpa memindai tabel dengan kondisi
+        
+        Args:
+            row_id: Nilai kolom 'id'
+            
+        Returns:
+            True jika baris ditemukan dan dihapus
+        """
+        row_id = self._normalize_id(row_id)
+        rows = self._rows_by_id(row_id)
+        if not rows:
+            return False
+        
+        # Baris hanya ditandai; urutan data tetap terjaga saat dipadatkan nanti
+        for row in rows:
+            self._delete_row(row)
+            self._record_undo('delete_row', row)
+        
+        self._record_change('delete_id', id=row_id)
+        return True
+    
+    # Alias untuk delete_by_id
+    hapus_id = delete_by_id
+    
+    # =========================================================================
+    # CACHE HASIL QUERY
+    # =========================================================================
+    
+    def enable_cache(self, max_entries: int = 128) -> None:
+        """
+        Mengaktifkan cache LRU hasil select_data/count_data
+        
+        Kunci cache dibentuk dari kondisi col(), kolom, urutan, limit dan
+        offset; kondisi lambda tidak dicache. Setiap mutasi menaikkan versi
+        tabel sehingga seluruh entri lama dibuang sebelum dipakai. Hasil
+        select dikembalikan sebagai salinan baris.
+        
+        Example:
+            >>> users.enable_cache(max_entries=256)
+            >>> users.count_data(col('active') == True)   # dihitung
+            >>> users.count_data(col('active') == True)   # dari cache
+        
+        Args:
+            max_entries: Jumlah maksimum hasil query yang disimpan
+            
+        Raises:
+            DatabaseValidationError: Jika max_entries tidak valid
+        """
+        try:
+            self._result_cache = ResultCache(max_entries)
+        except ValueError as e:
+            raise DatabaseValidationError(str(e))
+    
+    # Alias untuk enable_cache
+    aktifkan_cache = enable_cache
+    
+    def disable_cache(self) -> None:
+        """Menonaktifkan dan mengosongkan cache hasil query"""
+        self._result_cache = None
+    
+    # Alias untuk disable_cache
+    nonaktifkan_cache = disable_cache
+    
+    def clear_cache(self) -> None:
+        """Mengosongkan cache hasil query (statistik tetap)"""
+        if self._result_cache is not None:
+            self._result_cache.clear()
+    
+    # Alias untuk clear_cache
+    kosongkan_cache = clear_cache
+    
+    def cache_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Statistik cache hasil query
+        
+        Returns:
+            Dictionary hits, misses, hit_rate, entries, max_entries, evictions,
+            invalidations dan bypassed; None jika cache tidak aktif
+        """
+        if self._result_cache is None:
+            return None
+        return self._result_cache.stats()
+    
+    # Alias untuk cache_stats
+    statistik_cache = cache_stats
+    
+    def _cached_query(
+        self,
+        compute: Callable[[], Any],
+        copy: Optional[Callable[[Any], Any]],
+        kind: str,
+        condition: Optional[Union[Callable[[Dict[str, Any]], bool], Expr]],
+        *params: Any
+    ) -> Any:
+        """
+        Menjalankan query lewat cache hasil jika aktif
+        
+        Args:
+            compute: Menghitung hasil tanpa cache
+            copy: Menyalin hasil agar isi cache tidak ikut berubah (None = tidak perlu)
+            kind: Jenis query ('select', 'count')
+            condition: Kondisi query; lambda tidak dapat dicache
+            params: Argumen query lainnya (bagian dari kunci cache)
+        """
+        cache = self._result_cache
+        if cache is None:
+            return compute()
+        
+        key = None
+        if condition is None or isinstance(condition, Expr):
+            try:
+                key = (kind, None if condition is None else condition.key(), freeze(params))
+            except TypeError:
+                # Konstanta atau argumen tidak hashable
+                pass
+        if key is None:
+            cache.bypassed += 1
+            return compute()
+        
+        version = self._version
+        result = cache.lookup(key, version)
+        if result is MISSING:
+            result = compute()
+            cache.store(key, version, result if copy is None else copy(result))
+            return result
+        return result if copy is None else copy(result)
+    
+    # =========================================================================
+    # UTILITY METHODS
+    # =========================================================================
+    
+    def get_table_info(self) -> Dict[str, Any]:
+        """Mengembalikan informasi tabel"""
+        return {
+            'name': self.name,
+            'column_count': len(self.columns),
+            'data_count': self._row_count(),
+            'columns': {name: str(col_def) for name, col_def in self.columns.items()},
+            'indexes': self.get_indexes(),
+            'fulltext_indexes': self.get_fulltext_indexes(),
+            'zone_map': self.get_zone_map(),
+            'layout': self.layout,
+            'created_at': self._created_at.isoformat()
+        }
+    
+    def get_column_names(self) -> List[str]:
+        """Mengembalikan daftar nama kolom"""
+        return list(self.columns.keys())
+    
+    def count_data(self, condition: Optional[Union[Callable[[Dict], bool], Expr]] = None) -> int:
+        """Menghitung jumlah data yang memenuhi kondisi (lambda atau ekspresi col())"""
+        if condition is None:
+            return self._row_count()
+        return self._cached_query(partial(self._count_data, condition), None, 'count', condition)
+    
+    def _count_data(self, condition: Union[Callable[[Dict], bool], Expr]) -> int:
+        """Isi count_data tanpa cache"""
+        if isinstance(condition, Expr):
+            return len(self._select_expr(condition))
+        return len([row for row in self.data if condition(row)])
+    
+    def aggregate(
+        self,
+        group_by: Optional[Union[str, List[str]]] = None,
+        sum: Optional[Union[str, List[str]]] = None,
+        avg: Optional[Union[str, List[str]]] = None,
+        min: Optional[Union[str, List[str]]] = None,
+        max: Optional[Union[str, List[str]]] = None,
+        count: Optional[Union[bool, str, List[str]]] = None,
+        condition: Optional[Union[Callable[[Dict[str, Any]], bool], Expr]] = None
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Menghitung agregat (count/sum/avg/min/max), opsional per kelompok
+        
+        Baris disaring dulu dengan condition (ekspresi col() memakai planner
+        dan index), lalu dikelompokkan dalam satu lintasan. Tanpa group_by dan
+        condition, count baris serta min/max kolom ber-index terurut diambil
+        langsung tanpa memindai tabel.
+        
+        Example:
+            >>> orders.aggregate(group_by='status', sum='total', count=True)
+            [{'status': 'paid', 'sum_total': 1200, 'count': 3}, ...]
+            >>> orders.aggregate(avg='total', condition=col('status') == 'paid')
+            {'avg_total': 400.0}
+        
+        Args:
+            group_by: Kolom pengelompokan
+            sum: Kolom yang dijumlahkan
+            avg: Kolom yang dirata-rata
+            min: Kolom yang dicari nilai terkecilnya
+            max: Kolom yang dicari nilai terbesarnya
+            count: True untuk jumlah baris, atau kolom (jumlah nilai bukan None)
+            condition: Lambda atau ekspresi col() untuk menyaring baris
+        
+        Returns:
+            Dictionary hasil jika tanpa group_by, selain itu list dictionary
+            per kelompok (nilai kolom grup + hasil agregat). Tanpa fungsi
+            agregat, hasilnya count baris.
+        
+        Raises:
+            DatabaseColumnError: Jika kolom tidak ada
+            DatabaseTypeError: Jika nilai kolom tidak dapat diagregasi
+        """
+        if isinstance(group_by, str):
+            group_by = [group_by]
+        try:
+            specs = build_specs({'sum': sum, 'avg': avg, 'min': min, 'max': max, 'count': count})
+        except ValueError as e:
+            raise DatabaseValidationError(str(e))
+        
+        for column in list(group_by or []) + [column for _, column, _ in specs if column]:
+            if column not in self.columns:
+                raise DatabaseColumnError(f"Kolom '{column}' tidak ada di tabel {self.name}")
+        
+        try:
+            if not group_by and condition is None:
+                return self._aggregate_table(specs)
+            return self._aggregate_rows(specs, group_by, condition)
+        except TypeError as e:
+            raise DatabaseTypeError(f"Agregasi gagal di tabel {self.name}: {e}")
+    
+    # Alias untuk aggregate
+    agregasi = aggregate
+    
+    def _aggregate_rows(
+        self,
+        specs: List[Tuple[str, Optional[str], str]],
+        group_by: Optional[List[str]] = None,
+        condition: Optional[Union[Callable[[Dict[str, Any]], bool], Expr]] = None
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """Agregat atas baris yang memenuhi kondisi (dipindai)"""
+        if condition is None:
+            rows = self.data
+        elif isinstance(condition, Expr):
+            rows = self._select_expr(condition)
+        else:
+            rows = [row for row in self.data if condition(row)]
+        return aggregate_rows(rows, specs, group_by)
+    
+    def _aggregate_table(self, specs: List[Tuple[str, Optional[str], str]]) -> Dict[str, Any]:
+        """Agregat seluruh tabel; count baris dan min/max ber-index tanpa pemindaian"""
+        result: Dict[str, Any] = {}
+        remaining = []
+        for spec in specs:
+            function, column, name = spec
+            index = self._ordered_index(column) if function in ('min', 'max') else None
+            if column is None:
+                result[name] = self._row_count()
+            elif index is not None:
+                result[name] = index.min() if function == 'min' else index.max()
+            else:
+                remaining.append(spec)
+        
+        if remaining:
+            result.update(self._aggregate_rows(remaining))
+        return {name: result[name] for _, _, name in specs}
+    
+    def __repr__(self) -> str:
+        parts = [f"name='{self.name}'"]
+        
+        # Tambahkan informasi kolom jika ada
+        if self.columns:
+            parts.append(f"columns={len(self.columns)}")
+        
+        # Tambahkan informasi data
+        parts.append(f"data={self._row_count()}")
+        
+        # Tambahkan auto_increment jika lebih dari 1
+        if self._auto_increment > 1:
+            parts.append(f"auto_increment={self._auto_increment}")
+        
+        return f"Table({', '.join(parts)})"
+
+# =============================================================================
+# COLUMNAR TABLE
+# =============================================================================
+
+class ColumnarTable(Table):
+    """
+    Tabel dengan penyimpanan kolumnar in-memory (lihat columnar.py)
+    
+    API sama dengan Table, tetapi data disimpan per kolom (array bertipe,
+    buffer string dan bitmap None) sehingga memakai memori jauh lebih kecil,
+    dan ekspresi col(), count_data() serta aggregate() dievaluasi per kolom.
+    Dictionary baris hanya dibuat untuk hasil yang dikembalikan; baris hasil
+    adalah salinan, jadi perubahan tabel harus melalui update_data().
+    
+    Tabel kolumnar tidak memakai index kolom; pencarian id memakai peta
+    id -> posisi yang dibangun saat dibutuhkan.
+    """
+    
+    layout = 'columnar'
+    
+    def __init__(self, name: str, columns: Dict[str, Column]):
+        super().__init__(name, columns)
+        self._store = ColumnStore(self._column_types())
+        self._primary_index = None
+        
+        # Peta id -> posisi (int, atau list posisi untuk id duplikat); None = dibangun ulang saat dibutuhkan
+        self._id_map: Optional[Dict[Any, Union[int, List[int]]]] = None
+    
+    def _loaded_store(self) -> ColumnStore:
+        """Store kolom; data lazy dimuat ke kolom saat pertama kali diakses"""
+        if self._data_loader is not None:
+            data_loader = self._data_loader
+            self._data_loader = None
+            self._store = ColumnStore(self._column_types())
+            self._store.extend(data_loader())
+            self._id_map = None
+        return self._store
+    
+    @property
+    def data(self) -> List[Dict[str, Any]]:
+        """Salinan baris tabel sebagai dictionary (dibuat dari kolom setiap kali diakses)"""
+        return self._loaded_store().rows()
+    
+    @data.setter
+    def data(self, rows: List[Dict[str, Any]]) -> None:
+        self._data_loader = None
+        self._store = ColumnStore(self._column_types())
+        self._store.extend(list(rows))
+        self._id_map = None
+        self._dirty = True
+        self._version += 1
+    
+    def _row_count(self) -> int:
+        if self._data_loader is not None:
+            return self._lazy_row_count
+        return len(self._store)
+    
+    def _revert_change(self, op: str, info: Any) -> None:
+        store = self._loaded_store()
+        if op == 'insert':
+            store.pop()
+            self._auto_increment = info
+        elif op == 'insert_many':
+            count, self._auto_increment = info
+            store.delete(range(len(store) - count, len(store)))
+        elif op == 'update':
+            for position, old_values in reversed(info):
+                for col_name, value in old_values.items():
+                    store.set(position, col_name, value)
+        elif op == 'delete':
+            store.restore(info)
+        else:
+            super()._revert_change(op, info)
+            return
+        self._id_map = None
+        self._version += 1
+    
+    def _apply_change(self, op: str, payload: Dict[str, Any]) -> None:
+        store = self._loaded_store()
+        if op == 'insert':
+            self._append_row(payload['row'])
+            self._auto_increment = payload['auto_increment']
+        elif op == 'insert_many':
+            store.extend(payload['rows'])
+            self._id_map = None
+            self._auto_increment = payload['auto_increment']
+        elif op == 'update':
+            self._assign(payload['positions'], payload['updates'])
+        elif op == 'delete':
+            store.delete(payload['positions'])
+            self._id_map = None
+        elif op == 'update_id':
+            self._assign(self._id_positions(payload['id']), payload['updates'])
+        elif op == 'delete_id':
+            store.delete(self._id_positions(payload['id']))
+            self._id_map = None
+        else:
+            super()._apply_change(op, payload)
+            return
+        self._dirty = True
+        self._version += 1
+    
+    # =========================================================================
+    # MUTASI
+    # =========================================================================
+    
+    def _append_row(self, row: Dict[str, Any]) -> None:
+        """Menambahkan baris ke store dan peta id"""
+        store = self._loaded_store()
+        store.append(row)
+        if self._id_map is not None:
+            self._add_id(self._id_map, row.get('id'), len(store) - 1)
+    
+    def _assign(self, positions: List[int], updates: Dict[str, Any]) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Menulis nilai update ke posisi tertentu
+        
+        Returns:
+            Nilai lama per posisi untuk undo log (kosong jika tidak ada transaksi)
+        """
+        store = self._loaded_store()
+        old_values = []
+        if self._undo_log is not None:
+            previous = {col_name: store.values(col_name, positions) for col_name in updates}
+            old_values = [
+                (position, {col_name: previous[col_name][i] for col_name in updates})
+                for i, position in enumerate(positions)
+            ]
+        for col_name, value in updates.items():
+            for position in positions:
+                store.set(position, col_name, value)
+        if 'id' in updates:
+            self._id_map = None
+        return old_values
+    
+    def _check_update(self, positions: List[int], updates: Dict[str, Any]) -> None:
+        """
+        Validasi nilai update (kolom lain tidak berubah) dan keunikan id
+        
+        Raises:
+            DatabaseValidationError: Jika nilai tidak valid atau id menjadi duplikat
+        """
+        if not self._validate_row_data(updates):
+            raise DatabaseValidationError(f"Validasi update gagal untuk data di tabel {self.name}")
+        if updates.get('id') is not None:
+            if len(positions) > 1:
+                raise DatabaseValidationError(f"id {updates['id']!r} sudah ada di tabel {self.name}")
+            self._check_primary_key(updates['id'], positions[0])
+    
+    def insert_data(self, **data) -> int:
+        """
+        Menyisipkan data baru ke dalam tabel
+        """
+        complete_data, previous_auto_increment = self._prepare_insert(data)
+        try:
+            self._check_primary_key(complete_data.get('id'))
+        except DatabaseValidationError:
+            self._auto_increment = previous_auto_increment
+            raise
+        self._append_row(complete_data)
+        self._record_undo('insert', previous_auto_increment)
+        self._record_change('insert', row=complete_data, auto_increment=self._auto_increment)
+        return complete_data.get('id', len(self._store))
+    
+    # Alias untuk insert_data
+    tambah_data = insert_data
+    
+    def insert_many(
+        self,
+        rows: Iterable[Union[Dict[str, Any], Sequence[Any]]],
+        columns: Optional[List[str]] = None
+    ) -> List[Any]:
+        """
+        Menyisipkan banyak baris sekaligus (ditambahkan per kolom)
+        """
+        records, previous_auto_increment = self._prepare_many(rows, columns)
+        if not records:
+            return []
+        
+        store = self._loaded_store()
+        start = len(store)
+        store.extend(records)
+        if self._id_map is not None:
+            for position, row in enumerate(records, start):
+                self._add_id(self._id_map, row.get('id'), position)
+        self._record_undo('insert_many', (len(records), previous_auto_increment))
+        self._record_change('insert_many', rows=records, auto_increment=self._auto_increment)
+        return self._inserted_ids(records, start)
+    
+    # Alias untuk insert_many
+    tambah_banyak = insert_many
+    
+    def update_data(
+        self, 
+        condition: Union[Callable[[Dict[str, Any]], bool], Expr], 
+        **updates
+    ) -> int:
+        """
+        Memperbarui data berdasarkan kondisi (lambda atau ekspresi col())
+        """
+        normalized_updates = self._normalize_row_data(updates)
+        positions = self._positions(condition)
+        if not positions:
+            return 0
+        
+        self._check_update(positions, normalized_updates)
+        self._record_undo('update', self._assign(positions, normalized_updates))
+        self._record_change('update', positions=positions, updates=normalized_updates)
+        return len(positions)
+    
+    # Alias untuk update_data
+    perbarui_data = update_data
+    
+    def delete_data(self, condition: Union[Callable[[Dict[str, Any]], bool], Expr]) -> int:
+        """
+        Menghapus data berdasarkan kondisi (lambda atau ekspresi col())
+        """
+        positions = self._positions(condition)
+        if not positions:
+            return 0
+        
+        self._record_undo('delete', self._store.delete(positions))
+        self._id_map = None
+        self._record_change('delete', positions=positions)
+        return len(positions)
+    
+    # Alias untuk delete_data
+    hapus_data = delete_data
+    
+    # =========================================================================
+    # KONDISI
+    # =========================================================================
+    
+    def _positions(
+        self, condition: Optional[Union[Callable[[Dict[str, Any]], bool], Expr]]
+    ) -> List[int]:
+        """Posisi baris yang memenuhi kondisi (ekspresi dievaluasi per kolom)"""
+        store = self._loaded_store()
+        if condition is None:
+            return list(range(len(store)))
+        if isinstance(condition, Expr):
+            positions = self._plan_positions(self._plan(condition))
+            return list(range(len(store))) if positions is None else positions
+        return [position for position, row in enumerate(store.iter_rows()) if condition(row)]
+    
+    def _plan_positions(self, plan: QueryPlan) -> Optional[List[int]]:
+        """Posisi hasil rencana; filter dievaluasi dari yang paling selektif (None = semua baris)"""
+        store = self._loaded_store()
+        positions = None
+        for term in plan.filters:
+            positions = store.select(term, positions)
+            if not positions:
+                return []
+        return positions
+    
+    def _execute_plan(self, plan: QueryPlan) -> List[Dict[str, Any]]:
+        return self._loaded_store().rows(self._plan_positions(plan))
+    
+    def _iterate_plan(self, plan: QueryPlan) -> Iterator[Dict[str, Any]]:
+        return self._loaded_store().iter_rows(self._plan_positions(plan))
+    
+    def _iter_rows(self) -> Iterator[Dict[str, Any]]:
+        if self._streaming():
+            return self._row_stream()
+        return self._loaded_store().iter_rows()
+    
+    def _analyze_column(self, column: str) -> ColumnStats:
+        store = self._loaded_store()
+        positions = sample_positions(len(store))
+        return analyze_values(store.values(column, positions), len(store), positions is not None)
+    
+    def _ordered_rows(
+        self,
+        condition: Optional[Union[Callable[[Dict[str, Any]], bool], Expr]],
+        order_by: Any,
+        limit: Optional[int],
+        offset: int
+    ) -> Iterator[Dict[str, Any]]:
+        """Baris terurut dengan offset/limit; hanya kolom urutan yang diurutkan"""
+        try:
+            order = normalize_order(order_by)
+        except (TypeError, ValueError) as e:
+            raise DatabaseValidationError(str(e))
+        for column, _ in order:
+            if column not in self.columns:
+                raise DatabaseColumnError(f"Kolom '{column}' tidak ada di tabel {self.name}")
+        
+        end = None if limit is None else offset + limit
+        store = self._loaded_store()
+        positions = self._positions(condition)
+        
+        # Baris kunci ringan {0: posisi, kolom urutan: nilai}; baris lengkap dibuat setelah top-k
+        names = [0] + [column for column, _ in order]
+        keys = [store.values(column, positions) for column, _ in order]
+        proxies = list(map(dict, map(zip, repeat(names), zip(positions, *keys))))
+        try:
+            ordered = sort_rows(proxies, order, end)
+        except TypeError as e:
+            raise DatabaseTypeError(f"Nilai kolom urutan tidak dapat dibandingkan: {e}")
+        return store.iter_rows([proxy[0] for proxy in ordered[offset:end]])
+    
+    def _count_data(self, condition: Union[Callable[[Dict], bool], Expr]) -> int:
+        return len(self._positions(condition))
+    
+    def _aggregate_rows(
+        self,
+        specs: List[Tuple[str, Optional[str], str]],
+        group_by: Optional[List[str]] = None,
+        condition: Optional[Union[Callable[[Dict[str, Any]], bool], Expr]] = None
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """Agregat per kolom: posisi baris sebagai penanda, nilai diambil dari vektor"""
+        store = self._loaded_store()
+        positions = range(len(store)) if condition is None else self._positions(condition)
+        return aggregate_rows(positions, specs, group_by, store.aggregate_values, store.group_keys)
+    
+    def explain(
+        self, condition: Optional[Union[Callable[[Dict[str, Any]], bool], Expr]] = None
+    ) -> Dict[str, Any]:
+        info = super().explain(condition)
+        info['layout'] = self.layout
+        return info
+    
+    # =========================================================================
+    # INDEX
+    # =========================================================================
+    
+    def create_index(self, column: str, unique: bool = False, ordered: bool = False) -> None:
+        """
+        Tidak didukung: tabel kolumnar memindai kolom langsung
+        
+        Raises:
+            DatabaseError: Selalu
+        """
+        raise DatabaseError(
+            f"Tabel kolumnar {self.name} tidak mendukung index; kondisi col() dievaluasi per kolom"
+        )
+    
+    # Alias untuk create_index
+    buat_index = create_index
+    
+    def create_fulltext_index(self, column: str, tokenizer: Union[str, Callable[[str], List[str]]] = DEFAULT_TOKENIZER) -> None:
+        """
+        Tidak didukung: tabel kolumnar tidak menyimpan baris sebagai dictionary
+        
+        Raises:
+            DatabaseError: Selalu
+        """
+        raise DatabaseError(f"Tabel kolumnar {self.name} tidak mendukung index full-text")
+    
+    # Alias untuk create_fulltext_index
+    buat_index_teks = create_fulltext_index
+    
+    def create_zone_map(
+        self,
+        segment_rows: int = DEFAULT_ZONE_ROWS,
+        bloom_columns: Optional[List[str]] = None,
+        error_rate: float = DEFAULT_ERROR_RATE
+    ) -> None:
+        """
+        Tidak didukung: tabel kolumnar memindai kolom langsung
+        
+        Raises:
+            DatabaseError: Selalu
+        """
+        raise DatabaseError(f"Tabel kolumnar {self.name} tidak mendukung zone map")
+    
+    # Alias untuk create_zone_map
+    buat_zone_map = create_zone_map
+    
+    def _key_lookup(self, column: str) -> Optional[Callable[[Any], List[Dict[str, Any]]]]:
+        return self._rows_by_id if column == 'id' and 'id' in self.columns else None
+    
+    def find(self, **criteria) -> List[Dict[str, Any]]:
+        """
+        Mencari baris dengan kesamaan nilai kolom (kolom=nilai)
+        
+        Kriteria id memakai peta id -> posisi; kriteria lain dievaluasi per kolom.
+        """
+        for column in criteria:
+            if column not in self.columns:
+                raise DatabaseColumnError(f"Kolom '{column}' tidak ada di tabel {self.name}")
+        
+        store = self._loaded_store()
+        positions = None
+        if 'id' in criteria:
+            positions = self._id_positions(criteria['id'])
+        for column, value in criteria.items():
+            if positions is not None and not positions:
+                break
+            if column != 'id' or positions is None:
+                positions = store.select(col(column) == value, positions)
+        return store.rows(positions)
+    
+    # Alias untuk find
+    cari = find
+    
+    def find_range(
+        self,
+        column: str,
+        low: Any = None,
+        high: Any = None,
+        include_low: bool = True,
+        include_high: bool = True,
+        descending: bool = False
+    ) -> List[Dict[str, Any]]:
+        if column not in self.columns:
+            raise DatabaseColumnError(f"Kolom '{column}' tidak ada di tabel {self.name}")
+        
+        field = col(column)
+        terms = [field.is_not_null()]
+        if low is not None:
+            terms.append(field >= low if include_low else field > low)
+        if high is not None:
+            terms.append(field <= high if include_high else field < high)
+        return list(self.iter_data(And(*terms), order_by=(column, 'desc' if descending else 'asc')))
+    
+    # Alias untuk find_range
+    cari_rentang = find_range
+    
+    def order_by(self, column: str, descending: bool = False) -> List[Dict[str, Any]]:
+        return list(self.iter_data(order_by=(column, 'desc' if descending else 'asc')))
+    
+    # Alias untuk order_by
+    urutkan = order_by
+    
+    def min_value(self, column: str) -> Any:
+        return self.aggregate(min=column)[f"min_{column}"]
+    
+    def max_value(self, column: str) -> Any:
+        return self.aggregate(max=column)[f"max_{column}"]
+    
+    # =========================================================================
+    # PRIMARY KEY
+    # =========================================================================
+    
+    @staticmethod
+    def _add_id(id_map: Dict[Any, Union[int, List[int]]], row_id: Any, position: int) -> None:
+        """Menambahkan posisi ke peta id (list hanya untuk id duplikat)"""
+        existing = id_map.get(row_id)
+        if existing is None:
+            id_map[row_id] = position
+        elif isinstance(existing, list):
+            existing.append(position)
+        else:
+            id_map[row_id] = [existing, position]
+    
+    def _id_index(self) -> Dict[Any, Union[int, List[int]]]:
+        """Peta id -> posisi, dibangun ulang dari kolom id jika perlu"""
+        if self._id_map is None:
+            ids = self._loaded_store().values('id')
+            id_map = dict(zip(ids, range(len(ids))))
+            if len(id_map) != len(ids):
+                # Ada id duplikat (data lama): bangun dengan list posisi
+                id_map = {}
+                for position, row_id in enumerate(ids):
+                    self._add_id(id_map, row_id, position)
+            self._id_map = id_map
+        return self._id_map
+    
+    def _id_positions(self, row_id: Any) -> List[int]:
+        """Posisi baris dengan id tertentu"""
+        try:
+            found = self._id_index().get(row_id)
+        except TypeError:
+            return []
+        if found is None:
+            return []
+        return list(found) if isinstance(found, list) else [found]
+    
+    def _rows_by_id(self, row_id: Any) -> List[Dict[str, Any]]:
+        # Biasanya nol atau satu posisi: dictionary dibuat langsung per baris
+        return list(map(self._loaded_store().row, self._id_positions(row_id)))
+    
+    def _id_taken(self, row_id: Any) -> bool:
+        return bool(self._id_positions(row_id))
+    
+    def _check_primary_key(self, row_id: Any, position: Optional[int] = None) -> None:
+        """
+        Memastikan id belum dipakai baris lain
+        
+        Args:
+            row_id: Nilai id baru
+            position: Posisi baris pemilik id (diabaikan dari pengecekan, untuk update)
+        
+        Raises:
+            DatabaseValidationError: Jika id duplikat
+        """
+        if row_id is None or 'id' not in self.columns:
+            return
+        if any(existing != position for existing in self._id_positions(row_id)):
+            raise DatabaseValidationError(f"id {row_id!r} sudah ada di tabel {self.name}")
+    
+    def get_duplicate_ids(self) -> List[Any]:
+        if 'id' not in self.columns:
+            raise DatabaseColumnError(f"Tabel {self.name} tidak memiliki kolom 'id'")
+        return [row_id for row_id, found in self._id_index().items() if isinstance(found, list)]
+    
+    def update_by_id(self, row_id: Any, **updates) -> bool:
+        row_id = self._normalize_id(row_id)
+        positions = self._id_positions(row_id)
+        if not positions:
+            return False
+        
+        normalized_updates = self._normalize_row_data(updates)
+        self._check_update(positions, normalized_updates)
+        self._record_undo('update', self._assign(positions, normalized_updates))
+        self._record_change('update_id', id=row_id, updates=normalized_updates)
+        return True
+    
+    # Alias untuk update_by_id
+    perbarui_id = update_by_id
+    
+    def delete_by_id(self, row_id: Any) -> bool:
+        row_id = self._normalize_id(row_id)
+        positions = self._id_positions(row_id)
+        if not positions:
+            return False
+        
+        self._record_undo('delete', self._store.delete(positions))
+        self._id_map = None
+        self._record_change('delete_id', id=row_id)
+        return True
+    
+    # Alias untuk delete_by_id
+    hapus_id = delete_by_id
+    
+    # =========================================================================
+    # UTILITY METHODS
+    # =========================================================================
+    
+    def get_table_info(self) -> Dict[str, Any]:
+        """Mengembalikan informasi tabel (termasuk memori kolom jika data sudah dimuat)"""
+        info = super().get_table_info()
+        if self.is_loaded:
+            info['memory_bytes'] = self._store.nbytes
+            info['column_layout'] = self._store.column_layout()
+        return info
+
+# Sisanya tetap sama...
+# [Kode Database class dan lainnya tetap tidak berubah]
+
+# =============================================================================
+# DATABASE CLASS WITH ENCRYPTION
+# =============================================================================
+
+# Format file yang didukung:
+#   'json'      : satu token terenkripsi berisi seluruh database (format lama)
+#   'segmented' : direktori terenkripsi + segmen terenkripsi per tabel
+#   'stream'    : stream terenkripsi per chunk, ditulis/dibaca dengan memori terbatas
+#                 (baris tabel dibaca langsung dari file sampai Table.data dibutuhkan)
+STORAGE_FORMATS = ('json', 'segmented', 'stream')
+
+# Jumlah teks query berbeda yang hasil parsingnya disimpan oleh execute()
+STATEMENT_CACHE_SIZE = 256
+
+class Database:
+    """
+    Kelas utama untuk manajemen database dengan enkripsi
+    """
+    
+    def __init__(
+        self, 
+        name: str, 
+        password: str, 
+        storage_path: str = ".", 
+        create_new: bool = False,
+        wal: bool = False,
+        storage_format: Optional[str] = None,
+        segment_rows: int = DEFAULT_SEGMENT_ROWS,
+        cipher: Optional[str] = None,
+        compression: Optional[str] = None,
+        row_encoding: Optional[str] = None
+    ):
+        """
+        Inisialisasi database dengan password
+        
+        Args:
+            name: Nama database
+            password: Password untuk enkripsi/dekripsi
+            storage_path: Path penyimpanan
+            create_new: True untuk membuat database baru (overwrite jika ada)
+            wal: True untuk mencatat setiap insert/update/delete ke write-ahead
+                 log terenkripsi (<nama>.pydb.wal), sehingga perubahan langsung
+                 tahan crash tanpa menyimpan ulang seluruh database
+            storage_format: 'json', 'segmented' atau 'stream'. Jika None, ikuti
+                 format file yang ada ('json' untuk database baru). Format
+                 'segmented' hanya mendekripsi tabel yang diakses, format
+                 'stream' menulis/membaca per chunk tanpa salinan penuh di memori
+            segment_rows: Jumlah baris per segmen terenkripsi (format 'segmented')
+            cipher: 'fernet', 'aes-gcm' atau 'chacha20-poly1305'. Jika None, ikuti
+                 cipher file yang ada ('fernet' untuk database baru). Cipher
+                 AEAD menulis bytes mentah tanpa overhead base64 Fernet
+            compression: 'none', 'zlib', 'lzma' atau 'bz2'. Jika None, ikuti
+                 kompresi file yang ada ('none' untuk database baru). Data
+                 dikompresi sebelum dienkripsi
+            row_encoding: 'json' atau 'binary'. Jika None, ikuti encoding file
+                 yang ada ('json' untuk database baru). Encoding 'binary'
+                 memakai codec berbasis skema kolom (tanpa nama kolom per
+                 baris) untuk format 'json' dan 'segmented'
+        """
+        # Validasi parameter
+        if not isinstance(name, str) or not name.strip():
+            raise DatabaseError("Nama database harus string tidak kosong")
+        
+        if not name.endswith(".pydb"):
+            name += ".pydb"
+            
+        if not password:
+            raise PasswordValueError("Password harus disediakan")
+        
+        storage_path = str(os.path.abspath(storage_path))
+        
+        if not isinstance(storage_path, str) or not storage_path.strip():
+            raise DatabasePathError("Path penyimpanan harus string tidak kosong")
+        
+        # Cek dan buat path jika tidak ada
+        if not os.path.exists(storage_path):
+            try:
+                os.makedirs(storage_path, exist_ok=True)
+            except Exception as e:
+                raise DatabasePathError(f"Tidak dapat membuat path: {e}")
+        
+        if not os.access(storage_path, os.W_OK):
+            raise DatabasePathError(f"Path tidak dapat ditulisi: {storage_path}")
+        
+        if storage_format is not None and storage_format not in STORAGE_FORMATS:
+            raise DatabaseError(f"Format penyimpanan tidak didukung: {storage_format}")
+        
+        if segment_rows <= 0:
+            raise DatabaseLengthError("segment_rows harus lebih besar dari 0")
+        
+        if cipher is not None and cipher not in CIPHERS:
+            raise DatabaseError(f"Cipher tidak didukung: {cipher}")
+        
+        if compression is not None and compression not in COMPRESSIONS:
+            raise DatabaseError(f"Kompresi tidak didukung: {compression}")
+        
+        if row_encoding is not None and row_encoding not in ROW_ENCODINGS:
+            raise DatabaseError(f"Encoding baris tidak didukung: {row_encoding}")
+        
+        self.name = name.strip()
+        self.password = password
         self.storage_path = storage_path
         self.tables: Dict[str, Table] = {}
         self.file_path = str(os.path.join(storage_path, self.name))
+        self.wal_path = self.file_path + WAL_SUFFIX
+        self._checkpoint: Optional[str] = None
+        self._encryptor: Optional[TextEncryptor] = None
+        self._wal = WriteAheadLog(self.wal_path, password) if wal else None
+        self.storage_format = storage_format
+        self.segment_rows = segment_rows
+        self.cipher = cipher
+        self.compression = compression
+        self.row_encoding = row_encoding
+        
+        # Status batch/transaksi: penyimpanan ditunda sampai blok terluar selesai
+        self._batch_depth = 0
+        self._dirty = False
+        
+        # Cache pernyataan SQL execute(): teks query -> (pernyataan, tabel)
+        self._statements = LRUCache(STATEMENT_CACHE_SIZE)
+        self._undo_log: Optional[List[Tuple[Any, str, Any]]] = None
+        
+        # File tersegmentasi yang terakhir dimuat/ditulis (untuk penyimpanan inkremental)
+        self._segmented_file: Optional[SegmentedFile] = None
         
         # Muat data yang ada atau buat baru
         if create_new:
+            self.storage_format = self.storage_format or 'json'
+            self.cipher = self.cipher or DEFAULT_CIPHER
+            self.compression = self.compression or COMPRESSION_NONE
+            self.row_encoding = self.row_encoding or ROW_ENCODING_JSON
             self._create_new_database()
         elif not create_new or create_new and os.path.exists(storage_path):
             self._load_from_file()
+            self.storage_format = self.storage_format or 'json'
+            self.cipher = self.cipher or DEFAULT_CIPHER
+            self.compression = self.compression or COMPRESSION_NONE
+            self.row_encoding = self.row_encoding or ROW_ENCODING_JSON
+            
+            # WAL membutuhkan checkpoint yang tercatat di file utama
+            if self._wal is not None and self._checkpoint is None:
+                self._save_to_file()
     
     def _create_new_database(self):
         """Buat database baru"""
         self.tables.clear()
         self._save_to_file()
     
-    def create_table(self, name: str, columns: Dict[str, Column]) -> Table:
+    def create_table(self, name: str, columns: Dict[str, Column], columnar: bool = False) -> Table:
         """
         Membuat tabel baru
+        
+        Args:
+            name: Nama tabel
+            columns: Definisi kolom
+            columnar: True untuk penyimpanan kolumnar in-memory (ColumnarTable):
+                      memori lebih kecil, scan/count/aggregate per kolom, tanpa index
         """
         if name in self.tables:
             raise DatabaseTableError(f"Tabel '{name}' sudah ada")
         
-        table = Table(name, columns)
+        table = (ColumnarTable if columnar else Table)(name, columns)
+        self._attach_table(table)
         self.tables[name] = table
-        self._save_to_file()
+        self._record_undo('create_table', name)
+        self._schedule_save()
         
         return table
     
@@ -626,8 +3101,10 @@ class Database:
         if name not in self.tables:
             raise DatabaseTableError(f"Tabel '{name}' tidak ditemukan")
         
-        del self.tables[name]
-        self._save_to_file()
+        position = list(self.tables).index(name)
+        table = self.tables.pop(name)
+        self._record_undo('drop_table', (name, table, position))
+        self._schedule_save()
         return True
     
     # Alias untuk drop_table
@@ -645,6 +3122,440 @@ class Database:
     # Alias untuk get_table
     dapatkan_tabel = get_table
     
+    # =========================================================================
+    # JOIN
+    # =========================================================================
+    
+    def _join_table(self, table: Union[str, Table]) -> Table:
+        """Tabel join dari nama atau instance milik database ini"""
+        if isinstance(table, Table):
+            if self.tables.get(table.name) is not table:
+                raise DatabaseTableError(f"Tabel '{table.name}' bukan milik database {self.name}")
+            return table
+        return self.get_table(table)
+    
+    def join(
+        self,
+        left: Union[str, Table],
+        right: Union[str, Table],
+        on: Union[str, Tuple[str, str]],
+        how: str = 'inner',
+        columns: Optional[List[str]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Menggabungkan dua tabel dengan hash join (build/probe, O(n + m))
+        
+        Index yang sudah ada pada kolom kunci (termasuk peta id) dipakai
+        langsung sebagai sisi build; tanpa index, tabel kanan (atau tabel
+        yang lebih kecil pada inner join) dikelompokkan sekali per kunci.
+        Sisi lainnya dibaca lazy sehingga hasil dialirkan baris per baris.
+        Urutan hasil mengikuti sisi probe; kunci None tidak pernah cocok.
+        
+        Kolom yang ada di kedua tabel ditulis 'tabel.kolom'; kunci bernama
+        sama di kedua sisi ditulis sekali. Dengan columns, kolom tabel kiri
+        dihasilkan lebih dulu.
+        
+        Example:
+            >>> for row in db.join('orders', 'users', on=('user_id', 'id'), columns=['orders.id', 'name', 'total']):
+            ...     print(row)
+            
+        Args:
+            left: Nama atau instance tabel kiri
+            right: Nama atau instance tabel kanan
+            on: 'kolom' (nama sama di kedua tabel) atau ('kolom_kiri', 'kolom_kanan')
+            how: 'inner' (hanya yang berpasangan) atau 'left' (semua baris kiri)
+            columns: Kolom hasil berupa 'kolom' atau 'tabel.kolom' (None = semua)
+            
+        Returns:
+            Iterator baris hasil join
+            
+        Raises:
+            DatabaseTableError: Jika tabel tidak ditemukan atau sama
+            DatabaseColumnError: Jika kolom kunci/hasil tidak ada atau ambigu
+            DatabaseValidationError: Jika on atau how tidak valid
+        """
+        left_table = self._join_table(left)
+        right_table = self._join_table(right)
+        if left_table is right_table:
+            raise DatabaseTableError(f"Join tabel {left_table.name} dengan dirinya sendiri tidak didukung")
+        if how not in JOIN_TYPES:
+            raise DatabaseValidationError(f"Jenis join harus salah satu dari {', '.join(JOIN_TYPES)}, bukan {how!r}")
+        
+        try:
+            left_key, right_key = parse_on(on)
+        except ValueError as e:
+            raise DatabaseValidationError(str(e))
+        for table, key in ((left_table, left_key), (right_table, right_key)):
+            if key not in table.columns:
+                raise DatabaseColumnError(f"Kolom '{key}' tidak ada di tabel {table.name}")
+        
+        try:
+            projection = build_projection(
+                (left_table.name, list(left_table.columns)),
+                (right_table.name, list(right_table.columns)),
+                (left_key, right_key),
+                columns
+            )
+        except ValueError as e:
+            raise DatabaseColumnError(str(e))
+        
+        lookup = right_table._key_lookup(right_key)
+        if lookup is None and how == 'inner':
+            # Inner join simetris: probe tabel kanan ke index kiri, atau
+            # build dari tabel yang lebih kecil
+            lookup = left_table._key_lookup(left_key)
+            if lookup is None and left_table._row_count() < right_table._row_count():
+                lookup = build_lookup(left_table.iter_data(), left_key)
+            if lookup is not None:
+                return hash_join(right_table.iter_data(), right_key, lookup, projection, how, probe_is_left=False)
+        
+        if lookup is None:
+            lookup = build_lookup(right_table.iter_data(), right_key)
+        return hash_join(left_table.iter_data(), left_key, lookup, projection, how)
+    
+    # Alias untuk join
+    gabung = join
+    
+    # =========================================================================
+    # SQL
+    # =========================================================================
+    
+    def _prepare_statement(self, sql: str) -> Tuple[Statement, Table]:
+        """Pernyataan hasil parsing (dari cache per teks query) beserta tabelnya"""
+        cached = self._statements.get(sql)
+        if cached is not MISSING:
+            statement, table = cached
+            # Tabel yang sudah dihapus/dibuat ulang membutuhkan parsing ulang
+            if self.tables.get(statement.table) is table:
+                return statement, table
+        
+        schema = lambda name: self.get_table(name)._column_types()
+        try:
+            statement = parse_statement(sql, schema)
+        except ValueError as e:
+            raise DatabaseValidationError(f"Query tidak valid: {e}")
+        table = self.tables[statement.table]
+        self._statements.put(sql, (statement, table))
+        return statement, table
+    
+    def execute(self, sql: str, params: Optional[Union[Tuple[Any, ...], List[Any], Dict[str, Any]]] = None) -> Any:
+        """
+        Menjalankan satu pernyataan SQL (subset) pada tabel database
+        
+        Teks query diparse sekali lalu dicache (LRU) beserta kondisi col()
+        hasil parsingnya; nilai dari luar sebaiknya dikirim lewat parameter ?
+        atau :nama agar teks query tetap sama dan cache terpakai. WHERE
+        diteruskan ke planner (index/primary key), kolom SELECT, ORDER BY dan
+        LIMIT/OFFSET ke select_data, dan fungsi agregat ke aggregate, sehingga
+        hanya kolom dan baris yang diminta yang disalin. Lihat pydb.sql untuk
+        tata bahasanya.
+        
+        Seperti SQL standar, UPDATE dan DELETE tanpa WHERE berlaku untuk
+        semua baris tabel.
+        
+        Example:
+            >>> db.execute("SELECT name, age FROM users WHERE age >= ? ORDER BY age DESC LIMIT 10", (30,))
+            >>> db.execute("SELECT city, COUNT(*) AS total FROM users GROUP BY city ORDER BY total DESC")
+            >>> db.execute("UPDATE users SET active = false WHERE id = :id", {'id': 7})
+        
+        Args:
+            sql: Teks SQL (SELECT, INSERT, UPDATE atau DELETE)
+            params: List/tuple untuk ?, atau dictionary untuk :nama
+        
+        Returns:
+            SELECT: list dictionary baris hasil; INSERT/UPDATE/DELETE: jumlah
+            baris yang disisipkan/diubah/dihapus
+        
+        Raises:
+            DatabaseValidationError: Jika sintaks, kolom, konstanta atau parameter tidak valid
+            DatabaseTableError: Jika tabel tidak ditemukan
+            DatabaseTypeError: Jika nilai kolom tidak dapat diagregasi/diurutkan
+        """
+        statement, table = self._prepare_statement(sql)
+        try:
+            statement = statement.bind(params)
+        except ValueError as e:
+            raise DatabaseValidationError(f"Parameter query tidak valid: {e}")
+        
+        if statement.kind == 'select':
+            if statement.is_aggregate:
+                return self._execute_aggregate(table, statement)
+            return self._execute_select(table, statement)
+        
+        if statement.kind == 'insert':
+            # Beberapa baris disisipkan atomik dalam satu batch
+            return len(table.insert_many(statement.records()))
+        
+        # Tanpa WHERE: semua baris
+        condition = statement.where if statement.where is not None else (lambda row: True)
+        if statement.kind == 'update':
+            return table.update_data(condition, **statement.assignments)
+        return table.delete_data(condition)
+    
+    # Alias untuk execute
+    jalankan = execute
+    
+    def _execute_select(self, table: Table, statement: SelectStatement) -> List[Dict[str, Any]]:
+        """SELECT tanpa agregat: kolom, kondisi, urutan dan limit diteruskan ke select_data"""
+        order_by = [(column, 'desc' if descending else 'asc') for column, descending in statement.order_by]
+        columns = None
+        if statement.columns is not None:
+            columns = list(dict.fromkeys(column for column, _ in statement.columns))
+        
+        rows = table.select_data(
+            statement.where, columns, statement.limit, order_by or None, statement.offset
+        )
+        if statement.columns is None or all(column == output for column, output in statement.columns):
+            return rows
+        return [{output: row.get(column) for column, output in statement.columns} for row in rows]
+    
+    def _execute_aggregate(self, table: Table, statement: SelectStatement) -> List[Dict[str, Any]]:
+        """SELECT dengan fungsi agregat dan/atau GROUP BY lewat Table.aggregate"""
+        aggregates = statement.aggregates
+        if (not statement.group_by and len(aggregates) == 1 and aggregates[0][:2] == ('count', None)
+                and statement.where is not None):
+            # COUNT(*) dengan WHERE: count_data (memakai planner dan cache hasil)
+            rows = [{aggregates[0][2]: table.count_data(statement.where)}]
+        else:
+            requested: Dict[str, List[str]] = {}
+            for function, column, _ in aggregates:
+                requested.setdefault(function, []).append(column or '*')
+            result = table.aggregate(statement.group_by or None, condition=statement.where, **requested)
+            rows = result if statement.group_by else [result]
+            
+            # Nama hasil aggregate -> nama kolom SELECT (alias)
+            outputs = [(column, output) for column, output in statement.columns or []]
+            outputs += [(f"{function}_{column}" if column else 'count', output) for function, column, output in aggregates]
+            rows = [{output: row[name] for name, output in outputs} for row in rows]
+        
+        if statement.order_by:
+            try:
+                rows = sort_rows(rows, statement.order_by)
+            except TypeError as e:
+                raise DatabaseTypeError(f"Hasil query tidak dapat diurutkan: {e}")
+        end = None if statement.limit is None else statement.offset + statement.limit
+        return rows[statement.offset:end]
+    
+    def statement_cache_stats(self) -> Dict[str, Any]:
+        """Statistik cache pernyataan SQL execute() (lihat LRUCache.stats)"""
+        return self._statements.stats()
+    
+    # Alias untuk statement_cache_stats
+    statistik_query = statement_cache_stats
+    
+    # =========================================================================
+    # WRITE-AHEAD LOG
+    # =========================================================================
+    
+    def _attach_table(self, table: Table) -> None:
+        """Memasang journal (WAL/batch) dan undo log transaksi ke tabel"""
+        table._journal = self._journal
+        table._undo_log = self._undo_log
+    
+    def _journal(self, table_name: str, op: str, payload: Dict[str, Any]) -> None:
+        """Menulis satu mutasi tabel ke WAL (atau menandai batch kotor)"""
+        if self._batch_depth:
+            # Penyimpanan penuh saat commit sudah mencakup mutasi ini
+            self._dirty = True
+            return
+        
+        if self._wal is None:
+            return
+        
+        try:
+            self._wal.append(dict(payload, table=table_name, op=op))
+        except Exception as e:
+            raise DatabaseError(f"Gagal menulis WAL: {e}")
+    
+    def _replay_wal(self) -> None:
+        """Menerapkan ulang mutasi dari WAL yang belum masuk ke file utama"""
+        wal = self._wal if self._wal is not None else WriteAheadLog(self.wal_path, self.password)
+        records = wal.replay(self._checkpoint)
+        
+        for record in records:
+            self.get_table(record['table'])._apply_change(record['op'], record)
+        
+        if self._wal is None:
+            # WAL tidak aktif: gabungkan mutasi ke file utama lalu hapus WAL
+            if records:
+                self._save_to_file()
+            elif os.path.exists(self.wal_path):
+                wal.remove()
+        elif self._checkpoint is not None and not wal.ready:
+            wal.reset(self._checkpoint)
+    
+    def checkpoint(self) -> None:
+        """
+        Menyimpan database penuh dan mengosongkan WAL
+        
+        Berguna untuk membatasi ukuran WAL pada beban tulis yang tinggi.
+        """
+        self._save_to_file()
+    
+    # =========================================================================
+    # BATCH & TRANSAKSI
+    # =========================================================================
+    
+    def _schedule_save(self) -> None:
+        """Menyimpan sekarang, atau menunda sampai batch/transaksi terluar selesai"""
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self._save_to_file()
+    
+    def _set_undo_log(self, undo_log: Optional[List[Tuple[Any, str, Any]]]) -> None:
+        """Memasang (atau melepas) undo log ke database dan semua tabel"""
+        self._undo_log = undo_log
+        for table in self.tables.values():
+            table._undo_log = undo_log
+    
+    def _record_undo(self, op: str, info: Any) -> None:
+        """Mencatat informasi pembatalan operasi tabel jika transaksi aktif"""
+        if self._undo_log is not None:
+            self._undo_log.append((self, op, info))
+    
+    def _revert_change(self, op: str, info: Any) -> None:
+        """Membatalkan create_table/drop_table dari undo log"""
+        if op == 'create_table':
+            self.tables.pop(info)._undo_log = None
+        elif op == 'drop_table':
+            name, table, position = info
+            items = list(self.tables.items())
+            items.insert(position, (name, table))
+            self.tables.clear()
+            self.tables.update(items)
+        else:
+            raise DatabaseError(f"Operasi undo tidak dikenal: {op}")
+    
+    def _rollback_to(self, mark: int) -> None:
+        """Membatalkan semua operasi di undo log setelah posisi mark"""
+        while len(self._undo_log) > mark:
+            target, op, info = self._undo_log.pop()
+            target._revert_change(op, info)
+    
+    @contextmanager
+    def batch(self):
+        """
+        Mengelompokkan banyak perubahan menjadi satu penyimpanan terenkripsi
+        
+        create_table, drop_table dan mutasi tabel di dalam blok tidak langsung
+        disimpan; database disimpan sekali saat blok terluar selesai (juga
+        jika terjadi exception, karena batch tidak memiliki rollback).
+        
+        Example:
+            >>> with db.batch():
+            ...     for i in range(50):
+            ...         db.create_table(f"tabel_{i}", columns)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._dirty = False
+                self._save_to_file()
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Transaksi dengan satu penyimpanan saat commit dan rollback saat gagal
+        
+        Perubahan dicatat di undo log (nilai lama baris yang diubah, list baris
+        sebelum delete, tabel yang dibuat/dihapus), sehingga rollback tidak
+        membutuhkan deep copy database. Transaksi bersarang berlaku sebagai
+        savepoint: exception di dalamnya hanya membatalkan perubahan miliknya.
+        
+        Example:
+            >>> with db.transaction():
+            ...     users.insert_data(name="A")
+            ...     users.update_data(lambda r: r['id'] == 1, name="B")
+        
+        Raises:
+            Exception dari dalam blok (setelah rollback) atau DatabaseError
+            jika penyimpanan saat commit gagal
+        """
+        outermost = self._undo_log is None
+        if outermost:
+            self._set_undo_log([])
+        
+        mark = len(self._undo_log)
+        was_dirty = self._dirty
+        self._batch_depth += 1
+        try:
+            yield self
+            if self._batch_depth == 1 and self._dirty:
+                self._save_to_file()
+                self._dirty = False
+        except BaseException:
+            self._rollback_to(mark)
+            self._dirty = was_dirty
+            raise
+        finally:
+            self._batch_depth -= 1
+            if outermost:
+                self._set_undo_log(None)
+    
+    # =========================================================================
+    # SESSION KEY
+    # =========================================================================
+    
+    def _session_encryptor(self) -> TextEncryptor:
+        """
+        Encryptor sesi yang dipakai ulang oleh setiap penyimpanan
+        
+        Salt (dan key hasil PBKDF2) hanya dibuat sekali per password, sehingga
+        create_table, drop_table dan save tidak menjalankan KDF lagi.
+        """
+        if self._encryptor is None:
+            self._encryptor = TextEncryptor(self.password, cipher=self.cipher or DEFAULT_CIPHER)
+        return self._encryptor
+    
+    def _adopt_file_encryptor(self, encryptor: TextEncryptor) -> None:
+        """Memakai salt dan cipher file yang dimuat sebagai key sesi"""
+        self.cipher = self.cipher or encryptor.cipher
+        # Cipher berbeda dari file: penyimpanan berikutnya mengenkripsi ulang
+        self._encryptor = encryptor if encryptor.cipher == self.cipher else None
+    
+    def clear_session_key(self) -> None:
+        """
+        Melupakan key sesi dan mengeluarkan key password ini dari cache
+        
+        Penyimpanan berikutnya akan membuat salt dan key baru.
+        """
+        self._encryptor = None
+        evict_key(self.password)
+    
+    def _serialize_table_meta(self, table: Table) -> Dict[str, Any]:
+        """Mengkonversi metadata tabel (tanpa data) ke dictionary"""
+        serialized = {
+            'columns': {},
+            'auto_increment': table._auto_increment
+        }
+        
+        for col_name, col_def in table.columns.items():
+            serialized['columns'][col_name] = {
+                'data_type': col_def.data_type.__name__,
+                'min_length': col_def.min_length,
+                'max_length': col_def.max_length,
+                'nullable': col_def.nullable,
+                'default_value': col_def.default_value
+            }
+        
+        if table._indexes:
+            serialized['indexes'] = table.get_indexes()
+        
+        if table._fulltext:
+            serialized['fulltext'] = table._dump_fulltext()
+        
+        if table._zone_map is not None:
+            serialized['zone_map'] = table.get_zone_map()
+        
+        if table.layout != Table.layout:
+            serialized['layout'] = table.layout
+        
+        return serialized
+    
     def _serialize_to_dict(self) -> Dict[str, Any]:
         """Mengkonversi database ke dictionary untuk serialisasi"""
         serialized = {
@@ -653,69 +3564,219 @@ class Database:
         }
         
         for table_name, table in self.tables.items():
-            serialized['tables'][table_name] = {
-                'columns': {},
-                'data': table.data,
-                'auto_increment': table._auto_increment
-            }
-            
-            for col_name, col_def in table.columns.items():
-                serialized['tables'][table_name]['columns'][col_name] = {
-                    'data_type': col_def.data_type.__name__,
-                    'min_length': col_def.min_length,
-                    'max_length': col_def.max_length,
-                    'nullable': col_def.nullable,
-                    'default_value': col_def.default_value
-                }
+            serialized['tables'][table_name] = self._serialize_table_meta(table)
+            serialized['tables'][table_name]['data'] = table.data
         
         return serialized
     
+    def _deserialize_table(self, table_name: str, table_data: Dict[str, Any]) -> Table:
+        """Merekonstruksi tabel (tanpa data) dari metadata tersimpan"""
+        # Rekonstruksi kolom
+        columns = {}
+        for col_name, col_def_data in table_data.get('columns', {}).items():
+            # Konversi string type ke actual type
+            type_mapping = {
+                'String': String,
+                'Number': Number,
+                'Integer': Integer,
+                'Float': Float,
+                'Boolean': Boolean,
+                'str': str,
+                'int': int,
+                'float': float,
+                'bool': bool,
+                'NoneType': type(None)
+            }
+            
+            data_type = type_mapping.get(col_def_data['data_type'], str)
+            
+            column_def = Column(
+                name=col_name,
+                data_type=data_type,
+                min_length=col_def_data['min_length'],
+                max_length=col_def_data['max_length'],
+                nullable=col_def_data['nullable'],
+                default_value=col_def_data['default_value']
+            )
+            columns[col_name] = column_def
+        
+        # Buat tabel
+        table_class = ColumnarTable if table_data.get('layout') == ColumnarTable.layout else Table
+        table = table_class(table_name, columns)
+        table._auto_increment = table_data.get('auto_increment', 1)
+        for column, definition in table_data.get('indexes', {}).items():
+            table._define_index(column, definition.get('kind', HashIndex.kind), definition.get('unique', False))
+        for column, definition in table_data.get('fulltext', {}).items():
+            table._fulltext[column] = FullTextIndex(column, definition.get('tokenizer', DEFAULT_TOKENIZER))
+        if 'zone_map' in table_data:
+            table._zone_map = ZoneMap(columns, **table_data['zone_map'])
+        self._attach_table(table)
+        return table
+    
     def _deserialize_from_dict(self, data: Dict[str, Any]) -> None:
         """Mengkonversi dictionary ke database"""
         try:
             self.tables.clear()
             
             for table_name, table_data in data.get('tables', {}).items():
-                # Rekonstruksi kolom
-                columns = {}
-                for col_name, col_def_data in table_data.get('columns', {}).items():
-                    # Konversi string type ke actual type
-                    type_mapping = {
-                        'str': str,
-                        'int': int,
-                        'float': float,
-                        'bool': bool,
-                        'NoneType': type(None)
-                    }
-                    
-                    data_type = type_mapping.get(col_def_data['data_type'], str)
-                    
-                    column_def = Column(
-                        name=col_name,
-                        data_type=data_type,
-                        min_length=col_def_data['min_length'],
-                        max_length=col_def_data['max_length'],
-                        nullable=col_def_data['nullable'],
-                        default_value=col_def_data['default_value']
-                    )
-                    columns[col_name] = column_def
-                
-                # Buat tabel
-                table = Table(table_name, columns)
+                table = self._deserialize_table(table_name, table_data)
                 table.data = table_data['data']
-                table._auto_increment = table_data.get('auto_increment', 1)
-                
+                table._load_fulltext_states(table_data.get('fulltext', {}))
                 self.tables[table_name] = table
                 
         except Exception as e:
             raise DatabaseError(f"Gagal memuat data database: {e}")
     
+    def _deserialize_from_directory(self, segmented_file: SegmentedFile) -> None:
+        """Memuat direktori tabel; data tiap tabel didekripsi saat diakses"""
+        try:
+            directory = segmented_file.read_directory()
+            self.tables.clear()
+            
+            for table_name, entry in directory.get('tables', {}).items():
+                table = self._deserialize_table(table_name, entry)
+                table._set_lazy_data(partial(segmented_file.read_table, table_name), entry.get('rows', 0))
+                table._segment_reader = partial(segmented_file.read_segments, table_name)
+                table._load_fulltext_states(entry.get('fulltext', {}))
+                self.tables[table_name] = table
+            
+            self._checkpoint = directory.get('checkpoint')
+            self.compression = self.compression or directory.get('compression', COMPRESSION_NONE)
+            self.row_encoding = self.row_encoding or directory.get('row_encoding', ROW_ENCODING_JSON)
+            self._adopt_file_encryptor(segmented_file.encryptor)
+            self._segmented_file = segmented_file
+            
+        except Exception as e:
+            raise DatabaseError(f"Gagal memuat data database: {e}")
+    
+    def _deserialize_from_stream(self, streamed_file: StreamedFile) -> None:
+        """
+        Memuat metadata database dari file stream; baris tetap di file
+        
+        Setiap tabel dibuat lazy: iter_data/select_data membaca barisnya
+        langsung dari stream (memori terbatas), dan tabel baru dimuat penuh
+        saat Table.data atau index dibutuhkan.
+        """
+        try:
+            header = streamed_file.read_header()
+            self.tables.clear()
+            
+            for table_name, entry in header.get('tables', {}).items():
+                table = self._deserialize_table(table_name, entry)
+                table._set_lazy_data(partial(streamed_file.read_table, table_name), entry.get('rows', 0))
+                table._row_stream = partial(streamed_file.iter_table, table_name)
+                table._load_fulltext_states(entry.get('fulltext', {}))
+                self.tables[table_name] = table
+            
+            self._checkpoint = streamed_file.header.get('checkpoint')
+            self.compression = self.compression or streamed_file.compression
+            self._adopt_file_encryptor(streamed_file.encryptor)
+            
+        except Exception as e:
+            raise DatabaseError(f"Gagal memuat data database: {e}")
+    
+    def _save_stream(self, checkpoint: str) -> None:
+        """Menyimpan database sebagai stream terenkripsi (tanpa string JSON penuh)"""
+        header = {
+            'name': self.name,
+            'checkpoint': checkpoint,
+            'tables': {
+                table_name: self._serialize_table_meta(table)
+                for table_name, table in self.tables.items()
+            }
+        }
+        
+        # Tabel yang belum dimuat disalin baris demi baris dari file lama
+        table_rows = {table_name: table._iter_rows() for table_name, table in self.tables.items()}
+        row_counts = {table_name: table._row_count() for table_name, table in self.tables.items()}
+        StreamedFile.write(
+            self.file_path, self.password, header, table_rows, row_counts,
+            self._session_encryptor(), compression=self.compression or COMPRESSION_NONE
+        )
+    
+    def _save_segmented(self, checkpoint: str) -> None:
+        """Menyimpan database dalam format tersegmentasi"""
+        directory = {
+            'name': self.name,
+            'checkpoint': checkpoint,
+            'tables': {
+                table_name: self._serialize_table_meta(table)
+                for table_name, table in self.tables.items()
+            }
+        }
+        
+        encryptor = self._session_encryptor()
+        compression = self.compression or COMPRESSION_NONE
+        row_encoding = self.row_encoding or ROW_ENCODING_JSON
+        segmented_file = self._segmented_file
+        
+        if (segmented_file is not None
+                and segmented_file.can_update(encryptor, compression, row_encoding)
+                and segmented_file.garbage_ratio() <= MAX_GARBAGE_RATIO):
+            # Hanya tabel kotor yang dienkripsi ulang; segmen tabel lain dipakai ulang
+            table_rows = {
+                table_name: table.data 
+                for table_name, table in self.tables.items() if table.is_dirty
+            }
+            segmented_file.update(directory, table_rows, self.segment_rows)
+            return
+        
+        # Akses table.data memuat tabel lazy sebelum file lama ditimpa
+        table_rows = {table_name: table.data for table_name, table in self.tables.items()}
+        if segmented_file is None:
+            segmented_file = SegmentedFile(self.file_path, self.password)
+        segmented_file.password = self.password
+        segmented_file.save(
+            directory, table_rows, self.segment_rows, encryptor, compression, row_encoding
+        )
+        self._segmented_file = segmented_file
+    
+    def _save_binary(self, checkpoint: str) -> None:
+        """Menyimpan database sebagai payload codec biner dalam satu file terenkripsi"""
+        meta = {
+            'name': self.name,
+            'checkpoint': checkpoint,
+            'tables': {
+                table_name: self._serialize_table_meta(table)
+                for table_name, table in self.tables.items()
+            }
+        }
+        
+        table_rows = {table_name: table.data for table_name, table in self.tables.items()}
+        save(encode_database(meta, table_rows), self.password, self.file_path,
+             self._session_encryptor(), compression=self.compression or COMPRESSION_NONE)
+    
+    def _mark_clean(self) -> None:
+        """Menandai semua tabel sesuai dengan isi file utama"""
+        if self.storage_format != 'segmented':
+            self._segmented_file = None
+        for table in self.tables.values():
+            table._dirty = False
+    
     def _save_to_file(self) -> None:
         """Menyimpan database ke file dengan enkripsi"""
         try:
-            serialized_data = self._serialize_to_dict()
-            data_str = json.dumps(serialized_data, indent=4)
-            save(data_str, self.password, self.file_path)
+            checkpoint = os.urandom(16).hex()
+            if self.storage_format == 'segmented':
+                self._save_segmented(checkpoint)
+            elif self.storage_format == 'stream':
+                self._save_stream(checkpoint)
+            elif self.row_encoding == ROW_ENCODING_BINARY:
+                self._save_binary(checkpoint)
+            else:
+                serialized_data = self._serialize_to_dict()
+                serialized_data['checkpoint'] = checkpoint
+                data_str = json.dumps(serialized_data, indent=4)
+                save(data_str, self.password, self.file_path, self._session_encryptor(),
+                     compression=self.compression or COMPRESSION_NONE)
+            self._checkpoint = checkpoint
+            self._mark_clean()
+            
+            # Semua mutasi sudah ada di file utama, WAL dapat dikosongkan
+            if self._wal is not None:
+                self._wal.reset(checkpoint, self.password, self._session_encryptor())
+            elif os.path.exists(self.wal_path):
+                os.remove(self.wal_path)
         except Exception as e:
             raise DatabaseError(f"Gagal menyimpan database: {e}")
     
@@ -723,8 +3784,27 @@ class Database:
         """Memuat database dari file dengan dekripsi"""
         try:
             if os.path.exists(self.file_path):
-                data_dict = json.loads(load(self.password, self.file_path))
-                self._deserialize_from_dict(data_dict)
+                if is_segmented_file(self.file_path):
+                    self.storage_format = self.storage_format or 'segmented'
+                    self._deserialize_from_directory(SegmentedFile(self.file_path, self.password))
+                elif is_stream_file(self.file_path):
+                    self.storage_format = self.storage_format or 'stream'
+                    self._deserialize_from_stream(StreamedFile(self.file_path, self.password))
+                else:
+                    payload = load_bytes(self.password, self.file_path)
+                    if is_binary_payload(payload):
+                        self.row_encoding = self.row_encoding or ROW_ENCODING_BINARY
+                        data_dict = decode_database(payload)
+                    else:
+                        data_dict = json.loads(payload)
+                    self._deserialize_from_dict(data_dict)
+                    self._checkpoint = data_dict.get('checkpoint')
+                    # Salt file menjadi key sesi (key sudah ada di cache dari dekripsi)
+                    file_cipher, salt, file_compression = read_header(self.file_path)
+                    self.compression = self.compression or file_compression
+                    self._adopt_file_encryptor(TextEncryptor(self.password, salt, file_cipher))
+                self._mark_clean()
+                self._replay_wal()
                     
         except PasswordValueError:
             raise PasswordValueError("Password salah atau file database korup")
@@ -742,6 +3822,7 @@ class Database:
         """
         if new_password:
             self.password = new_password
+            self._encryptor = None
         self._save_to_file()
     
     def backup(self, backup_path: str, backup_password: Optional[str] = None) -> None:
@@ -758,13 +3839,27 @@ class Database:
         save(data_str, backup_password, backup_path)
     
     @classmethod
-    def load_from_file(cls, file_path: str, password: str) -> 'Database':
+    def load_from_file(
+        cls, 
+        file_path: str, 
+        password: str, 
+        wal: bool = False,
+        storage_format: Optional[str] = None,
+        cipher: Optional[str] = None,
+        compression: Optional[str] = None,
+        row_encoding: Optional[str] = None
+    ) -> 'Database':
         """
         Memuat database dari file yang sudah ada
         
         Args:
             file_path: Path file database
             password: Password untuk dekripsi
+            wal: True untuk mengaktifkan write-ahead log
+            storage_format: Format untuk penyimpanan berikutnya (None = ikuti file)
+            cipher: Cipher untuk penyimpanan berikutnya (None = ikuti file)
+            compression: Kompresi untuk penyimpanan berikutnya (None = ikuti file)
+            row_encoding: Encoding baris untuk penyimpanan berikutnya (None = ikuti file)
             
         Returns:
             Instance Database
@@ -777,11 +3872,23 @@ class Database:
         storage_path = os.path.dirname(file_path)
         
         # Buat instance database
-        db = cls(name, password, storage_path, create_new=False)
+        db = cls(name, password, storage_path, create_new=False, wal=wal,
+                 storage_format=storage_format, cipher=cipher, compression=compression,
+                 row_encoding=row_encoding)
         return db
     
     @classmethod
-    def create_new(cls, name: str, password: str, storage_path: str = ".") -> 'Database':
+    def create_new(
+        cls, 
+        name: str, 
+        password: str, 
+        storage_path: str = ".", 
+        wal: bool = False,
+        storage_format: Optional[str] = None,
+        cipher: Optional[str] = None,
+        compression: Optional[str] = None,
+        row_encoding: Optional[str] = None
+    ) -> 'Database':
         """
         Membuat database baru
         
@@ -789,11 +3896,18 @@ class Database:
             name: Nama database
             password: Password untuk enkripsi
             storage_path: Path penyimpanan
+            wal: True untuk mengaktifkan write-ahead log
+            storage_format: 'json' (default), 'segmented' atau 'stream'
+            cipher: 'fernet' (default), 'aes-gcm' atau 'chacha20-poly1305'
+            compression: 'none' (default), 'zlib', 'lzma' atau 'bz2'
+            row_encoding: 'json' (default) atau 'binary'
             
         Returns:
             Instance Database baru
         """
-        return cls(name, password, storage_path, create_new=True)
+        return cls(name, password, storage_path, create_new=True, wal=wal,
+                   storage_format=storage_format, cipher=cipher, compression=compression,
+                   row_encoding=row_encoding)
     
     def get_database_info(self) -> Dict[str, Any]:
         """Mengembalikan informasi database"""
@@ -807,6 +3921,11 @@ class Database:
             'file_path': self.file_path,
             'table_count': len(self.tables),
             'encrypted': True,
+            'storage_format': self.storage_format,
+            'cipher': self.cipher,
+            'compression': self.compression,
+            'row_encoding': self.row_encoding,
+            'wal': self._wal is not None,
             'tables': table_info
         }
     
@@ -36,11 +36,17 @@ from .encrypted import (
     decrypt,
     save,
     load,
+    save_stream,
+    load_stream,
+    clear_key_cache,
+    evict_key,
     PasswordValueError,
 )
 
 from .loader import loader
 
+from .query import col, Expr
+
 from .__type__ import String, Number, Integer, Float, Boolean
 
 __all__ = [
@@ -55,9 +61,17 @@ __all__ = [
     'decrypt',
     'save',
     'load',
+    'save_stream',
+    'load_stream',
+    'clear_key_cache',
+    'evict_key',
     
     # semi/sub Encryption utilities
-    'loader'
+    'loader',
+    
+    # Query expressions
+    'col',
+    'Expr',
     
     # Types
     "String",
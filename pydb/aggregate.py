@@ -0,0 +1,174 @@
+import builtins
+from functools import partial
+from operator import is_not, methodcaller
+from typing import Dict, List, Any, Optional, Callable, Iterable, Tuple, Union
+
+# =============================================================================
+# AGREGASI
+# =============================================================================
+#
+# Agregasi hash satu lintasan: baris dikelompokkan sekali ke dictionary
+# kunci grup -> baris, lalu setiap fungsi agregat dihitung per grup dengan
+# builtin (sum/min/max/len) atas list nilai kolom, bukan akumulator Python
+# per baris.
+#
+# Nilai None diabaikan seperti SQL: sum/avg/min/max dari kolom tanpa nilai
+# menghasilkan None, count(kolom) hanya menghitung nilai bukan None.
+#
+# Nama hasil: 'count' (jumlah baris), 'count_<kolom>', 'sum_<kolom>',
+# 'avg_<kolom>', 'min_<kolom>', 'max_<kolom>'.
+
+AGGREGATE_FUNCTIONS = ('count', 'sum', 'avg', 'min', 'max')
+
+_not_none = partial(is_not, None)
+
+# Spesifikasi satu agregat: (fungsi, kolom atau None untuk count baris, nama hasil)
+AggregateSpec = Tuple[str, Optional[str], str]
+
+
+def build_specs(requested: Dict[str, Any]) -> List[AggregateSpec]:
+    """
+    Normalisasi argumen agregat menjadi list spesifikasi
+
+    Args:
+        requested: {fungsi: kolom | list kolom | True (khusus count)};
+                   '*' di list kolom count berarti count baris
+
+    Returns:
+        List (fungsi, kolom, nama hasil); tanpa argumen = count baris
+
+    Raises:
+        ValueError: Jika fungsi atau argumennya tidak valid
+    """
+    specs: List[AggregateSpec] = []
+    for function in AGGREGATE_FUNCTIONS:
+        columns = requested.get(function)
+        if columns is None or columns is False:
+            continue
+
+        if columns is True:
+            if function != 'count':
+                raise ValueError(f"{function} membutuhkan nama kolom")
+            specs.append(('count', None, 'count'))
+            continue
+
+        if isinstance(columns, str):
+            columns = [columns]
+        for column in columns:
+            if not isinstance(column, str):
+                raise ValueError(f"Nama kolom untuk {function} harus string, bukan {column!r}")
+            if column == '*':
+                if function != 'count':
+                    raise ValueError(f"{function} membutuhkan nama kolom")
+                specs.append(('count', None, 'count'))
+                continue
+            specs.append((function, column, f"{function}_{column}"))
+
+    unknown = set(requested) - set(AGGREGATE_FUNCTIONS)
+    if unknown:
+        raise ValueError(f"Fungsi agregat tidak dikenal: {', '.join(sorted(unknown))}")
+
+    return specs or [('count', None, 'count')]
+
+
+def column_values(rows: List[Dict[str, Any]], column: str) -> List[Any]:
+    """Nilai kolom yang bukan None (map/filter di level C)"""
+    return list(filter(_not_none, map(methodcaller('get', column), rows)))
+
+
+def aggregate_values(function: str, values: List[Any]) -> Any:
+    """
+    Menghitung satu fungsi agregat atas nilai bukan None
+
+    Args:
+        function: 'count', 'sum', 'avg', 'min' atau 'max'
+        values: Nilai kolom (tanpa None)
+
+    Returns:
+        Hasil agregat (None jika tidak ada nilai, kecuali count)
+    """
+    if function == 'count':
+        return len(values)
+    if not values:
+        return None
+    if function == 'sum':
+        return builtins.sum(values)
+    if function == 'avg':
+        return builtins.sum(values) / len(values)
+    if function == 'min':
+        return builtins.min(values)
+    return builtins.max(values)
+
+
+def _aggregate_group(
+    rows: List[Dict[str, Any]],
+    specs: List[AggregateSpec],
+    values_of: Callable[[List[Dict[str, Any]], str], List[Any]]
+) -> Dict[str, Any]:
+    """Semua agregat untuk satu kelompok baris"""
+    result: Dict[str, Any] = {}
+    cache: Dict[str, List[Any]] = {}
+    for function, column, name in specs:
+        if column is None:
+            result[name] = len(rows)
+            continue
+        values = cache.get(column)
+        if values is None:
+            values = cache[column] = values_of(rows, column)
+        result[name] = aggregate_values(function, values)
+    return result
+
+
+def group_keys(rows: List[Dict[str, Any]], group_by: List[str]) -> Iterable[Any]:
+    """Kunci grup per baris: nilai kolom (satu kolom) atau tuple nilai kolom"""
+    if len(group_by) == 1:
+        return map(methodcaller('get', group_by[0]), rows)
+    return zip(*[map(methodcaller('get', column), rows) for column in group_by])
+
+
+def aggregate_rows(
+    rows: Iterable[Dict[str, Any]],
+    specs: List[AggregateSpec],
+    group_by: Optional[List[str]] = None,
+    values_of: Callable[[List[Dict[str, Any]], str], List[Any]] = column_values,
+    keys_of: Callable[[List[Dict[str, Any]], List[str]], Iterable[Any]] = group_keys
+) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Menghitung agregat, opsional per kelompok
+
+    Args:
+        rows: Baris yang diagregasi (sudah disaring); dengan values_of dan
+              keys_of sendiri dapat berupa penanda baris lain (misalnya posisi)
+        specs: Hasil build_specs
+        group_by: Kolom pengelompokan (None = satu hasil untuk semua baris)
+        values_of: Fungsi pengambil nilai kolom bukan None dari list baris
+        keys_of: Fungsi pengambil kunci grup per baris dari list baris
+
+    Returns:
+        Dictionary hasil jika tanpa group_by, selain itu list dictionary per
+        kelompok (kolom grup + hasil agregat) sesuai urutan kemunculan grup
+
+    Raises:
+        TypeError: Jika nilai kolom tidak dapat dijumlahkan/dibandingkan
+    """
+    if not isinstance(rows, (list, tuple, range)):
+        rows = list(rows)
+
+    if not group_by:
+        return _aggregate_group(rows, specs, values_of)
+
+    groups: Dict[Any, List[Dict[str, Any]]] = {}
+    for row, key in zip(rows, keys_of(rows, group_by)):
+        bucket = groups.get(key)
+        if bucket is None:
+            groups[key] = [row]
+        else:
+            bucket.append(row)
+    keys = ((key,) for key in groups) if len(group_by) == 1 else iter(groups)
+
+    results = []
+    for key, bucket in zip(keys, groups.values()):
+        result = dict(zip(group_by, key))
+        result.update(_aggregate_group(bucket, specs, values_of))
+        results.append(result)
+    return results
@@ -0,0 +1,152 @@
+from collections import OrderedDict
+from typing import Dict, List, Any, Hashable, Optional
+
+# =============================================================================
+# CACHE LRU
+# =============================================================================
+#
+# LRUCache    : cache generik dengan batas jumlah entri; entri yang paling
+#               lama tidak dipakai dibuang lebih dulu (OrderedDict)
+# ResultCache : cache hasil query per tabel; setiap entri hanya berlaku untuk
+#               satu nomor versi tabel (Table._version naik pada setiap
+#               mutasi), sehingga hasil basi tidak pernah dikembalikan
+#
+# Keduanya mencatat statistik hit/miss untuk diperiksa lewat stats().
+
+# Penanda entri tidak ditemukan (None dapat menjadi nilai yang valid)
+MISSING = object()
+
+
+class LRUCache:
+    """
+    Cache LRU dengan batas jumlah entri dan statistik hit/miss
+    """
+
+    def __init__(self, max_entries: int = 128):
+        """
+        Inisialisasi cache kosong
+
+        Args:
+            max_entries: Jumlah maksimum entri (minimal 1)
+
+        Raises:
+            ValueError: Jika max_entries bukan bilangan bulat positif
+        """
+        if isinstance(max_entries, bool) or not isinstance(max_entries, int) or max_entries < 1:
+            raise ValueError(f"max_entries harus bilangan bulat positif, bukan {max_entries!r}")
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """
+        Mengambil entri dan menandainya sebagai baru dipakai
+
+        Returns:
+            Nilai entri, atau default jika tidak ada
+        """
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Menyimpan entri, membuang entri terlama jika cache penuh"""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Menghapus semua entri (statistik tetap)"""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Statistik cache: hits, misses, hit_rate, entries, max_entries, evictions"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'evictions': self.evictions,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(entries={len(self._entries)}, max_entries={self.max_entries})"
+
+
+class ResultCache(LRUCache):
+    """
+    Cache hasil query yang terikat pada nomor versi tabel
+
+    Semua entri dibuang sekaligus begitu versi tabel berubah, karena setiap
+    mutasi dapat mengubah hasil query mana pun.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        super().__init__(max_entries)
+        self.version: Optional[int] = None
+        self.invalidations = 0
+        self.bypassed = 0
+
+    def _sync(self, version: int) -> None:
+        """Membuang entri milik versi tabel sebelumnya"""
+        if version != self.version:
+            if self._entries:
+                self.invalidations += 1
+                self._entries.clear()
+            self.version = version
+
+    def lookup(self, key: Hashable, version: int) -> Any:
+        """
+        Mengambil hasil query untuk versi tabel saat ini
+
+        Returns:
+            Hasil tersimpan, atau MISSING
+        """
+        self._sync(version)
+        return self.get(key)
+
+    def store(self, key: Hashable, version: int, value: Any) -> None:
+        """Menyimpan hasil query untuk versi tabel saat ini"""
+        self._sync(version)
+        self.put(key, value)
+
+    def stats(self) -> Dict[str, Any]:
+        """Statistik LRUCache beserta invalidations (pergantian versi) dan bypassed (kondisi lambda)"""
+        stats = super().stats()
+        stats['invalidations'] = self.invalidations
+        stats['bypassed'] = self.bypassed
+        return stats
+
+
+def freeze(value: Any) -> Hashable:
+    """
+    Mengubah argumen query (list/tuple/dict bersarang) menjadi bentuk hashable
+
+    Raises:
+        TypeError: Jika ada nilai yang tidak hashable
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(map(freeze, value))
+    if isinstance(value, dict):
+        return tuple(sorted((key, freeze(item)) for key, item in value.items()))
+    hash(value)
+    return value
+
+
+def copy_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Salinan list baris beserta dictionary-nya"""
+    return list(map(dict, rows))
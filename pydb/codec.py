@@ -0,0 +1,378 @@
+import json
+import struct
+from itertools import accumulate
+from typing import Dict, List, Any, Tuple, Iterable
+
+# =============================================================================
+# CODEC BARIS BINER
+# =============================================================================
+#
+# Blok baris (satu potongan baris satu tabel), kolom demi kolom sesuai urutan
+# Table.columns:
+#   jumlah baris (varint)
+#   untuk setiap kolom:
+#     bitmap null (ceil(n/8) byte, hanya untuk kolom nullable)
+#     nilai baris yang tidak null:
+#       Integer : section varint zigzag
+#       Float   : IEEE 754 double (big-endian)
+#       String  : section panjang per nilai (karakter) | panjang UTF-8 (varint)
+#                 | UTF-8 seluruh nilai
+#       Boolean : 1 byte per nilai
+#       Number  : tag per nilai (0 int, 1 float) | section varint | double
+#
+# Section varint = panjang section dalam byte (varint) | varint zigzag, agar
+# decoder dapat mengiterasi section tanpa indeks per byte.
+#
+# Nama kolom tidak diulang per baris; skema diambil dari metadata tabel
+# yang sudah tersimpan di file.
+
+ROW_ENCODING_JSON = 'json'
+ROW_ENCODING_BINARY = 'binary'
+ROW_ENCODINGS = (ROW_ENCODING_JSON, ROW_ENCODING_BINARY)
+
+# Payload database biner (pengganti dokumen JSON pada format 'json'):
+#   MAGIC (8 byte) | panjang metadata (varint) | metadata JSON
+#   | untuk setiap tabel sesuai urutan metadata: panjang blok (varint) | blok
+BINARY_MAGIC = b"PYDBROW1"
+
+_NUMBER_INT = 0
+_NUMBER_FLOAT = 1
+
+
+def _write_varints(values: Iterable[int], out: bytearray) -> None:
+    """Menulis bilangan bulat sebagai varint zigzag"""
+    append = out.append
+    for value in values:
+        value = (value << 1) if value >= 0 else ((-value << 1) - 1)
+        while value >= 0x80:
+            append((value & 0x7F) | 0x80)
+            value >>= 7
+        append(value)
+
+
+def _read_varints(section: bytes) -> List[int]:
+    """Membaca seluruh varint zigzag dalam satu section"""
+    values = []
+    append = values.append
+    value = shift = 0
+    for byte in section:
+        if byte < 0x80:
+            value |= byte << shift
+            append((value >> 1) ^ -(value & 1))
+            value = shift = 0
+        else:
+            value |= (byte & 0x7F) << shift
+            shift += 7
+    if shift:
+        raise ValueError("Varint terpotong")
+    return values
+
+
+def _write_varint(value: int, out: bytearray) -> None:
+    """Menulis satu varint zigzag"""
+    _write_varints((value,), out)
+
+
+def _read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    """Membaca satu varint zigzag, mengembalikan (nilai, offset berikutnya)"""
+    value = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return (value >> 1) ^ -(value & 1), offset
+        shift += 7
+
+
+def _write_varint_section(values: Iterable[int], out: bytearray) -> None:
+    """Menulis deretan varint diawali panjang section dalam byte"""
+    section = bytearray()
+    _write_varints(values, section)
+    _write_varint(len(section), out)
+    out += section
+
+
+def _read_varint_section(data: bytes, offset: int, count: int) -> Tuple[List[int], int]:
+    """Membaca section varint berisi tepat count nilai"""
+    size, offset = _read_varint(data, offset)
+    values = _read_varints(data[offset:offset + size])
+    if len(values) != count:
+        raise ValueError("Jumlah nilai varint tidak sesuai")
+    return values, offset + size
+
+
+def _encode_integers(values: List[Any], out: bytearray) -> None:
+    _write_varint_section(values, out)
+
+
+def _decode_integers(data: bytes, offset: int, count: int) -> Tuple[List[Any], int]:
+    return _read_varint_section(data, offset, count)
+
+
+def _encode_floats(values: List[Any], out: bytearray) -> None:
+    out += struct.pack(f">{len(values)}d", *values)
+
+
+def _decode_floats(data: bytes, offset: int, count: int) -> Tuple[List[Any], int]:
+    end = offset + 8 * count
+    return list(struct.unpack(f">{count}d", data[offset:end])), end
+
+
+def _encode_strings(values: List[Any], out: bytearray) -> None:
+    values = [str(value) for value in values]
+    _write_varint_section(map(len, values), out)
+    blob = "".join(values).encode('utf-8', 'surrogatepass')
+    _write_varint(len(blob), out)
+    out += blob
+
+
+def _decode_strings(data: bytes, offset: int, count: int) -> Tuple[List[Any], int]:
+    lengths, offset = _read_varint_section(data, offset, count)
+    size, offset = _read_varint(data, offset)
+    text = data[offset:offset + size].decode('utf-8', 'surrogatepass')
+
+    ends = list(accumulate(lengths))
+    starts = [0] + ends[:-1]
+    return [text[start:end] for start, end in zip(starts, ends)], offset + size
+
+
+def _encode_booleans(values: List[Any], out: bytearray) -> None:
+    out += bytes(1 if value else 0 for value in values)
+
+
+def _decode_booleans(data: bytes, offset: int, count: int) -> Tuple[List[Any], int]:
+    end = offset + count
+    return [byte == 1 for byte in data[offset:end]], end
+
+
+def _encode_numbers(values: List[Any], out: bytearray) -> None:
+    tags = bytes(_NUMBER_INT if isinstance(value, int) else _NUMBER_FLOAT for value in values)
+    out += tags
+    _encode_integers([value for value in values if isinstance(value, int)], out)
+    _encode_floats([float(value) for value in values if not isinstance(value, int)], out)
+
+
+def _decode_numbers(data: bytes, offset: int, count: int) -> Tuple[List[Any], int]:
+    tags = data[offset:offset + count]
+    offset += count
+    float_count = tags.count(_NUMBER_FLOAT)
+    integers, offset = _read_varint_section(data, offset, count - float_count)
+    floats, offset = _decode_floats(data, offset, float_count)
+
+    integers.reverse()
+    floats.reverse()
+    return [integers.pop() if tag == _NUMBER_INT else floats.pop() for tag in tags], offset
+
+
+_CODECS = {
+    'Integer': (_encode_integers, _decode_integers),
+    'int': (_encode_integers, _decode_integers),
+    'Float': (_encode_floats, _decode_floats),
+    'float': (_encode_floats, _decode_floats),
+    'String': (_encode_strings, _decode_strings),
+    'str': (_encode_strings, _decode_strings),
+    'Boolean': (_encode_booleans, _decode_booleans),
+    'bool': (_encode_booleans, _decode_booleans),
+    'Number': (_encode_numbers, _decode_numbers),
+}
+
+
+class RowCodec:
+    """
+    Encoder/decoder baris biner berdasarkan skema kolom tabel
+    """
+
+    def __init__(self, columns: Dict[str, Dict[str, Any]]):
+        """
+        Inisialisasi codec dari metadata kolom
+
+        Args:
+            columns: Metadata kolom sesuai urutan tabel, seperti yang ditulis
+                     Database._serialize_table_meta ({nama: {'data_type', 'nullable', ...}})
+        """
+        self.names = list(columns)
+        self._columns = []
+
+        for name, meta in columns.items():
+            data_type = meta.get('data_type')
+            if data_type not in _CODECS:
+                raise ValueError(f"Tipe data kolom '{name}' tidak didukung codec biner: {data_type}")
+            encode, decode = _CODECS[data_type]
+            self._columns.append((name, bool(meta.get('nullable', True)), encode, decode))
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, Any]) -> 'RowCodec':
+        """
+        Membuat codec langsung dari dictionary Column milik Table
+
+        Args:
+            columns: Table.columns
+
+        Returns:
+            Instance RowCodec
+        """
+        return cls({
+            name: {'data_type': column.data_type.__name__, 'nullable': column.nullable}
+            for name, column in columns.items()
+        })
+
+    def encode(self, rows: List[Dict[str, Any]]) -> bytes:
+        """
+        Mengkodekan list baris menjadi satu blok biner
+
+        Args:
+            rows: Baris data tabel
+
+        Returns:
+            Blok biner
+
+        Raises:
+            ValueError: Jika baris tidak sesuai skema
+        """
+        out = bytearray()
+        _write_varint(len(rows), out)
+
+        for name, nullable, encode, _ in self._columns:
+            values = [row.get(name) for row in rows]
+
+            if nullable:
+                bitmap = bytearray((len(values) + 7) // 8)
+                for position, value in enumerate(values):
+                    if value is None:
+                        bitmap[position >> 3] |= 1 << (position & 7)
+                out += bitmap
+                values = [value for value in values if value is not None]
+            elif None in values:
+                raise ValueError(f"Kolom '{name}' tidak nullable tetapi berisi None")
+
+            try:
+                encode(values, out)
+            except (TypeError, ValueError, struct.error) as e:
+                raise ValueError(f"Nilai kolom '{name}' tidak sesuai tipe data: {e}")
+
+        if rows and any(len(row) > len(self._columns) for row in rows):
+            unknown = next(key for row in rows for key in row if key not in self.names)
+            raise ValueError(f"Kolom '{unknown}' tidak ada di skema tabel")
+
+        return bytes(out)
+
+    def decode(self, data: bytes, offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        Mendekode blok biner menjadi list baris
+
+        Args:
+            data: Bytes berisi blok
+            offset: Posisi awal blok
+
+        Returns:
+            List baris (dictionary)
+
+        Raises:
+            ValueError: Jika blok rusak
+        """
+        try:
+            count, offset = _read_varint(data, offset)
+            columns = []
+
+            for _, nullable, _, decode in self._columns:
+                if not nullable:
+                    values, offset = decode(data, offset, count)
+                    columns.append(values)
+                    continue
+
+                bitmap_size = (count + 7) // 8
+                bitmap = data[offset:offset + bitmap_size]
+                offset += bitmap_size
+                if bitmap.count(0) == bitmap_size:
+                    values, offset = decode(data, offset, count)
+                    columns.append(values)
+                    continue
+
+                nulls = [bool(bitmap[position >> 3] & (1 << (position & 7))) for position in range(count)]
+
+                values, offset = decode(data, offset, count - sum(nulls))
+                values.reverse()
+                columns.append([None if is_null else values.pop() for is_null in nulls])
+        except (IndexError, struct.error, UnicodeDecodeError) as e:
+            raise ValueError(f"Blok baris biner rusak: {e}")
+
+        names = self.names
+        return [dict(zip(names, values)) for values in zip(*columns)] if columns else [{} for _ in range(count)]
+
+    def __repr__(self) -> str:
+        return f"RowCodec(columns={self.names})"
+
+
+# =============================================================================
+# PAYLOAD DATABASE
+# =============================================================================
+
+def is_binary_payload(data: bytes) -> bool:
+    """
+    Cek apakah plaintext database berupa payload biner
+
+    Args:
+        data: Plaintext hasil dekripsi
+
+    Returns:
+        True jika diawali magic payload biner
+    """
+    return data[:len(BINARY_MAGIC)] == BINARY_MAGIC
+
+
+def encode_database(meta: Dict[str, Any], table_rows: Dict[str, List[Dict[str, Any]]]) -> bytes:
+    """
+    Mengkodekan database lengkap menjadi payload biner
+
+    Args:
+        meta: Metadata database; meta['tables'][nama] berisi metadata kolom
+              tiap tabel (tanpa data)
+        table_rows: Baris data per tabel
+
+    Returns:
+        Payload biner
+    """
+    meta_bytes = json.dumps(meta).encode('utf-8')
+    out = bytearray(BINARY_MAGIC)
+    _write_varint(len(meta_bytes), out)
+    out += meta_bytes
+
+    for table_name, entry in meta.get('tables', {}).items():
+        block = RowCodec(entry.get('columns', {})).encode(table_rows.get(table_name, []))
+        _write_varint(len(block), out)
+        out += block
+
+    return bytes(out)
+
+
+def decode_database(data: bytes) -> Dict[str, Any]:
+    """
+    Mendekode payload biner ke dictionary database (format yang sama dengan JSON)
+
+    Args:
+        data: Payload biner
+
+    Returns:
+        Dictionary database dengan 'data' di setiap tabel
+
+    Raises:
+        ValueError: Jika payload bukan payload biner atau rusak
+    """
+    if not is_binary_payload(data):
+        raise ValueError("Bukan payload database biner")
+
+    try:
+        size, offset = _read_varint(data, len(BINARY_MAGIC))
+        meta = json.loads(data[offset:offset + size])
+        offset += size
+
+        for entry in meta.get('tables', {}).values():
+            size, offset = _read_varint(data, offset)
+            entry['data'] = RowCodec(entry.get('columns', {})).decode(data[offset:offset + size])
+            offset += size
+    except (IndexError, UnicodeDecodeError) as e:
+        raise ValueError(f"Payload database biner rusak: {e}")
+
+    return meta
+
@@ -0,0 +1,781 @@
+import sys
+from abc import ABC, abstractmethod
+from array import array
+from heapq import merge
+from functools import partial
+from itertools import accumulate, chain, compress, filterfalse, repeat
+from operator import add, eq, ne, lt, le, gt, ge, is_, is_not, methodcaller
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Sequence, Tuple, Union
+from .query import Expr, And, Or, Not, Comparison, In, Between, StringMatch
+
+# =============================================================================
+# PENYIMPANAN KOLUMNAR
+# =============================================================================
+#
+# Alternatif penyimpanan in-memory untuk Table: setiap kolom disimpan sebagai
+# satu vektor bertipe, bukan satu dictionary per baris.
+#
+#   Integer / Float / Boolean : array.array ('q' / 'd' / 'b')
+#   String                    : buffer UTF-8 (bytearray) + array offset dan panjang
+#   Number / lainnya          : list Python biasa
+#
+# Nilai None dicatat di bitmap null (1 bit per baris; slot array di posisi
+# tersebut berisi 0). Kondisi col() dievaluasi per kolom dengan map/compress
+# di level C dan menghasilkan list posisi baris; dictionary baris hanya dibuat
+# untuk hasil yang dikembalikan.
+#
+# Nilai yang tidak muat di vektor bertipe (misalnya integer di luar 64 bit
+# atau data lama dengan tipe berbeda) membuat vektor kolom tersebut beralih
+# ke list Python biasa.
+
+Positions = Optional[Sequence[int]]
+
+# Operator "nilai <op> konstanta" ditulis sebagai partial(op', konstanta)(nilai)
+_REFLECTED = {'==': eq, '!=': ne, '<': gt, '<=': ge, '>': lt, '>=': le}
+_OPERATORS = {'==': eq, '!=': ne, '<': lt, '<=': le, '>': gt, '>=': ge}
+
+# Konversi bitmap <-> mask satu byte per baris (1 = None)
+_EXPAND = [bytes((byte >> bit) & 1 for bit in range(8)) for byte in range(256)]
+_PACK = {pattern: byte for byte, pattern in enumerate(_EXPAND)}
+_INVERT = bytes.maketrans(b'\x00\x01', b'\x01\x00')
+
+_is_none = partial(is_, None)
+_not_none = partial(is_not, None)
+
+# Tipe kolom -> typecode array.array
+_TYPECODES = {
+    'Integer': 'q', 'int': 'q',
+    'Float': 'd', 'float': 'd',
+    'Boolean': 'b', 'bool': 'b',
+}
+_STRING_TYPES = ('String', 'str')
+
+
+class NullBitmap:
+    """
+    Bitmap None satu bit per baris
+
+    Byte hanya dialokasikan sampai posisi None terakhir, sehingga kolom tanpa
+    None tidak memakai memori bitmap sama sekali.
+    """
+
+    def __init__(self, size: int = 0):
+        self._bits = bytearray()
+        self.size = size
+        self.count = 0
+
+    def __getitem__(self, position: int) -> bool:
+        byte = position >> 3
+        return byte < len(self._bits) and bool(self._bits[byte] >> (position & 7) & 1)
+
+    def append(self, is_null: bool) -> None:
+        self.size += 1
+        if is_null:
+            self.set(self.size - 1, True)
+
+    def set(self, position: int, is_null: bool) -> None:
+        """Menandai (atau menghapus tanda) None pada satu posisi"""
+        if self[position] == is_null:
+            return
+        byte = position >> 3
+        if is_null:
+            if byte >= len(self._bits):
+                self._bits.extend(bytes(byte + 1 - len(self._bits)))
+            self._bits[byte] |= 1 << (position & 7)
+            self.count += 1
+        else:
+            self._bits[byte] &= ~(1 << (position & 7)) & 0xFF
+            self.count -= 1
+
+    def pop(self) -> None:
+        self.set(self.size - 1, False)
+        self.size -= 1
+
+    def mask(self) -> bytes:
+        """Satu byte per baris: 1 untuk None, 0 untuk nilai"""
+        expanded = b''.join(map(_EXPAND.__getitem__, self._bits))[:self.size]
+        return expanded + bytes(self.size - len(expanded))
+
+    def valid_mask(self) -> bytes:
+        """Satu byte per baris: 1 untuk nilai, 0 untuk None"""
+        return self.mask().translate(_INVERT)
+
+    @classmethod
+    def from_mask(cls, mask: bytes) -> 'NullBitmap':
+        """Bitmap dari mask satu byte per baris (1 = None)"""
+        bitmap = cls(len(mask))
+        last = mask.rfind(1)
+        if last >= 0:
+            padded = mask[:last + 1] + bytes(-(last + 1) % 8)
+            bitmap._bits = bytearray(map(_PACK.__getitem__, (padded[i:i + 8] for i in range(0, len(padded), 8))))
+            bitmap.count = mask.count(1)
+        return bitmap
+
+    def extend(self, mask: bytes) -> None:
+        """Menambahkan mask satu byte per baris di akhir bitmap"""
+        if mask.count(1):
+            combined = NullBitmap.from_mask(self.mask() + mask)
+            self._bits, self.count = combined._bits, combined.count
+        self.size += len(mask)
+
+    def compact(self, keep: bytes) -> 'NullBitmap':
+        """Bitmap baru yang hanya berisi posisi dengan keep = 1"""
+        if not self.count:
+            return NullBitmap(keep.count(1))
+        return NullBitmap.from_mask(bytes(compress(self.mask(), keep)))
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._bits)
+
+
+class _MaskedVector(ABC):
+    """
+    Basis vektor bertipe dengan bitmap None
+
+    Subclass menyediakan _raw_values(positions) (nilai tanpa memperhatikan
+    None) beserta append/get/set/pop/compact.
+    """
+
+    nulls: NullBitmap
+
+    def __len__(self) -> int:
+        return self.nulls.size
+
+    @abstractmethod
+    def _raw_values(self, positions: Positions) -> List[Any]:
+        """Nilai mentah di posisi tertentu (slot None berisi placeholder)"""
+
+    def values(self, positions: Positions = None) -> List[Any]:
+        """Nilai kolom (None untuk baris bernilai None), seluruh baris atau posisi tertentu"""
+        values = self._raw_values(positions)
+        if self.nulls.count:
+            mask = self.nulls.mask()
+            if positions is None:
+                for position in compress(range(len(mask)), mask):
+                    values[position] = None
+            else:
+                values = [None if mask[position] else value for position, value in zip(positions, values)]
+        return values
+
+    def present(self, positions: Positions = None) -> Tuple[Sequence[int], Sequence[Any]]:
+        """Posisi dan nilai baris yang tidak bernilai None"""
+        if not self.nulls.count:
+            return (range(len(self)) if positions is None else positions), self._raw_values(positions)
+        valid = self.nulls.valid_mask()
+        if positions is None:
+            positions = list(compress(range(len(valid)), valid))
+        else:
+            positions = list(compress(positions, map(valid.__getitem__, positions)))
+        return positions, self._raw_values(positions)
+
+    def null_positions(self, positions: Positions = None) -> List[int]:
+        """Posisi baris bernilai None"""
+        if not self.nulls.count:
+            return []
+        mask = self.nulls.mask()
+        if positions is None:
+            return list(compress(range(len(mask)), mask))
+        return list(compress(positions, map(mask.__getitem__, positions)))
+
+    def _scan(self, predicate: Any, raw: Iterable[Any], positions: Positions, keep_nulls: bool) -> List[int]:
+        """
+        Posisi dengan predicate(nilai mentah) benar, dalam satu lintasan di level C
+
+        Slot None berisi placeholder, jadi hasilnya hanya dikoreksi jika
+        predicate(placeholder) berbeda dari keep_nulls (None ikut atau tidak).
+        """
+        base = range(len(self)) if positions is None else positions
+        selected = list(compress(base, map(predicate, raw)))
+        if not self.nulls.count or bool(predicate(self.placeholder)) == keep_nulls:
+            return selected
+        if keep_nulls:
+            return list(merge(selected, self.null_positions(positions)))
+        valid = self.nulls.valid_mask()
+        return list(compress(selected, map(valid.__getitem__, selected)))
+
+
+class _ObjectValues:
+    """Basis vektor list Python (None disimpan langsung di list)"""
+
+    _data: List[Any]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def values(self, positions: Positions = None) -> List[Any]:
+        if positions is None:
+            return list(self._data)
+        return list(map(self._data.__getitem__, positions))
+
+    def present(self, positions: Positions = None) -> Tuple[Sequence[int], Sequence[Any]]:
+        values = self.values(positions)
+        flags = list(map(_not_none, values))
+        base = range(len(values)) if positions is None else positions
+        return list(compress(base, flags)), list(compress(values, flags))
+
+    def null_positions(self, positions: Positions = None) -> List[int]:
+        base = range(len(self._data)) if positions is None else positions
+        return list(compress(base, map(_is_none, self.values(positions))))
+
+
+class _Comparisons(ABC):
+    """
+    Evaluasi kondisi satu kolom menjadi list posisi (menaik)
+
+    Akses nilai (__len__, values, present, null_positions) disediakan oleh
+    basis penyimpanan (_MaskedVector atau _ObjectValues).
+    """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Jumlah baris"""
+
+    def compare(self, op: str, value: Any, positions: Positions = None) -> List[int]:
+        """
+        Posisi baris dengan nilai <op> value
+
+        Semantik mengikuti ekspresi col(): None hanya sama dengan None, selalu
+        berbeda (!=) dari nilai lain, dan tidak memenuhi perbandingan urutan.
+
+        Raises:
+            TypeError: Jika nilai kolom tidak dapat dibandingkan dengan value
+        """
+        if value is None and op in ('==', '!='):
+            if op == '==':
+                return self.null_positions(positions)
+            return list(self.present(positions)[0])
+        if op == '!=':
+            base = range(len(self)) if positions is None else positions
+            return list(compress(base, map(partial(ne, value), self.values(positions))))
+        present_positions, values = self.present(positions)
+        return list(compress(present_positions, map(partial(_REFLECTED[op], value), values)))
+
+    def isin(self, values: Sequence[Any], positions: Positions = None) -> List[int]:
+        """Posisi baris dengan nilai di dalam values"""
+        try:
+            contains = frozenset(values).__contains__
+        except TypeError:
+            contains = tuple(values).__contains__
+        base = range(len(self)) if positions is None else positions
+        return list(compress(base, map(contains, self.values(positions))))
+
+    def match(self, kind: str, text: str, positions: Positions = None) -> List[int]:
+        """Posisi baris string yang diawali (startswith) atau memuat (contains) text"""
+        present_positions, values = self.present(positions)
+        method = methodcaller('startswith' if kind == 'startswith' else '__contains__', text)
+        return list(compress(present_positions, map(method, values)))
+
+    @abstractmethod
+    def values(self, positions: Positions = None) -> List[Any]:
+        """Nilai kolom (None untuk baris bernilai None)"""
+
+    @abstractmethod
+    def present(self, positions: Positions = None) -> Tuple[Sequence[int], Sequence[Any]]:
+        """Posisi dan nilai baris yang tidak bernilai None"""
+
+    @abstractmethod
+    def null_positions(self, positions: Positions = None) -> List[int]:
+        """Posisi baris bernilai None"""
+
+
+class ArrayVector(_MaskedVector, _Comparisons):
+    """Kolom numerik/boolean dalam array.array bertipe"""
+
+    placeholder = 0
+
+    def __init__(self, typecode: str):
+        self.typecode = typecode
+        self._data = array(typecode)
+        self.nulls = NullBitmap()
+        # Boolean disimpan sebagai 0/1 dan dikembalikan sebagai bool
+        self._cast = bool if typecode == 'b' else None
+
+    def _raw_values(self, positions: Positions) -> List[Any]:
+        data = self._data
+        values = data.tolist() if positions is None else list(map(data.__getitem__, positions))
+        if self._cast is not None:
+            values = list(map(self._cast, values))
+        return values
+
+    def present(self, positions: Positions = None) -> Tuple[Sequence[int], Sequence[Any]]:
+        if positions is None and not self.nulls.count and self._cast is None:
+            # Array dipakai langsung (sum/min/max/map tanpa salinan list)
+            return range(len(self._data)), self._data
+        return super().present(positions)
+
+    def _raw(self, positions: Positions) -> Iterable[Any]:
+        """Isi array apa adanya (0 di slot None, boolean sebagai 0/1)"""
+        return self._data if positions is None else map(self._data.__getitem__, positions)
+
+    def compare(self, op: str, value: Any, positions: Positions = None) -> List[int]:
+        if value is None:
+            return super().compare(op, value, positions)
+        return self._scan(partial(_REFLECTED[op], value), self._raw(positions), positions, op == '!=')
+
+    def isin(self, values: Sequence[Any], positions: Positions = None) -> List[int]:
+        try:
+            contains = frozenset(values).__contains__
+        except TypeError:
+            return super().isin(values, positions)
+        return self._scan(contains, self._raw(positions), positions, None in values)
+
+    def get(self, position: int) -> Any:
+        if self.nulls.count and self.nulls[position]:
+            return None
+        value = self._data[position]
+        return value if self._cast is None else self._cast(value)
+
+    def append(self, value: Any) -> None:
+        """
+        Raises:
+            TypeError, OverflowError: Jika nilai tidak muat di array
+        """
+        self._data.append(0 if value is None else value)
+        self.nulls.append(value is None)
+
+    def extend(self, values: List[Any]) -> None:
+        flags = bytes(map(_is_none, values))
+        if flags.count(1):
+            values = [0 if value is None else value for value in values]
+        size = len(self._data)
+        try:
+            self._data.extend(values)
+        except (TypeError, OverflowError):
+            del self._data[size:]
+            raise
+        self.nulls.extend(flags)
+
+    def set(self, position: int, value: Any) -> None:
+        self._data[position] = 0 if value is None else value
+        self.nulls.set(position, value is None)
+
+    def pop(self) -> None:
+        self._data.pop()
+        self.nulls.pop()
+
+    def compact(self, keep: bytes) -> 'ArrayVector':
+        """Vektor baru yang hanya berisi posisi dengan keep = 1"""
+        vector = ArrayVector(self.typecode)
+        vector._data = array(self.typecode, compress(self._data, keep))
+        vector.nulls = self.nulls.compact(keep)
+        return vector
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._data) * self._data.itemsize + self.nulls.nbytes
+
+
+class StringVector(_MaskedVector, _Comparisons):
+    """
+    Kolom string: satu buffer UTF-8 dengan array offset dan panjang per baris
+
+    Update menulis nilai baru di akhir buffer; ruang nilai lama dipadatkan
+    ulang jika lebih dari separuh buffer.
+    """
+
+    placeholder = b''
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._starts = array('q')
+        self._lengths = array('q')
+        self.nulls = NullBitmap()
+        # Buffer ASCII dapat didekode sekali lalu diiris per karakter
+        self._ascii = True
+        self._garbage = 0
+
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        if not isinstance(value, str):
+            raise TypeError(f"Kolom string tidak dapat menyimpan {type(value).__name__}")
+        return value.encode('utf-8', 'surrogatepass')
+
+    def _slices(self, positions: Positions) -> Iterator[slice]:
+        """Irisan buffer per baris"""
+        if positions is None:
+            starts, lengths = self._starts, self._lengths
+        else:
+            starts = list(map(self._starts.__getitem__, positions))
+            lengths = list(map(self._lengths.__getitem__, positions))
+        return map(slice, starts, map(add, starts, lengths))
+
+    def _raw(self, positions: Positions) -> Iterable[bytes]:
+        """Nilai sebagai bytes UTF-8 (b'' di slot None)"""
+        return map(bytes(self._buffer).__getitem__, self._slices(positions))
+
+    def _raw_values(self, positions: Positions) -> List[Any]:
+        if positions is not None and len(positions) * 4 < len(self._starts):
+            # Sedikit baris: dekode langsung per irisan tanpa menyalin buffer
+            decode = methodcaller('decode', 'utf-8', 'surrogatepass')
+            return list(map(decode, map(self._buffer.__getitem__, self._slices(positions))))
+        if self._ascii:
+            text = self._buffer.decode('ascii')
+            return list(map(text.__getitem__, self._slices(positions)))
+        # Nilai yang sama cukup didekode sekali
+        pieces = list(self._raw(positions))
+        decoded = {piece: piece.decode('utf-8', 'surrogatepass') for piece in set(pieces)}
+        return list(map(decoded.__getitem__, pieces))
+
+    # Urutan bytes UTF-8 sama dengan urutan code point string, sehingga
+    # perbandingan dan pencocokan dilakukan tanpa mendekode buffer
+
+    def compare(self, op: str, value: Any, positions: Positions = None) -> List[int]:
+        if not isinstance(value, str):
+            return super().compare(op, value, positions)
+        encoded = value.encode('utf-8', 'surrogatepass')
+        if op == '==':
+            # Saring dulu berdasarkan panjang bytes, baru bandingkan isinya
+            base = range(len(self)) if positions is None else positions
+            lengths = self._lengths if positions is None else map(self._lengths.__getitem__, positions)
+            positions = list(compress(base, map(partial(eq, len(encoded)), lengths)))
+        return self._scan(partial(_REFLECTED[op], encoded), self._raw(positions), positions, op == '!=')
+
+    def isin(self, values: Sequence[Any], positions: Positions = None) -> List[int]:
+        encoded = frozenset(value.encode('utf-8', 'surrogatepass') for value in values if isinstance(value, str))
+        return self._scan(encoded.__contains__, self._raw(positions), positions, None in values)
+
+    def match(self, kind: str, text: str, positions: Positions = None) -> List[int]:
+        if not isinstance(text, str):
+            return super().match(kind, text, positions)
+        encoded = text.encode('utf-8', 'surrogatepass')
+        method = methodcaller('startswith' if kind == 'startswith' else '__contains__', encoded)
+        return self._scan(method, self._raw(positions), positions, False)
+
+    def get(self, position: int) -> Any:
+        if self.nulls.count and self.nulls[position]:
+            return None
+        start = self._starts[position]
+        return self._buffer[start:start + self._lengths[position]].decode('utf-8', 'surrogatepass')
+
+    def append(self, value: Any) -> None:
+        """
+        Raises:
+            TypeError: Jika nilai bukan string
+        """
+        encoded = b'' if value is None else self._encode(value)
+        self._starts.append(len(self._buffer))
+        self._lengths.append(len(encoded))
+        self._buffer += encoded
+        if self._ascii and not encoded.isascii():
+            self._ascii = False
+        self.nulls.append(value is None)
+
+    def extend(self, values: List[Any]) -> None:
+        if not values:
+            return
+        flags = bytes(map(_is_none, values))
+        encoded = [b'' if value is None else self._encode(value) for value in values]
+        lengths = list(map(len, encoded))
+        self._starts.extend(accumulate(chain((len(self._buffer),), lengths[:-1]), add))
+        self._lengths.extend(lengths)
+        block = b''.join(encoded)
+        self._buffer += block
+        if self._ascii and not block.isascii():
+            self._ascii = False
+        self.nulls.extend(flags)
+
+    def set(self, position: int, value: Any) -> None:
+        encoded = b'' if value is None else self._encode(value)
+        self._garbage += self._lengths[position]
+        self._starts[position] = len(self._buffer)
+        self._lengths[position] = len(encoded)
+        self._buffer += encoded
+        if self._ascii and not encoded.isascii():
+            self._ascii = False
+        self.nulls.set(position, value is None)
+        if self._garbage * 2 > len(self._buffer):
+            self._repack(self.compact(b'\x01' * len(self)))
+
+    def pop(self) -> None:
+        start = self._starts.pop()
+        length = self._lengths.pop()
+        if start + length == len(self._buffer):
+            del self._buffer[start:]
+        else:
+            self._garbage += length
+        self.nulls.pop()
+
+    def _repack(self, vector: 'StringVector') -> None:
+        self._buffer, self._starts, self._lengths = vector._buffer, vector._starts, vector._lengths
+        self.nulls, self._garbage = vector.nulls, 0
+
+    def compact(self, keep: bytes) -> 'StringVector':
+        """Vektor baru (buffer dipadatkan) yang hanya berisi posisi dengan keep = 1"""
+        vector = StringVector()
+        starts = list(compress(self._starts, keep))
+        lengths = list(compress(self._lengths, keep))
+        buffer = bytes(self._buffer)
+        vector._buffer = bytearray(b''.join(map(buffer.__getitem__, map(slice, starts, map(add, starts, lengths)))))
+        vector._starts = array('q', accumulate(chain((0,), lengths[:-1]), add)) if lengths else array('q')
+        vector._lengths = array('q', lengths)
+        vector.nulls = self.nulls.compact(keep)
+        vector._ascii = self._ascii
+        return vector
+
+    @property
+    def nbytes(self) -> int:
+        return (len(self._buffer) + len(self._starts) * self._starts.itemsize
+                + len(self._lengths) * self._lengths.itemsize + self.nulls.nbytes)
+
+
+class ObjectVector(_ObjectValues, _Comparisons):
+    """Kolom list Python biasa (Number, tipe lain, atau hasil peralihan vektor bertipe)"""
+
+    def __init__(self, values: Optional[List[Any]] = None):
+        self._data: List[Any] = [] if values is None else values
+
+    def get(self, position: int) -> Any:
+        return self._data[position]
+
+    def append(self, value: Any) -> None:
+        self._data.append(value)
+
+    def extend(self, values: List[Any]) -> None:
+        self._data.extend(values)
+
+    def set(self, position: int, value: Any) -> None:
+        self._data[position] = value
+
+    def pop(self) -> None:
+        self._data.pop()
+
+    def compact(self, keep: bytes) -> 'ObjectVector':
+        return ObjectVector(list(compress(self._data, keep)))
+
+    @property
+    def nbytes(self) -> int:
+        return sys.getsizeof(self._data) + sum(map(sys.getsizeof, filter(_not_none, self._data)))
+
+
+Vector = Union[ArrayVector, StringVector, ObjectVector]
+
+# Kesalahan yang membuat vektor bertipe beralih ke list Python
+_PROMOTE_ERRORS = (TypeError, ValueError, OverflowError)
+
+
+def make_vector(type_name: str) -> Vector:
+    """Vektor kosong untuk tipe kolom (nama tipe seperti Column.get_data_type())"""
+    if type_name in _TYPECODES:
+        return ArrayVector(_TYPECODES[type_name])
+    if type_name in _STRING_TYPES:
+        return StringVector()
+    return ObjectVector()
+
+
+class ColumnStore:
+    """
+    Penyimpanan kolumnar untuk seluruh baris satu tabel
+
+    Baris dialamatkan dengan posisinya (0..len-1); delete memadatkan semua
+    vektor sehingga posisi baris setelahnya bergeser seperti list baris biasa.
+    Kolom di luar skema tidak disimpan.
+    """
+
+    def __init__(self, types: Dict[str, str]):
+        """
+        Args:
+            types: Nama kolom -> nama tipe (Column.get_data_type())
+        """
+        self._types = dict(types)
+        self._vectors: Dict[str, Vector] = {name: make_vector(type_name) for name, type_name in types.items()}
+        self._names = tuple(types)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _promote(self, column: str) -> Vector:
+        """Mengganti vektor bertipe kolom dengan list Python (isi dipertahankan)"""
+        vector = ObjectVector(self._vectors[column].values())
+        self._vectors[column] = vector
+        return vector
+
+    # -------------------------------------------------------------------------
+    # Mutasi
+    # -------------------------------------------------------------------------
+
+    def append(self, row: Dict[str, Any]) -> None:
+        """Menambahkan satu baris di akhir"""
+        for column, vector in self._vectors.items():
+            value = row.get(column)
+            try:
+                vector.append(value)
+            except _PROMOTE_ERRORS:
+                self._promote(column).append(value)
+        self._size += 1
+
+    def extend(self, rows: List[Dict[str, Any]]) -> None:
+        """Menambahkan banyak baris sekaligus (per kolom)"""
+        if not rows:
+            return
+        for column, vector in self._vectors.items():
+            values = list(map(methodcaller('get', column), rows))
+            try:
+                vector.extend(values)
+            except _PROMOTE_ERRORS:
+                self._promote(column).extend(values)
+        self._size += len(rows)
+
+    def set(self, position: int, column: str, value: Any) -> None:
+        """Mengganti nilai satu kolom pada satu baris"""
+        try:
+            self._vectors[column].set(position, value)
+        except _PROMOTE_ERRORS:
+            self._promote(column).set(position, value)
+
+    def pop(self) -> None:
+        """Menghapus baris terakhir"""
+        for vector in self._vectors.values():
+            vector.pop()
+        self._size -= 1
+
+    def delete(self, positions: Iterable[int]) -> Tuple[Dict[str, Vector], int]:
+        """
+        Menghapus baris pada posisi tertentu (vektor dipadatkan ulang)
+
+        Returns:
+            Snapshot vektor sebelum delete, untuk restore()
+        """
+        keep = bytearray(b'\x01') * self._size
+        for position in positions:
+            keep[position] = 0
+        keep = bytes(keep)
+
+        snapshot = (self._vectors, self._size)
+        self._vectors = {column: vector.compact(keep) for column, vector in self._vectors.items()}
+        self._size = keep.count(1)
+        return snapshot
+
+    def restore(self, snapshot: Tuple[Dict[str, Vector], int]) -> None:
+        """Mengembalikan isi store dari snapshot delete()"""
+        self._vectors, self._size = snapshot
+
+    # -------------------------------------------------------------------------
+    # Pembacaan
+    # -------------------------------------------------------------------------
+
+    def row(self, position: int) -> Dict[str, Any]:
+        """Dictionary satu baris (dibuat baru)"""
+        return {column: vector.get(position) for column, vector in self._vectors.items()}
+
+    def rows(self, positions: Positions = None) -> List[Dict[str, Any]]:
+        """Dictionary baris untuk seluruh tabel atau posisi tertentu (dibuat kolom demi kolom)"""
+        columns = [vector.values(positions) for vector in self._vectors.values()]
+        return list(map(dict, map(zip, repeat(self._names), zip(*columns))))
+
+    def iter_rows(self, positions: Positions = None) -> Iterator[Dict[str, Any]]:
+        """Dictionary baris satu per satu (untuk iterasi lazy)"""
+        return map(self.row, range(self._size) if positions is None else positions)
+
+    def values(self, column: str, positions: Positions = None) -> List[Any]:
+        """Nilai satu kolom (termasuk None)"""
+        return self._vectors[column].values(positions)
+
+    def present(self, column: str, positions: Positions = None) -> Sequence[Any]:
+        """Nilai satu kolom yang bukan None (dapat berupa array tanpa salinan)"""
+        return self._vectors[column].present(self._all_or(positions))[1]
+
+    def _all_or(self, positions: Positions) -> Positions:
+        """None jika positions mencakup seluruh baris berurutan"""
+        if isinstance(positions, range) and positions == range(self._size):
+            return None
+        return positions
+
+    # Hook aggregate_rows: baris diwakili posisinya
+    def aggregate_values(self, positions: Sequence[int], column: str) -> Sequence[Any]:
+        """Nilai bukan None kolom untuk posisi tertentu (values_of aggregate_rows)"""
+        return self.present(column, positions)
+
+    def group_keys(self, positions: Sequence[int], group_by: List[str]) -> Iterable[Any]:
+        """Kunci grup per posisi (keys_of aggregate_rows)"""
+        positions = self._all_or(positions)
+        if len(group_by) == 1:
+            return self.values(group_by[0], positions)
+        return zip(*[self.values(column, positions) for column in group_by])
+
+    # -------------------------------------------------------------------------
+    # Kondisi
+    # -------------------------------------------------------------------------
+
+    def select(self, expr: Expr, positions: Positions = None) -> List[int]:
+        """
+        Posisi baris (menaik) yang memenuhi ekspresi col()
+
+        And dievaluasi berurutan atas posisi yang tersisa; Or dan Not memakai
+        himpunan posisi. Jenis ekspresi lain dievaluasi per baris.
+
+        Args:
+            expr: Ekspresi kondisi
+            positions: Kandidat posisi (None = seluruh baris)
+
+        Raises:
+            TypeError: Jika nilai kolom tidak dapat dibandingkan
+        """
+        if isinstance(expr, And):
+            for operand in expr.operands:
+                positions = self.select(operand, positions)
+                if not positions:
+                    return []
+            return list(positions)
+
+        if isinstance(expr, Or):
+            matched = set()
+            for operand in expr.operands:
+                matched.update(self.select(operand, positions))
+            return sorted(matched)
+
+        base = range(self._size) if positions is None else positions
+        if isinstance(expr, Not):
+            excluded = set(self.select(expr.operand, positions))
+            return list(filterfalse(excluded.__contains__, base))
+
+        if isinstance(expr, Comparison):
+            if expr.is_constant:
+                return self._vectors[expr.column].compare(expr.op, expr.value, positions)
+            left = self.values(expr.column, positions)
+            right = self.values(expr.value.name, positions)
+            operator = _OPERATORS[expr.op]
+            if expr.op in ('==', '!='):
+                return list(compress(base, map(operator, left, right)))
+            return [
+                position for position, a, b in zip(base, left, right)
+                if a is not None and b is not None and operator(a, b)
+            ]
+
+        if isinstance(expr, In):
+            return self._vectors[expr.column].isin(expr.values, positions)
+
+        if isinstance(expr, Between):
+            vector = self._vectors[expr.column]
+            return vector.compare('<=', expr.high, vector.compare('>=', expr.low, positions))
+
+        if isinstance(expr, StringMatch):
+            return self._vectors[expr.column].match(expr.kind, expr.text, positions)
+
+        predicate = expr.compile()
+        return [position for position in base if predicate(self.row(position))]
+
+    # -------------------------------------------------------------------------
+    # Informasi
+    # -------------------------------------------------------------------------
+
+    def column_layout(self) -> Dict[str, str]:
+        """Jenis vektor per kolom ('array:q', 'string', 'object')"""
+        layout = {}
+        for column, vector in self._vectors.items():
+            if isinstance(vector, ArrayVector):
+                layout[column] = f"array:{vector.typecode}"
+            elif isinstance(vector, StringVector):
+                layout[column] = 'string'
+            else:
+                layout[column] = 'object'
+        return layout
+
+    @property
+    def nbytes(self) -> int:
+        """Perkiraan memori data kolom (byte)"""
+        return sum(vector.nbytes for vector in self._vectors.values())
+
+    def __repr__(self) -> str:
+        return f"ColumnStore(columns={len(self._vectors)}, rows={self._size}, bytes={self.nbytes})"
@@ -1,8 +1,16 @@
 import os
+import bz2
 import json
+import lzma
+import zlib
 import base64
-from typing import Union, Optional
+import struct
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Union, Optional, Tuple, Iterable, Iterator, BinaryIO
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
@@ -13,37 +21,472 @@ class PasswordValueError(SyntaxError, ValueError):
     def __repr__(self):
         return f"PasswordValueError({ErrorText})"
 
+# =============================================================================
+# CACHE DERIVED KEY (PBKDF2)
+# =============================================================================
+
+KDF_ALGORITHM = 'sha256'
+KDF_ITERATIONS = 100000
+KDF_LENGTH = 32
+KEY_CACHE_SIZE = 64
+
+class DerivedKeyCache:
+    """
+    Cache LRU terbatas untuk key hasil PBKDF2 di dalam satu proses
+    
+    Key cache adalah (digest SHA-256 password, salt, algoritma, iterasi,
+    panjang key), sehingga password asli tidak disimpan. Key disimpan sebagai
+    bytearray agar dapat ditimpa nol (zeroize) saat dikeluarkan dari cache;
+    salinan yang sudah dipakai oleh objek Fernet berada di luar kendali cache.
+    """
+    
+    def __init__(self, max_size: int = KEY_CACHE_SIZE):
+        """
+        Inisialisasi cache
+        
+        Args:
+            max_size: Jumlah key maksimal sebelum key terlama dikeluarkan
+        """
+        if max_size < 0:
+            raise ValueError("max_size tidak boleh negatif")
+        
+        self.max_size = max_size
+        self._keys: 'OrderedDict[Tuple, bytearray]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _cache_key(password: bytes, salt: bytes, iterations: int, length: int) -> Tuple:
+        return (hashlib.sha256(password).digest(), bytes(salt), KDF_ALGORITHM, iterations, length)
+    
+    @staticmethod
+    def _zeroize(key: bytearray) -> None:
+        for i in range(len(key)):
+            key[i] = 0
+    
+    def derive(
+        self, 
+        password: bytes, 
+        salt: bytes, 
+        iterations: int = KDF_ITERATIONS, 
+        length: int = KDF_LENGTH
+    ) -> bytes:
+        """
+        Mengembalikan key dari cache, atau menjalankan PBKDF2 jika belum ada
+        
+        Args:
+            password: Password dalam bytes
+            salt: Salt untuk key derivation
+            iterations: Jumlah iterasi PBKDF2
+            length: Panjang key dalam bytes
+            
+        Returns:
+            Key hasil derivasi
+        """
+        cache_key = self._cache_key(password, salt, iterations, length)
+        
+        with self._lock:
+            if cache_key in self._keys:
+                self._keys.move_to_end(cache_key)
+                return bytes(self._keys[cache_key])
+        
+        kdf = PBKDF2HMAC(
+            algorithm=hashes.SHA256(),
+            length=length,
+            salt=salt,
+            iterations=iterations,
+        )
+        key = kdf.derive(password)
+        
+        if self.max_size > 0:
+            with self._lock:
+                self._keys[cache_key] = bytearray(key)
+                self._keys.move_to_end(cache_key)
+                while len(self._keys) > self.max_size:
+                    _, evicted = self._keys.popitem(last=False)
+                    self._zeroize(evicted)
+        
+        return key
+    
+    def evict(self, password: Union[str, bytes], salt: Optional[bytes] = None) -> int:
+        """
+        Mengeluarkan (dan zeroize) key milik password tertentu
+        
+        Args:
+            password: Password yang key-nya akan dihapus
+            salt: Jika diisi, hanya key dengan salt ini yang dihapus
+            
+        Returns:
+            Jumlah key yang dihapus
+        """
+        if isinstance(password, str):
+            password = password.encode('utf-8')
+        digest = hashlib.sha256(password).digest()
+        
+        with self._lock:
+            matches = [
+                cache_key for cache_key in self._keys
+                if cache_key[0] == digest and (salt is None or cache_key[1] == bytes(salt))
+            ]
+            for cache_key in matches:
+                self._zeroize(self._keys.pop(cache_key))
+        
+        return len(matches)
+    
+    def clear(self) -> None:
+        """Mengosongkan cache dan zeroize semua key"""
+        with self._lock:
+            for key in self._keys.values():
+                self._zeroize(key)
+            self._keys.clear()
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def __repr__(self) -> str:
+        return f"DerivedKeyCache(size={len(self._keys)}, max_size={self.max_size})"
+
+# Cache global untuk seluruh proses
+key_cache = DerivedKeyCache()
+
+def clear_key_cache() -> None:
+    """Mengosongkan cache derived key dan zeroize semua key"""
+    key_cache.clear()
+
+def evict_key(password: str, salt: Optional[bytes] = None) -> int:
+    """
+    Mengeluarkan key milik password dari cache derived key
+    
+    Args:
+        password: Password yang key-nya akan dihapus
+        salt: Jika diisi, hanya key dengan salt ini yang dihapus
+        
+    Returns:
+        Jumlah key yang dihapus
+    """
+    return key_cache.evict(password, salt)
+
+# =============================================================================
+# CIPHER BACKEND
+# =============================================================================
+#
+# 'fernet'            : format lama, salt (16 byte) + token Fernet (base64)
+# 'aes-gcm'           : AES-256-GCM atas bytes mentah (akselerasi AES-NI)
+# 'chacha20-poly1305' : ChaCha20-Poly1305 atas bytes mentah
+#
+# Format berversi (AEAD, atau Fernet dengan kompresi):
+#   MAGIC (7 byte) | versi (1 byte) | id cipher (1 byte) | id kompresi (1 byte)
+#   | salt (16 byte) | nonce (12 byte) | ciphertext + tag
+# Header ikut diautentikasi: sebagai associated data (AEAD) atau, karena
+# Fernet tidak mendukung associated data, sebagai prefix plaintext yang
+# diperiksa setelah dekripsi.
+
+CIPHER_FERNET = 'fernet'
+CIPHER_AES_GCM = 'aes-gcm'
+CIPHER_CHACHA20 = 'chacha20-poly1305'
+DEFAULT_CIPHER = CIPHER_FERNET
+
+CIPHER_IDS = {
+    CIPHER_FERNET: 0,
+    CIPHER_AES_GCM: 1,
+    CIPHER_CHACHA20: 2,
+}
+CIPHERS = tuple(CIPHER_IDS)
+
+ENCRYPTED_MAGIC = b"PYDBENC"
+ENCRYPTED_VERSION = 3
+SALT_SIZE = 16
+NONCE_SIZE = 12
+_VERSIONED_HEADER_SIZE = len(ENCRYPTED_MAGIC) + 3 + SALT_SIZE
+
+def cipher_id(cipher: str) -> int:
+    """Mengembalikan id numerik cipher untuk header file"""
+    if cipher not in CIPHER_IDS:
+        raise ValueError(f"Cipher tidak didukung: {cipher} (pilihan: {', '.join(CIPHERS)})")
+    return CIPHER_IDS[cipher]
+
+def cipher_name(identifier: int) -> str:
+    """Mengembalikan nama cipher dari id numerik di header file"""
+    for name, value in CIPHER_IDS.items():
+        if value == identifier:
+            return name
+    raise PasswordValueError(f"Id cipher tidak dikenal: {identifier}")
+
+# =============================================================================
+# KOMPRESI
+# =============================================================================
+#
+# Kompresi dijalankan sebelum enkripsi (ciphertext tidak dapat dikompresi)
+# dan dicatat di header file. Semua metode berasal dari standard library.
+
+COMPRESSION_NONE = 'none'
+COMPRESSION_ZLIB = 'zlib'
+COMPRESSION_LZMA = 'lzma'
+COMPRESSION_BZ2 = 'bz2'
+
+COMPRESSION_IDS = {
+    COMPRESSION_NONE: 0,
+    COMPRESSION_ZLIB: 1,
+    COMPRESSION_LZMA: 2,
+    COMPRESSION_BZ2: 3,
+}
+COMPRESSIONS = tuple(COMPRESSION_IDS)
+
+def compression_id(compression: str) -> int:
+    """Mengembalikan id numerik kompresi untuk header file"""
+    if compression not in COMPRESSION_IDS:
+        raise ValueError(f"Kompresi tidak didukung: {compression} (pilihan: {', '.join(COMPRESSIONS)})")
+    return COMPRESSION_IDS[compression]
+
+def compression_name(identifier: int) -> str:
+    """Mengembalikan nama kompresi dari id numerik di header file"""
+    for name, value in COMPRESSION_IDS.items():
+        if value == identifier:
+            return name
+    raise PasswordValueError(f"Id kompresi tidak dikenal: {identifier}")
+
+class _NoCompression:
+    """Kompresor/dekompresor identitas untuk kompresi 'none'"""
+    
+    eof = True
+    unused_data = b""
+    
+    def compress(self, data: bytes) -> bytes:
+        return data
+    
+    def decompress(self, data: bytes, max_length: int = -1) -> bytes:
+        return data
+    
+    def flush(self) -> bytes:
+        return b""
+
+def compressor(compression: str):
+    """Membuat kompresor inkremental (compress/flush) untuk metode tertentu"""
+    compression_id(compression)
+    if compression == COMPRESSION_ZLIB:
+        return zlib.compressobj()
+    if compression == COMPRESSION_LZMA:
+        return lzma.LZMACompressor()
+    if compression == COMPRESSION_BZ2:
+        return bz2.BZ2Compressor()
+    return _NoCompression()
+
+def decompressor(compression: str):
+    """Membuat dekompresor inkremental (decompress) untuk metode tertentu"""
+    compression_id(compression)
+    if compression == COMPRESSION_ZLIB:
+        return zlib.decompressobj()
+    if compression == COMPRESSION_LZMA:
+        return lzma.LZMADecompressor()
+    if compression == COMPRESSION_BZ2:
+        return bz2.BZ2Decompressor()
+    return _NoCompression()
+
+def compress_data(data: bytes, compression: str) -> bytes:
+    """
+    Kompresi bytes sekaligus
+    
+    Args:
+        data: Bytes yang akan dikompresi
+        compression: 'none', 'zlib', 'lzma' atau 'bz2'
+        
+    Returns:
+        Bytes terkompresi
+    """
+    if compression == COMPRESSION_NONE:
+        return data
+    engine = compressor(compression)
+    return engine.compress(data) + engine.flush()
+
+def _decompress_pieces(engine, data: bytes) -> Iterator[bytes]:
+    """
+    Dekompresi input dengan output dibatasi DEFAULT_CHUNK_SIZE per potongan
+    
+    Input kecil yang mengembang sangat besar tidak pernah didekompresi
+    dalam satu panggilan.
+    
+    Raises:
+        PasswordValueError: Jika data terkompresi korup
+    """
+    pending = data or None
+    while pending is not None:
+        try:
+            piece = engine.decompress(pending, DEFAULT_CHUNK_SIZE)
+        except Exception as e:
+            raise PasswordValueError(f"Gagal dekompresi: data korup - {e}")
+        if piece:
+            yield piece
+        if engine.eof:
+            # Input setelah akhir data terkompresi tercatat di unused_data
+            return
+        # zlib menyisakan input di unconsumed_tail; lzma/bz2 menahan
+        # output sampai needs_input kembali True (dikuras dengan b"")
+        pending = getattr(engine, 'unconsumed_tail', b"") or None
+        if pending is None and not getattr(engine, 'needs_input', True):
+            pending = b""
+
+def decompress_data(data: bytes, compression: str) -> bytes:
+    """
+    Dekompresi bytes hasil compress_data
+    
+    Args:
+        data: Bytes terkompresi
+        compression: Metode kompresi yang tercatat di header
+        
+    Returns:
+        Bytes asli
+        
+    Raises:
+        PasswordValueError: Jika data korup, terpotong atau memiliki data tambahan
+    """
+    if compression == COMPRESSION_NONE:
+        return data
+    engine = decompressor(compression)
+    result = b"".join(_decompress_pieces(engine, data))
+    if not engine.eof:
+        raise PasswordValueError("Data terkompresi tidak lengkap")
+    if engine.unused_data:
+        raise PasswordValueError("Data tambahan setelah akhir data terkompresi")
+    return result
+
+def _split_header(encrypted_bytes: bytes) -> Tuple[str, str, bytes, Optional[bytes], int]:
+    """
+    Memisahkan header data terenkripsi
+    
+    Returns:
+        (cipher, kompresi, salt, header untuk associated data atau None, offset body)
+    """
+    if encrypted_bytes[:len(ENCRYPTED_MAGIC)] == ENCRYPTED_MAGIC:
+        if len(encrypted_bytes) <= len(ENCRYPTED_MAGIC):
+            raise PasswordValueError("Data terenkripsi tidak valid")
+        
+        version = encrypted_bytes[len(ENCRYPTED_MAGIC)]
+        if version != ENCRYPTED_VERSION:
+            raise PasswordValueError(f"Versi format enkripsi tidak didukung: {version}")
+        
+        if len(encrypted_bytes) < _VERSIONED_HEADER_SIZE:
+            raise PasswordValueError("Data terenkripsi tidak valid")
+        
+        header = bytes(encrypted_bytes[:_VERSIONED_HEADER_SIZE])
+        cipher = cipher_name(header[len(ENCRYPTED_MAGIC) + 1])
+        compression = compression_name(header[len(ENCRYPTED_MAGIC) + 2])
+        return cipher, compression, header[-SALT_SIZE:], header, _VERSIONED_HEADER_SIZE
+    
+    # Format lama (Fernet): salt + token
+    if len(encrypted_bytes) < SALT_SIZE:
+        raise PasswordValueError("Data terenkripsi tidak valid")
+    return CIPHER_FERNET, COMPRESSION_NONE, bytes(encrypted_bytes[:SALT_SIZE]), None, SALT_SIZE
+
+def _strip_bound_header(data: bytes, header: bytes) -> bytes:
+    """
+    Memverifikasi dan membuang header yang disisipkan di awal plaintext Fernet
+
+    Raises:
+        PasswordValueError: Jika header file tidak sama dengan header saat enkripsi
+    """
+    if data[:len(header)] != header:
+        raise PasswordValueError("Header data terenkripsi tidak cocok: data dimodifikasi")
+    return data[len(header):]
+
 class TextEncryptor:
     """
     Kelas untuk mengenkripsi dan mendekripsi teks menggunakan password
     """
     
-    def __init__(self, password: str, salt: Optional[bytes] = None):
+    def __init__(
+        self, 
+        password: Union[str, bytes], 
+        salt: Optional[bytes] = None, 
+        cipher: str = DEFAULT_CIPHER
+    ):
         """
         Inisialisasi encryptor dengan password
         
         Args:
             password: Password untuk enkripsi/dekripsi
             salt: Salt untuk key derivation (opsional)
+            cipher: 'fernet' (default), 'aes-gcm' atau 'chacha20-poly1305'
         """
         if not password:
             raise PasswordValueError("Password tidak boleh kosong")
         
-        self.password = password.encode('utf-8')
-        self.salt = salt or os.urandom(16)
-        self.fernet = self._generate_fernet_key()
+        cipher_id(cipher)
+        
+        self.password = password if isinstance(password, bytes) else password.encode('utf-8')
+        self.salt = salt or os.urandom(SALT_SIZE)
+        self.cipher = cipher
+        self._fernet: Optional[Fernet] = None
+        self._aead = None
     
-    def _generate_fernet_key(self) -> Fernet:
-        """Generate Fernet key dari password"""
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=self.salt,
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(self.password))
+    @property
+    def fernet(self) -> Fernet:
+        """Instance Fernet, key diturunkan saat pertama kali dibutuhkan"""
+        if self._fernet is None:
+            self._fernet = self._generate_fernet_key()
+        return self._fernet
+    
+    @property
+    def aead(self) -> Union[AESGCM, ChaCha20Poly1305]:
+        """Instance cipher AEAD (AES-GCM/ChaCha20-Poly1305) untuk salt ini"""
+        if self._aead is None:
+            key = key_cache.derive(self.password, self.salt)
+            self._aead = AESGCM(key) if self.cipher == CIPHER_AES_GCM else ChaCha20Poly1305(key)
+        return self._aead
+    
+    def _generate_fernet_key(self, salt: Optional[bytes] = None) -> Fernet:
+        """Generate Fernet key dari password (melalui cache derived key)"""
+        key = base64.urlsafe_b64encode(key_cache.derive(self.password, salt or self.salt))
         return Fernet(key)
     
+    def _for_header(self, cipher: str, salt: bytes) -> 'TextEncryptor':
+        """Encryptor untuk cipher dan salt dari header data (memakai cache key)"""
+        if cipher == self.cipher and salt == self.salt:
+            return self
+        return TextEncryptor(self.password, salt, cipher)
+    
+    def encrypt_data(self, data: bytes, compression: str = COMPRESSION_NONE) -> bytes:
+        """
+        Enkripsi bytes menjadi format file lengkap (header + salt + ciphertext)
+        
+        Args:
+            data: Bytes yang akan dienkripsi
+            compression: Kompresi sebelum enkripsi ('none', 'zlib', 'lzma', 'bz2')
+            
+        Returns:
+            Bytes terenkripsi
+        """
+        if self.cipher == CIPHER_FERNET and compression == COMPRESSION_NONE:
+            # Gabungkan salt dengan data terenkripsi untuk penyimpanan
+            return self.salt + self.fernet.encrypt(data)
+        
+        header = ENCRYPTED_MAGIC + bytes((
+            ENCRYPTED_VERSION, cipher_id(self.cipher), compression_id(compression)
+        )) + self.salt
+        data = compress_data(data, compression)
+        if self.cipher == CIPHER_FERNET:
+            # Fernet tanpa associated data: header diikat lewat prefix plaintext
+            data = header + data
+        return header + self.encrypt_bytes(data, header)
+    
+    def decrypt_data(self, encrypted_bytes: bytes) -> bytes:
+        """
+        Dekripsi bytes format file lengkap (Fernet lama maupun format berversi)
+        
+        Args:
+            encrypted_bytes: Bytes terenkripsi
+            
+        Returns:
+            Bytes asli
+            
+        Raises:
+            PasswordValueError: Jika password salah atau data korup
+        """
+        cipher, compression, salt, header, offset = _split_header(encrypted_bytes)
+        encryptor = self._for_header(cipher, salt)
+        data = encryptor.decrypt_bytes(encrypted_bytes[offset:], header)
+        if cipher == CIPHER_FERNET and header is not None:
+            data = _strip_bound_header(data, header)
+        return decompress_data(data, compression)
+    
     def encrypt_text(self, text: str) -> bytes:
         """
         Enkripsi teks menjadi bytes yang aman
@@ -57,10 +500,7 @@ class TextEncryptor:
         if not isinstance(text, str):
             raise TypeError("Input harus string")
         
-        encrypted_data = self.fernet.encrypt(text.encode('utf-8'))
-        
-        # Gabungkan salt dengan data terenkripsi untuk penyimpanan
-        return self.salt + encrypted_data
+        return self.encrypt_data(text.encode('utf-8'))
     
     def decrypt_text(self, encrypted_bytes: bytes) -> str:
         """
@@ -75,27 +515,50 @@ class TextEncryptor:
         Raises:
             PasswordValueError: Jika password salah atau data korup
         """
-        if len(encrypted_bytes) < 16:
-            raise PasswordValueError("Data terenkripsi tidak valid")
-        
-        # Ekstrak salt dari data
-        salt = encrypted_bytes[:16]
-        encrypted_data = encrypted_bytes[16:]
-        
-        # Buat Fernet instance baru dengan salt yang diekstrak
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(self.password))
-        fernet = Fernet(key)
-        
-        # Dekripsi data
+        decrypted_data = self.decrypt_data(encrypted_bytes)
         try:
-            decrypted_data = fernet.decrypt(encrypted_data)
             return decrypted_data.decode('utf-8')
+        except UnicodeDecodeError as e:
+            raise PasswordValueError(f"Gagal mendekripsi: Password salah atau data korup - {e}")
+
+    def encrypt_bytes(self, data: bytes, associated_data: Optional[bytes] = None) -> bytes:
+        """
+        Enkripsi bytes dengan key milik encryptor ini (tanpa prefix salt)
+
+        Dipakai untuk banyak record kecil yang berbagi satu salt, sehingga
+        PBKDF2 cukup dijalankan sekali.
+
+        Args:
+            data: Bytes yang akan dienkripsi
+            associated_data: Data tambahan yang ikut diautentikasi (hanya AEAD)
+
+        Returns:
+            Token terenkripsi dan terautentikasi
+        """
+        if self.cipher == CIPHER_FERNET:
+            return self.fernet.encrypt(data)
+        
+        nonce = os.urandom(NONCE_SIZE)
+        return nonce + self.aead.encrypt(nonce, data, associated_data)
+
+    def decrypt_bytes(self, token: bytes, associated_data: Optional[bytes] = None) -> bytes:
+        """
+        Dekripsi token hasil encrypt_bytes
+
+        Args:
+            token: Token terenkripsi
+            associated_data: Data tambahan yang diautentikasi saat enkripsi
+
+        Returns:
+            Bytes asli
+
+        Raises:
+            PasswordValueError: Jika password salah atau data korup
+        """
+        try:
+            if self.cipher == CIPHER_FERNET:
+                return self.fernet.decrypt(token)
+            return self.aead.decrypt(token[:NONCE_SIZE], token[NONCE_SIZE:], associated_data)
         except Exception as e:
             raise PasswordValueError(f"Gagal mendekripsi: Password salah atau data korup - {e}")
 
@@ -103,19 +566,30 @@ class TextEncryptor:
 # FUNGSI SEDERHANA (Standalone)
 # =============================================================================
 
-def encrypt(text: str, password: str) -> bytes:
+def encrypt(
+    text: Union[str, bytes], 
+    password: str, 
+    encryptor: Optional[TextEncryptor] = None,
+    cipher: str = DEFAULT_CIPHER,
+    compression: str = COMPRESSION_NONE
+) -> bytes:
     """
     Enkripsi string menjadi bytes dengan password
     
     Args:
-        text: Teks yang akan dienkripsi
+        text: Teks (atau bytes UTF-8) yang akan dienkripsi
         password: Password untuk enkripsi
+        encryptor: Encryptor yang sudah ada (key sesi) agar PBKDF2 tidak diulang
+        cipher: Cipher jika encryptor tidak diberikan
+        compression: Kompresi sebelum enkripsi ('none', 'zlib', 'lzma', 'bz2')
         
     Returns:
         Bytes terenkripsi
     """
-    encryptor = TextEncryptor(password)
-    return encryptor.encrypt_text(text)
+    encryptor = encryptor or TextEncryptor(password, cipher=cipher)
+    if isinstance(text, str):
+        text = text.encode('utf-8')
+    return encryptor.encrypt_data(text, compression)
 
 def decrypt(encrypted_bytes: bytes, password: str) -> str:
     """
@@ -128,21 +602,39 @@ def decrypt(encrypted_bytes: bytes, password: str) -> str:
     Returns:
         Teks asli yang didekripsi
     """
-    encryptor = TextEncryptor(password)  # Salt akan diekstrak dari bytes
+    encryptor = TextEncryptor(password)  # Cipher dan salt akan diekstrak dari bytes
     return encryptor.decrypt_text(encrypted_bytes)
 
-def save(text: str, password: str, file_path: str) -> None:
+def save(
+    text: Union[str, bytes], 
+    password: str, 
+    file_path: str, 
+    encryptor: Optional[TextEncryptor] = None,
+    cipher: str = DEFAULT_CIPHER,
+    compression: str = COMPRESSION_NONE
+) -> None:
     """
     Simpan teks terenkripsi ke file
     
+    Path ditulis secara atomik (file sementara, fsync, lalu os.replace), sehingga
+    crash saat menulis tidak meninggalkan file setengah jadi.
+    
     Args:
-        text: Teks yang akan disimpan
+        text: Teks (atau bytes UTF-8) yang akan disimpan
         password: Password untuk enkripsi
         file_path: Path file tujuan
+        encryptor: Encryptor yang sudah ada (key sesi) agar PBKDF2 tidak diulang
+        cipher: 'fernet' (default), 'aes-gcm' atau 'chacha20-poly1305'
+        compression: 'none' (default), 'zlib', 'lzma' atau 'bz2'
     """
-    encrypted_bytes = encrypt(text, password)
-    with open(os.path.abspath(file_path), 'wb') as f:
+    encrypted_bytes = encrypt(text, password, encryptor, cipher, compression)
+    file_path = os.path.abspath(file_path)
+    temp_path = file_path + '.tmp'
+    with open(temp_path, 'wb') as f:
         f.write(encrypted_bytes)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, file_path)
 
 def load(password: str, file_path: str) -> str:
     """
@@ -157,4 +649,287 @@ def load(password: str, file_path: str) -> str:
     """
     with open(file_path, 'rb') as f:
         encrypted_bytes = f.read()
-    return decrypt(encrypted_bytes, password)
\ No newline at end of file
+    return decrypt(encrypted_bytes, password)
+
+def load_bytes(password: str, file_path: str) -> bytes:
+    """
+    Muat dan dekripsi bytes dari file (tanpa decode UTF-8)
+    
+    Args:
+        password: Password untuk dekripsi
+        file_path: Path file sumber
+        
+    Returns:
+        Bytes asli yang didekripsi
+    """
+    with open(file_path, 'rb') as f:
+        encrypted_bytes = f.read()
+    return TextEncryptor(password).decrypt_data(encrypted_bytes)
+
+def read_header(file_path: str) -> Tuple[str, bytes, str]:
+    """
+    Membaca cipher, salt dan kompresi dari file yang ditulis oleh save()
+    
+    Args:
+        file_path: Path file terenkripsi
+        
+    Returns:
+        Tuple (nama cipher, salt, nama kompresi)
+    """
+    with open(file_path, 'rb') as f:
+        head = f.read(_VERSIONED_HEADER_SIZE)
+    cipher, compression, salt, _, _ = _split_header(head)
+    return cipher, salt, compression
+
+# =============================================================================
+# STREAMING (CHUNKED) ENCRYPTION
+# =============================================================================
+#
+# Header : MAGIC (7 byte) | versi (1 byte) | id cipher (1 byte) | id kompresi (1 byte)
+#          | salt (16 byte) | ukuran chunk (4 byte)
+# Chunk  : panjang (4 byte) | flag final (1 byte) | chunk terenkripsi
+#
+# Kompresi (jika ada) diterapkan secara inkremental pada seluruh stream
+# sebelum dipotong menjadi chunk. Setiap chunk memiliki nonce sendiri dan diautentikasi bersama header,
+# nomor urut dan flag final (AEAD: associated data, Fernet: prefix plaintext),
+# sehingga chunk yang ditukar, dihapus atau stream yang terpotong terdeteksi.
+
+STREAM_MAGIC = b"PYDBSTR"
+STREAM_VERSION = 3
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_STREAM_HEADER = struct.Struct(">7sBBB16sI")
+_CHUNK_HEADER = struct.Struct(">IB")
+_CHUNK_INFO = struct.Struct(">QB")
+
+def _seal_chunk(encryptor: TextEncryptor, header: bytes, index: int, final: bool, data: bytes) -> bytes:
+    """Mengenkripsi satu chunk stream beserta header, nomor urut dan flag final"""
+    info = _CHUNK_INFO.pack(index, final)
+    if encryptor.cipher == CIPHER_FERNET:
+        return encryptor.encrypt_bytes(header + info + data)
+    return encryptor.encrypt_bytes(data, header + info)
+
+def _open_chunk(encryptor: TextEncryptor, header: bytes, index: int, final: bool, sealed: bytes) -> bytes:
+    """Mendekripsi satu chunk stream dan memverifikasi header serta posisinya"""
+    info = _CHUNK_INFO.pack(index, final)
+    if encryptor.cipher == CIPHER_FERNET:
+        plain = encryptor.decrypt_bytes(sealed)
+        prefix = header + info
+        if plain[:len(prefix)] != prefix:
+            raise PasswordValueError("Header atau urutan chunk stream tidak valid atau data korup")
+        return plain[len(prefix):]
+    return encryptor.decrypt_bytes(sealed, header + info)
+
+def _rechunk(chunks: Iterable[Union[str, bytes]], chunk_size: int) -> Iterator[Tuple[bytes, bool]]:
+    """Menyusun ulang input menjadi chunk berukuran tetap, menandai chunk terakhir"""
+    buffer = bytearray()
+    pending: Optional[bytes] = None
+    
+    for chunk in chunks:
+        buffer += chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+        while len(buffer) >= chunk_size:
+            if pending is not None:
+                yield pending, False
+            pending = bytes(buffer[:chunk_size])
+            del buffer[:chunk_size]
+    
+    if buffer:
+        if pending is not None:
+            yield pending, False
+        pending = bytes(buffer)
+    
+    yield (pending if pending is not None else b""), True
+
+def _compress_chunks(chunks: Iterable[Union[str, bytes]], compression: str) -> Iterator[bytes]:
+    """Mengompresi iterator data secara inkremental"""
+    engine = compressor(compression)
+    for chunk in chunks:
+        data = engine.compress(chunk.encode('utf-8') if isinstance(chunk, str) else chunk)
+        if data:
+            yield data
+    yield engine.flush()
+
+def encrypt_stream(
+    chunks: Iterable[Union[str, bytes]],
+    output: BinaryIO,
+    password: str,
+    encryptor: Optional[TextEncryptor] = None,
+    cipher: str = DEFAULT_CIPHER,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    compression: str = COMPRESSION_NONE
+) -> int:
+    """
+    Enkripsi iterator data ke file object secara bertahap (memori terbatas)
+    
+    Args:
+        chunks: Iterator str/bytes dengan ukuran bebas
+        output: File object biner tujuan
+        password: Password untuk enkripsi
+        encryptor: Encryptor yang sudah ada (key sesi) agar PBKDF2 tidak diulang
+        cipher: Cipher jika encryptor tidak diberikan
+        chunk_size: Ukuran plaintext per chunk terenkripsi
+        compression: Kompresi stream sebelum enkripsi
+        
+    Returns:
+        Jumlah bytes yang ditulis
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size harus lebih besar dari 0")
+    
+    encryptor = encryptor or TextEncryptor(password, cipher=cipher)
+    header = _STREAM_HEADER.pack(
+        STREAM_MAGIC, STREAM_VERSION, cipher_id(encryptor.cipher), compression_id(compression),
+        encryptor.salt, chunk_size
+    )
+    output.write(header)
+    written = len(header)
+    
+    if compression != COMPRESSION_NONE:
+        chunks = _compress_chunks(chunks, compression)
+    
+    for index, (data, final) in enumerate(_rechunk(chunks, chunk_size)):
+        sealed = _seal_chunk(encryptor, header, index, final, data)
+        output.write(_CHUNK_HEADER.pack(len(sealed), final))
+        output.write(sealed)
+        written += _CHUNK_HEADER.size + len(sealed)
+    
+    return written
+
+def read_stream_header(source: BinaryIO, password: str) -> Tuple[TextEncryptor, bytes, str]:
+    """
+    Membaca header stream dan menyiapkan encryptor untuk salt/cipher-nya
+    
+    Args:
+        source: File object biner pada posisi awal stream
+        password: Password untuk dekripsi
+        
+    Returns:
+        Tuple (encryptor, bytes header, nama kompresi)
+    """
+    prefix = source.read(len(STREAM_MAGIC) + 1)
+    if len(prefix) < len(STREAM_MAGIC) + 1 or prefix[:len(STREAM_MAGIC)] != STREAM_MAGIC:
+        raise PasswordValueError("Bukan stream terenkripsi PyDB")
+    
+    version = prefix[-1]
+    if version != STREAM_VERSION:
+        raise PasswordValueError(f"Versi stream tidak didukung: {version}")
+    
+    header = prefix + source.read(_STREAM_HEADER.size - len(prefix))
+    if len(header) < _STREAM_HEADER.size:
+        raise PasswordValueError("Header stream tidak lengkap")
+    
+    _, _, cipher, compression, salt, _ = _STREAM_HEADER.unpack(header)
+    return TextEncryptor(password, salt, cipher_name(cipher)), header, compression_name(compression)
+
+def decrypt_stream(source: BinaryIO, password: str) -> Iterator[bytes]:
+    """
+    Dekripsi stream chunk demi chunk dari file object
+    
+    Args:
+        source: File object biner berisi stream terenkripsi
+        password: Password untuk dekripsi
+        
+    Yields:
+        Plaintext per chunk
+        
+    Raises:
+        PasswordValueError: Jika password salah, chunk rusak atau stream terpotong
+    """
+    encryptor, header, compression = read_stream_header(source, password)
+    engine = decompressor(compression)
+    index = 0
+    
+    while True:
+        chunk_header = source.read(_CHUNK_HEADER.size)
+        if len(chunk_header) < _CHUNK_HEADER.size:
+            raise PasswordValueError("Stream terpotong: chunk final tidak ditemukan")
+        
+        length, final = _CHUNK_HEADER.unpack(chunk_header)
+        sealed = source.read(length)
+        if len(sealed) < length:
+            raise PasswordValueError("Stream terpotong")
+        
+        data = _open_chunk(encryptor, header, index, bool(final), sealed)
+        yield from _decompress_pieces(engine, data)
+        
+        if final:
+            if not engine.eof:
+                raise PasswordValueError("Stream terkompresi tidak lengkap")
+            if engine.unused_data:
+                raise PasswordValueError("Data tambahan setelah akhir stream terkompresi")
+            if source.read(1):
+                raise PasswordValueError("Data tambahan setelah chunk final")
+            return
+        index += 1
+
+def is_stream_file(file_path: str) -> bool:
+    """
+    Cek apakah file berisi stream terenkripsi
+    
+    Args:
+        file_path: Path file
+        
+    Returns:
+        True jika file diawali magic stream
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            return f.read(len(STREAM_MAGIC)) == STREAM_MAGIC
+    except OSError:
+        return False
+
+def save_stream(
+    chunks: Iterable[Union[str, bytes]],
+    password: str,
+    file: Union[str, BinaryIO],
+    encryptor: Optional[TextEncryptor] = None,
+    cipher: str = DEFAULT_CIPHER,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    compression: str = COMPRESSION_NONE
+) -> int:
+    """
+    Simpan iterator data ke file sebagai stream terenkripsi
+    
+    Path ditulis secara atomik (file sementara lalu os.replace).
+    
+    Args:
+        chunks: Iterator str/bytes yang akan disimpan
+        password: Password untuk enkripsi
+        file: Path file atau file object biner tujuan
+        encryptor: Encryptor yang sudah ada (key sesi) agar PBKDF2 tidak diulang
+        cipher: Cipher jika encryptor tidak diberikan
+        chunk_size: Ukuran plaintext per chunk
+        compression: 'none' (default), 'zlib', 'lzma' atau 'bz2'
+        
+    Returns:
+        Jumlah bytes yang ditulis
+    """
+    if not isinstance(file, str):
+        return encrypt_stream(chunks, file, password, encryptor, cipher, chunk_size, compression)
+    
+    file_path = os.path.abspath(file)
+    temp_path = file_path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        written = encrypt_stream(chunks, f, password, encryptor, cipher, chunk_size, compression)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, file_path)
+    return written
+
+def load_stream(password: str, file: Union[str, BinaryIO]) -> Iterator[bytes]:
+    """
+    Muat dan dekripsi stream terenkripsi secara bertahap
+    
+    Args:
+        password: Password untuk dekripsi
+        file: Path file atau file object biner sumber
+        
+    Yields:
+        Plaintext per chunk
+    """
+    if not isinstance(file, str):
+        yield from decrypt_stream(file, password)
+        return
+    
+    with open(file, 'rb') as f:
+        yield from decrypt_stream(f, password)
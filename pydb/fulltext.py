@@ -0,0 +1,305 @@
+import re
+import math
+import heapq
+from bisect import bisect_left
+from collections import Counter
+from operator import itemgetter
+from typing import Dict, List, Any, Callable, Iterable, Optional, Tuple
+
+# =============================================================================
+# INDEX FULL-TEXT
+# =============================================================================
+#
+# Inverted index: token -> posting list {kunci baris: frekuensi token}.
+# Seperti index lain, baris dirujuk lewat referensi dictionary di Table.data
+# (kunci id(baris)), sehingga posisi baris boleh bergeser setelah delete.
+#
+# Query berupa kata-kata yang dipecah dengan tokenizer index; kata berakhiran
+# '*' dicari sebagai prefix (memakai kosakata terurut dan bisect). Mode 'and'
+# menuntut semua term ada di baris, mode 'or' cukup salah satu. Hasil diurut
+# menurut skor BM25 (term langka dan baris pendek bernilai lebih tinggi).
+#
+# Untuk disimpan, posting list ditulis per posisi baris (dump) dan dipulihkan
+# tanpa tokenisasi ulang (restore) selama data tabel belum berubah.
+
+# Parameter BM25
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+QUERY_MODES = ('and', 'or')
+
+_WORD = re.compile(r"\w+")
+
+
+def simple_tokenizer(text: str) -> List[str]:
+    """Kata alfanumerik (unicode) dalam huruf kecil"""
+    return _WORD.findall(text.lower())
+
+
+def whitespace_tokenizer(text: str) -> List[str]:
+    """Potongan teks dipisah spasi, dalam huruf kecil (tanda baca ikut)"""
+    return text.lower().split()
+
+
+# Tokenizer per nama; nama disimpan bersama index sehingga tokenizer buatan
+# sendiri perlu didaftarkan di sini sebelum database dibuka
+TOKENIZERS: Dict[str, Callable[[str], List[str]]] = {
+    'simple': simple_tokenizer,
+    'whitespace': whitespace_tokenizer,
+}
+
+DEFAULT_TOKENIZER = 'simple'
+
+
+def tokenizer_name(tokenizer: Any) -> str:
+    """
+    Nama tokenizer terdaftar dari nama atau fungsinya
+
+    Raises:
+        ValueError: Jika tokenizer tidak terdaftar di TOKENIZERS
+    """
+    if isinstance(tokenizer, str) and tokenizer in TOKENIZERS:
+        return tokenizer
+    for name, function in TOKENIZERS.items():
+        if function is tokenizer:
+            return name
+    raise ValueError(
+        f"Tokenizer {tokenizer!r} tidak terdaftar; pilih {', '.join(TOKENIZERS)} "
+        f"atau daftarkan fungsinya di pydb.fulltext.TOKENIZERS"
+    )
+
+
+class FullTextIndex:
+    """
+    Inverted index untuk pencarian kata pada kolom teks
+    """
+
+    kind = 'fulltext'
+
+    # Index full-text tidak pernah menolak nilai (check selalu lolos)
+    unique = False
+
+    def __init__(self, column: str, tokenizer: str = DEFAULT_TOKENIZER):
+        """
+        Inisialisasi index kosong
+
+        Args:
+            column: Nama kolom yang diindex
+            tokenizer: Nama tokenizer di TOKENIZERS
+
+        Raises:
+            ValueError: Jika tokenizer tidak terdaftar
+        """
+        self.column = column
+        self.tokenizer = tokenizer_name(tokenizer)
+        self._tokenize = TOKENIZERS[self.tokenizer]
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._rows: Dict[int, Dict[str, Any]] = {}
+        self._lengths: Dict[int, int] = {}
+        self._total_length = 0
+        # Kosakata terurut untuk prefix; dibuat ulang saat token baru muncul
+        self._vocabulary: Optional[List[str]] = None
+
+    def _terms(self, row: Dict[str, Any]) -> Counter:
+        value = row.get(self.column)
+        return Counter(self._tokenize(value)) if isinstance(value, str) else Counter()
+
+    def build(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Membangun ulang index dari seluruh baris"""
+        self._postings, self._rows, self._lengths = {}, {}, {}
+        self._total_length = 0
+        self._vocabulary = None
+        for row in rows:
+            self.add(row)
+
+    def check(self, value: Any, row: Any = None) -> None:
+        """Tidak ada batasan nilai (antarmuka yang sama dengan index lain)"""
+
+    def add(self, row: Dict[str, Any]) -> None:
+        """Menambahkan satu baris ke index"""
+        terms = self._terms(row)
+        if not terms:
+            return
+        key = id(row)
+        postings = self._postings
+        for term, frequency in terms.items():
+            posting = postings.get(term)
+            if posting is None:
+                postings[term] = {key: frequency}
+                self._vocabulary = None
+            else:
+                posting[key] = frequency
+        length = sum(terms.values())
+        self._rows[key] = row
+        self._lengths[key] = length
+        self._total_length += length
+
+    def extend(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Menambahkan banyak baris ke index"""
+        for row in rows:
+            self.add(row)
+
+    def remove(self, row: Dict[str, Any]) -> None:
+        """Menghapus satu baris dari index (dengan nilai kolom yang diindex)"""
+        key = id(row)
+        length = self._lengths.pop(key, None)
+        if length is None:
+            return
+        del self._rows[key]
+        self._total_length -= length
+        for term in self._terms(row):
+            posting = self._postings.get(term)
+            if posting is not None:
+                posting.pop(key, None)
+                if not posting:
+                    del self._postings[term]
+                    self._vocabulary = None
+
+    # -------------------------------------------------------------------------
+    # Query
+    # -------------------------------------------------------------------------
+
+    def parse_query(self, query: str) -> List[Tuple[str, bool]]:
+        """
+        Term query sebagai (token, prefix), tanpa duplikat
+
+        Kata berakhiran '*' menjadikan token terakhirnya prefix.
+        """
+        terms: Dict[Tuple[str, bool], None] = {}
+        for word in query.split():
+            prefix = word.endswith('*')
+            tokens = self._tokenize(word.rstrip('*'))
+            for position, token in enumerate(tokens):
+                terms[(token, prefix and position == len(tokens) - 1)] = None
+        return list(terms)
+
+    def _expand(self, prefix: str) -> List[str]:
+        """Token di kosakata yang diawali prefix"""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        vocabulary = self._vocabulary
+        matches = []
+        position = bisect_left(vocabulary, prefix)
+        while position < len(vocabulary) and vocabulary[position].startswith(prefix):
+            matches.append(vocabulary[position])
+            position += 1
+        return matches
+
+    def _term_scores(self, token: str, prefix: bool) -> Dict[int, float]:
+        """Skor BM25 satu term query per kunci baris (prefix: jumlah skor semua token yang cocok)"""
+        tokens = self._expand(token) if prefix else [token]
+        row_count = len(self._lengths)
+        average = self._total_length / row_count if row_count else 0.0
+        lengths = self._lengths
+        scores: Dict[int, float] = {}
+        for term in tokens:
+            posting = self._postings.get(term)
+            if not posting:
+                continue
+            frequency = len(posting)
+            idf = math.log(1 + (row_count - frequency + 0.5) / (frequency + 0.5))
+            for key, count in posting.items():
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[key] / average)
+                scores[key] = scores.get(key, 0.0) + idf * count * (BM25_K1 + 1) / (count + norm)
+        return scores
+
+    def search(self, query: str, mode: str = 'and', limit: Optional[int] = None) -> List[Tuple[float, Dict[str, Any]]]:
+        """
+        Mencari baris yang cocok dengan query, terurut menurut skor
+
+        Args:
+            query: Kata-kata query; 'kata*' untuk prefix
+            mode: 'and' (semua term) atau 'or' (salah satu term)
+            limit: Jumlah hasil teratas (None = semua)
+
+        Returns:
+            List (skor, baris), skor tertinggi lebih dulu
+
+        Raises:
+            ValueError: Jika mode tidak valid
+        """
+        if mode not in QUERY_MODES:
+            raise ValueError(f"Mode pencarian harus salah satu dari {', '.join(QUERY_MODES)}, bukan {mode!r}")
+
+        per_term = [self._term_scores(token, prefix) for token, prefix in self.parse_query(query)]
+        if not per_term:
+            return []
+
+        if mode == 'and':
+            # Mulai dari term dengan kandidat paling sedikit
+            per_term.sort(key=len)
+            scores = dict(per_term[0])
+            for term_scores in per_term[1:]:
+                if not scores:
+                    break
+                scores = {key: score + term_scores[key] for key, score in scores.items() if key in term_scores}
+        else:
+            scores = {}
+            for term_scores in per_term:
+                for key, score in term_scores.items():
+                    scores[key] = scores.get(key, 0.0) + score
+
+        ranked = (
+            heapq.nlargest(limit, scores.items(), key=itemgetter(1)) if limit is not None
+            else sorted(scores.items(), key=itemgetter(1), reverse=True)
+        )
+        rows = self._rows
+        return [(score, rows[key]) for key, score in ranked]
+
+    # -------------------------------------------------------------------------
+    # Persistensi
+    # -------------------------------------------------------------------------
+
+    def dump(self, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Posting list per posisi baris untuk disimpan bersama tabel
+
+        Args:
+            rows: Table.data (urutan yang sama dengan yang akan disimpan)
+
+        Returns:
+            {'rows': jumlah baris, 'lengths': jumlah token per posisi,
+             'postings': {token: [posisi, frekuensi, posisi, frekuensi, ...]}}
+        """
+        positions = {id(row): position for position, row in enumerate(rows)}
+        lengths = [0] * len(rows)
+        for key, length in self._lengths.items():
+            lengths[positions[key]] = length
+
+        postings = {}
+        for term, posting in self._postings.items():
+            flat = []
+            for key, frequency in posting.items():
+                flat.append(positions[key])
+                flat.append(frequency)
+            postings[term] = flat
+        return {'rows': len(rows), 'lengths': lengths, 'postings': postings}
+
+    def restore(self, state: Dict[str, Any], rows: List[Dict[str, Any]]) -> None:
+        """
+        Memulihkan index dari hasil dump tanpa tokenisasi ulang
+
+        Raises:
+            ValueError: Jika state tidak cocok dengan baris tabel
+        """
+        if state.get('rows') != len(rows) or len(state.get('lengths', ())) != len(rows):
+            raise ValueError(f"Index full-text kolom '{self.column}' tidak cocok dengan data tabel")
+
+        keys = [id(row) for row in rows]
+        self._rows = {keys[position]: rows[position] for position, length in enumerate(state['lengths']) if length}
+        self._lengths = {keys[position]: length for position, length in enumerate(state['lengths']) if length}
+        self._total_length = sum(self._lengths.values())
+        self._postings = {
+            term: dict(zip(map(keys.__getitem__, flat[0::2]), flat[1::2]))
+            for term, flat in state['postings'].items()
+        }
+        self._vocabulary = None
+
+    def definition(self) -> Dict[str, Any]:
+        return {'kind': self.kind, 'tokenizer': self.tokenizer}
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def __repr__(self) -> str:
+        return f"FullTextIndex(column='{self.column}', tokenizer='{self.tokenizer}', terms={len(self._postings)})"
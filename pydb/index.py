@@ -0,0 +1,392 @@
+from bisect import bisect_left, bisect_right
+from operator import itemgetter, methodcaller
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Union
+
+# =============================================================================
+# INDEX TABEL
+# =============================================================================
+#
+# Index menyimpan referensi ke dictionary baris di Table.data (bukan posisi),
+# sehingga tidak perlu diperbarui ketika posisi baris bergeser setelah delete.
+# Nilai None ikut diindex (find(kolom=None)), tetapi tidak dihitung sebagai
+# duplikat pada index unique.
+#
+# HashIndex    : dictionary nilai -> baris, untuk kesamaan (O(1))
+# OrderedIndex : array kunci terurut (bisect) beserta barisnya, untuk
+#                kesamaan (O(log n)), rentang, urutan dan min/max
+
+
+class HashIndex:
+    """
+    Index hash untuk pencarian kesamaan (kolom == nilai) dalam O(1)
+    """
+
+    kind = 'hash'
+
+    def __init__(self, column: str, unique: bool = False):
+        """
+        Inisialisasi index kosong
+
+        Args:
+            column: Nama kolom yang diindex
+            unique: True untuk menolak nilai duplikat (selain None)
+        """
+        self.column = column
+        self.unique = unique
+        self._map: Dict[Any, List[Dict[str, Any]]] = {}
+
+    def build(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """
+        Membangun ulang index dari seluruh baris
+
+        Args:
+            rows: Baris data tabel
+
+        Raises:
+            ValueError: Jika index unique menemukan nilai duplikat
+        """
+        self._map = {}
+        for row in rows:
+            self.add(row)
+
+    def check(self, value: Any, row: Any = None) -> None:
+        """
+        Memastikan nilai tidak melanggar keunikan
+
+        Args:
+            value: Nilai kolom yang akan disimpan
+            row: Baris pemilik nilai (diabaikan dari pengecekan, untuk update)
+
+        Raises:
+            ValueError: Jika nilai sudah dipakai baris lain
+        """
+        if not self.unique or value is None:
+            return
+        bucket = self._map.get(value)
+        if bucket and any(existing is not row for existing in bucket):
+            raise ValueError(f"Nilai duplikat untuk kolom unik '{self.column}': {value!r}")
+
+    def add(self, row: Dict[str, Any]) -> None:
+        """
+        Menambahkan satu baris ke index
+
+        Raises:
+            ValueError: Jika index unique sudah memiliki nilai yang sama
+        """
+        value = row.get(self.column)
+        self.check(value, row)
+        self._map.setdefault(value, []).append(row)
+
+    def extend(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Menambahkan banyak baris (keunikan sudah diperiksa pemanggil)"""
+        column = self.column
+        index_map = self._map
+        rows = list(rows)
+        values = list(map(methodcaller('get', column), rows))
+        distinct = set(values)
+        if len(distinct) == len(rows) and distinct.isdisjoint(index_map):
+            # Semua nilai baru dan berbeda (mis. id baru): satu bucket per baris
+            index_map.update(zip(values, map(list, zip(rows))))
+            return
+        for row in rows:
+            value = row.get(column)
+            bucket = index_map.get(value)
+            if bucket is None:
+                index_map[value] = [row]
+            else:
+                bucket.append(row)
+
+    def remove(self, row: Dict[str, Any]) -> None:
+        """Menghapus satu baris (berdasarkan identitas) dari index"""
+        value = row.get(self.column)
+        bucket = self._map.get(value)
+        if not bucket:
+            return
+
+        for position, existing in enumerate(bucket):
+            if existing is row:
+                del bucket[position]
+                break
+        if not bucket:
+            del self._map[value]
+
+    def lookup(self, value: Any) -> List[Dict[str, Any]]:
+        """
+        Mengambil baris dengan nilai kolom tertentu
+
+        Args:
+            value: Nilai yang dicari
+
+        Returns:
+            List baris (referensi ke baris di tabel)
+        """
+        try:
+            return list(self._map.get(value, ()))
+        except TypeError:
+            # Nilai tidak hashable tidak mungkin ada di index
+            return []
+
+    def count(self, value: Any) -> int:
+        """Jumlah baris dengan nilai kolom tertentu"""
+        try:
+            return len(self._map.get(value, ()))
+        except TypeError:
+            return 0
+
+    def definition(self) -> Dict[str, Any]:
+        """Definisi index untuk disimpan di metadata tabel"""
+        return {'kind': self.kind, 'unique': self.unique}
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._map.values())
+
+    def __repr__(self) -> str:
+        return f"HashIndex(column='{self.column}', unique={self.unique}, keys={len(self._map)})"
+
+
+class OrderedIndex:
+    """
+    Index terurut (array terurut dengan bisect) untuk rentang dan pengurutan
+    
+    Kunci dan baris disimpan dalam dua list paralel yang selalu terurut;
+    baris dengan nilai None disimpan terpisah dan dianggap paling besar.
+    """
+
+    kind = 'ordered'
+
+    def __init__(self, column: str, unique: bool = False):
+        """
+        Inisialisasi index kosong
+
+        Args:
+            column: Nama kolom yang diindex
+            unique: True untuk menolak nilai duplikat (selain None)
+        """
+        self.column = column
+        self.unique = unique
+        self._keys: List[Any] = []
+        self._rows: List[Dict[str, Any]] = []
+        self._nulls: List[Dict[str, Any]] = []
+
+    def build(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """
+        Membangun ulang index dari seluruh baris (satu kali sort)
+
+        Raises:
+            ValueError: Jika index unique menemukan nilai duplikat
+        """
+        column = self.column
+        values = []
+        self._nulls = []
+        for row in rows:
+            if row.get(column) is None:
+                self._nulls.append(row)
+            else:
+                values.append(row)
+
+        values.sort(key=itemgetter(column))
+        self._rows = values
+        self._keys = [row[column] for row in values]
+
+        if self.unique:
+            for previous, key in zip(self._keys, self._keys[1:]):
+                if previous == key:
+                    raise ValueError(f"Nilai duplikat untuk kolom unik '{column}': {key!r}")
+
+    def check(self, value: Any, row: Any = None) -> None:
+        """
+        Memastikan nilai tidak melanggar keunikan
+
+        Raises:
+            ValueError: Jika nilai sudah dipakai baris lain
+        """
+        if not self.unique or value is None:
+            return
+        low = bisect_left(self._keys, value)
+        high = bisect_right(self._keys, value, low)
+        if any(existing is not row for existing in self._rows[low:high]):
+            raise ValueError(f"Nilai duplikat untuk kolom unik '{self.column}': {value!r}")
+
+    def add(self, row: Dict[str, Any]) -> None:
+        """
+        Menambahkan satu baris di posisi terurutnya
+
+        Raises:
+            ValueError: Jika index unique sudah memiliki nilai yang sama
+        """
+        value = row.get(self.column)
+        if value is None:
+            self._nulls.append(row)
+            return
+
+        self.check(value, row)
+        position = bisect_right(self._keys, value)
+        self._keys.insert(position, value)
+        self._rows.insert(position, row)
+
+    def extend(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """
+        Menambahkan banyak baris (keunikan sudah diperiksa pemanggil)
+
+        Baris baru diurutkan sekali lalu digabung dengan array lama; sort
+        Python mengenali dua run terurut sehingga penggabungan linear.
+        Baris baru ditempatkan setelah baris lama dengan nilai sama, seperti add.
+        """
+        column = self.column
+        values = []
+        for row in rows:
+            if row.get(column) is None:
+                self._nulls.append(row)
+            else:
+                values.append(row)
+        if not values:
+            return
+        if len(values) == 1:
+            row = values[0]
+            position = bisect_right(self._keys, row[column])
+            self._keys.insert(position, row[column])
+            self._rows.insert(position, row)
+            return
+
+        values.sort(key=itemgetter(column))
+        self._rows.extend(values)
+        self._rows.sort(key=itemgetter(column))
+        self._keys = [row[column] for row in self._rows]
+
+    def remove(self, row: Dict[str, Any]) -> None:
+        """Menghapus satu baris (berdasarkan identitas) dari index"""
+        value = row.get(self.column)
+        if value is None:
+            bucket, low, high = self._nulls, 0, len(self._nulls)
+        else:
+            bucket = self._rows
+            low = bisect_left(self._keys, value)
+            high = bisect_right(self._keys, value, low)
+
+        for position in range(low, high):
+            if bucket[position] is row:
+                del bucket[position]
+                if bucket is self._rows:
+                    del self._keys[position]
+                return
+
+    def lookup(self, value: Any) -> List[Dict[str, Any]]:
+        """Mengambil baris dengan nilai kolom tertentu (O(log n))"""
+        if value is None:
+            return list(self._nulls)
+        try:
+            low = bisect_left(self._keys, value)
+            return self._rows[low:bisect_right(self._keys, value, low)]
+        except TypeError:
+            # Tipe nilai tidak dapat dibandingkan dengan kunci index
+            return []
+
+    def count(self, value: Any) -> int:
+        """Jumlah baris dengan nilai kolom tertentu"""
+        if value is None:
+            return len(self._nulls)
+        try:
+            return bisect_right(self._keys, value) - bisect_left(self._keys, value)
+        except TypeError:
+            return 0
+
+    def range(
+        self,
+        low: Any = None,
+        high: Any = None,
+        include_low: bool = True,
+        include_high: bool = True,
+        reverse: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Mengambil baris dengan nilai dalam rentang, terurut menurut kolom
+
+        Args:
+            low: Batas bawah (None = tanpa batas)
+            high: Batas atas (None = tanpa batas)
+            include_low: True jika batas bawah ikut (>=), False untuk (>)
+            include_high: True jika batas atas ikut (<=), False untuk (<)
+            reverse: True untuk urutan menurun
+
+        Returns:
+            List baris (tanpa baris bernilai None)
+        """
+        start, end = self._bounds(low, high, include_low, include_high)
+        rows = self._rows[start:end] if start < end else []
+        if reverse:
+            rows.reverse()
+        return rows
+
+    def count_range(
+        self,
+        low: Any = None,
+        high: Any = None,
+        include_low: bool = True,
+        include_high: bool = True
+    ) -> int:
+        """Jumlah baris dalam rentang (O(log n), tanpa mengambil baris)"""
+        start, end = self._bounds(low, high, include_low, include_high)
+        return max(end - start, 0)
+
+    def _bounds(self, low: Any, high: Any, include_low: bool, include_high: bool):
+        """Posisi awal dan akhir rentang di array kunci"""
+        start = 0
+        end = len(self._keys)
+        if low is not None:
+            start = (bisect_left if include_low else bisect_right)(self._keys, low)
+        if high is not None:
+            end = (bisect_right if include_high else bisect_left)(self._keys, high)
+        return start, end
+
+    def ordered(self, reverse: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Iterasi semua baris terurut; baris bernilai None di akhir (menaik)
+        atau di awal (menurun)
+
+        Seperti sort stabil, baris dengan kunci sama tetap berurutan sesuai
+        urutan sisip pada kedua arah.
+        """
+        if reverse:
+            yield from self._nulls
+            if self.unique:
+                yield from reversed(self._rows)
+                return
+            # Kelompok kunci sama ditelusuri dari belakang, isi kelompok tetap maju
+            keys, rows = self._keys, self._rows
+            end = len(keys)
+            while end:
+                start = bisect_left(keys, keys[end - 1], 0, end)
+                yield from rows[start:end]
+                end = start
+        else:
+            yield from self._rows
+            yield from self._nulls
+
+    def min(self) -> Optional[Any]:
+        """Nilai terkecil yang tidak None"""
+        return self._keys[0] if self._keys else None
+
+    def max(self) -> Optional[Any]:
+        """Nilai terbesar yang tidak None"""
+        return self._keys[-1] if self._keys else None
+
+    def definition(self) -> Dict[str, Any]:
+        """Definisi index untuk disimpan di metadata tabel"""
+        return {'kind': self.kind, 'unique': self.unique}
+
+    def __len__(self) -> int:
+        return len(self._rows) + len(self._nulls)
+
+    def __repr__(self) -> str:
+        return f"OrderedIndex(column='{self.column}', unique={self.unique}, rows={len(self)})"
+
+
+Index = Union[HashIndex, OrderedIndex]
+
+INDEX_TYPES = {
+    HashIndex.kind: HashIndex,
+    OrderedIndex.kind: OrderedIndex,
+}
+
+# Tipe kolom yang dapat diurutkan oleh OrderedIndex
+ORDERED_TYPES = ('Integer', 'Float', 'Number', 'String')
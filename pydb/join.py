@@ -0,0 +1,186 @@
+from typing import Dict, List, Any, Optional, Callable, Iterable, Iterator, Tuple
+
+# =============================================================================
+# HASH JOIN
+# =============================================================================
+#
+# Join dua tabel dengan build/probe hash join, O(n + m) alih-alih loop
+# bersarang O(n * m):
+#
+#   build : baris satu sisi dikelompokkan sekali ke dictionary kunci -> baris
+#           (dilewati jika sisi tersebut sudah memiliki index pada kolom kunci)
+#   probe : baris sisi lain dibaca satu per satu (lazy) dan dicocokkan ke
+#           dictionary/index, sehingga hasil dialirkan tanpa menyalin tabel
+#
+# Kunci None tidak pernah cocok (seperti SQL). Pada left join, baris kiri
+# tanpa pasangan tetap dihasilkan dengan kolom kanan bernilai None.
+#
+# Nama kolom hasil: kolom yang hanya ada di satu tabel memakai namanya
+# sendiri, kolom yang ada di kedua tabel ditulis 'tabel.kolom'. Jika kunci
+# join bernama sama di kedua sisi, kolom kunci ditulis sekali tanpa prefix.
+
+JOIN_TYPES = ('inner', 'left')
+
+# Fungsi pencarian baris per nilai kunci (HashIndex.lookup atau dictionary hasil build)
+Lookup = Callable[[Any], List[Dict[str, Any]]]
+
+# Proyeksi hasil: pasangan (kolom sumber, nama hasil) untuk sisi kiri dan kanan
+Projection = Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]
+
+
+def parse_on(on: Any) -> Tuple[str, str]:
+    """
+    Normalisasi argumen on menjadi (kolom kiri, kolom kanan)
+
+    Args:
+        on: 'kolom' (nama sama di kedua tabel) atau ('kolom_kiri', 'kolom_kanan')
+
+    Raises:
+        ValueError: Jika format on tidak valid
+    """
+    if isinstance(on, str):
+        return on, on
+    if isinstance(on, (tuple, list)) and len(on) == 2 and all(isinstance(column, str) for column in on):
+        return on[0], on[1]
+    raise ValueError(f"on harus 'kolom' atau ('kolom_kiri', 'kolom_kanan'), bukan {on!r}")
+
+
+def build_projection(
+    left: Tuple[str, List[str]],
+    right: Tuple[str, List[str]],
+    keys: Tuple[str, str],
+    columns: Optional[List[str]] = None
+) -> Projection:
+    """
+    Menentukan kolom hasil join
+
+    Args:
+        left: (nama tabel kiri, kolom tabel kiri)
+        right: (nama tabel kanan, kolom tabel kanan)
+        keys: (kolom kunci kiri, kolom kunci kanan)
+        columns: Kolom hasil berupa 'kolom' atau 'tabel.kolom' (None = semua)
+
+    Returns:
+        (pasangan kolom kiri, pasangan kolom kanan)
+
+    Raises:
+        ValueError: Jika kolom tidak dikenal atau ambigu
+    """
+    (left_name, left_columns), (right_name, right_columns) = left, right
+    shared = set(left_columns) & set(right_columns)
+    # Kunci bernama sama ditulis sekali (diambil dari sisi kiri)
+    merged_key = keys[0] if keys[0] == keys[1] else None
+
+    if columns is None:
+        left_pairs = [
+            (column, column if column not in shared or column == merged_key else f"{left_name}.{column}")
+            for column in left_columns
+        ]
+        right_pairs = [
+            (column, column if column not in shared else f"{right_name}.{column}")
+            for column in right_columns if column != merged_key
+        ]
+        return left_pairs, right_pairs
+
+    left_pairs, right_pairs = [], []
+    for name in columns:
+        if not isinstance(name, str):
+            raise ValueError(f"Nama kolom harus string, bukan {name!r}")
+
+        table, _, column = name.rpartition('.')
+        if table == left_name and column in left_columns:
+            left_pairs.append((column, name))
+        elif table == right_name and column in right_columns:
+            right_pairs.append((column, name))
+        elif table:
+            raise ValueError(f"Kolom '{name}' tidak ada di tabel {left_name} maupun {right_name}")
+        elif column == merged_key or (column in left_columns and column not in shared):
+            left_pairs.append((column, name))
+        elif column in right_columns and column not in shared:
+            right_pairs.append((column, name))
+        elif column in shared:
+            raise ValueError(f"Kolom '{name}' ambigu, tulis '{left_name}.{name}' atau '{right_name}.{name}'")
+        else:
+            raise ValueError(f"Kolom '{name}' tidak ada di tabel {left_name} maupun {right_name}")
+    return left_pairs, right_pairs
+
+
+def build_lookup(rows: Iterable[Dict[str, Any]], column: str) -> Lookup:
+    """
+    Fase build: mengelompokkan baris menurut nilai kunci
+
+    Args:
+        rows: Baris sisi build
+        column: Kolom kunci
+
+    Returns:
+        Fungsi pencarian baris per nilai kunci
+    """
+    groups: Dict[Any, List[Dict[str, Any]]] = {}
+    for row in rows:
+        key = row.get(column)
+        if key is None:
+            continue
+        bucket = groups.get(key)
+        if bucket is None:
+            groups[key] = [row]
+        else:
+            bucket.append(row)
+
+    empty: List[Dict[str, Any]] = []
+
+    def lookup(value: Any) -> List[Dict[str, Any]]:
+        try:
+            return groups.get(value, empty)
+        except TypeError:
+            # Nilai tidak hashable tidak mungkin menjadi kunci
+            return empty
+    return lookup
+
+
+def hash_join(
+    probe_rows: Iterable[Dict[str, Any]],
+    probe_key: str,
+    lookup: Lookup,
+    projection: Projection,
+    how: str = 'inner',
+    probe_is_left: bool = True
+) -> Iterator[Dict[str, Any]]:
+    """
+    Fase probe: mencocokkan baris satu per satu dan mengalirkan hasil
+
+    Args:
+        probe_rows: Baris sisi probe (dibaca lazy)
+        probe_key: Kolom kunci sisi probe
+        lookup: Pencarian baris sisi build per nilai kunci
+        projection: Hasil build_projection
+        how: 'inner' atau 'left' (left hanya jika sisi probe adalah kiri)
+        probe_is_left: False jika sisi probe adalah tabel kanan
+
+    Yields:
+        Dictionary baris hasil join
+    """
+    left_pairs, right_pairs = projection
+    probe_pairs, build_pairs = (left_pairs, right_pairs) if probe_is_left else (right_pairs, left_pairs)
+    missing = dict.fromkeys([name for _, name in build_pairs])
+    keep_unmatched = how == 'left'
+
+    for row in probe_rows:
+        key = row.get(probe_key)
+        matches = lookup(key) if key is not None else ()
+        if not matches:
+            if keep_unmatched:
+                result = {name: row.get(column) for column, name in probe_pairs}
+                result.update(missing)
+                yield result
+            continue
+
+        probed = [(name, row.get(column)) for column, name in probe_pairs]
+        for match in matches:
+            if probe_is_left:
+                result = dict(probed)
+                result.update([(name, match.get(column)) for column, name in build_pairs])
+            else:
+                result = {name: match.get(column) for column, name in build_pairs}
+                result.update(probed)
+            yield result
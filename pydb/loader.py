@@ -1,7 +1,9 @@
 import json
 import os
-from typing import Optional, Dict, Any, Union, List
-from .encrypted import load
+from typing import Optional, Dict, Any, Union, List, Iterator
+from .encrypted import load_bytes, is_stream_file
+from .storage import SegmentedFile, StreamedFile, is_segmented_file
+from .codec import decode_database, is_binary_payload
 from .PyDB import Database, Table, Column
 
 
@@ -50,6 +52,14 @@ class loader:
         # Cache untuk data yang sudah dimuat
         self._loaded_data = None
         self._structured_data = None
+        
+        # Format tersegmentasi/stream: hanya direktori dan tabel yang diakses yang diproses
+        self._container_file: Optional[Union[SegmentedFile, StreamedFile]] = None
+        if is_segmented_file(self.path):
+            self._container_file = SegmentedFile(self.path, password)
+        elif is_stream_file(self.path):
+            self._container_file = StreamedFile(self.path, password)
+        self._table_cache: Dict[str, List[Dict[str, Any]]] = {}
     
     def _validate_initialization(self, path: str, password: str, json_output: bool, enable_filter: bool) -> None:
         """
@@ -89,10 +99,68 @@ class loader:
             String data yang sudah didekripsi
         """
         try:
-            return load(self.password, self.path)
+            if self._container_file is not None:
+                return json.dumps(self._materialize_container())
+            payload = load_bytes(self.password, self.path)
+            if is_binary_payload(payload):
+                return json.dumps(decode_database(payload))
+            return payload.decode('utf-8')
         except Exception as e:
             raise Exception(f"Gagal memuat data dari {self.path}: {e}")
     
+    def _load_directory(self) -> Dict[str, Any]:
+        """
+        Memuat direktori file tersegmentasi/header file stream (tanpa data tabel)
+        
+        Returns:
+            Direktori database
+        """
+        try:
+            if isinstance(self._container_file, StreamedFile):
+                if self._container_file.header is None:
+                    self._container_file.read_header()
+                return self._container_file.header
+            
+            if self._container_file.directory is None:
+                self._container_file.read_directory()
+            return self._container_file.directory
+        except Exception as e:
+            raise Exception(f"Gagal memuat direktori dari {self.path}: {e}")
+    
+    def _load_container_table(self, table_name: str) -> List[Dict[str, Any]]:
+        """
+        Mendekripsi data satu tabel (dengan cache)
+        
+        Args:
+            table_name: Nama tabel
+            
+        Returns:
+            List data tabel
+        """
+        if table_name not in self._table_cache:
+            self._load_directory()
+            self._table_cache[table_name] = self._container_file.read_table(table_name)
+        return self._table_cache[table_name]
+    
+    def _materialize_container(self) -> Dict[str, Any]:
+        """
+        Menyusun ulang seluruh isi file tersegmentasi/stream ke format dictionary lama
+        
+        Returns:
+            Dictionary database lengkap dengan data semua tabel
+        """
+        directory = self._load_directory()
+        tables = {}
+        
+        for table_name, entry in directory.get("tables", {}).items():
+            tables[table_name] = {
+                "columns": entry.get("columns", {}),
+                "data": self._load_container_table(table_name),
+                "auto_increment": entry.get("auto_increment", 1)
+            }
+        
+        return {"name": directory.get("name", ""), "tables": tables}
+    
     def _parse_to_structured_format(self, raw_data: str) -> Dict[str, Any]:
         """
         Parse data mentah ke format terstruktur PyDB
@@ -179,6 +247,9 @@ class loader:
         Returns:
             Nama database
         """
+        if self._container_file is not None:
+            return self._load_directory().get("name", "")
+        
         structured_data = self._load_structured_data()
         return structured_data.get("name", "")
     
@@ -189,6 +260,9 @@ class loader:
         Returns:
             List nama tabel
         """
+        if self._container_file is not None:
+            return list(self._load_directory().get("tables", {}).keys())
+        
         structured_data = self._load_structured_data()
         return list(structured_data.get("tables", {}).keys())
     
@@ -220,11 +294,36 @@ class loader:
         Returns:
             List data tabel atau None jika tidak ditemukan
         """
+        if self._container_file is not None:
+            if table_name not in self._load_directory().get("tables", {}):
+                return None
+            return self._load_container_table(table_name)
+        
         table_info = self.get_table_info(table_name)
         if table_info:
             return table_info.get("data", [])
         return None
     
+    def iter_table_data(self, table_name: str) -> Iterator[Dict[str, Any]]:
+        """
+        Menghasilkan data tabel baris demi baris
+        
+        Untuk file berformat stream, baris didekripsi dan di-parse per chunk
+        tanpa menyimpan seluruh tabel di memori.
+        
+        Args:
+            table_name: Nama tabel
+            
+        Returns:
+            Iterator baris tabel (kosong jika tabel tidak ditemukan)
+        """
+        if isinstance(self._container_file, StreamedFile) and table_name not in self._table_cache:
+            if table_name not in self._load_directory().get("tables", {}):
+                return iter(())
+            return self._container_file.iter_table(table_name)
+        
+        return iter(self.get_table_data(table_name) or [])
+    
     def get_table_columns(self, table_name: str) -> Optional[Dict[str, Any]]:
         """
         Mendapatkan definisi kolom dari tabel spesifik
@@ -314,6 +413,9 @@ class loader:
         Returns:
             Dictionary berisi summary database
         """
+        if self._container_file is not None:
+            return self._get_container_summary()
+        
         structured_data = self._load_structured_data()
         
         table_count = len(structured_data.get("tables", {}))
@@ -338,6 +440,34 @@ class loader:
             "file_path": self.path
         }
     
+    def _get_container_summary(self) -> Dict[str, Any]:
+        """
+        Summary database tersegmentasi/stream langsung dari direktori (tanpa dekripsi data)
+        
+        Returns:
+            Dictionary berisi summary database
+        """
+        directory = self._load_directory()
+        total_records = 0
+        table_info = {}
+        
+        for table_name, entry in directory.get("tables", {}).items():
+            record_count = entry.get("rows", 0)
+            total_records += record_count
+            
+            table_info[table_name] = {
+                "records": record_count,
+                "columns": len(entry.get("columns", {}))
+            }
+        
+        return {
+            "name": directory.get("name", ""),
+            "table_count": len(table_info),
+            "total_records": total_records,
+            "tables": table_info,
+            "file_path": self.path
+        }
+    
     def validate_database(self) -> bool:
         """
         Validasi integritas database
@@ -0,0 +1,674 @@
+import math
+import heapq
+import random
+from operator import itemgetter
+from typing import Dict, List, Any, Optional, Callable, Iterable, Iterator, Tuple
+from .index import OrderedIndex, Index
+from .query import Expr, And, Or, Not, Comparison, In, Between, StringMatch
+
+# =============================================================================
+# STATISTIK KOLOM
+# =============================================================================
+#
+# Statistik dihitung per kolom saat pertama kali dibutuhkan planner dan
+# dihitung ulang setelah tabel cukup banyak berubah. Tabel besar dianalisis
+# dari sampel acak (SAMPLE_ROWS baris, seed tetap); jumlah nilai unik
+# diperkirakan dengan estimator GEE (sqrt(n/s) * f1 + nilai yang muncul > 1x).
+
+SAMPLE_ROWS = 20000
+STATS_STALE_RATIO = 0.1
+STATS_MIN_CHANGES = 100
+
+# Selektivitas bawaan jika statistik tidak dapat dipakai
+_RANGE_SELECTIVITY = 1 / 3
+_STRING_SELECTIVITY = {'startswith': 0.1, 'contains': 0.25}
+
+
+class ColumnStats:
+    """
+    Statistik satu kolom: jumlah baris, nilai unik, None, min dan max
+    """
+
+    def __init__(
+        self,
+        row_count: int,
+        distinct: int,
+        null_count: int,
+        min_value: Any = None,
+        max_value: Any = None,
+        sampled: bool = False,
+        version: int = 0
+    ):
+        self.row_count = row_count
+        self.distinct = distinct
+        self.null_count = null_count
+        self.min_value = min_value
+        self.max_value = max_value
+        self.sampled = sampled
+        self.version = version
+
+    @property
+    def null_fraction(self) -> float:
+        """Proporsi baris bernilai None"""
+        return self.null_count / self.row_count if self.row_count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Statistik dalam bentuk dictionary (untuk analyze/explain)"""
+        return {
+            'row_count': self.row_count,
+            'distinct': self.distinct,
+            'null_count': self.null_count,
+            'min': self.min_value,
+            'max': self.max_value,
+            'sampled': self.sampled,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"ColumnStats(rows={self.row_count}, distinct={self.distinct}, "
+            f"nulls={self.null_count}, min={self.min_value!r}, max={self.max_value!r})"
+        )
+
+
+def sample_positions(row_count: int, sample_rows: int = SAMPLE_ROWS) -> Optional[List[int]]:
+    """
+    Posisi sampel acak (seed tetap) untuk tabel besar
+
+    Returns:
+        List posisi terurut, atau None jika seluruh baris diperiksa
+    """
+    if not sample_rows or row_count <= sample_rows:
+        return None
+    return sorted(random.Random(row_count).sample(range(row_count), sample_rows))
+
+
+def analyze_column(rows: List[Dict[str, Any]], column: str, sample_rows: int = SAMPLE_ROWS) -> ColumnStats:
+    """
+    Menghitung statistik satu kolom
+
+    Args:
+        rows: Baris data tabel
+        column: Nama kolom
+        sample_rows: Batas jumlah baris yang diperiksa (sampel acak)
+
+    Returns:
+        Instance ColumnStats
+    """
+    positions = sample_positions(len(rows), sample_rows)
+    sample = rows if positions is None else [rows[position] for position in positions]
+    return analyze_values([row.get(column) for row in sample], len(rows), positions is not None)
+
+
+def analyze_values(values: List[Any], row_count: int, sampled: bool = False) -> ColumnStats:
+    """
+    Menghitung statistik dari nilai kolom (seluruh baris atau sampel)
+
+    Args:
+        values: Nilai kolom, termasuk None
+        row_count: Jumlah baris tabel
+        sampled: True jika values adalah sampel dari sample_positions()
+
+    Returns:
+        Instance ColumnStats
+    """
+    present = [value for value in values if value is not None]
+
+    null_count = (len(values) - len(present)) * row_count // len(values) if values else 0
+
+    frequencies: Dict[Any, int] = {}
+    try:
+        for value in present:
+            frequencies[value] = frequencies.get(value, 0) + 1
+        distinct = len(frequencies)
+        if sampled and present:
+            singles = sum(1 for count in frequencies.values() if count == 1)
+            scale = math.sqrt(row_count / len(values))
+            distinct = min(int(scale * singles) + distinct - singles, row_count - null_count)
+    except TypeError:
+        distinct = len(present)
+
+    try:
+        min_value = min(present) if present else None
+        max_value = max(present) if present else None
+    except TypeError:
+        min_value = max_value = None
+
+    return ColumnStats(row_count, max(distinct, 1 if present else 0), null_count, min_value, max_value, sampled)
+
+
+# =============================================================================
+# ESTIMASI SELEKTIVITAS
+# =============================================================================
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _range_fraction(stats: ColumnStats, low: Any, high: Any) -> Optional[float]:
+    """Proporsi nilai dalam [low, high] dengan interpolasi linier min/max"""
+    minimum, maximum = stats.min_value, stats.max_value
+    if not (_is_number(minimum) and _is_number(maximum)):
+        return None
+    low = minimum if low is None else low
+    high = maximum if high is None else high
+    if not (_is_number(low) and _is_number(high)):
+        return None
+    if high < low or high < minimum or low > maximum:
+        return 0.0
+    if maximum == minimum:
+        return 1.0
+
+    covered = min(high, maximum) - max(low, minimum)
+    return max(covered / (maximum - minimum), 1.0 / max(stats.distinct, 1))
+
+
+def estimate_selectivity(expr: Expr, stats: Callable[[str], ColumnStats]) -> float:
+    """
+    Memperkirakan proporsi baris yang memenuhi ekspresi
+
+    Args:
+        expr: Ekspresi kondisi
+        stats: Fungsi nama kolom -> ColumnStats
+
+    Returns:
+        Selektivitas antara 0.0 dan 1.0
+    """
+    if isinstance(expr, And):
+        selectivity = 1.0
+        for operand in expr.operands:
+            selectivity *= estimate_selectivity(operand, stats)
+        return selectivity
+
+    if isinstance(expr, Or):
+        remaining = 1.0
+        for operand in expr.operands:
+            remaining *= 1.0 - estimate_selectivity(operand, stats)
+        return 1.0 - remaining
+
+    if isinstance(expr, Not):
+        return 1.0 - estimate_selectivity(expr.operand, stats)
+
+    if isinstance(expr, StringMatch):
+        column = stats(expr.column)
+        return (1.0 - column.null_fraction) * _STRING_SELECTIVITY[expr.kind]
+
+    if isinstance(expr, In):
+        column = stats(expr.column)
+        return min(1.0, len(set(map(repr, expr.values))) / max(column.distinct, 1)) * (1.0 - column.null_fraction)
+
+    if isinstance(expr, Between):
+        column = stats(expr.column)
+        fraction = _range_fraction(column, expr.low, expr.high)
+        return (1.0 - column.null_fraction) * (_RANGE_SELECTIVITY if fraction is None else fraction)
+
+    if isinstance(expr, Comparison):
+        column = stats(expr.column)
+        if expr.value is None and expr.op in ('==', '!='):
+            fraction = column.null_fraction
+            return fraction if expr.op == '==' else 1.0 - fraction
+
+        not_null = 1.0 - column.null_fraction
+        if not expr.is_constant:
+            return not_null * _RANGE_SELECTIVITY
+
+        if expr.op in ('==', '!='):
+            equal = not_null / max(column.distinct, 1)
+            fraction = _range_fraction(column, expr.value, expr.value)
+            if fraction == 0.0:
+                equal = 0.0
+            return equal if expr.op == '==' else not_null - equal
+
+        if expr.op in ('<', '<='):
+            fraction = _range_fraction(column, None, expr.value)
+        else:
+            fraction = _range_fraction(column, expr.value, None)
+        return not_null * (_RANGE_SELECTIVITY if fraction is None else fraction)
+
+    return _RANGE_SELECTIVITY
+
+
+# =============================================================================
+# JALUR AKSES
+# =============================================================================
+
+ACCESS_FULL_SCAN = 'full_scan'
+ACCESS_PRIMARY_KEY = 'primary_key'
+ACCESS_INDEX_LOOKUP = 'index_lookup'
+ACCESS_INDEX_RANGE = 'index_range'
+
+
+class AccessPath:
+    """
+    Cara mengambil baris kandidat: full scan, primary key, lookup atau rentang index
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        rows: int,
+        cost: float,
+        column: Optional[str] = None,
+        index: Optional[Index] = None,
+        values: Tuple[Any, ...] = (),
+        bounds: Optional[Tuple[Any, Any, bool, bool]] = None,
+        covered: Tuple[Expr, ...] = ()
+    ):
+        """
+        Args:
+            kind: Jenis akses (ACCESS_*)
+            rows: Perkiraan (atau jumlah pasti dari index) baris kandidat
+            cost: Perkiraan biaya dalam satuan "baris diperiksa"
+            column: Kolom index
+            index: Index yang dipakai
+            values: Nilai yang dicari (lookup)
+            bounds: (low, high, include_low, include_high) untuk rentang
+            covered: Bagian kondisi yang sudah dipenuhi oleh akses ini
+        """
+        self.kind = kind
+        self.rows = rows
+        self.cost = cost
+        self.column = column
+        self.index = index
+        self.values = values
+        self.bounds = bounds
+        self.covered = covered
+
+    def fetch(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Mengambil baris kandidat
+
+        Args:
+            data: Seluruh baris tabel (untuk full scan)
+
+        Returns:
+            List baris kandidat (data itu sendiri untuk full scan)
+        """
+        if self.kind == ACCESS_FULL_SCAN:
+            return data
+        if self.kind == ACCESS_INDEX_RANGE:
+            return self.index.range(*self.bounds)
+        if len(self.values) == 1:
+            return self.index.lookup(self.values[0])
+
+        rows: List[Dict[str, Any]] = []
+        for value in self.values:
+            rows.extend(self.index.lookup(value))
+        return rows
+
+    def describe(self) -> Dict[str, Any]:
+        """Ringkasan jalur akses untuk explain"""
+        info: Dict[str, Any] = {'access': self.kind, 'rows': self.rows, 'cost': round(self.cost, 2)}
+        if self.column is not None:
+            info['column'] = self.column
+            info['index'] = self.index.kind
+        if self.covered:
+            info['condition'] = " & ".join(repr(term) for term in self.covered)
+        return info
+
+    def __repr__(self) -> str:
+        column = f", column='{self.column}'" if self.column else ""
+        return f"AccessPath('{self.kind}'{column}, rows={self.rows}, cost={self.cost:.1f})"
+
+
+class QueryPlan:
+    """
+    Rencana eksekusi: satu jalur akses lalu filter sisa (paling selektif dulu)
+    """
+
+    def __init__(
+        self,
+        expr: Optional[Expr],
+        access: AccessPath,
+        filters: List[Expr],
+        considered: List[AccessPath],
+        stats: Callable[[str], ColumnStats]
+    ):
+        self.expr = expr
+        self.access = access
+        self.filters = filters
+        self.considered = considered
+        self._stats = stats
+        self._estimated_rows: Optional[float] = None
+
+    @property
+    def estimated_rows(self) -> float:
+        """Perkiraan jumlah baris hasil (statistik kolom dihitung saat dibutuhkan)"""
+        if self._estimated_rows is None:
+            estimated = float(self.access.rows)
+            for term in self.filters:
+                estimated *= estimate_selectivity(term, self._stats)
+            self._estimated_rows = estimated
+        return self._estimated_rows
+
+    def _filter_expr(self) -> Optional[Expr]:
+        """Ekspresi filter sisa (dicache di ekspresi asal agar tidak dikompilasi ulang)"""
+        if not self.filters:
+            return None
+        if len(self.filters) == 1:
+            return self.filters[0]
+
+        cache = self.expr.__dict__.setdefault('_residual_filters', {})
+        key = tuple(id(term) for term in self.filters)
+        residual = cache.get(key)
+        if residual is None:
+            residual = cache[key] = And(*self.filters)
+        return residual
+
+    def execute(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Menjalankan rencana
+
+        Args:
+            data: Seluruh baris tabel
+
+        Returns:
+            List baris hasil (list baru, bukan data tabel)
+        """
+        rows = self.access.fetch(data)
+        residual = self._filter_expr()
+        if residual is not None:
+            return residual.filter(rows)
+        return list(rows) if rows is data else rows
+
+    def iterate(self, data: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Menjalankan rencana secara lazy (baris dievaluasi saat diiterasi)
+
+        Args:
+            data: Seluruh baris tabel
+
+        Returns:
+            Iterator baris hasil
+        """
+        rows = self.access.fetch(data)
+        residual = self._filter_expr()
+        if residual is None:
+            return iter(rows)
+        return filter(residual.compile(), rows)
+
+    def describe(self) -> Dict[str, Any]:
+        """Ringkasan rencana untuk Table.explain"""
+        plan = self.access.describe()
+        plan['filters'] = [repr(term) for term in self.filters]
+        plan['estimated_rows'] = int(round(self.estimated_rows))
+        plan['considered'] = [path.describe() for path in self.considered]
+        return plan
+
+    def __repr__(self) -> str:
+        return f"QueryPlan({self.access!r}, filters={len(self.filters)}, estimated_rows={self.estimated_rows:.0f})"
+
+
+# =============================================================================
+# PLANNER
+# =============================================================================
+
+def _lookup_values(term: Expr) -> Optional[Tuple[Any, ...]]:
+    """Nilai kesamaan yang dapat dicari lewat index, atau None"""
+    if isinstance(term, Comparison) and term.op == '==' and term.is_constant:
+        return (term.value,)
+    if isinstance(term, In):
+        try:
+            return tuple(dict.fromkeys(term.values))
+        except TypeError:
+            return None
+    return None
+
+
+def _range_terms(conjuncts: List[Expr]) -> Dict[str, List[Expr]]:
+    """Konjungsi rentang (<, <=, >, >=, between dengan konstanta) per kolom"""
+    ranges: Dict[str, List[Expr]] = {}
+    for term in conjuncts:
+        if isinstance(term, Between) and term.low is not None and term.high is not None:
+            ranges.setdefault(term.column, []).append(term)
+        elif (isinstance(term, Comparison) and term.op in ('<', '<=', '>', '>=')
+              and term.is_constant and term.value is not None):
+            ranges.setdefault(term.column, []).append(term)
+    return ranges
+
+
+def _merge_bounds(terms: List[Expr]) -> Optional[Tuple[Any, Any, bool, bool]]:
+    """Menggabungkan beberapa batas rentang menjadi batas tersempit"""
+    low = high = None
+
+    def tighter(current, value, inclusive, larger):
+        if current is None:
+            return (value, inclusive)
+        if (value > current[0]) if larger else (value < current[0]):
+            return (value, inclusive)
+        if value == current[0] and not inclusive:
+            return (value, False)
+        return current
+
+    try:
+        for term in terms:
+            if isinstance(term, Between):
+                low = tighter(low, term.low, True, True)
+                high = tighter(high, term.high, True, False)
+            elif term.op in ('>', '>='):
+                low = tighter(low, term.value, term.op == '>=', True)
+            else:
+                high = tighter(high, term.value, term.op == '<=', False)
+    except TypeError:
+        return None
+
+    return (
+        low[0] if low else None,
+        high[0] if high else None,
+        low[1] if low else True,
+        high[1] if high else True,
+    )
+
+
+def plan_query(
+    expr: Optional[Expr],
+    row_count: int,
+    stats: Callable[[str], ColumnStats],
+    indexes: Dict[str, Index],
+    primary: Optional[Index] = None
+) -> QueryPlan:
+    """
+    Memilih jalur akses termurah dan urutan filter untuk ekspresi
+
+    Biaya dihitung dalam satuan baris yang diperiksa: full scan = jumlah baris,
+    lookup/rentang index = jumlah kandidat pasti dari index (+ log2 n untuk
+    index terurut). Filter sisa diurutkan dari yang paling selektif menurut
+    statistik kolom.
+
+    Args:
+        expr: Ekspresi kondisi (None = semua baris)
+        row_count: Jumlah baris tabel
+        stats: Fungsi nama kolom -> ColumnStats (dipanggil hanya jika perlu)
+        indexes: Index kolom yang siap pakai
+        primary: Peta primary key (kolom 'id'), jika ada
+
+    Returns:
+        Instance QueryPlan
+    """
+    full_scan = AccessPath(ACCESS_FULL_SCAN, row_count, float(row_count))
+    if expr is None:
+        return QueryPlan(None, full_scan, [], [full_scan], stats)
+
+    conjuncts = expr.conjuncts()
+    log_cost = math.log2(row_count + 1)
+    paths = [full_scan]
+
+    candidates = list(indexes.items())
+    if primary is not None:
+        candidates.append((primary.column, primary))
+
+    for term in conjuncts:
+        values = _lookup_values(term)
+        if values is None:
+            continue
+        for column, index in candidates:
+            if column != term.column:
+                continue
+            count = sum(index.count(value) for value in values)
+            extra = log_cost if index.kind == OrderedIndex.kind else 1.0
+            kind = ACCESS_PRIMARY_KEY if index is primary else ACCESS_INDEX_LOOKUP
+            paths.append(AccessPath(
+                kind, count, count + extra * len(values), column, index, values=values, covered=(term,)
+            ))
+
+    for column, terms in _range_terms(conjuncts).items():
+        index = indexes.get(column)
+        if index is None or index.kind != OrderedIndex.kind:
+            continue
+        bounds = _merge_bounds(terms)
+        if bounds is None:
+            continue
+        count = index.count_range(*bounds)
+        paths.append(AccessPath(
+            ACCESS_INDEX_RANGE, count, count + log_cost, column, index, bounds=bounds, covered=tuple(terms)
+        ))
+
+    access = min(paths, key=lambda path: path.cost)
+    covered = {id(term) for term in access.covered}
+    residual = [term for term in conjuncts if id(term) not in covered]
+
+    if len(residual) > 1:
+        selectivity = {id(term): estimate_selectivity(term, stats) for term in residual}
+        residual.sort(key=lambda term: selectivity[id(term)])
+
+    return QueryPlan(expr, access, residual, paths, stats)
+
+
+# =============================================================================
+# PENGURUTAN
+# =============================================================================
+#
+# Urutan mengikuti index terurut: None dianggap paling besar (di akhir untuk
+# urutan menaik, di awal untuk urutan menurun). Dengan limit, hanya
+# offset + limit baris teratas yang dipertahankan (heapq, O(n log k)).
+
+_DIRECTIONS = {'asc': False, 'desc': True}
+
+
+def normalize_order(order_by: Any) -> List[Tuple[str, bool]]:
+    """
+    Normalisasi spesifikasi urutan menjadi list (kolom, menurun)
+
+    Args:
+        order_by: 'kolom', ('kolom', 'desc') atau list keduanya
+
+    Returns:
+        List (nama kolom, True jika menurun)
+
+    Raises:
+        ValueError: Jika spesifikasi tidak valid
+    """
+    if isinstance(order_by, (str, tuple)):
+        order_by = [order_by]
+
+    order = []
+    for item in order_by:
+        if isinstance(item, str):
+            column, direction = item, 'asc'
+        elif isinstance(item, (tuple, list)) and len(item) == 2:
+            column, direction = item
+        else:
+            raise ValueError(f"Spesifikasi order_by tidak valid: {item!r}")
+
+        direction = str(direction).lower()
+        if direction not in _DIRECTIONS:
+            raise ValueError(f"Arah urutan harus 'asc' atau 'desc', bukan {direction!r}")
+        order.append((column, _DIRECTIONS[direction]))
+
+    if not order:
+        raise ValueError("order_by tidak boleh kosong")
+    return order
+
+
+class _Descending:
+    """Pembungkus kunci untuk kolom menurun dalam urutan campuran"""
+
+    __slots__ = ('key',)
+
+    def __init__(self, key: Any):
+        self.key = key
+
+    def __lt__(self, other: '_Descending') -> bool:
+        return other.key < self.key
+
+    def __eq__(self, other: Any) -> bool:
+        return self.key == other.key
+
+
+def _sort_single(rows: Iterable[Dict[str, Any]], column: str, descending: bool, limit: Optional[int]) -> List[Dict[str, Any]]:
+    """Urutan satu kolom: baris None dipisah agar kunci cukup itemgetter (C)"""
+    key = itemgetter(column)
+    if limit is None:
+        values: List[Dict[str, Any]] = []
+        nulls: List[Dict[str, Any]] = []
+        for row in rows:
+            (nulls if row.get(column) is None else values).append(row)
+        if descending:
+            return nulls + sorted(values, key=key, reverse=True)
+        return sorted(values, key=key) + nulls
+
+    # Top-k: hanya limit baris teratas dan limit baris None pertama yang
+    # disimpan, sehingga iterator (mis. tabel stream) dibaca dengan memori terbatas
+    null_rows: List[Dict[str, Any]] = []
+
+    def present() -> Iterator[Dict[str, Any]]:
+        for row in rows:
+            if row.get(column) is not None:
+                yield row
+            elif len(null_rows) < limit:
+                null_rows.append(row)
+
+    if descending:
+        top = heapq.nlargest(limit, present(), key=key)
+        return (null_rows + top)[:limit]
+    top = heapq.nsmallest(limit, present(), key=key)
+    return top + null_rows[:limit - len(top)]
+
+
+def sort_rows(
+    rows: Iterable[Dict[str, Any]],
+    order: List[Tuple[str, bool]],
+    limit: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Mengurutkan baris (stabil); dengan limit hanya limit baris teratas (top-k)
+
+    Args:
+        rows: Baris yang diurutkan
+        order: Hasil normalize_order
+        limit: Jumlah baris teratas yang dibutuhkan (None = semua)
+
+    Returns:
+        List baris terurut
+
+    Raises:
+        TypeError: Jika nilai kolom tidak dapat dibandingkan
+    """
+    if len(order) == 1:
+        column, descending = order[0]
+        return _sort_single(rows, column, descending, limit)
+
+    directions = {descending for _, descending in order}
+    if len(directions) == 1:
+        # Satu arah untuk semua kolom: cukup tuple (None?, nilai) dan reverse
+        descending = directions.pop()
+        columns = [column for column, _ in order]
+
+        def key(row):
+            return tuple((row.get(column) is None, row.get(column)) for column in columns)
+
+        if limit is None:
+            return sorted(rows, key=key, reverse=descending)
+        select = heapq.nlargest if descending else heapq.nsmallest
+        return select(limit, rows, key=key)
+
+    def mixed_key(row):
+        parts = []
+        for column, descending in order:
+            value = row.get(column)
+            part = (value is None, value)
+            parts.append(_Descending(part) if descending else part)
+        return tuple(parts)
+
+    if limit is None:
+        return sorted(rows, key=mixed_key)
+    return heapq.nsmallest(limit, rows, key=mixed_key)
@@ -0,0 +1,514 @@
+import re
+import math
+from abc import ABC, abstractmethod
+from typing import Dict, List, Any, Callable, Iterable, Set, Tuple
+
+# =============================================================================
+# EKSPRESI KONDISI
+# =============================================================================
+#
+# Kondisi deklaratif untuk select_data/update_data/delete_data/count_data:
+#
+#   (col('age') > 30) & (col('country') == 'ID')
+#   col('status').isin(['aktif', 'baru']) | col('deleted_at').is_null()
+#
+# Berbeda dengan lambda, ekspresi dapat diperiksa oleh Table (kolom yang
+# dipakai, konjungsi kesamaan untuk index) dan dikompilasi menjadi satu
+# fungsi Python (kode sumber dibangkitkan sekali per ekspresi) sehingga full
+# scan tidak membayar pemanggilan fungsi bertingkat per baris.
+#
+# Setiap ekspresi dibangkitkan dalam dua versi: versi cepat (row[kolom], tanpa
+# pengecekan None, konstanta sederhana sebagai literal) dan versi aman
+# (row.get(kolom) dengan pengecekan None). Versi aman hanya dipakai ulang jika
+# versi cepat gagal karena kolom hilang (KeyError) atau None ikut
+# dibandingkan (TypeError).
+#
+# Catatan: & dan | mengikat lebih kuat daripada perbandingan, jadi setiap
+# perbandingan harus diberi kurung.
+#
+# Perbandingan urutan (<, <=, >, >=, between) bernilai False untuk None,
+# bukan TypeError seperti lambda biasa.
+
+_COMPARISONS = {
+    '==': '==',
+    '!=': '!=',
+    '<': '<',
+    '<=': '<=',
+    '>': '>',
+    '>=': '>=',
+}
+
+
+class _Compiler:
+    """Pengumpul konstanta untuk kode sumber yang dibangkitkan"""
+
+    def __init__(self):
+        self.columns: Dict[str, str] = {}
+        self.namespace: Dict[str, Any] = {}
+        self.safe = False
+
+    def column(self, name: str) -> str:
+        """Kode untuk membaca nilai kolom dari baris"""
+        if name not in self.columns:
+            self.columns[name] = self.constant(name)
+        if self.safe:
+            return f"row.get({self.columns[name]})"
+        return f"row[{self.columns[name]}]"
+
+    def constant(self, value: Any) -> str:
+        """Literal untuk konstanta sederhana, selain itu nama global di namespace"""
+        if value is None:
+            return 'None'
+        if isinstance(value, bool):
+            return repr(bool(value))
+        if isinstance(value, int):
+            return repr(int(value))
+        if isinstance(value, str):
+            return repr(str(value))
+        if isinstance(value, float) and math.isfinite(value):
+            return repr(float(value))
+
+        name = f"k{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def guard(self, *operands: str) -> str:
+        """Pengecekan None untuk perbandingan urutan (hanya versi aman)"""
+        if not self.safe:
+            return ""
+        return "".join(f"{operand} is not None and " for operand in operands)
+
+    def operand(self, value: Any) -> str:
+        """Kolom (Field) atau konstanta"""
+        if isinstance(value, Field):
+            return self.column(value.name)
+        return self.constant(value)
+
+    def build(self, expr: 'Expr', template: str, name: str) -> Callable:
+        """Membangkitkan fungsi dari template (versi cepat dan versi row.get)"""
+        self.safe = False
+        fast = expr._source(self)
+        self.safe = True
+        safe = expr._source(self)
+
+        source = template.format(fast=fast, safe=safe)
+        namespace = dict(self.namespace)
+        exec(compile(source, f"<pydb query {name}>", 'exec'), namespace)
+        return namespace[name]
+
+
+_MATCH_TEMPLATE = """\
+def match(row):
+    try:
+        return bool({fast})
+    except (KeyError, TypeError, AttributeError):
+        return bool({safe})
+"""
+
+_FILTER_TEMPLATE = """\
+def filter_rows(rows):
+    try:
+        return [row for row in rows if {fast}]
+    except (KeyError, TypeError, AttributeError):
+        return [row for row in rows if {safe}]
+"""
+
+
+class Expr(ABC):
+    """
+    Basis ekspresi kondisi; dapat dipanggil seperti lambda (expr(row) -> bool)
+    """
+
+    def __and__(self, other: 'Expr') -> 'Expr':
+        return And(self, _require_expr(other))
+
+    def __or__(self, other: 'Expr') -> 'Expr':
+        return Or(self, _require_expr(other))
+
+    def __invert__(self) -> 'Expr':
+        return Not(self)
+
+    def __bool__(self):
+        raise TypeError(
+            "Ekspresi kondisi tidak dapat dipakai sebagai bool; gunakan &, | dan ~ "
+            "(beri kurung pada setiap perbandingan) atau between()"
+        )
+
+    def __call__(self, row: Dict[str, Any]) -> bool:
+        return self.compile()(row)
+
+    @abstractmethod
+    def _source(self, compiler: _Compiler) -> str:
+        """Kode sumber Python ekspresi untuk fungsi predikat terkompilasi"""
+
+    @abstractmethod
+    def columns(self) -> Set[str]:
+        """Nama kolom yang dipakai ekspresi"""
+
+    def conjuncts(self) -> List['Expr']:
+        """Ekspresi yang digabung dengan AND di level teratas"""
+        return [self]
+
+    @abstractmethod
+    def key(self) -> Tuple[Any, ...]:
+        """
+        Deskripsi ekspresi yang hashable (untuk cache hasil query)
+
+        Konstanta disertai nama tipenya agar 1, 1.0 dan True tidak tertukar.
+
+        Raises:
+            TypeError: Jika konstanta tidak hashable
+        """
+
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        """
+        Mengompilasi ekspresi menjadi predikat satu baris
+
+        Returns:
+            Fungsi row -> bool (dicache di ekspresi)
+        """
+        compiled = self.__dict__.get('_match')
+        if compiled is None:
+            compiled = _Compiler().build(self, _MATCH_TEMPLATE, 'match')
+            self._match = compiled
+        return compiled
+
+    def filter(self, rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Menyaring baris dengan satu loop terkompilasi (tanpa pemanggilan predikat per baris)
+
+        Args:
+            rows: Baris yang akan disaring
+
+        Returns:
+            List baris yang memenuhi ekspresi
+        """
+        compiled = self.__dict__.get('_filter')
+        if compiled is None:
+            compiled = _Compiler().build(self, _FILTER_TEMPLATE, 'filter_rows')
+            self._filter = compiled
+        if not isinstance(rows, (list, tuple)):
+            # Dapat dievaluasi ulang (fallback KeyError) tanpa kehilangan baris
+            rows = list(rows)
+        return compiled(rows)
+
+
+def _constant_key(value: Any) -> Tuple[str, Any]:
+    """Kunci hashable untuk konstanta atau referensi kolom"""
+    if isinstance(value, Field):
+        return ('col', value.name)
+    hash(value)
+    return (type(value).__name__, value)
+
+
+def _require_expr(value: Any) -> Expr:
+    if not isinstance(value, Expr):
+        raise TypeError(f"Operand kondisi harus ekspresi col(...), bukan {type(value).__name__}")
+    return value
+
+
+class Field:
+    """
+    Referensi kolom untuk membangun ekspresi (dibuat dengan col())
+    """
+
+    def __init__(self, name: str):
+        if not isinstance(name, str) or not name:
+            raise ValueError("Nama kolom harus string tidak kosong")
+        self.name = name
+
+    def _compare(self, op: str, value: Any) -> 'Comparison':
+        return Comparison(self.name, op, value)
+
+    def __eq__(self, value: Any) -> 'Comparison':  # type: ignore[override]
+        return self._compare('==', value)
+
+    def __ne__(self, value: Any) -> 'Comparison':  # type: ignore[override]
+        return self._compare('!=', value)
+
+    def __lt__(self, value: Any) -> 'Comparison':
+        return self._compare('<', value)
+
+    def __le__(self, value: Any) -> 'Comparison':
+        return self._compare('<=', value)
+
+    def __gt__(self, value: Any) -> 'Comparison':
+        return self._compare('>', value)
+
+    def __ge__(self, value: Any) -> 'Comparison':
+        return self._compare('>=', value)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def isin(self, values: Iterable[Any]) -> 'In':
+        """Nilai kolom termasuk salah satu values"""
+        return In(self.name, values)
+
+    def between(self, low: Any, high: Any) -> 'Between':
+        """low <= nilai kolom <= high"""
+        return Between(self.name, low, high)
+
+    def is_null(self) -> 'Comparison':
+        """Nilai kolom None"""
+        return Comparison(self.name, '==', None)
+
+    def is_not_null(self) -> 'Comparison':
+        """Nilai kolom tidak None"""
+        return Comparison(self.name, '!=', None)
+
+    def startswith(self, prefix: str) -> 'StringMatch':
+        """Nilai kolom (string) diawali prefix"""
+        return StringMatch(self.name, 'startswith', prefix)
+
+    def contains(self, text: str) -> 'StringMatch':
+        """Nilai kolom (string) mengandung text"""
+        return StringMatch(self.name, 'contains', text)
+
+    def like(self, pattern: str) -> Expr:
+        """
+        Pola LIKE SQL: % = karakter apa pun (boleh kosong), _ = tepat satu karakter
+
+        Pola tanpa wildcard, 'awalan%' dan '%teks%' diubah menjadi ==,
+        startswith() dan contains() agar tetap dapat memakai index/planner.
+        Pencocokan peka huruf besar-kecil.
+        """
+        if not isinstance(pattern, str):
+            raise ValueError(f"Pola LIKE harus string, bukan {pattern!r}")
+        if '_' not in pattern:
+            if '%' not in pattern:
+                return Comparison(self.name, '==', pattern)
+            if '%' not in pattern[:-1]:
+                return StringMatch(self.name, 'startswith', pattern[:-1])
+            if len(pattern) >= 2 and pattern[0] == '%' and '%' not in pattern[1:-1] and pattern[-1] == '%':
+                return StringMatch(self.name, 'contains', pattern[1:-1])
+        return Like(self.name, pattern)
+
+    def __repr__(self) -> str:
+        return f"col({self.name!r})"
+
+
+def col(name: str) -> Field:
+    """
+    Membuat referensi kolom untuk ekspresi kondisi
+
+    Example:
+        >>> users.select_data((col('age') > 30) & (col('country') == 'ID'))
+
+    Args:
+        name: Nama kolom
+
+    Returns:
+        Instance Field
+    """
+    return Field(name)
+
+
+class Comparison(Expr):
+    """Perbandingan kolom dengan konstanta atau kolom lain"""
+
+    def __init__(self, column: str, op: str, value: Any):
+        if op not in _COMPARISONS:
+            raise ValueError(f"Operator perbandingan tidak didukung: {op}")
+        self.column = column
+        self.op = op
+        self.value = value
+
+    def _source(self, compiler: _Compiler) -> str:
+        left = compiler.column(self.column)
+        right = compiler.operand(self.value)
+        if self.op in ('==', '!='):
+            if self.value is None:
+                return f"({left} is {'' if self.op == '==' else 'not '}None)"
+            return f"({left} {self.op} {right})"
+
+        guard = compiler.guard(left, right) if isinstance(self.value, Field) else compiler.guard(left)
+        return f"({guard}{left} {self.op} {right})"
+
+    def columns(self) -> Set[str]:
+        columns = {self.column}
+        if isinstance(self.value, Field):
+            columns.add(self.value.name)
+        return columns
+
+    def key(self) -> Tuple[Any, ...]:
+        return ('cmp', self.column, self.op, _constant_key(self.value))
+
+    @property
+    def is_constant(self) -> bool:
+        """True jika dibandingkan dengan konstanta (bukan kolom lain)"""
+        return not isinstance(self.value, Field)
+
+    def __repr__(self) -> str:
+        if self.value is None and self.op in ('==', '!='):
+            return f"col({self.column!r}).{'is_null' if self.op == '==' else 'is_not_null'}()"
+        return f"(col({self.column!r}) {self.op} {self.value!r})"
+
+
+class In(Expr):
+    """Keanggotaan nilai kolom dalam himpunan konstanta"""
+
+    def __init__(self, column: str, values: Iterable[Any]):
+        self.column = column
+        self.values = tuple(values)
+
+    def _source(self, compiler: _Compiler) -> str:
+        try:
+            values = frozenset(self.values)
+        except TypeError:
+            values = self.values
+        return f"({compiler.column(self.column)} in {compiler.constant(values)})"
+
+    def columns(self) -> Set[str]:
+        return {self.column}
+
+    def key(self) -> Tuple[Any, ...]:
+        return ('in', self.column, tuple(map(_constant_key, self.values)))
+
+    def __repr__(self) -> str:
+        return f"col({self.column!r}).isin({list(self.values)!r})"
+
+
+class Between(Expr):
+    """Rentang inklusif low <= kolom <= high"""
+
+    def __init__(self, column: str, low: Any, high: Any):
+        self.column = column
+        self.low = low
+        self.high = high
+
+    def _source(self, compiler: _Compiler) -> str:
+        value = compiler.column(self.column)
+        low = compiler.constant(self.low)
+        high = compiler.constant(self.high)
+        return f"({compiler.guard(value)}{low} <= {value} <= {high})"
+
+    def columns(self) -> Set[str]:
+        return {self.column}
+
+    def key(self) -> Tuple[Any, ...]:
+        return ('between', self.column, _constant_key(self.low), _constant_key(self.high))
+
+    def __repr__(self) -> str:
+        return f"col({self.column!r}).between({self.low!r}, {self.high!r})"
+
+
+class StringMatch(Expr):
+    """Pencocokan string (startswith / contains)"""
+
+    def __init__(self, column: str, kind: str, text: str):
+        if kind not in ('startswith', 'contains'):
+            raise ValueError(f"Jenis pencocokan string tidak didukung: {kind}")
+        self.column = column
+        self.kind = kind
+        self.text = text
+
+    def _source(self, compiler: _Compiler) -> str:
+        value = compiler.column(self.column)
+        text = compiler.constant(self.text)
+        if self.kind == 'startswith':
+            return f"({compiler.guard(value)}{value}.startswith({text}))"
+        return f"({compiler.guard(value)}{text} in {value})"
+
+    def columns(self) -> Set[str]:
+        return {self.column}
+
+    def key(self) -> Tuple[Any, ...]:
+        return (self.kind, self.column, _constant_key(self.text))
+
+    def __repr__(self) -> str:
+        return f"col({self.column!r}).{self.kind}({self.text!r})"
+
+
+class Like(Expr):
+    """Pola LIKE umum (dibuat lewat col(...).like()), dicocokkan dengan regex"""
+
+    def __init__(self, column: str, pattern: str):
+        self.column = column
+        self.pattern = pattern
+        regex = ''.join(
+            '.*' if char == '%' else '.' if char == '_' else re.escape(char)
+            for char in pattern
+        )
+        self._regex = re.compile(regex, re.DOTALL)
+
+    def _source(self, compiler: _Compiler) -> str:
+        value = compiler.column(self.column)
+        match = compiler.constant(self._regex.fullmatch)
+        return f"({compiler.guard(value)}{match}({value}) is not None)"
+
+    def columns(self) -> Set[str]:
+        return {self.column}
+
+    def key(self) -> Tuple[Any, ...]:
+        return ('like', self.column, self.pattern)
+
+    def __repr__(self) -> str:
+        return f"col({self.column!r}).like({self.pattern!r})"
+
+
+class _Compound(Expr):
+    """Basis And/Or dengan operand yang diratakan"""
+
+    keyword = ''
+
+    def __init__(self, *operands: Expr):
+        flattened: List[Expr] = []
+        for operand in operands:
+            if type(operand) is type(self):
+                flattened.extend(operand.operands)
+            else:
+                flattened.append(_require_expr(operand))
+        self.operands: Tuple[Expr, ...] = tuple(flattened)
+
+    def _source(self, compiler: _Compiler) -> str:
+        joiner = f" {self.keyword} "
+        return "(" + joiner.join(operand._source(compiler) for operand in self.operands) + ")"
+
+    def columns(self) -> Set[str]:
+        columns: Set[str] = set()
+        for operand in self.operands:
+            columns |= operand.columns()
+        return columns
+
+    def key(self) -> Tuple[Any, ...]:
+        return (self.keyword,) + tuple(operand.key() for operand in self.operands)
+
+
+class And(_Compound):
+    """Konjungsi (a & b)"""
+
+    keyword = 'and'
+
+    def conjuncts(self) -> List[Expr]:
+        return list(self.operands)
+
+    def __repr__(self) -> str:
+        return " & ".join(repr(operand) for operand in self.operands)
+
+
+class Or(_Compound):
+    """Disjungsi (a | b)"""
+
+    keyword = 'or'
+
+    def __repr__(self) -> str:
+        return "(" + " | ".join(repr(operand) for operand in self.operands) + ")"
+
+
+class Not(Expr):
+    """Negasi (~a)"""
+
+    def __init__(self, operand: Expr):
+        self.operand = _require_expr(operand)
+
+    def _source(self, compiler: _Compiler) -> str:
+        return f"(not {self.operand._source(compiler)})"
+
+    def columns(self) -> Set[str]:
+        return self.operand.columns()
+
+    def key(self) -> Tuple[Any, ...]:
+        return ('not', self.operand.key())
+
+    def __repr__(self) -> str:
+        return f"~({self.operand!r})"
@@ -0,0 +1,964 @@
+import re
+import copy
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from typing import Dict, List, Any, Optional, Callable, Sequence, Set, Tuple, Union
+
+from .query import Expr, Field, Comparison, And, Or, Not, In, Between, col
+
+# =============================================================================
+# PARSER KLAUSA WHERE
+# =============================================================================
+#
+# Mengubah teks kondisi gaya SQL menjadi ekspresi col() sehingga memakai
+# jalur yang sama dengan kondisi dari kode: planner memilih index/primary
+# key untuk kesamaan dan rentang, sisanya dievaluasi sebagai satu predikat
+# terkompilasi.
+#
+#   age >= 30 AND (city = 'Bandung' OR city IN ('Jakarta', 'Bogor'))
+#   NOT active = true OR deleted_at IS NULL
+#   name LIKE 'Bud%' AND score BETWEEN 50 AND 80
+#
+# Prioritas operator: NOT > AND > OR. Perbandingan: = == != <> < <= > >=,
+# IN (...), BETWEEN a AND b, LIKE 'pola', IS [NOT] NULL, masing-masing dapat
+# diawali NOT. Kata kunci tidak peka huruf besar-kecil; nama kolom yang
+# bentrok dengan kata kunci ditulis dengan backtick (`order`).
+#
+# Konstanta dikonversi sekali ke tipe kolom (Column.data_type), misalnya
+# id = '5' menjadi id == 5, agar kesamaan cocok dengan index. Kolom yang
+# tidak dikenal ditolak, sehingga salah ketik tidak pernah berarti "semua
+# baris". Untuk kompatibilitas format lama 'kolom=nilai', kata tanpa kutip
+# di sisi kanan yang bukan nama kolom dianggap string. Klausa lama yang tidak
+# dapat diurai sebagai SQL (email=u1@ex.com, name=John Doe) diperlakukan
+# seperti dulu: satu kesamaan dengan seluruh sisi kanan sebagai nilainya.
+#
+# NULL mengikuti ekspresi col(): != dan NOT bernilai benar untuk baris NULL
+# (bukan logika tiga nilai SQL); pakai IS NOT NULL untuk mengecualikannya.
+#
+# Konstanta dapat ditulis sebagai parameter ? (posisi) atau :nama yang diisi
+# saat eksekusi, sehingga teks query yang sama dapat dicache dan dipakai ulang.
+
+KEYWORDS = frozenset({
+    'AND', 'OR', 'NOT', 'IN', 'BETWEEN', 'LIKE', 'IS', 'NULL', 'TRUE', 'FALSE',
+    'SELECT', 'FROM', 'WHERE', 'GROUP', 'ORDER', 'BY', 'ASC', 'DESC', 'LIMIT',
+    'OFFSET', 'AS', 'INSERT', 'INTO', 'VALUES', 'UPDATE', 'SET', 'DELETE',
+})
+
+_TOKEN = re.compile(r"""
+    (?P<space>\s+)
+  | (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)
+  | (?P<string>'(?:[^']|'')*'|"(?:[^"]|"")*")
+  | (?P<quoted>`[^`]+`)
+  | (?P<word>[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<op><=|>=|<>|!=|==|[=<>(),*;?-]|:[A-Za-z_][A-Za-z0-9_]*)
+""", re.VERBOSE)
+
+_COMPARISON_OPS = {'=': '==', '==': '==', '!=': '!=', '<>': '!=', '<': '<', '<=': '<=', '>': '>', '>=': '>='}
+
+# Kebalikan operator saat konstanta ditulis di kiri (5 < age -> age > 5)
+_FLIPPED = {'==': '==', '!=': '!=', '<': '>', '<=': '>=', '>': '<', '>=': '<='}
+
+# Format lama 'kolom=nilai' (sisi kanan apa adanya, termasuk spasi dan simbol)
+_LEGACY_EQUALITY = re.compile(r'^\s*(\w+)\s*=\s*(.+?)\s*$', re.DOTALL)
+
+_TRUE_WORDS = ('true', '1', 'yes', 'ya')
+_FALSE_WORDS = ('false', '0', 'no', 'tidak')
+
+
+class Token:
+    """Satu token teks query"""
+
+    __slots__ = ('kind', 'value', 'text', 'position')
+
+    def __init__(self, kind: str, value: Any, text: str, position: int):
+        self.kind = kind
+        self.value = value
+        self.text = text
+        self.position = position
+
+    def is_keyword(self, *words: str) -> bool:
+        """True jika token adalah kata kunci (kata tanpa kutip) salah satu words"""
+        return self.kind == 'word' and self.text.upper() in words
+
+    def __repr__(self) -> str:
+        return f"Token({self.kind}, {self.text!r})"
+
+
+def tokenize(text: str) -> List[Token]:
+    """
+    Memecah teks query menjadi token (diakhiri token 'end')
+
+    Raises:
+        ValueError: Jika ada karakter yang tidak dikenal
+    """
+    if not isinstance(text, str):
+        raise ValueError(f"Query harus string, bukan {type(text).__name__}")
+
+    tokens: List[Token] = []
+    position = 0
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if match is None:
+            raise ValueError(f"Karakter tidak dikenal di posisi {position}: {text[position]!r}")
+        kind = match.lastgroup
+        raw = match.group()
+        if kind == 'number':
+            value: Any = float(raw) if any(char in raw for char in '.eE') else int(raw)
+            tokens.append(Token(kind, value, raw, position))
+        elif kind == 'string':
+            quote = raw[0]
+            tokens.append(Token(kind, raw[1:-1].replace(quote * 2, quote), raw, position))
+        elif kind == 'quoted':
+            tokens.append(Token('name', raw[1:-1], raw, position))
+        elif kind != 'space':
+            tokens.append(Token(kind, raw, raw, position))
+        position = match.end()
+
+    tokens.append(Token('end', None, '', len(text)))
+    return tokens
+
+
+def _to_integer(value: Any) -> int:
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError
+    return int(value)
+
+
+def _to_number(value: Any) -> Any:
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            return float(value)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise TypeError
+    return value
+
+
+def _to_boolean(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    word = str(value).strip().lower()
+    if word in _TRUE_WORDS:
+        return True
+    if word in _FALSE_WORDS:
+        return False
+    raise ValueError
+
+
+def _to_string(value: Any) -> str:
+    return value if isinstance(value, str) else str(value)
+
+
+# Konversi konstanta per nama tipe kolom (Column.get_data_type())
+_CONVERTERS = {
+    'Integer': _to_integer, 'int': _to_integer,
+    'Float': float, 'float': float,
+    'Number': _to_number,
+    'Boolean': _to_boolean, 'bool': _to_boolean,
+    'String': _to_string, 'str': _to_string,
+}
+
+
+def coerce_value(value: Any, type_name: Optional[str], column: str = '') -> Any:
+    """
+    Mengonversi konstanta ke tipe kolom
+
+    Args:
+        value: Konstanta hasil parsing
+        type_name: Nama tipe kolom (Column.get_data_type()), None = apa adanya
+        column: Nama kolom (untuk pesan error)
+
+    Raises:
+        ValueError: Jika konstanta tidak dapat dikonversi
+    """
+    converter = _CONVERTERS.get(type_name)
+    if value is None or converter is None:
+        return value
+    try:
+        return converter(value)
+    except (ValueError, TypeError, OverflowError):
+        raise ValueError(f"Nilai {value!r} tidak sesuai dengan tipe kolom '{column}' ({type_name})")
+
+
+def _legacy_value(text: str) -> Any:
+    """Nilai format lama 'kolom=nilai' untuk kolom tanpa tipe (true/false/null/angka/teks)"""
+    word = text.lower()
+    if word in ('true', 'false'):
+        return word == 'true'
+    if word == 'null':
+        return None
+    if text.isdigit():
+        return int(text)
+    if text.replace('.', '', 1).isdigit():
+        return float(text)
+    return text
+
+
+class Param:
+    """
+    Parameter query (? atau :nama) yang diisi saat eksekusi
+
+    Args:
+        key: Posisi (mulai 0) untuk ?, atau nama untuk :nama
+        column: Kolom tujuan (menentukan tipe konversi)
+        type_name: Nama tipe kolom
+    """
+
+    __slots__ = ('key', 'column', 'type_name')
+
+    def __init__(self, key: Union[int, str], column: Optional[str] = None, type_name: Optional[str] = None):
+        self.key = key
+        self.column = column
+        self.type_name = type_name
+
+    def resolve(self, params: Any) -> Any:
+        """
+        Nilai parameter, dikonversi ke tipe kolom
+
+        Raises:
+            ValueError: Jika parameter tidak diberikan atau tipenya tidak sesuai
+        """
+        try:
+            value = params[self.key]
+        except (KeyError, IndexError, TypeError):
+            name = f"ke-{self.key + 1}" if isinstance(self.key, int) else f"':{self.key}'"
+            raise ValueError(f"Parameter {name} tidak diberikan")
+        return coerce_value(value, self.type_name, self.column or '')
+
+    def __repr__(self) -> str:
+        return '?' if isinstance(self.key, int) else f":{self.key}"
+
+
+class ParamLike(Expr):
+    """Pola LIKE dari parameter; diubah menjadi col().like() saat parameter diisi"""
+
+    def __init__(self, column: str, pattern: Param):
+        self.column = column
+        self.pattern = pattern
+
+    def _source(self, compiler: Any) -> str:
+        # Placeholder ini selalu diganti oleh bind_expr sebelum dievaluasi
+        raise ValueError(f"Pola LIKE untuk kolom '{self.column}' belum diisi parameter")
+
+    def columns(self) -> Set[str]:
+        return {self.column}
+
+    def key(self) -> Tuple[Any, ...]:
+        return ('like', self.column, repr(self.pattern))
+
+    def __repr__(self) -> str:
+        return f"col({self.column!r}).like({self.pattern!r})"
+
+
+def bind_value(value: Any, params: Any) -> Any:
+    """Nilai konstanta, atau isi parameter jika value adalah Param"""
+    return value.resolve(params) if isinstance(value, Param) else value
+
+
+def bind_expr(expr: Expr, params: Any) -> Expr:
+    """
+    Membangun ulang ekspresi dengan parameter yang sudah diisi
+
+    Raises:
+        ValueError: Jika parameter tidak ada atau tidak valid
+    """
+    if isinstance(expr, ParamLike):
+        pattern = expr.pattern.resolve(params)
+        if not isinstance(pattern, str):
+            raise ValueError(f"Pola LIKE untuk kolom '{expr.column}' harus string")
+        return col(expr.column).like(pattern)
+    if isinstance(expr, Comparison):
+        value = bind_value(expr.value, params)
+        if value is None and expr.op not in ('==', '!='):
+            raise ValueError(f"NULL hanya dapat dibandingkan dengan = atau != (kolom '{expr.column}')")
+        return Comparison(expr.column, expr.op, value)
+    if isinstance(expr, In):
+        return In(expr.column, [bind_value(value, params) for value in expr.values])
+    if isinstance(expr, Between):
+        return Between(expr.column, bind_value(expr.low, params), bind_value(expr.high, params))
+    if isinstance(expr, (And, Or)):
+        return type(expr)(*[bind_expr(operand, params) for operand in expr.operands])
+    if isinstance(expr, Not):
+        return Not(bind_expr(expr.operand, params))
+    return expr
+
+
+class Parser:
+    """
+    Parser rekursif (recursive descent) untuk teks query
+
+    Args:
+        text: Teks query
+        column_types: Nama kolom -> nama tipe (Column.get_data_type());
+                      None = kolom tidak divalidasi dan konstanta tidak dikonversi
+    """
+
+    def __init__(self, text: str, column_types: Optional[Dict[str, str]] = None):
+        self.text = text
+        self.tokens = tokenize(text)
+        self.position = 0
+        self.column_types = column_types
+        self.positional = 0
+        self.named: Set[str] = set()
+
+    # -------------------------------------------------------------------------
+    # Navigasi token
+    # -------------------------------------------------------------------------
+
+    def peek(self, offset: int = 0) -> Token:
+        return self.tokens[min(self.position + offset, len(self.tokens) - 1)]
+
+    def advance(self) -> Token:
+        token = self.tokens[self.position]
+        if token.kind != 'end':
+            self.position += 1
+        return token
+
+    def accept(self, *words: str) -> Optional[Token]:
+        """Mengambil token jika berupa kata kunci/operator yang diminta"""
+        token = self.peek()
+        if token.is_keyword(*words) or (token.kind == 'op' and token.text in words):
+            return self.advance()
+        return None
+
+    def expect(self, *words: str) -> Token:
+        token = self.accept(*words)
+        if token is None:
+            raise self.error(f"diharapkan {' atau '.join(words)}")
+        return token
+
+    def expect_end(self) -> None:
+        self.accept(';')
+        if self.peek().kind != 'end':
+            raise self.error("sisa teks tidak dikenal")
+
+    def error(self, message: str) -> ValueError:
+        token = self.peek()
+        found = repr(token.text) if token.kind != 'end' else 'akhir teks'
+        return ValueError(f"Sintaks tidak valid di posisi {token.position} ({found}): {message}")
+
+    # -------------------------------------------------------------------------
+    # Nama dan konstanta
+    # -------------------------------------------------------------------------
+
+    def _is_column(self, token: Token) -> bool:
+        if token.kind == 'name':
+            return True
+        if token.kind != 'word' or token.text.upper() in KEYWORDS:
+            return False
+        return self.column_types is None or token.text in self.column_types
+
+    def column_name(self) -> str:
+        """
+        Nama kolom (kata atau `backtick`)
+
+        Raises:
+            ValueError: Jika bukan nama kolom atau kolom tidak dikenal
+        """
+        token = self.peek()
+        if token.kind not in ('word', 'name') or (token.kind == 'word' and token.text.upper() in KEYWORDS):
+            raise self.error("diharapkan nama kolom")
+        if self.column_types is not None and token.value not in self.column_types:
+            raise ValueError(f"Kolom '{token.value}' tidak ada")
+        self.advance()
+        return token.value
+
+    def constant(self, column: Optional[str] = None, bare_words: bool = False) -> Any:
+        """
+        Konstanta (angka, string, TRUE/FALSE/NULL), dikonversi ke tipe kolom
+
+        Args:
+            column: Kolom pembanding (menentukan tipe konversi)
+            bare_words: True untuk menerima kata tanpa kutip sebagai string
+        """
+        token = self.peek()
+        if token.kind == 'op' and (token.text == '?' or token.text.startswith(':')):
+            self.advance()
+            return self._param(token, column)
+
+        negative = token.kind == 'op' and token.text == '-'
+        if negative:
+            self.advance()
+            token = self.peek()
+            if token.kind != 'number':
+                raise self.error("diharapkan angka setelah '-'")
+
+        if token.kind in ('number', 'string'):
+            # String untuk kolom String memakai teks asli angka (007 tetap '007')
+            value = token.value
+            if token.kind == 'number' and self._type_of(column) in ('String', 'str'):
+                value = token.text
+            if negative:
+                value = -value if not isinstance(value, str) else '-' + value
+        elif token.is_keyword('NULL'):
+            value = None
+        elif token.is_keyword('TRUE', 'FALSE'):
+            value = token.text.upper() == 'TRUE'
+        elif bare_words and token.kind == 'word' and token.text.upper() not in KEYWORDS:
+            value = token.text
+        else:
+            raise self.error("diharapkan konstanta")
+        self.advance()
+        return coerce_value(value, self._type_of(column), column or '')
+
+    def _param(self, token: Token, column: Optional[str]) -> Param:
+        """Parameter ? atau :nama (keduanya tidak boleh dicampur)"""
+        if token.text == '?':
+            if self.named:
+                raise self.error("parameter ? dan :nama tidak dapat dicampur")
+            self.positional += 1
+            return Param(self.positional - 1, column, self._type_of(column))
+        if self.positional:
+            raise self.error("parameter ? dan :nama tidak dapat dicampur")
+        self.named.add(token.text[1:])
+        return Param(token.text[1:], column, self._type_of(column))
+
+    def _type_of(self, column: Optional[str]) -> Optional[str]:
+        if column is None or self.column_types is None:
+            return None
+        return self.column_types.get(column)
+
+    # -------------------------------------------------------------------------
+    # Kondisi
+    # -------------------------------------------------------------------------
+
+    def condition(self) -> Expr:
+        """or_expr := and_expr (OR and_expr)*"""
+        operands = [self._and()]
+        while self.accept('OR'):
+            operands.append(self._and())
+        return operands[0] if len(operands) == 1 else Or(*operands)
+
+    def _and(self) -> Expr:
+        operands = [self._not()]
+        while self.accept('AND'):
+            operands.append(self._not())
+        return operands[0] if len(operands) == 1 else And(*operands)
+
+    def _not(self) -> Expr:
+        if self.accept('NOT'):
+            return Not(self._not())
+        return self._predicate()
+
+    def _predicate(self) -> Expr:
+        if self.accept('('):
+            expr = self.condition()
+            self.expect(')')
+            return expr
+
+        if not self._is_column(self.peek()):
+            # Konstanta di kiri: 5 < age
+            token = self.peek()
+            if (token.kind in ('number', 'string') or token.is_keyword('TRUE', 'FALSE')
+                    or (token.kind == 'op' and (token.text in ('-', '?') or token.text.startswith(':')))):
+                return self._reversed_comparison()
+        column = self.column_name()
+
+        if self.accept('IS'):
+            negated = self.accept('NOT') is not None
+            self.expect('NULL')
+            return col(column).is_not_null() if negated else col(column).is_null()
+
+        negated = self.accept('NOT') is not None
+        if self.accept('IN'):
+            expr = self._in(column)
+        elif self.accept('BETWEEN'):
+            low = self.constant(column)
+            self.expect('AND')
+            expr = Between(column, low, self.constant(column))
+        elif self.accept('LIKE'):
+            pattern = self.constant(None)
+            if isinstance(pattern, Param):
+                expr = ParamLike(column, pattern)
+            elif isinstance(pattern, str):
+                expr = col(column).like(pattern)
+            else:
+                raise self.error("pola LIKE harus string")
+        elif negated:
+            raise self.error("diharapkan IN, BETWEEN atau LIKE setelah NOT")
+        else:
+            return self._comparison(column)
+        return Not(expr) if negated else expr
+
+    def _in(self, column: str) -> Expr:
+        self.expect('(')
+        values = [self.constant(column)]
+        while self.accept(','):
+            values.append(self.constant(column))
+        self.expect(')')
+        return In(column, values)
+
+    def _comparison(self, column: str) -> Expr:
+        token = self.peek()
+        if token.kind != 'op' or token.text not in _COMPARISON_OPS:
+            raise self.error("diharapkan operator perbandingan")
+        self.advance()
+        op = _COMPARISON_OPS[token.text]
+
+        if self._is_column(self.peek()):
+            return Comparison(column, op, Field(self.column_name()))
+        value = self.constant(column, bare_words=True)
+        if value is None and op not in ('==', '!='):
+            raise ValueError(f"NULL hanya dapat dibandingkan dengan = atau != (kolom '{column}')")
+        return Comparison(column, op, value)
+
+    def _reversed_comparison(self) -> Expr:
+        start, positional = self.position, self.positional
+        self.constant(None)
+        token = self.peek()
+        if token.kind != 'op' or token.text not in _COMPARISON_OPS:
+            raise self.error("diharapkan operator perbandingan")
+        self.advance()
+        column = self.column_name()
+        end = self.position
+
+        # Parse ulang konstanta dengan tipe kolom yang sekarang diketahui
+        self.position, self.positional = start, positional
+        value = self.constant(column)
+        self.position = end
+        if value is None and _COMPARISON_OPS[token.text] not in ('==', '!='):
+            raise ValueError(f"NULL hanya dapat dibandingkan dengan = atau != (kolom '{column}')")
+        return Comparison(column, _FLIPPED[_COMPARISON_OPS[token.text]], value)
+
+
+def parse_where(text: str, column_types: Optional[Dict[str, str]] = None) -> Expr:
+    """
+    Mengubah teks klausa WHERE menjadi ekspresi col()
+
+    Format lama 'kolom=nilai' yang bukan SQL sah (email=u1@ex.com,
+    name=John Doe) dibaca sebagai satu kesamaan dengan sisi kanan apa adanya.
+
+    Example:
+        >>> parse_where("age >= 30 AND city IN ('Bandung', 'Bogor')", {'age': 'Integer', 'city': 'String'})
+        (col('age') >= 30) & col('city').isin(['Bandung', 'Bogor'])
+
+    Args:
+        text: Klausa WHERE (tanpa kata WHERE)
+        column_types: Nama kolom -> nama tipe; None = tanpa validasi kolom
+
+    Returns:
+        Ekspresi kondisi
+
+    Raises:
+        ValueError: Jika sintaks, kolom atau konstanta tidak valid
+    """
+    try:
+        parser = Parser(text, column_types)
+        if parser.peek().kind == 'end':
+            raise ValueError("Klausa WHERE kosong")
+        expr = parser.condition()
+        parser.expect_end()
+        return expr
+    except ValueError as error:
+        legacy = _LEGACY_EQUALITY.match(text)
+        if legacy is None or (column_types is not None and legacy.group(1) not in column_types):
+            raise
+        syntax_error = error
+    
+    # Format lama 'kolom=nilai': satu kesamaan dengan sisi kanan apa adanya
+    column, value = legacy.groups()
+    type_name = None if column_types is None else column_types[column]
+    if value.lower() == 'null':
+        return col(column) == None  # noqa: E711
+    if type_name not in _CONVERTERS:
+        return col(column) == _legacy_value(value)
+    try:
+        return col(column) == coerce_value(value, type_name, column)
+    except ValueError:
+        # Bukan nilai lama yang sah (mis. "age = 30 AND"): laporkan error sintaksnya
+        raise syntax_error from None
+
+
+# =============================================================================
+# PERNYATAAN SQL
+# =============================================================================
+#
+# Subset SQL untuk Database.execute():
+#
+#   SELECT * | kolom [AS alias], ... | COUNT(*) / SUM(kolom) / ... [AS alias]
+#       FROM tabel [WHERE ...] [GROUP BY kolom, ...]
+#       [ORDER BY nama [ASC|DESC], ...] [LIMIT n [OFFSET m]]
+#   INSERT INTO tabel [(kolom, ...)] VALUES (nilai, ...), (...)
+#       (tanpa daftar kolom: semua kolom kecuali id, urut sesuai definisi)
+#   UPDATE tabel SET kolom = nilai, ... [WHERE ...]
+#   DELETE FROM tabel [WHERE ...]
+#       (tanpa WHERE: semua baris tabel)
+#
+# Hasil parsing tidak bergantung pada nilai parameter, sehingga satu objek
+# pernyataan dapat dicache per teks query; bind() hanya mengganti Param
+# dengan nilainya. Pernyataan tanpa parameter dipakai apa adanya (termasuk
+# predikat terkompilasi yang dicache di ekspresinya).
+
+AGGREGATE_NAMES = ('COUNT', 'SUM', 'AVG', 'MIN', 'MAX')
+
+
+class Statement(ABC):
+    """Basis pernyataan hasil parse_statement (subclass mengisi Param lewat _bind)"""
+
+    kind = ''
+
+    def __init__(self, table: str):
+        self.table = table
+        self.positional = 0
+        self.named: Set[str] = set()
+
+    @property
+    def has_params(self) -> bool:
+        return bool(self.positional or self.named)
+
+    def _check_params(self, params: Any) -> None:
+        if not self.has_params:
+            if params:
+                raise ValueError("Query tidak memiliki parameter, tetapi parameter diberikan")
+            return
+        if self.positional:
+            if isinstance(params, (str, bytes, Mapping)) or not isinstance(params, Sequence):
+                raise ValueError(f"Query membutuhkan {self.positional} parameter posisi (list/tuple)")
+            if len(params) != self.positional:
+                raise ValueError(f"Query membutuhkan {self.positional} parameter, diberikan {len(params)}")
+            return
+        if not isinstance(params, Mapping):
+            raise ValueError("Query dengan :nama membutuhkan parameter berupa dictionary")
+        missing = self.named - set(params)
+        if missing:
+            raise ValueError(f"Parameter tidak diberikan: {', '.join(sorted(missing))}")
+
+    def bind(self, params: Any = None) -> 'Statement':
+        """
+        Pernyataan dengan parameter terisi (self jika tanpa parameter)
+
+        Raises:
+            ValueError: Jika parameter kurang, berlebih atau tidak valid
+        """
+        self._check_params(params)
+        if not self.has_params:
+            return self
+        bound = copy.copy(self)
+        bound._bind(params)
+        bound.positional, bound.named = 0, set()
+        return bound
+
+    @abstractmethod
+    def _bind(self, params: Any) -> None:
+        """Mengganti Param pada salinan pernyataan dengan nilai dari params"""
+
+
+def _bind_count(value: Any, params: Any, name: str) -> Optional[int]:
+    """LIMIT/OFFSET: bilangan bulat tidak negatif"""
+    value = bind_value(value, params)
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise ValueError(f"{name} harus bilangan bulat tidak negatif, bukan {value!r}")
+    return value
+
+
+class SelectStatement(Statement):
+    """
+    SELECT; columns berisi (kolom sumber, nama hasil), None untuk *
+
+    aggregates berisi (fungsi, kolom atau None untuk COUNT(*), nama hasil).
+    """
+
+    kind = 'select'
+
+    def __init__(self, table: str):
+        super().__init__(table)
+        self.columns: Optional[List[Tuple[str, str]]] = None
+        self.aggregates: List[Tuple[str, Optional[str], str]] = []
+        self.group_by: List[str] = []
+        self.where: Optional[Expr] = None
+        self.order_by: List[Tuple[str, bool]] = []
+        self.limit: Any = None
+        self.offset: Any = 0
+
+    @property
+    def is_aggregate(self) -> bool:
+        return bool(self.aggregates or self.group_by)
+
+    def _bind(self, params: Any) -> None:
+        if self.where is not None:
+            self.where = bind_expr(self.where, params)
+        self.limit = _bind_count(self.limit, params, 'LIMIT')
+        self.offset = _bind_count(self.offset, params, 'OFFSET') or 0
+
+
+class InsertStatement(Statement):
+    """INSERT; rows berisi list nilai sesuai urutan columns"""
+
+    kind = 'insert'
+
+    def __init__(self, table: str, columns: List[str], rows: List[List[Any]]):
+        super().__init__(table)
+        self.columns = columns
+        self.rows = rows
+
+    def _bind(self, params: Any) -> None:
+        self.rows = [[bind_value(value, params) for value in row] for row in self.rows]
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Baris sebagai dictionary kolom -> nilai"""
+        return [dict(zip(self.columns, row)) for row in self.rows]
+
+
+class UpdateStatement(Statement):
+    """UPDATE; assignments berisi kolom -> nilai baru"""
+
+    kind = 'update'
+
+    def __init__(self, table: str, assignments: Dict[str, Any], where: Optional[Expr]):
+        super().__init__(table)
+        self.assignments = assignments
+        self.where = where
+
+    def _bind(self, params: Any) -> None:
+        self.assignments = {column: bind_value(value, params) for column, value in self.assignments.items()}
+        if self.where is not None:
+            self.where = bind_expr(self.where, params)
+
+
+class DeleteStatement(Statement):
+    """DELETE"""
+
+    kind = 'delete'
+
+    def __init__(self, table: str, where: Optional[Expr]):
+        super().__init__(table)
+        self.where = where
+
+    def _bind(self, params: Any) -> None:
+        if self.where is not None:
+            self.where = bind_expr(self.where, params)
+
+
+class StatementParser(Parser):
+    """
+    Parser pernyataan SQL lengkap
+
+    Args:
+        text: Teks query
+        schema: Nama tabel -> {kolom: nama tipe}; dipanggil begitu nama tabel
+                diketahui (boleh melempar error tabel tidak ditemukan)
+    """
+
+    def __init__(self, text: str, schema: Callable[[str], Dict[str, str]]):
+        super().__init__(text)
+        self.schema = schema
+
+    def statement(self) -> Statement:
+        """Satu pernyataan sampai akhir teks (';' di akhir boleh)"""
+        if self.accept('SELECT'):
+            statement: Statement = self._select()
+        elif self.accept('INSERT'):
+            statement = self._insert()
+        elif self.accept('UPDATE'):
+            statement = self._update()
+        elif self.accept('DELETE'):
+            self.expect('FROM')
+            table = self._table()
+            statement = DeleteStatement(table, self._where())
+        else:
+            raise self.error("diharapkan SELECT, INSERT, UPDATE atau DELETE")
+        self.expect_end()
+        statement.positional, statement.named = self.positional, set(self.named)
+        return statement
+
+    # -------------------------------------------------------------------------
+    # Bagian umum
+    # -------------------------------------------------------------------------
+
+    def _name(self, what: str = "nama") -> str:
+        """Nama (kata bukan kata kunci atau `backtick`) tanpa validasi kolom"""
+        token = self.peek()
+        if token.kind == 'name' or (token.kind == 'word' and token.text.upper() not in KEYWORDS):
+            self.advance()
+            return token.value
+        raise self.error(f"diharapkan {what}")
+
+    def _table(self) -> str:
+        """Nama tabel; skema kolomnya dipakai untuk sisa pernyataan"""
+        table = self._name("nama tabel")
+        self.column_types = self.schema(table)
+        return table
+
+    def _where(self) -> Optional[Expr]:
+        return self.condition() if self.accept('WHERE') else None
+
+    def _check_column(self, column: str) -> str:
+        if column not in self.column_types:
+            raise ValueError(f"Kolom '{column}' tidak ada")
+        return column
+
+    # -------------------------------------------------------------------------
+    # SELECT
+    # -------------------------------------------------------------------------
+
+    def _select(self) -> SelectStatement:
+        star = self.accept('*') is not None
+        items = [] if star else self._select_items()
+
+        self.expect('FROM')
+        statement = SelectStatement(self._table())
+        for item in items:
+            if item[0] == 'column':
+                self._check_column(item[1])
+            elif item[2] is not None:
+                self._check_column(item[2])
+
+        statement.where = self._where()
+        if self.accept('GROUP'):
+            self.expect('BY')
+            statement.group_by = [self.column_name()]
+            while self.accept(','):
+                statement.group_by.append(self.column_name())
+
+        if not star:
+            for item in items:
+                if item[0] == 'column':
+                    if statement.columns is None:
+                        statement.columns = []
+                    statement.columns.append((item[1], item[2]))
+                else:
+                    statement.aggregates.append((item[1], item[2], item[3]))
+
+        if statement.is_aggregate:
+            if star:
+                raise ValueError("SELECT * tidak dapat dipakai dengan GROUP BY atau fungsi agregat")
+            for column, _ in statement.columns or []:
+                if column not in statement.group_by:
+                    raise ValueError(f"Kolom '{column}' harus ada di GROUP BY atau di dalam fungsi agregat")
+
+        if self.accept('ORDER'):
+            self.expect('BY')
+            statement.order_by = [self._order_item(statement)]
+            while self.accept(','):
+                statement.order_by.append(self._order_item(statement))
+
+        if self.accept('LIMIT'):
+            statement.limit = self._count('LIMIT')
+            if self.accept('OFFSET'):
+                statement.offset = self._count('OFFSET')
+        return statement
+
+    def _select_items(self) -> List[Tuple[Any, ...]]:
+        """('column', kolom, alias) atau ('aggregate', fungsi, kolom|None, alias)"""
+        items = []
+        while True:
+            token = self.peek()
+            # COUNT/SUM/... bukan kata kunci: kolom bernama count tetap dapat dipilih
+            if token.is_keyword(*AGGREGATE_NAMES) and self.peek(1).text == '(':
+                function = self.advance().text.lower()
+                self.expect('(')
+                if self.accept('*'):
+                    if function != 'count':
+                        raise self.error(f"{function.upper()}(*) tidak didukung, hanya COUNT(*)")
+                    column = None
+                else:
+                    column = self._name("nama kolom")
+                self.expect(')')
+                default = 'count' if column is None else f"{function}_{column}"
+                items.append(('aggregate', function, column, self._alias(default)))
+            else:
+                column = self._name("nama kolom atau fungsi agregat")
+                items.append(('column', column, self._alias(column)))
+            if not self.accept(','):
+                return items
+
+    def _alias(self, default: str) -> str:
+        return self._name("alias") if self.accept('AS') else default
+
+    def _order_item(self, statement: SelectStatement) -> Tuple[str, bool]:
+        """(nama, menurun); nama kolom tabel, atau nama hasil untuk query agregat"""
+        name = self._name("nama kolom urutan")
+        descending = self.accept('DESC') is not None
+        if not descending:
+            self.accept('ASC')
+
+        if statement.is_aggregate:
+            outputs = [output for _, output in statement.columns or []]
+            outputs += [output for _, _, output in statement.aggregates]
+            if name not in outputs:
+                raise ValueError(f"ORDER BY '{name}' harus kolom hasil query agregat")
+            return name, descending
+
+        # Alias kolom diurutkan menurut kolom sumbernya
+        for column, output in statement.columns or []:
+            if output == name:
+                return column, descending
+        return self._check_column(name), descending
+
+    def _count(self, name: str) -> Any:
+        token = self.peek()
+        value = self.constant(None)
+        if isinstance(value, Param):
+            return value
+        if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+            raise ValueError(f"{name} harus bilangan bulat tidak negatif, bukan {token.text}")
+        return value
+
+    # -------------------------------------------------------------------------
+    # INSERT / UPDATE
+    # -------------------------------------------------------------------------
+
+    def _insert(self) -> InsertStatement:
+        self.expect('INTO')
+        table = self._table()
+        if self.accept('('):
+            columns = [self.column_name()]
+            while self.accept(','):
+                columns.append(self.column_name())
+            self.expect(')')
+        else:
+            # Tanpa daftar kolom: semua kolom kecuali id (diisi auto increment)
+            columns = [column for column in self.column_types if column != 'id']
+
+        self.expect('VALUES')
+        rows = [self._values(columns)]
+        while self.accept(','):
+            rows.append(self._values(columns))
+        return InsertStatement(table, columns, rows)
+
+    def _values(self, columns: List[str]) -> List[Any]:
+        self.expect('(')
+        values = [self.constant(columns[0])]
+        while self.accept(','):
+            if len(values) >= len(columns):
+                raise self.error(f"jumlah nilai melebihi {len(columns)} kolom")
+            values.append(self.constant(columns[len(values)]))
+        self.expect(')')
+        if len(values) != len(columns):
+            raise ValueError(f"Jumlah nilai ({len(values)}) tidak sama dengan jumlah kolom ({len(columns)})")
+        return values
+
+    def _update(self) -> UpdateStatement:
+        table = self._table()
+        self.expect('SET')
+        assignments: Dict[str, Any] = {}
+        while True:
+            column = self.column_name()
+            self.expect('=', '==')
+            assignments[column] = self.constant(column)
+            if not self.accept(','):
+                break
+        return UpdateStatement(table, assignments, self._where())
+
+
+def parse_statement(text: str, schema: Callable[[str], Dict[str, str]]) -> Statement:
+    """
+    Mengubah teks SQL menjadi objek pernyataan
+
+    Example:
+        >>> parse_statement("SELECT name FROM users WHERE age > ? LIMIT 10", schemas.__getitem__)
+
+    Args:
+        text: Teks SQL (satu pernyataan)
+        schema: Nama tabel -> {kolom: nama tipe}
+
+    Returns:
+        SelectStatement, InsertStatement, UpdateStatement atau DeleteStatement
+
+    Raises:
+        ValueError: Jika sintaks, kolom atau konstanta tidak valid
+    """
+    return StatementParser(text, schema).statement()
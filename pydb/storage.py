@@ -0,0 +1,668 @@
+import os
+import json
+import struct
+from typing import Dict, List, Any, Optional, Callable, Iterable, Iterator, Tuple
+from .encrypted import (
+    TextEncryptor, DEFAULT_CHUNK_SIZE, COMPRESSION_NONE, cipher_id, cipher_name,
+    compression_id, compress_data, decompress_data, save_stream, decrypt_stream, read_stream_header
+)
+from .codec import RowCodec, ROW_ENCODING_JSON, ROW_ENCODING_BINARY, ROW_ENCODINGS
+from .zonemap import summarize, dump_zone, load_zone, DEFAULT_ERROR_RATE
+
+# =============================================================================
+# FORMAT FILE TERSEGMENTASI
+# =============================================================================
+#
+# Header    : MAGIC (8 byte) | id cipher (1 byte) | salt (16 byte)
+#             | offset direktori (8 byte) | panjang direktori (4 byte)
+# Segmen    : token terenkripsi berisi potongan baris satu tabel (JSON, atau
+#             blok codec biner jika direktori mencatat 'row_encoding' = 'binary'),
+#             dikompresi sebelum enkripsi jika direktori mencatat 'compression'
+# Direktori : token terenkripsi (tidak dikompresi) berisi metadata database,
+#             kolom setiap tabel dan daftar segmen (offset, panjang, jumlah baris)
+#
+# Setiap segmen dienkripsi terpisah dengan key yang sama (satu PBKDF2 per
+# file), sehingga membaca satu tabel hanya mendekripsi direktori dan
+# segmen milik tabel tersebut.
+#
+# Tabel dengan zone map (entri direktori 'zone_map') mencatat ringkasan
+# min/max/None per kolom, dan Bloom filter untuk kolom terpilih, di setiap
+# entri segmen. read_segments() memakainya untuk melewati segmen yang pasti
+# tidak memuat baris yang dicari tanpa membaca atau mendekripsinya.
+#
+# Penyimpanan inkremental (SegmentedFile.update) menambahkan segmen tabel
+# yang berubah dan direktori baru di akhir file, lalu menimpa header. Segmen
+# tabel lain dipakai ulang apa adanya; segmen lama menjadi sampah sampai
+# file ditulis ulang penuh (kompaksi).
+
+SEGMENT_MAGIC = b"PYDBSEG2"
+DEFAULT_SEGMENT_ROWS = 10000
+MAX_GARBAGE_RATIO = 0.5
+
+_HEADER = struct.Struct(">8sB16sQI")
+
+
+def is_segmented_file(file_path: str) -> bool:
+    """
+    Cek apakah file menggunakan format tersegmentasi
+
+    Args:
+        file_path: Path file database
+
+    Returns:
+        True jika file diawali magic format tersegmentasi
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            return f.read(len(SEGMENT_MAGIC)) == SEGMENT_MAGIC
+    except OSError:
+        return False
+
+
+class SegmentedFile:
+    """
+    Pembaca/penulis file database tersegmentasi dengan dekripsi per tabel
+    """
+
+    def __init__(self, path: str, password: str):
+        """
+        Inisialisasi akses ke file tersegmentasi
+
+        Args:
+            path: Path file database
+            password: Password untuk enkripsi/dekripsi
+        """
+        self.path = os.path.abspath(path)
+        self.password = password
+        self.directory: Optional[Dict[str, Any]] = None
+        self._encryptor: Optional[TextEncryptor] = None
+        # (offset, panjang) direktori yang tercatat di header saat terakhir dibaca/ditulis
+        self._location: Optional[Tuple[int, int]] = None
+        # Ringkasan segmen yang sudah didecode (Bloom filter), per offset segmen
+        self._zones: Dict[int, Dict[str, Any]] = {}
+
+    # =========================================================================
+    # READ
+    # =========================================================================
+
+    def read_directory(self) -> Dict[str, Any]:
+        """
+        Membaca dan mendekripsi direktori tabel (tanpa data tabel)
+
+        Returns:
+            Dictionary direktori database
+        """
+        with open(self.path, 'rb') as f:
+            header = f.read(_HEADER.size)
+            if header[:len(SEGMENT_MAGIC)] != SEGMENT_MAGIC:
+                raise ValueError("Bukan file database tersegmentasi")
+            if len(header) < _HEADER.size:
+                raise ValueError("Header file tersegmentasi tidak lengkap")
+
+            _, cipher, salt, directory_offset, directory_length = _HEADER.unpack(header)
+            self._encryptor = TextEncryptor(self.password, salt, cipher_name(cipher))
+            self.directory = json.loads(self._read_blob(f, directory_offset, directory_length))
+            self._zones = {}
+            self._location = (directory_offset, directory_length)
+
+        return self.directory
+
+    @property
+    def encryptor(self) -> Optional[TextEncryptor]:
+        """Encryptor untuk salt file ini (tersedia setelah read_directory)"""
+        return self._encryptor
+
+    def _read_blob(self, f, offset: int, length: int) -> bytes:
+        """Membaca dan mendekripsi satu blob dari file yang terbuka"""
+        f.seek(offset)
+        token = f.read(length)
+        if len(token) < length:
+            raise ValueError("File database terpotong")
+        return self._encryptor.decrypt_bytes(token)
+
+    def _table_entry(self, table_name: str) -> Dict[str, Any]:
+        """Mengambil entri direktori untuk satu tabel"""
+        if self.directory is None:
+            self.read_directory()
+
+        tables = self.directory.get('tables', {})
+        if table_name not in tables:
+            raise KeyError(f"Tabel '{table_name}' tidak ada di direktori")
+        return tables[table_name]
+
+    def read_table(self, table_name: str) -> List[Dict[str, Any]]:
+        """
+        Mendekripsi semua segmen satu tabel
+
+        Args:
+            table_name: Nama tabel
+
+        Returns:
+            List baris tabel
+        """
+        entry = self._table_entry(table_name)
+        return self._decode_segments(entry, entry.get('segments', []))
+
+    def _decode_segments(self, entry: Dict[str, Any], segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Mendekripsi dan mendecode segmen-segmen satu tabel"""
+        compression = self.directory.get('compression', COMPRESSION_NONE)
+        codec = None
+        if self.directory.get('row_encoding', ROW_ENCODING_JSON) == ROW_ENCODING_BINARY:
+            codec = RowCodec(entry.get('columns', {}))
+        rows: List[Dict[str, Any]] = []
+
+        with open(self.path, 'rb') as f:
+            for segment in segments:
+                blob = decompress_data(self._read_blob(f, segment['offset'], segment['length']), compression)
+                rows.extend(codec.decode(blob) if codec is not None else json.loads(blob))
+
+        return rows
+
+    def _segment_zone(self, segment: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Ringkasan segmen (Bloom filter didecode sekali), None jika tidak ada"""
+        if 'zone' not in segment:
+            return None
+        zone = self._zones.get(segment['offset'])
+        if zone is None:
+            zone = self._zones[segment['offset']] = load_zone(segment['zone'])
+        return zone
+
+    def read_segments(
+        self,
+        table_name: str,
+        keep: Callable[[Dict[str, Any]], bool]
+    ) -> Tuple[List[Dict[str, Any]], int, int]:
+        """
+        Mendekripsi hanya segmen yang ringkasannya mungkin memuat baris dicari
+
+        Segmen tanpa ringkasan (tabel tanpa zone map) selalu dibaca.
+
+        Args:
+            table_name: Nama tabel
+            keep: Predikat ringkasan segmen (zonemap.may_match)
+
+        Returns:
+            (baris segmen yang dibaca, jumlah segmen dibaca, jumlah segmen)
+        """
+        entry = self._table_entry(table_name)
+        segments = [
+            segment for segment in entry.get('segments', [])
+            if self._segment_zone(segment) is None or keep(self._segment_zone(segment))
+        ]
+        return self._decode_segments(entry, segments), len(segments), len(entry.get('segments', []))
+
+    # =========================================================================
+    # WRITE
+    # =========================================================================
+
+    @staticmethod
+    def _write_segments(
+        f,
+        encryptor: TextEncryptor,
+        entry: Dict[str, Any],
+        rows: List[Dict[str, Any]],
+        segment_rows: int,
+        compression: str,
+        row_encoding: str
+    ) -> None:
+        """Menulis segmen satu tabel di posisi file saat ini dan mencatatnya di entri direktori"""
+        codec = RowCodec(entry.get('columns', {})) if row_encoding == ROW_ENCODING_BINARY else None
+        zone_map = entry.get('zone_map')
+        segments = []
+
+        for start in range(0, len(rows), segment_rows):
+            chunk = rows[start:start + segment_rows]
+            blob = codec.encode(chunk) if codec is not None else json.dumps(chunk).encode('utf-8')
+            token = encryptor.encrypt_bytes(compress_data(blob, compression))
+            segment = {'offset': f.tell(), 'length': len(token), 'rows': len(chunk)}
+            if zone_map is not None:
+                segment['zone'] = dump_zone(summarize(
+                    chunk, entry.get('columns', {}), zone_map.get('bloom_columns', ()),
+                    zone_map.get('error_rate', DEFAULT_ERROR_RATE)
+                ))
+            segments.append(segment)
+            f.write(token)
+
+        entry['segments'] = segments
+        entry['rows'] = len(rows)
+
+    @staticmethod
+    def _write_directory(f, encryptor: TextEncryptor, directory: Dict[str, Any]) -> Tuple[int, int]:
+        """Menulis direktori di akhir file lalu header yang menunjuk ke sana"""
+        directory_token = encryptor.encrypt_bytes(json.dumps(directory).encode('utf-8'))
+        f.seek(0, os.SEEK_END)
+        directory_offset = f.tell()
+        f.write(directory_token)
+        # Direktori harus sudah tersimpan sebelum header menunjuk ke sana
+        f.flush()
+        os.fsync(f.fileno())
+
+        f.seek(0)
+        f.write(_HEADER.pack(
+            SEGMENT_MAGIC, cipher_id(encryptor.cipher), encryptor.salt,
+            directory_offset, len(directory_token)
+        ))
+        f.flush()
+        os.fsync(f.fileno())
+        return directory_offset, len(directory_token)
+
+    @staticmethod
+    def _prepare_directory(
+        directory: Dict[str, Any],
+        segment_rows: int,
+        compression: str,
+        row_encoding: str
+    ) -> Dict[str, Any]:
+        """Validasi parameter dan menyalin direktori beserta entri tabelnya"""
+        if segment_rows <= 0:
+            raise ValueError("segment_rows harus lebih besar dari 0")
+        if row_encoding not in ROW_ENCODINGS:
+            raise ValueError(f"Encoding baris tidak didukung: {row_encoding}")
+        compression_id(compression)
+
+        directory = dict(directory, compression=compression, row_encoding=row_encoding)
+        directory['tables'] = {name: dict(entry) for name, entry in directory.get('tables', {}).items()}
+        return directory
+
+    @staticmethod
+    def _write_file(
+        path: str,
+        directory: Dict[str, Any],
+        table_rows: Dict[str, List[Dict[str, Any]]],
+        segment_rows: int,
+        encryptor: TextEncryptor,
+        compression: str,
+        row_encoding: str
+    ) -> Tuple[Dict[str, Any], Tuple[int, int]]:
+        """Menulis file baru secara atomik, mengembalikan (direktori, lokasi direktori)"""
+        directory = SegmentedFile._prepare_directory(directory, segment_rows, compression, row_encoding)
+        temp_path = path + '.tmp'
+
+        with open(temp_path, 'wb') as f:
+            # Header sementara, ditimpa setelah posisi direktori diketahui
+            f.write(b"\x00" * _HEADER.size)
+
+            for table_name, entry in directory['tables'].items():
+                SegmentedFile._write_segments(
+                    f, encryptor, entry, table_rows.get(table_name, []),
+                    segment_rows, compression, row_encoding
+                )
+
+            location = SegmentedFile._write_directory(f, encryptor, directory)
+
+        os.replace(temp_path, path)
+        return directory, location
+
+    @staticmethod
+    def write(
+        path: str,
+        password: str,
+        directory: Dict[str, Any],
+        table_rows: Dict[str, List[Dict[str, Any]]],
+        segment_rows: int = DEFAULT_SEGMENT_ROWS,
+        encryptor: Optional[TextEncryptor] = None,
+        compression: str = COMPRESSION_NONE,
+        row_encoding: str = ROW_ENCODING_JSON
+    ) -> Dict[str, Any]:
+        """
+        Menulis file tersegmentasi secara atomik
+
+        Args:
+            path: Path file tujuan
+            password: Password untuk enkripsi
+            directory: Metadata database; directory['tables'][nama] berisi
+                       metadata kolom tiap tabel (tanpa data)
+            table_rows: Baris data per tabel
+            segment_rows: Jumlah baris maksimal per segmen
+            encryptor: Encryptor sesi; jika None, dibuat salt dan key baru
+            compression: Kompresi setiap segmen sebelum enkripsi
+            row_encoding: 'json' atau 'binary' (codec baris berbasis skema)
+
+        Returns:
+            Direktori yang ditulis (lengkap dengan daftar segmen)
+        """
+        directory, _ = SegmentedFile._write_file(
+            os.path.abspath(path), directory, table_rows, segment_rows,
+            encryptor or TextEncryptor(password), compression, row_encoding
+        )
+        return directory
+
+    def save(
+        self,
+        directory: Dict[str, Any],
+        table_rows: Dict[str, List[Dict[str, Any]]],
+        segment_rows: int = DEFAULT_SEGMENT_ROWS,
+        encryptor: Optional[TextEncryptor] = None,
+        compression: str = COMPRESSION_NONE,
+        row_encoding: str = ROW_ENCODING_JSON
+    ) -> Dict[str, Any]:
+        """
+        Menulis ulang seluruh file (sekaligus kompaksi) dan mengingat direktorinya
+
+        Args:
+            directory: Metadata database (tanpa data)
+            table_rows: Baris data semua tabel
+            segment_rows: Jumlah baris maksimal per segmen
+            encryptor: Encryptor sesi; jika None, dibuat salt dan key baru
+            compression: Kompresi setiap segmen sebelum enkripsi
+            row_encoding: 'json' atau 'binary'
+
+        Returns:
+            Direktori yang ditulis
+        """
+        encryptor = encryptor or TextEncryptor(self.password)
+        self.directory, self._location = self._write_file(
+            self.path, directory, table_rows, segment_rows, encryptor, compression, row_encoding
+        )
+        self._encryptor = encryptor
+        self._zones = {}
+        return self.directory
+
+    def can_update(self, encryptor: TextEncryptor, compression: str, row_encoding: str) -> bool:
+        """
+        Cek apakah file dapat diperbarui secara inkremental
+
+        File harus belum diubah pihak lain sejak terakhir dibaca/ditulis,
+        dan memakai salt, cipher, kompresi serta encoding baris yang sama.
+
+        Args:
+            encryptor: Encryptor sesi yang akan dipakai
+            compression: Kompresi yang diminta
+            row_encoding: Encoding baris yang diminta
+
+        Returns:
+            True jika segmen lama dapat dipakai ulang
+        """
+        if self.directory is None or self._location is None or self._encryptor is None:
+            return False
+        if (encryptor.cipher, encryptor.salt) != (self._encryptor.cipher, self._encryptor.salt):
+            return False
+        if self.directory.get('compression', COMPRESSION_NONE) != compression:
+            return False
+        if self.directory.get('row_encoding', ROW_ENCODING_JSON) != row_encoding:
+            return False
+
+        try:
+            with open(self.path, 'rb') as f:
+                header = f.read(_HEADER.size)
+        except OSError:
+            return False
+
+        if len(header) < _HEADER.size or header[:len(SEGMENT_MAGIC)] != SEGMENT_MAGIC:
+            return False
+        _, _, _, directory_offset, directory_length = _HEADER.unpack(header)
+        return (directory_offset, directory_length) == self._location
+
+    def garbage_ratio(self) -> float:
+        """
+        Perkiraan porsi file yang tidak lagi dirujuk direktori
+
+        Returns:
+            Rasio 0.0 - 1.0
+        """
+        if self.directory is None or self._location is None:
+            return 0.0
+
+        live = _HEADER.size + self._location[1]
+        for entry in self.directory.get('tables', {}).values():
+            live += sum(segment['length'] for segment in entry.get('segments', []))
+
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return 0.0
+        return max(0.0, 1.0 - live / size) if size else 0.0
+
+    def update(
+        self,
+        directory: Dict[str, Any],
+        table_rows: Dict[str, List[Dict[str, Any]]],
+        segment_rows: int = DEFAULT_SEGMENT_ROWS
+    ) -> Dict[str, Any]:
+        """
+        Penyimpanan inkremental: hanya tabel di table_rows yang dienkripsi ulang
+
+        Segmen baru dan direktori baru ditambahkan di akhir file, lalu header
+        ditimpa. Jika proses terhenti sebelum header ditimpa, file tetap
+        menunjuk ke direktori lama yang utuh.
+
+        Args:
+            directory: Metadata database terbaru (semua tabel)
+            table_rows: Baris data tabel yang berubah; tabel lain di
+                        directory['tables'] harus sudah ada di file
+            segment_rows: Jumlah baris maksimal per segmen
+
+        Returns:
+            Direktori yang ditulis
+
+        Raises:
+            ValueError: Jika tabel yang tidak berubah tidak ada di file
+        """
+        compression = self.directory.get('compression', COMPRESSION_NONE)
+        row_encoding = self.directory.get('row_encoding', ROW_ENCODING_JSON)
+        directory = self._prepare_directory(directory, segment_rows, compression, row_encoding)
+        old_tables = self.directory.get('tables', {})
+
+        for table_name, entry in directory['tables'].items():
+            if table_name in table_rows:
+                continue
+            if table_name not in old_tables:
+                raise ValueError(f"Tabel '{table_name}' tidak ada di file dan tidak disertakan")
+            entry['segments'] = old_tables[table_name].get('segments', [])
+            entry['rows'] = old_tables[table_name].get('rows', 0)
+
+        with open(self.path, 'r+b') as f:
+            f.seek(0, os.SEEK_END)
+            for table_name, entry in directory['tables'].items():
+                if table_name in table_rows:
+                    self._write_segments(
+                        f, self._encryptor, entry, table_rows[table_name],
+                        segment_rows, compression, row_encoding
+                    )
+            location = self._write_directory(f, self._encryptor, directory)
+
+        self.directory, self._location = directory, location
+        return directory
+
+    def __repr__(self) -> str:
+        tables = len(self.directory.get('tables', {})) if self.directory else 0
+        return f"SegmentedFile(path='{self.path}', tables={tables})"
+
+
+# =============================================================================
+# FORMAT FILE STREAM
+# =============================================================================
+#
+# Stream terenkripsi per chunk (lihat encrypted.encrypt_stream) berisi JSON
+# per baris teks:
+#   baris pertama : metadata database dan metadata tabel (termasuk jumlah baris)
+#   baris berikut : baris data setiap tabel, berurutan sesuai metadata
+#
+# Penulisan dan pembacaan berjalan chunk demi chunk, sehingga memori yang
+# dipakai tidak bergantung pada ukuran database. Baris selalu
+# ditulis sebagai JSON (format ini berbasis baris teks).
+
+_row_encoder = json.JSONEncoder()
+
+
+def _iter_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Memecah chunk plaintext menjadi baris (tanpa newline)"""
+    pending = b""
+    for chunk in chunks:
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        yield from lines
+    if pending:
+        yield pending
+
+
+def _take_rows(lines: Iterator[bytes], count: int) -> Iterator[Dict[str, Any]]:
+    """
+    Mem-parsing count baris berikutnya sebagai baris tabel
+
+    Raises:
+        ValueError: Jika stream berakhir sebelum count baris terbaca
+    """
+    for _ in range(count):
+        try:
+            line = next(lines)
+        except StopIteration:
+            # StopIteration di dalam generator akan menjadi RuntimeError (PEP 479)
+            raise ValueError("File stream terpotong") from None
+        yield json.loads(line)
+
+
+class StreamedFile:
+    """
+    Pembaca/penulis file database berformat stream terenkripsi
+    """
+
+    def __init__(self, path: str, password: str):
+        """
+        Inisialisasi akses ke file stream
+
+        Args:
+            path: Path file database
+            password: Password untuk enkripsi/dekripsi
+        """
+        self.path = os.path.abspath(path)
+        self.password = password
+        self.header: Optional[Dict[str, Any]] = None
+        self.compression: Optional[str] = None
+        self._encryptor: Optional[TextEncryptor] = None
+
+    @property
+    def encryptor(self) -> Optional[TextEncryptor]:
+        """Encryptor untuk salt file ini (tersedia setelah header dibaca)"""
+        return self._encryptor
+
+    def _iter_file_lines(self) -> Iterator[bytes]:
+        """Membuka file dan menghasilkan baris plaintext satu per satu"""
+        with open(self.path, 'rb') as f:
+            self._encryptor, _, self.compression = read_stream_header(f, self.password)
+            f.seek(0)
+            yield from _iter_lines(decrypt_stream(f, self.password))
+
+    def read_header(self) -> Dict[str, Any]:
+        """
+        Membaca metadata database (hanya chunk awal yang didekripsi)
+
+        Returns:
+            Dictionary metadata database
+        """
+        lines = self._iter_file_lines()
+        try:
+            self.header = json.loads(next(lines))
+        except StopIteration:
+            raise ValueError("File stream kosong")
+        finally:
+            lines.close()
+        return self.header
+
+    def iter_tables(self) -> Iterator[Tuple[str, Dict[str, Any], Iterator[Dict[str, Any]]]]:
+        """
+        Membaca seluruh tabel secara berurutan
+
+        Iterator baris setiap tabel harus dihabiskan sebelum tabel berikutnya.
+
+        Yields:
+            Tuple (nama tabel, metadata tabel, iterator baris)
+        """
+        lines = self._iter_file_lines()
+        try:
+            self.header = json.loads(next(lines))
+            for table_name, entry in self.header.get('tables', {}).items():
+                yield table_name, entry, _take_rows(lines, entry.get('rows', 0))
+        except StopIteration:
+            raise ValueError("File stream terpotong")
+        finally:
+            lines.close()
+
+    def iter_table(self, table_name: str) -> Iterator[Dict[str, Any]]:
+        """
+        Menghasilkan baris satu tabel tanpa mem-parsing tabel lain
+
+        Args:
+            table_name: Nama tabel
+
+        Yields:
+            Baris data tabel
+        """
+        lines = self._iter_file_lines()
+        try:
+            self.header = json.loads(next(lines))
+            tables = self.header.get('tables', {})
+            if table_name not in tables:
+                raise KeyError(f"Tabel '{table_name}' tidak ada di file")
+
+            for name, entry in tables.items():
+                if name == table_name:
+                    for _ in range(entry.get('rows', 0)):
+                        yield json.loads(next(lines))
+                    return
+                for _ in range(entry.get('rows', 0)):
+                    next(lines)
+        except StopIteration:
+            raise ValueError("File stream terpotong")
+        finally:
+            lines.close()
+
+    def read_table(self, table_name: str) -> List[Dict[str, Any]]:
+        """
+        Memuat seluruh baris satu tabel (tabel lain dilewati tanpa di-parse)
+
+        Args:
+            table_name: Nama tabel
+
+        Returns:
+            List baris tabel
+        """
+        return list(self.iter_table(table_name))
+
+    @staticmethod
+    def write(
+        path: str,
+        password: str,
+        header: Dict[str, Any],
+        table_rows: Dict[str, Iterable[Dict[str, Any]]],
+        row_counts: Dict[str, int],
+        encryptor: Optional[TextEncryptor] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        compression: str = COMPRESSION_NONE
+    ) -> int:
+        """
+        Menulis database sebagai stream terenkripsi secara atomik
+
+        Args:
+            path: Path file tujuan
+            password: Password untuk enkripsi
+            header: Metadata database; header['tables'][nama] berisi metadata
+                    kolom tiap tabel (tanpa data)
+            table_rows: Iterable baris per tabel
+            row_counts: Jumlah baris per tabel (dicatat di header)
+            encryptor: Encryptor sesi; jika None, dibuat salt dan key baru
+            chunk_size: Ukuran plaintext per chunk
+            compression: Kompresi stream sebelum enkripsi
+
+        Returns:
+            Jumlah bytes yang ditulis
+        """
+        header = dict(header)
+        header['tables'] = {
+            name: dict(entry, rows=row_counts.get(name, 0))
+            for name, entry in header.get('tables', {}).items()
+        }
+
+        def lines() -> Iterator[str]:
+            yield _row_encoder.encode(header) + "\n"
+            for table_name in header['tables']:
+                for row in table_rows.get(table_name, ()):
+                    yield _row_encoder.encode(row) + "\n"
+
+        return save_stream(
+            lines(), password, path, encryptor, chunk_size=chunk_size, compression=compression
+        )
+
+    def __repr__(self) -> str:
+        tables = len(self.header.get('tables', {})) if self.header else 0
+        return f"StreamedFile(path='{self.path}', tables={tables})"
@@ -0,0 +1,194 @@
+import os
+import json
+import struct
+from typing import Dict, List, Any, Optional
+from .encrypted import TextEncryptor, PasswordValueError, cipher_id, cipher_name
+
+# =============================================================================
+# FORMAT FILE WAL
+# =============================================================================
+#
+# Header : MAGIC (8 byte) | id cipher (1 byte) | salt (16 byte) | checkpoint (16 byte)
+# Record : panjang token (4 byte, big-endian) | token terenkripsi
+#
+# Checkpoint mengikat WAL ke satu versi file .pydb. WAL dengan checkpoint
+# yang berbeda dari file utama sudah basi (isinya sudah tersimpan penuh)
+# dan diabaikan saat replay.
+
+WAL_MAGIC = b"PYDBWAL2"
+WAL_SUFFIX = ".wal"
+
+_HEADER = struct.Struct(">8sB16s16s")
+_RECORD_LENGTH = struct.Struct(">I")
+
+
+class WriteAheadLog:
+    """
+    Log tulis-depan (write-ahead log) terenkripsi dan append-only
+
+    Setiap mutasi tabel disimpan sebagai record kecil yang terenkripsi dan
+    terautentikasi, sehingga biaya commit sebanding dengan ukuran perubahan,
+    bukan ukuran database.
+    """
+
+    def __init__(self, path: str, password: str, sync: bool = True):
+        """
+        Inisialisasi WAL
+
+        Args:
+            path: Path file WAL (biasanya <database>.pydb.wal)
+            password: Password untuk enkripsi/dekripsi record
+            sync: True untuk fsync setiap record (commit tahan crash)
+        """
+        if not password:
+            raise PasswordValueError("Password tidak boleh kosong")
+
+        self.path = os.path.abspath(path)
+        self.password = password
+        self.sync = sync
+
+        self._encryptor: Optional[TextEncryptor] = None
+        self._checkpoint: Optional[bytes] = None
+        self._sequence = 0
+        self._end_offset = 0
+
+    @staticmethod
+    def _checkpoint_bytes(checkpoint: str) -> bytes:
+        """Konversi checkpoint hex dari file utama ke 16 byte"""
+        return bytes.fromhex(checkpoint)
+
+    def replay(self, checkpoint: Optional[str]) -> List[Dict[str, Any]]:
+        """
+        Membaca semua record valid milik checkpoint yang diberikan
+
+        Record terakhir yang terpotong (crash saat menulis) diabaikan dan
+        akan ditimpa oleh append berikutnya.
+
+        Args:
+            checkpoint: Checkpoint yang tercatat di file utama
+
+        Returns:
+            List record sesuai urutan penulisan
+
+        Raises:
+            PasswordValueError: Jika record tidak dapat diautentikasi
+        """
+        self._encryptor = None
+        self._checkpoint = None
+        self._sequence = 0
+        self._end_offset = 0
+
+        if not checkpoint or not os.path.exists(self.path):
+            return []
+
+        with open(self.path, 'rb') as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size or header[:len(WAL_MAGIC)] != WAL_MAGIC:
+                return []
+
+            _, cipher, salt, wal_checkpoint = _HEADER.unpack(header)
+            if wal_checkpoint != self._checkpoint_bytes(checkpoint):
+                return []
+
+            self._encryptor = TextEncryptor(self.password, salt, cipher_name(cipher))
+            self._checkpoint = wal_checkpoint
+            self._end_offset = _HEADER.size
+
+            records = []
+            while True:
+                length_bytes = f.read(_RECORD_LENGTH.size)
+                if len(length_bytes) < _RECORD_LENGTH.size:
+                    break
+
+                (length,) = _RECORD_LENGTH.unpack(length_bytes)
+                token = f.read(length)
+                if len(token) < length:
+                    break
+
+                record = json.loads(self._encryptor.decrypt_bytes(token).decode('utf-8'))
+                if record.get('seq') != self._sequence + 1:
+                    raise PasswordValueError("Urutan record WAL tidak valid atau WAL korup")
+
+                self._sequence = record['seq']
+                self._end_offset = f.tell()
+                records.append(record)
+
+        return records
+
+    def reset(
+        self,
+        checkpoint: str,
+        password: Optional[str] = None,
+        encryptor: Optional[TextEncryptor] = None
+    ) -> None:
+        """
+        Mengosongkan WAL dan mengikatnya ke checkpoint baru
+
+        Dipanggil setelah file utama disimpan penuh.
+
+        Args:
+            checkpoint: Checkpoint baru dari file utama
+            password: Password baru (jika None, gunakan password lama)
+            encryptor: Encryptor sesi database; jika None, dibuat salt dan key baru
+        """
+        if password:
+            self.password = password
+
+        self._encryptor = encryptor or TextEncryptor(self.password)
+        self._checkpoint = self._checkpoint_bytes(checkpoint)
+        self._sequence = 0
+
+        with open(self.path, 'wb') as f:
+            f.write(_HEADER.pack(
+                WAL_MAGIC, cipher_id(self._encryptor.cipher), self._encryptor.salt, self._checkpoint
+            ))
+            self._flush(f)
+            self._end_offset = f.tell()
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """
+        Menambahkan satu record mutasi ke akhir WAL
+
+        Args:
+            record: Dictionary mutasi yang dapat diserialisasi ke JSON
+        """
+        if not self.ready:
+            raise PasswordValueError("WAL belum diinisialisasi dengan checkpoint")
+
+        self._sequence += 1
+        payload = dict(record, seq=self._sequence)
+        token = self._encryptor.encrypt_bytes(json.dumps(payload).encode('utf-8'))
+
+        with open(self.path, 'r+b') as f:
+            # Timpa sisa record terpotong (jika ada) dari crash sebelumnya
+            f.seek(self._end_offset)
+            f.write(_RECORD_LENGTH.pack(len(token)) + token)
+            f.truncate()
+            self._flush(f)
+            self._end_offset = f.tell()
+
+    def remove(self) -> None:
+        """Menghapus file WAL jika ada"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self._encryptor = None
+        self._checkpoint = None
+        self._sequence = 0
+        self._end_offset = 0
+
+    @property
+    def ready(self) -> bool:
+        """True jika WAL sudah terikat ke checkpoint dan siap ditulisi"""
+        return self._encryptor is not None
+
+    def _flush(self, f) -> None:
+        """Flush buffer dan fsync jika diminta"""
+        f.flush()
+        if self.sync:
+            os.fsync(f.fileno())
+
+    def __len__(self) -> int:
+        return self._sequence
+
+    def __repr__(self) -> str:
+        return f"WriteAheadLog(path='{self.path}', records={self._sequence}, sync={self.sync})"
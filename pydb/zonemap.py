@@ -0,0 +1,417 @@
+import math
+import base64
+import hashlib
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+
+from .query import Expr, Comparison, In, Between, StringMatch, And, Or
+
+# =============================================================================
+# ZONE MAP DAN BLOOM FILTER
+# =============================================================================
+#
+# Baris tabel dibagi menjadi segmen berukuran tetap. Setiap segmen membawa
+# ringkasan (zone):
+#
+#   rows  : jumlah baris segmen
+#   nulls : jumlah nilai None per kolom
+#   min   : nilai terkecil (bukan None) per kolom
+#   max   : nilai terbesar (bukan None) per kolom
+#   bloom : Bloom filter nilai kolom terpilih (kesamaan pada kolom dengan
+#           banyak nilai berbeda, di mana min/max hampir selalu mencakup nilai)
+#
+# may_match() memeriksa kondisi col() terhadap ringkasan; segmen yang pasti
+# tidak memuat baris cocok dilewati tanpa dipindai (atau didekripsi, untuk
+# segmen file tersegmentasi). Pemeriksaan selalu konservatif: bagian kondisi
+# yang tidak dapat dinilai (NOT, LIKE, perbandingan antar kolom, tipe campuran)
+# dianggap mungkin cocok.
+#
+# min/max hanya dicatat untuk nilai bool/int/float/str (termasuk String,
+# Integer dan Float, disimpan sebagai tipe dasarnya) yang dapat
+# dibandingkan satu sama lain, sehingga ringkasan aman disimpan sebagai JSON.
+
+DEFAULT_ZONE_ROWS = 1024
+DEFAULT_ERROR_RATE = 0.01
+
+# bool lebih dulu karena bool juga int
+_SCALARS = (bool, int, float, str)
+
+_MISSING = object()
+
+
+def _bloom_key(value: Any) -> Optional[bytes]:
+    """
+    Kunci hash stabil untuk nilai (None jika tipe tidak didukung)
+
+    Angka yang sama nilainya (1, 1.0, True) memakai kunci yang sama karena
+    sama menurut ==.
+    """
+    if isinstance(value, str):
+        return b's' + value.encode('utf-8', 'surrogatepass')
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            return b'f' + repr(value).encode()
+        if value.is_integer():
+            return b'n' + str(int(value)).encode()
+        return b'n' + repr(value).encode()
+    if isinstance(value, int):
+        return b'n' + str(int(value)).encode()
+    return None
+
+
+class BloomFilter:
+    """
+    Bloom filter dengan double hashing (blake2b, stabil antar proses)
+    """
+
+    def __init__(self, capacity: int, error_rate: float = DEFAULT_ERROR_RATE, bits: Optional[bytes] = None,
+                 hashes: Optional[int] = None):
+        """
+        Args:
+            capacity: Perkiraan jumlah nilai
+            error_rate: Peluang positif palsu yang diinginkan (0 < error_rate < 1)
+            bits: Isi bit tersimpan (untuk from_dict)
+            hashes: Jumlah fungsi hash tersimpan (untuk from_dict)
+
+        Raises:
+            ValueError: Jika error_rate tidak valid
+        """
+        if not 0 < error_rate < 1:
+            raise ValueError(f"error_rate harus di antara 0 dan 1, bukan {error_rate!r}")
+        if bits is None:
+            size = max(64, int(-max(capacity, 1) * math.log(error_rate) / (math.log(2) ** 2)))
+            bits = bytes((size + 7) // 8)
+            hashes = max(1, round(size / max(capacity, 1) * math.log(2)))
+        self._bits = bytearray(bits)
+        self._size = len(self._bits) * 8
+        self.hashes = hashes
+
+    def _positions(self, key: bytes) -> List[int]:
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        size = self._size
+        return [(first + i * second) % size for i in range(self.hashes)]
+
+    def add(self, value: Any) -> None:
+        """Menambahkan nilai (tipe yang tidak didukung diabaikan)"""
+        key = _bloom_key(value)
+        if key is None:
+            return
+        bits = self._bits
+        for position in self._positions(key):
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def might_contain(self, value: Any) -> bool:
+        """False jika nilai pasti tidak pernah ditambahkan"""
+        key = _bloom_key(value)
+        if key is None:
+            return True
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'bits': base64.b64encode(bytes(self._bits)).decode('ascii'), 'hashes': self.hashes}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'BloomFilter':
+        return cls(0, bits=base64.b64decode(data['bits']), hashes=data['hashes'])
+
+    def __repr__(self) -> str:
+        return f"BloomFilter(bits={self._size}, hashes={self.hashes})"
+
+
+# =============================================================================
+# RINGKASAN SEGMEN
+# =============================================================================
+
+def _scalar(value: Any) -> Any:
+    """
+    Nilai sebagai tipe dasar bool/int/float/str, atau _MISSING
+
+    Nilai tabel biasanya berupa subclass (String, Integer, Float); nilainya
+    diturunkan ke tipe dasar agar ringkasan dapat disimpan sebagai JSON.
+    """
+    for base in _SCALARS:
+        if isinstance(value, base):
+            return base(value)
+    return _MISSING
+
+
+def _extremes(values: List[Any]) -> Optional[Tuple[Any, Any]]:
+    """(min, max) nilai bukan None jika aman dipakai untuk pruning, selain itu None"""
+    if not values:
+        return None
+    try:
+        low, high = min(values), max(values)
+    except TypeError:
+        return None
+    low, high = _scalar(low), _scalar(high)
+    if low is _MISSING or high is _MISSING:
+        return None
+    if isinstance(low, float) or isinstance(high, float):
+        # NaN membuat min/max tidak dapat dipercaya
+        if any(value != value for value in values):
+            return None
+    return low, high
+
+
+def _unique(values: List[Any]) -> Iterable[Any]:
+    """Nilai unik (apa adanya jika ada nilai tidak hashable)"""
+    try:
+        return set(values)
+    except TypeError:
+        return values
+
+
+def summarize(
+    rows: List[Dict[str, Any]],
+    columns: Iterable[str],
+    bloom_columns: Iterable[str] = (),
+    error_rate: float = DEFAULT_ERROR_RATE,
+    capacity: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Ringkasan satu segmen baris
+
+    Args:
+        rows: Baris segmen
+        columns: Kolom yang diringkas (nulls/min/max)
+        bloom_columns: Kolom yang juga mendapat Bloom filter
+        error_rate: Peluang positif palsu Bloom filter
+        capacity: Kapasitas Bloom filter (None = jumlah baris)
+
+    Returns:
+        Dictionary zone (bloom berupa objek BloomFilter)
+    """
+    zone: Dict[str, Any] = {'rows': len(rows), 'nulls': {}, 'min': {}, 'max': {}, 'bloom': {}}
+    bloom_columns = set(bloom_columns)
+    for column in columns:
+        values = [row.get(column) for row in rows]
+        present = [value for value in values if value is not None]
+        zone['nulls'][column] = len(values) - len(present)
+        extremes = _extremes(present)
+        if extremes is not None:
+            zone['min'][column], zone['max'][column] = extremes
+        if column in bloom_columns:
+            bloom = BloomFilter(capacity or len(rows), error_rate)
+            for value in _unique(present):
+                bloom.add(value)
+            zone['bloom'][column] = bloom
+    return zone
+
+
+def extend_zone(zone: Dict[str, Any], row: Dict[str, Any]) -> None:
+    """Memperbarui ringkasan dengan satu baris tambahan (insert di akhir segmen)"""
+    zone['rows'] += 1
+    nulls, lows, highs = zone['nulls'], zone['min'], zone['max']
+    for column in nulls:
+        value = row.get(column)
+        if value is None:
+            nulls[column] += 1
+            continue
+
+        bloom = zone['bloom'].get(column)
+        if bloom is not None:
+            bloom.add(value)
+
+        present = zone['rows'] - nulls[column]
+        if present == 1:
+            extremes = _extremes([value])
+        elif column in lows:
+            extremes = _extremes([lows[column], highs[column], value])
+        else:
+            # Kolom sudah tidak dapat diringkas (tipe campuran atau NaN)
+            continue
+        if extremes is None:
+            lows.pop(column, None)
+            highs.pop(column, None)
+        else:
+            lows[column], highs[column] = extremes
+
+
+def dump_zone(zone: Dict[str, Any]) -> Dict[str, Any]:
+    """Ringkasan dalam bentuk JSON (Bloom filter sebagai bits base64)"""
+    dumped = dict(zone)
+    dumped['bloom'] = {column: bloom.to_dict() for column, bloom in zone['bloom'].items()}
+    return dumped
+
+
+def load_zone(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Kebalikan dump_zone"""
+    zone = dict(data)
+    zone['bloom'] = {column: BloomFilter.from_dict(bloom) for column, bloom in data.get('bloom', {}).items()}
+    return zone
+
+
+# =============================================================================
+# PRUNING
+# =============================================================================
+
+
+def _compare_may_match(zone: Dict[str, Any], column: str, op: str, value: Any) -> bool:
+    """Apakah ada baris segmen yang mungkin memenuhi (kolom op konstanta)"""
+    nulls = zone['nulls'].get(column)
+    if nulls is None:
+        return True
+    rows = zone['rows']
+
+    if value is None:
+        if op == '==':
+            return nulls > 0
+        if op == '!=':
+            return nulls < rows
+        return True
+
+    low = zone['min'].get(column, _MISSING)
+    high = zone['max'].get(column, _MISSING)
+    if op == '!=':
+        # Hanya segmen tanpa None yang seluruh nilainya sama dengan konstanta
+        return not (nulls == 0 and low is not _MISSING and low == high == value)
+    if nulls == rows:
+        # Semua None: kesamaan dan perbandingan urutan selalu False
+        return False
+
+    if op == '==':
+        bloom = zone['bloom'].get(column)
+        if bloom is not None and not bloom.might_contain(value):
+            return False
+    if low is _MISSING:
+        return True
+
+    try:
+        if op == '==':
+            return bool(low <= value <= high)
+        if op == '<':
+            return bool(low < value)
+        if op == '<=':
+            return bool(low <= value)
+        if op == '>':
+            return bool(high > value)
+        if op == '>=':
+            return bool(high >= value)
+    except TypeError:
+        return True
+    return True
+
+
+def _prefix_may_match(zone: Dict[str, Any], column: str, prefix: Any) -> bool:
+    """Apakah ada nilai segmen yang mungkin diawali prefix (menurut min/max)"""
+    low = zone['min'].get(column, _MISSING)
+    high = zone['max'].get(column, _MISSING)
+    if zone['nulls'].get(column) == zone['rows']:
+        return False
+    if not isinstance(prefix, str) or not isinstance(low, str) or not isinstance(high, str):
+        return True
+    # String berawalan prefix berada di antara prefix dan string pertama setelah rentangnya
+    if high < prefix:
+        return False
+    return low.startswith(prefix) or low < prefix
+
+
+def may_match(expr: Expr, zone: Dict[str, Any]) -> bool:
+    """
+    Apakah segmen mungkin memuat baris yang memenuhi ekspresi
+
+    Args:
+        expr: Ekspresi col()
+        zone: Ringkasan segmen (hasil summarize/load_zone)
+
+    Returns:
+        False hanya jika segmen pasti tidak memuat baris yang cocok
+    """
+    if isinstance(expr, And):
+        return all(may_match(operand, zone) for operand in expr.operands)
+    if isinstance(expr, Or):
+        return any(may_match(operand, zone) for operand in expr.operands)
+    if isinstance(expr, Comparison):
+        if not expr.is_constant:
+            return True
+        return _compare_may_match(zone, expr.column, expr.op, expr.value)
+    if isinstance(expr, In):
+        return any(_compare_may_match(zone, expr.column, '==', value) for value in expr.values)
+    if isinstance(expr, Between):
+        return (_compare_may_match(zone, expr.column, '>=', expr.low)
+                and _compare_may_match(zone, expr.column, '<=', expr.high))
+    if isinstance(expr, StringMatch) and expr.kind == 'startswith':
+        return _prefix_may_match(zone, expr.column, expr.text)
+    return True
+
+
+class ZoneMap:
+    """
+    Ringkasan per segmen tetap dari baris tabel di memori
+    """
+
+    def __init__(
+        self,
+        columns: Iterable[str],
+        segment_rows: int = DEFAULT_ZONE_ROWS,
+        bloom_columns: Iterable[str] = (),
+        error_rate: float = DEFAULT_ERROR_RATE
+    ):
+        """
+        Args:
+            columns: Kolom yang diringkas
+            segment_rows: Jumlah baris per segmen
+            bloom_columns: Kolom yang mendapat Bloom filter
+            error_rate: Peluang positif palsu Bloom filter
+
+        Raises:
+            ValueError: Jika segment_rows atau error_rate tidak valid
+        """
+        if isinstance(segment_rows, bool) or not isinstance(segment_rows, int) or segment_rows < 1:
+            raise ValueError(f"segment_rows harus bilangan bulat positif, bukan {segment_rows!r}")
+        if not 0 < error_rate < 1:
+            raise ValueError(f"error_rate harus di antara 0 dan 1, bukan {error_rate!r}")
+        self.columns = list(columns)
+        self.segment_rows = segment_rows
+        self.bloom_columns = list(bloom_columns)
+        self.error_rate = error_rate
+        self.zones: List[Dict[str, Any]] = []
+        # Versi data tabel yang diringkas (None = belum dibangun)
+        self.version: Optional[int] = None
+
+    def build(self, rows: List[Dict[str, Any]]) -> None:
+        """Meringkas ulang seluruh baris"""
+        size = self.segment_rows
+        self.zones = [
+            summarize(rows[start:start + size], self.columns, self.bloom_columns, self.error_rate, size)
+            for start in range(0, len(rows), size)
+        ]
+
+    def append(self, row: Dict[str, Any]) -> None:
+        """Meringkas satu baris yang ditambahkan di akhir tabel"""
+        if self.zones and self.zones[-1]['rows'] < self.segment_rows:
+            extend_zone(self.zones[-1], row)
+        else:
+            self.zones.append(
+                summarize([row], self.columns, self.bloom_columns, self.error_rate, self.segment_rows)
+            )
+
+    def ranges(self, expr: Expr) -> List[Tuple[int, int]]:
+        """
+        Rentang posisi baris (awal, akhir) yang perlu dipindai untuk ekspresi
+
+        Segmen bersebelahan digabung menjadi satu rentang.
+        """
+        size = self.segment_rows
+        ranges: List[Tuple[int, int]] = []
+        for number, zone in enumerate(self.zones):
+            if not may_match(expr, zone):
+                continue
+            start = number * size
+            end = start + zone['rows']
+            if ranges and ranges[-1][1] == start:
+                ranges[-1] = (ranges[-1][0], end)
+            else:
+                ranges.append((start, end))
+        return ranges
+
+    def definition(self) -> Dict[str, Any]:
+        return {'segment_rows': self.segment_rows, 'bloom_columns': self.bloom_columns, 'error_rate': self.error_rate}
+
+    def __len__(self) -> int:
+        return len(self.zones)
+
+    def __repr__(self) -> str:
+        return f"ZoneMap(segments={len(self.zones)}, segment_rows={self.segment_rows})"
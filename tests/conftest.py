@@ -0,0 +1,48 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydb import Database, Column, Integer, String, Float, Boolean  # noqa: E402
+
+PASSWORD = 'rahasia-uji'
+
+
+@pytest.fixture
+def make_db(tmp_path):
+    """Pembuat database baru di direktori sementara (argumen diteruskan ke Database)"""
+    def make(name='uji', **options):
+        return Database(name, PASSWORD, str(tmp_path), create_new=True, **options)
+    return make
+
+
+@pytest.fixture
+def reopen():
+    """Memuat ulang database dari file-nya (argumen diteruskan ke load_from_file)"""
+    def load(db, **options):
+        return Database.load_from_file(db.file_path, PASSWORD, **options)
+    return load
+
+
+def user_columns():
+    return {
+        'id': Column('id', Integer),
+        'name': Column('name', String),
+        'age': Column('age', Integer),
+        'score': Column('score', Float),
+        'active': Column('active', Boolean),
+    }
+
+
+def user_rows(count):
+    return [
+        {
+            'name': ['Budi', 'Ani', 'Citra', None][i % 4],
+            'age': i % 80 if i % 9 else None,
+            'score': i / 10,
+            'active': bool(i % 2),
+        }
+        for i in range(1, count + 1)
+    ]
@@ -0,0 +1,56 @@
+import pytest
+
+from pydb import col
+from conftest import user_columns, user_rows
+
+EXPRESSIONS = [
+    col('age') == 30,
+    col('age') != 30,
+    col('age') > 50,
+    col('score').between(2, 5),
+    col('name').isin(['Ani', 'Citra']),
+    col('name').is_null(),
+    col('name').like('B%'),
+    ~(col('active') == True) | (col('age') < 10),  # noqa: E712
+]
+
+
+@pytest.fixture
+def tables(make_db):
+    db = make_db()
+    row_table = db.create_table('rows', user_columns())
+    column_table = db.create_table('columns', user_columns(), columnar=True)
+    for table in (row_table, column_table):
+        table.insert_many(user_rows(200))
+        table.delete_by_id(17)
+        table.update_data(col('id') == 5, name='Lima', age=None)
+    return row_table, column_table
+
+
+def test_data_agrees(tables):
+    row_table, column_table = tables
+    assert column_table.data == row_table.data
+
+
+@pytest.mark.parametrize('expr', EXPRESSIONS)
+def test_select_agrees(tables, expr):
+    row_table, column_table = tables
+    assert column_table.select_data(expr) == row_table.select_data(expr)
+    assert column_table.count_data(expr) == row_table.count_data(expr)
+
+
+@pytest.mark.parametrize('direction', ['asc', 'desc'])
+def test_order_and_aggregate_agree(tables, direction):
+    row_table, column_table = tables
+    order = ('age', direction)
+    assert column_table.select_data(order_by=order, limit=15) == row_table.select_data(order_by=order, limit=15)
+    query = dict(group_by='name', sum='age', avg='score', count=True)
+    assert column_table.aggregate(**query) == row_table.aggregate(**query)
+
+
+def test_columnar_round_trip(make_db, reopen):
+    db = make_db()
+    table = db.create_table('users', user_columns(), columnar=True)
+    table.insert_many(user_rows(50))
+    db.save()
+    assert reopen(db).get_table('users').data == table.data
@@ -0,0 +1,87 @@
+import io
+
+import pytest
+
+from pydb.encrypted import (
+    TextEncryptor, PasswordValueError, encrypt_stream, decrypt_stream, compress_data, decompress_data,
+    ENCRYPTED_MAGIC, STREAM_MAGIC, CIPHERS, COMPRESSIONS, COMPRESSION_IDS,
+)
+from conftest import PASSWORD, user_columns, user_rows
+
+DATA = b'{"users": [' + b'{"name": "Budi", "age": 30}, ' * 500 + b'{}]}'
+
+# Posisi byte versi dan byte kompresi di header berversi
+VERSION_BYTE = len(ENCRYPTED_MAGIC)
+COMPRESSION_BYTE = len(ENCRYPTED_MAGIC) + 2
+
+
+@pytest.mark.parametrize('cipher', CIPHERS)
+@pytest.mark.parametrize('compression', COMPRESSIONS)
+def test_round_trip(cipher, compression):
+    encryptor = TextEncryptor(PASSWORD, cipher=cipher)
+    token = encryptor.encrypt_data(DATA, compression)
+    assert TextEncryptor(PASSWORD).decrypt_data(token) == DATA
+    with pytest.raises(PasswordValueError):
+        TextEncryptor('password-lain').decrypt_data(token)
+
+
+@pytest.mark.parametrize('cipher', CIPHERS)
+def test_tampered_compression_byte_is_rejected(cipher):
+    token = bytearray(TextEncryptor(PASSWORD, cipher=cipher).encrypt_data(DATA, 'zlib'))
+    token[COMPRESSION_BYTE] = COMPRESSION_IDS['none']
+    with pytest.raises(PasswordValueError):
+        TextEncryptor(PASSWORD).decrypt_data(bytes(token))
+
+
+def test_fernet_version_downgrade_is_rejected():
+    token = bytearray(TextEncryptor(PASSWORD).encrypt_data(DATA, 'zlib'))
+    token[VERSION_BYTE] = 2
+    with pytest.raises(PasswordValueError):
+        TextEncryptor(PASSWORD).decrypt_data(bytes(token))
+
+
+@pytest.mark.parametrize('compression', ['zlib', 'lzma', 'bz2'])
+def test_decompress_rejects_truncated_and_trailing_data(compression):
+    big = b'0' * (4 * 1024 * 1024)
+    packed = compress_data(big, compression)
+    assert decompress_data(packed, compression) == big
+
+    with pytest.raises(PasswordValueError):
+        decompress_data(packed[:-8], compression)
+    with pytest.raises(PasswordValueError):
+        decompress_data(packed + b'sisa', compression)
+    with pytest.raises(PasswordValueError):
+        decompress_data(packed + packed, compression)
+
+
+@pytest.mark.parametrize('cipher', CIPHERS)
+def test_stream_header_is_authenticated(cipher):
+    buffer = io.BytesIO()
+    encryptor = TextEncryptor(PASSWORD, cipher=cipher)
+    encrypt_stream(iter([DATA]), buffer, PASSWORD, encryptor=encryptor, compression='zlib')
+    stream = bytearray(buffer.getvalue())
+    assert b''.join(decrypt_stream(io.BytesIO(bytes(stream)), PASSWORD)) == DATA
+
+    stream[len(STREAM_MAGIC) + 2] = COMPRESSION_IDS['none']
+    with pytest.raises(PasswordValueError):
+        list(decrypt_stream(io.BytesIO(bytes(stream)), PASSWORD))
+
+
+@pytest.mark.parametrize('storage', [
+    {},
+    {'row_encoding': 'binary'},
+    {'storage_format': 'segmented'},
+    {'storage_format': 'stream'},
+])
+@pytest.mark.parametrize('cipher', CIPHERS)
+@pytest.mark.parametrize('compression', ['none', 'zlib'])
+def test_database_round_trip(make_db, reopen, storage, cipher, compression):
+    db = make_db(cipher=cipher, compression=compression, **storage)
+    table = db.create_table('users', user_columns())
+    table.insert_many(user_rows(40))
+    table.create_index('age')
+    db.save()
+
+    restored = reopen(db).get_table('users')
+    assert restored.data == table.data
+    assert restored.find(age=30) == table.find(age=30)
@@ -0,0 +1,63 @@
+import pytest
+
+from pydb import col
+from conftest import user_columns, user_rows
+
+
+@pytest.fixture
+def users(make_db):
+    table = make_db().create_table('users', user_columns())
+    table.insert_many(user_rows(500))
+    return table
+
+
+def matching(table, expr):
+    return [row for row in table.data if expr(row)]
+
+
+def test_without_index_uses_full_scan(users):
+    expr = col('age') > 30
+    info = users.explain(expr)
+    assert info['table'] == 'users'
+    assert info['access'] == 'full_scan'
+    assert info['actual_rows'] == len(matching(users, expr))
+
+
+def test_primary_key_lookup(users):
+    info = users.explain(col('id') == 42)
+    assert info['access'] == 'primary_key'
+    assert info['actual_rows'] == 1
+
+
+def test_equality_prefers_index_and_orders_filters(users):
+    users.create_index('name')
+    expr = (col('active') == True) & (col('age') > 60) & (col('name') == 'Ani')
+    info = users.explain(expr)
+    assert info['access'] == 'index_lookup' and info['column'] == 'name'
+    assert info['filters'] == [repr(col('age') > 60), repr(col('active') == True)]
+    assert {path['access'] for path in info['considered']} == {'full_scan', 'index_lookup'}
+    assert info['actual_rows'] == len(matching(users, expr))
+
+
+def test_range_uses_ordered_index_only_when_selective(users):
+    users.create_index('score', ordered=True)
+    narrow = col('score').between(10, 12)
+    info = users.explain(narrow)
+    assert info['access'] == 'index_range' and info['index'] == 'ordered'
+    assert info['actual_rows'] == len(matching(users, narrow))
+
+    wide = col('score') >= -1
+    assert users.explain(wide)['access'] == 'full_scan'
+
+
+def test_cheapest_of_several_indexes_wins(users):
+    users.create_index('active')
+    users.create_index('name')
+    info = users.explain((col('active') == True) & (col('name') == 'Citra'))
+    assert info['column'] == 'name'
+    assert info['estimated_rows'] <= info['rows']
+
+
+def test_lambda_condition_is_full_scan(users):
+    info = users.explain(lambda row: row['active'])
+    assert info['access'] == 'full_scan' and info['estimated_rows'] is None
@@ -0,0 +1,42 @@
+import pytest
+
+from pydb import Column, String, DatabaseError
+
+NOTES = [
+    'Kunci sesi dienkripsi dengan AES',
+    'Catatan rapat mingguan',
+    'Enkripsi stream memakai kunci turunan',
+    'Rapat tentang kunci cadangan',
+]
+
+
+@pytest.fixture
+def notes(make_db):
+    db = make_db()
+    table = db.create_table('notes', {'id': Column('id', String), 'body': Column('body', String)})
+    for i, body in enumerate(NOTES, 1):
+        table.insert_data(id=str(i), body=body)
+    table.create_fulltext_index('body')
+    return table
+
+
+def bodies(rows):
+    return sorted(row['body'] for row in rows)
+
+
+def test_and_or_and_prefix(notes):
+    assert bodies(notes.search('body', 'kunci rapat')) == [NOTES[3]]
+    assert bodies(notes.search('body', 'aes rapat', mode='or')) == sorted([NOTES[0], NOTES[1], NOTES[3]])
+    assert bodies(notes.search('body', 'enkrip*')) == [NOTES[2]]
+    assert bodies(notes.search('body', 'ming* rapat')) == [NOTES[1]]
+
+
+def test_search_follows_mutations(notes):
+    notes.insert_data(id='5', body='Kunci baru')
+    notes.delete_by_id('1')
+    assert bodies(notes.search('body', 'kunci')) == sorted([NOTES[2], NOTES[3], 'Kunci baru'])
+
+
+def test_search_without_index(notes):
+    with pytest.raises(DatabaseError):
+        notes.search('id', 'x')
@@ -0,0 +1,59 @@
+import pytest
+
+from pydb import col
+from conftest import user_columns, user_rows
+
+SCORES = [5, 3, 9, 3, 1, 9, 9, 3, None, 1]
+
+
+def scored_table(make_db, index=None):
+    db = make_db()
+    table = db.create_table('users', user_columns())
+    table.insert_many([{'name': f'u{i}', 'score': score} for i, score in enumerate(SCORES, 1)])
+    if index is not None:
+        table.create_index('score', **index)
+    return table
+
+
+def by_id(rows):
+    return sorted(rows, key=lambda row: row['id'])
+
+
+@pytest.mark.parametrize('direction', ['asc', 'desc'])
+@pytest.mark.parametrize('limit', [None, 4])
+def test_ordered_index_matches_sort_with_ties(make_db, direction, limit):
+    plain = scored_table(make_db)
+    indexed = scored_table(make_db, {'ordered': True})
+    order = ('score', direction)
+
+    expected = [row['id'] for row in plain.select_data(order_by=order, limit=limit)]
+    assert [row['id'] for row in indexed.select_data(order_by=order, limit=limit)] == expected
+    assert [row['id'] for row in indexed.order_by('score', direction == 'desc')] == \
+        [row['id'] for row in plain.order_by('score', direction == 'desc')]
+
+
+def test_descending_ties_keep_insertion_order(make_db):
+    table = scored_table(make_db, {'ordered': True})
+    rows = table.select_data(col('score') > 1, order_by=('score', 'desc'), limit=4)
+    assert [row['id'] for row in rows] == [3, 6, 7, 1]
+
+
+@pytest.mark.parametrize('ordered', [False, True])
+@pytest.mark.parametrize('expr', [
+    col('age') == 30,
+    col('age') >= 60,
+    col('age').between(10, 20) & (col('name') == 'Ani'),
+    col('age').isin([1, 2, 3]) | col('age').is_null(),
+])
+def test_index_results_match_full_scan(make_db, ordered, expr):
+    db = make_db()
+    table = db.create_table('users', user_columns())
+    table.insert_many(user_rows(300))
+    expected = expr.filter(table.data)
+
+    table.create_index('age', ordered=ordered)
+    # Rentang lewat index terurut mengikuti urutan kunci, jadi dibandingkan per id
+    assert by_id(table.select_data(expr)) == by_id(expected)
+    table.insert_data(name='Ani', age=30)
+    table.delete_by_id(5)
+    assert by_id(table.select_data(expr)) == by_id(expr.filter(table.data))
@@ -0,0 +1,79 @@
+import pytest
+
+from pydb import DatabaseColumnError, DatabaseValidationError
+from conftest import user_columns, user_rows
+
+
+@pytest.fixture(params=[False, True], ids=['row', 'columnar'])
+def users(make_db, request):
+    return make_db().create_table('users', user_columns(), columnar=request.param)
+
+
+def test_bulk_insert_matches_insert_data(make_db, users):
+    rows = user_rows(50)
+    ids = users.insert_many(rows)
+    single = make_db('satu').create_table('users', user_columns())
+    for row in rows:
+        single.insert_data(**row)
+
+    assert ids == list(range(1, 51))
+    assert users.data == single.data
+
+
+def test_ids_skip_explicit_ids(users):
+    users.insert_data(id=2, name='Ani')
+    assert users.insert_many([{'name': 'Budi'}, {'id': 4, 'name': 'Citra'}, {'name': 'Dewi'}]) == [1, 4, 3]
+    assert users.insert_data(name='Eko') == 5
+
+
+def test_tuple_rows_with_columns(users):
+    ids = users.insert_many([('Ani', 30), ('Budi', '25')], columns=['name', 'age'])
+    assert [(row['id'], row['name'], row['age']) for row in users.data] == [(1, 'Ani', 30), (2, 'Budi', 25)]
+    assert ids == [1, 2]
+
+    with pytest.raises(DatabaseColumnError):
+        users.insert_many([('Ani',)], columns=['nama'])
+
+
+@pytest.mark.parametrize('bad', [
+    {'name': 'X', 'age': 'bukan angka'},
+    {'name': 'X', 'unknown': 1},
+    {'id': 1, 'name': 'sudah ada'},
+    {'id': 3, 'name': 'kembar dalam batch'},
+], ids=['type', 'column', 'existing_id', 'batch_id'])
+def test_one_invalid_row_inserts_nothing(users, bad):
+    users.insert_data(name='awal')
+    before = [dict(row) for row in users.data]
+
+    with pytest.raises((DatabaseValidationError, DatabaseColumnError)):
+        users.insert_many([{'id': 3, 'name': 'Budi'}, {'name': 'Ani'}, bad, {'name': 'Citra'}])
+
+    assert users.data == before
+    assert users.insert_data(name='lanjut') == 2
+
+
+def test_unique_index_is_checked_for_whole_batch(make_db):
+    users = make_db().create_table('users', user_columns())
+    users.create_index('name', unique=True)
+    users.insert_data(name='Ani')
+
+    with pytest.raises(DatabaseValidationError):
+        users.insert_many([{'name': 'Budi'}, {'name': 'Ani'}])
+    with pytest.raises(DatabaseValidationError):
+        users.insert_many([{'name': 'Citra'}, {'name': 'Citra'}])
+
+    assert [row['name'] for row in users.data] == ['Ani']
+    assert users.find(name='Budi') == []
+
+
+def test_rollback_removes_inserted_rows(make_db):
+    db = make_db()
+    users = db.create_table('users', user_columns())
+    users.insert_many(user_rows(3))
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            users.insert_many(user_rows(10))
+            raise RuntimeError('batal')
+
+    assert users.count_data() == 3
+    assert users.insert_data(name='baru') == 4
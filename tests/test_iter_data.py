@@ -0,0 +1,61 @@
+import itertools
+
+import pytest
+
+from pydb import DatabaseValidationError, col
+from conftest import user_columns, user_rows
+
+
+@pytest.fixture(params=[False, True], ids=['row', 'columnar'])
+def users(make_db, request):
+    table = make_db().create_table('users', user_columns(), columnar=request.param)
+    table.insert_many(user_rows(1000))
+    return table
+
+
+class Counting:
+    """Kondisi lambda yang mencatat jumlah baris yang diperiksa"""
+
+    def __init__(self, predicate):
+        self.predicate = predicate
+        self.calls = 0
+
+    def __call__(self, row):
+        self.calls += 1
+        return self.predicate(row)
+
+
+def test_limit_stops_scanning_early(users):
+    active = Counting(lambda row: row['active'])
+    rows = list(users.iter_data(active, limit=5, offset=10))
+    assert [row['id'] for row in rows] == [21, 23, 25, 27, 29]
+    assert active.calls < 40
+
+
+def test_iterator_is_lazy(users):
+    everyone = Counting(lambda row: True)
+    iterator = users.iter_data(everyone)
+    assert everyone.calls == 0
+    assert [row['id'] for row in itertools.islice(iterator, 3)] == [1, 2, 3]
+    assert everyone.calls == 3
+
+
+def test_matches_select_data(users):
+    expr = (col('age') > 40) & (col('active') == True)
+    for options in [{}, {'limit': 7}, {'limit': 7, 'offset': 30}, {'columns': ['id', 'age']},
+                    {'order_by': ('score', 'desc'), 'limit': 4}, {'order_by': 'age', 'offset': 5, 'limit': 3}]:
+        assert list(users.iter_data(expr, **options)) == users.select_data(expr, **options)
+
+
+def test_ordered_index_is_read_in_order(make_db):
+    users = make_db().create_table('users', user_columns())
+    users.insert_many(user_rows(1000))
+    users.create_index('score', ordered=True)
+    rows = list(users.iter_data(order_by=('score', 'desc'), limit=3))
+    assert [row['score'] for row in rows] == [100.0, 99.9, 99.8]
+
+
+@pytest.mark.parametrize('options', [{'limit': -1}, {'offset': -1}, {'order_by': ('age', 'naik')}])
+def test_invalid_window(users, options):
+    with pytest.raises(DatabaseValidationError):
+        users.iter_data(**options)
@@ -0,0 +1,87 @@
+import pytest
+
+from pydb import Column, Integer, String, Float, DatabaseColumnError, DatabaseTableError, DatabaseValidationError
+from pydb.PyDB import ColumnarTable
+
+USERS = [{'name': 'Ani'}, {'name': 'Budi'}, {'name': 'Citra'}]
+ORDERS = [
+    {'user_id': 1, 'total': 10.0},
+    {'user_id': 3, 'total': 5.0},
+    {'user_id': None, 'total': 1.0},
+    {'user_id': 9, 'total': 2.0},
+    {'user_id': 1, 'total': 7.0},
+]
+
+
+@pytest.fixture(params=[False, True], ids=['row', 'columnar'])
+def db(make_db, request):
+    db = make_db()
+    db.create_table('users', {
+        'id': Column('id', Integer), 'name': Column('name', String),
+    }, columnar=request.param).insert_many(USERS)
+    db.create_table('orders', {
+        'id': Column('id', Integer), 'user_id': Column('user_id', Integer), 'total': Column('total', Float),
+    }, columnar=request.param).insert_many(ORDERS)
+    return db
+
+
+def nested_loop(left, right, left_key, right_key, how):
+    """Join referensi O(n * m) untuk dibandingkan dengan hash join"""
+    result = []
+    for left_row in left.data:
+        matches = [
+            right_row for right_row in right.data
+            if left_row[left_key] is not None and left_row[left_key] == right_row[right_key]
+        ]
+        for right_row in matches or ([None] if how == 'left' else []):
+            result.append((left_row['id'], right_row and right_row['id']))
+    return result
+
+
+@pytest.mark.parametrize('how', ['inner', 'left'])
+@pytest.mark.parametrize('index', [None, 'user_id'])
+def test_join_matches_nested_loop(db, how, index):
+    orders, users = db.get_table('orders'), db.get_table('users')
+    if index:
+        if isinstance(orders, ColumnarTable):
+            pytest.skip('tabel kolumnar tidak memiliki index')
+        orders.create_index(index)
+    # Urutan inner join mengikuti sisi probe (bisa tabel kanan), jadi dibandingkan terurut
+    arrange = sorted if how == 'inner' else list
+
+    rows = db.join('orders', 'users', on=('user_id', 'id'), how=how)
+    assert arrange((row['orders.id'], row['users.id']) for row in rows) == \
+        arrange(nested_loop(orders, users, 'user_id', 'id', how))
+
+    reverse = db.join('users', 'orders', on=('id', 'user_id'), how=how)
+    assert arrange((row['users.id'], row['orders.id']) for row in reverse) == \
+        arrange(nested_loop(users, orders, 'id', 'user_id', how))
+
+
+def test_left_join_fills_unmatched_and_none_keys(db):
+    rows = list(db.join('orders', 'users', on=('user_id', 'id'), how='left', columns=['orders.id', 'name']))
+    assert rows == [
+        {'orders.id': 1, 'name': 'Ani'},
+        {'orders.id': 2, 'name': 'Citra'},
+        {'orders.id': 3, 'name': None},
+        {'orders.id': 4, 'name': None},
+        {'orders.id': 5, 'name': 'Ani'},
+    ]
+
+
+def test_colliding_column_names_are_qualified(db):
+    row = next(db.join('orders', 'users', on=('user_id', 'id')))
+    assert set(row) == {'orders.id', 'user_id', 'total', 'users.id', 'name'}
+    with pytest.raises(DatabaseColumnError):
+        list(db.join('orders', 'users', on=('user_id', 'id'), columns=['id']))
+
+
+def test_invalid_join_arguments(db):
+    with pytest.raises(DatabaseValidationError):
+        db.join('orders', 'users', on=('user_id', 'id'), how='outer')
+    with pytest.raises(DatabaseColumnError):
+        db.join('orders', 'users', on=('nope', 'id'))
+    with pytest.raises(DatabaseTableError):
+        db.join('orders', 'orders', on='id')
+    with pytest.raises(DatabaseTableError):
+        db.join('orders', 'missing', on='id')
@@ -0,0 +1,73 @@
+import pytest
+
+from pydb import Database, clear_key_cache, evict_key
+from pydb.encrypted import DerivedKeyCache, key_cache, read_header
+from conftest import PASSWORD, user_columns, user_rows
+
+SALT = b'0123456789abcdef'
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_key_cache()
+    yield
+    clear_key_cache()
+
+
+def test_cached_key_matches_fresh_derivation():
+    cache = DerivedKeyCache(max_size=2)
+    key = cache.derive(PASSWORD.encode(), SALT)
+    assert cache.derive(PASSWORD.encode(), SALT) == key == DerivedKeyCache(0).derive(PASSWORD.encode(), SALT)
+    assert len(cache) == 1
+
+
+def test_least_recently_used_key_is_evicted_and_zeroized():
+    cache = DerivedKeyCache(max_size=2)
+    for salt in (b'a' * 16, b'b' * 16, b'c' * 16):
+        cache.derive(b'pw', salt)
+    assert len(cache) == 2
+    assert all(key[1] != b'a' * 16 for key in cache._keys)
+
+    stored = next(iter(cache._keys.values()))
+    cache.clear()
+    assert len(cache) == 0 and stored == bytearray(len(stored))
+
+
+def test_evict_key_only_removes_matching_password():
+    key_cache.derive(PASSWORD.encode(), SALT)
+    key_cache.derive(PASSWORD.encode(), b'x' * 16)
+    key_cache.derive(b'password-lain', SALT)
+
+    assert evict_key(PASSWORD, salt=SALT) == 1
+    assert evict_key(PASSWORD) == 1
+    assert evict_key(PASSWORD) == 0
+    assert len(key_cache) == 1
+
+
+def test_session_key_is_reused_between_saves(make_db, reopen):
+    db = make_db()
+    db.create_table('users', user_columns()).insert_many(user_rows(5))
+    db.save()
+    _, salt, _ = read_header(db.file_path)
+    db.get_table('users').insert_data(name='baru')
+    db.save()
+    assert read_header(db.file_path)[1] == salt
+    assert len(key_cache) == 1
+
+    restored = reopen(db)
+    restored.save()
+    assert read_header(db.file_path)[1] == salt
+    assert restored.get_table('users').count_data() == 6
+
+
+def test_clear_session_key_forces_new_salt(make_db):
+    db = make_db()
+    db.create_table('users', user_columns())
+    db.save()
+    _, salt, _ = read_header(db.file_path)
+
+    db.clear_session_key()
+    assert len(key_cache) == 0
+    db.save()
+    assert read_header(db.file_path)[1] != salt
+    assert Database.load_from_file(db.file_path, PASSWORD).get_table('users').name == 'users'
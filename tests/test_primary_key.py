@@ -0,0 +1,89 @@
+import pytest
+
+from pydb import DatabaseError, DatabaseValidationError
+from conftest import user_columns, user_rows
+
+
+def populated(make_db, count=20, **options):
+    db = make_db(**options)
+    table = db.create_table('users', user_columns())
+    table.insert_many(user_rows(count))
+    return db, table
+
+
+def test_delete_by_id_keeps_order_and_count(make_db):
+    db, table = populated(make_db)
+    assert table.delete_by_id(5)
+    assert table.delete_by_id(12)
+    assert not table.delete_by_id(5)
+
+    assert table.count_data() == 18
+    assert [row['id'] for row in table.data] == [i for i in range(1, 21) if i not in (5, 12)]
+    assert table.find(id=5) == []
+
+
+def test_delete_by_id_interleaved_with_insert(make_db):
+    db, table = populated(make_db, count=5)
+    for i in range(1, 6):
+        table.delete_by_id(i)
+        table.insert_data(name=f'baru{i}')
+
+    assert [row['id'] for row in table.data] == [6, 7, 8, 9, 10]
+    assert table.count_data() == 5
+
+
+def test_rollback_restores_deleted_rows_in_place(make_db):
+    db, table = populated(make_db)
+    before = [dict(row) for row in table.data]
+
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            table.delete_by_id(3)
+            table.delete_by_id(7)
+            assert table.count_data() == 18
+            # Akses data memadatkan tabel di tengah transaksi
+            assert len(table.data) == 18
+            table.delete_by_id(10)
+            raise RuntimeError('batal')
+
+    assert table.data == before
+    assert table.find(id=7)[0]['name'] == before[6]['name']
+
+
+def test_replay_of_delete_id(make_db, reopen):
+    db, table = populated(make_db, wal=True)
+    db.save()
+    table.delete_by_id(2)
+    table.delete_by_id(4)
+    expected = [dict(row) for row in table.data]
+
+    restored = reopen(db, wal=True).get_table('users')
+    assert restored.data == expected
+
+
+def test_delete_by_id_on_columnar_table(make_db):
+    db = make_db()
+    table = db.create_table('users', user_columns(), columnar=True)
+    table.insert_many(user_rows(10))
+    assert table.delete_by_id(4)
+    assert [row['id'] for row in table.data] == [1, 2, 3, 5, 6, 7, 8, 9, 10]
+    with pytest.raises(DatabaseError):
+        table.insert_data(id=5, name='kembar')
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_failed_insert_keeps_auto_increment(make_db, columnar):
+    db = make_db()
+    table = db.create_table('users', user_columns(), columnar=columnar)
+    table.insert_data(id=2, name='Ani')
+    if not columnar:
+        table.create_index('name', unique=True)
+
+    with pytest.raises(DatabaseValidationError):
+        table.insert_data(id=2, name='kembar')
+    if not columnar:
+        with pytest.raises(DatabaseValidationError):
+            table.insert_data(name='Ani')
+
+    assert table.insert_data(name='Citra') == 1
+    assert table.insert_data(name='Dewi') == 3
@@ -0,0 +1,73 @@
+import pytest
+
+from pydb import DatabaseValidationError, col
+from conftest import user_columns, user_rows
+
+
+@pytest.fixture
+def db(make_db):
+    return make_db()
+
+
+@pytest.fixture
+def users(db):
+    table = db.create_table('users', user_columns())
+    table.insert_many(user_rows(20))
+    table.enable_cache(max_entries=8)
+    return table
+
+
+ACTIVE = col('active') == True
+
+
+def test_repeated_query_is_served_from_cache(users):
+    first = users.select_data(ACTIVE)
+    assert users.select_data(ACTIVE) == first
+    assert users.count_data(ACTIVE) == users.count_data(ACTIVE) == len(first)
+    stats = users.cache_stats()
+    assert stats['hits'] == 2 and stats['misses'] == 2
+
+
+def test_cached_rows_are_copies(users):
+    users.select_data(ACTIVE)[0]['name'] = 'diubah'
+    assert users.select_data(ACTIVE)[0]['name'] != 'diubah'
+
+
+@pytest.mark.parametrize('mutate', [
+    lambda t: t.insert_data(name='baru', active=True),
+    lambda t: t.update_data(col('id') == 3, active=False),
+    lambda t: t.delete_data(col('id') == 2),
+    lambda t: t.delete_by_id(4),
+    lambda t: t.insert_many([{'name': 'x', 'active': True}]),
+], ids=['insert', 'update', 'delete', 'delete_by_id', 'insert_many'])
+def test_mutation_invalidates_cache(users, mutate):
+    users.count_data(ACTIVE)
+    mutate(users)
+    expected = sum(1 for row in users.data if row['active'])
+    assert users.count_data(ACTIVE) == expected
+    assert users.cache_stats()['invalidations'] == 1
+
+
+def test_rollback_invalidates_cache(db, users):
+    before = users.select_data(ACTIVE)
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            users.delete_data(ACTIVE)
+            assert users.select_data(ACTIVE) == []
+            raise RuntimeError('batal')
+    assert users.select_data(ACTIVE) == before
+
+
+def test_lambda_conditions_bypass_cache(users):
+    users.count_data(lambda row: row['active'])
+    users.count_data(lambda row: row['active'])
+    stats = users.cache_stats()
+    assert stats['bypassed'] == 2 and stats['entries'] == 0
+
+
+def test_cache_can_be_disabled(users):
+    users.count_data(ACTIVE)
+    users.disable_cache()
+    assert users.cache_stats() is None
+    with pytest.raises(DatabaseValidationError):
+        users.enable_cache(max_entries=0)
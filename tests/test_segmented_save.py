@@ -0,0 +1,77 @@
+import os
+
+import pytest
+
+from pydb import Database
+from conftest import PASSWORD, user_columns, user_rows
+
+
+def segments(db, table_name):
+    return db._segmented_file.directory['tables'][table_name]['segments']
+
+
+@pytest.fixture
+def db(make_db):
+    db = make_db(storage_format='segmented', segment_rows=100)
+    db.create_table('users', user_columns()).insert_many(user_rows(300))
+    db.create_table('logs', user_columns()).insert_many(user_rows(300))
+    db.save()
+    return db
+
+
+def test_only_dirty_tables_are_rewritten(db, reopen):
+    logs_before = segments(db, 'logs')
+    size = os.path.getsize(db.file_path)
+
+    db.get_table('users').insert_data(name='baru')
+    assert db.get_table('users').is_dirty and not db.get_table('logs').is_dirty
+    db.save()
+
+    assert segments(db, 'logs') == logs_before
+    assert all(segment['offset'] >= size for segment in segments(db, 'users'))
+    assert not db.get_table('users').is_dirty
+
+    restored = reopen(db, storage_format='segmented')
+    assert restored.get_table('users').count_data() == 301
+    assert restored.get_table('logs').data == db.get_table('logs').data
+
+
+def test_clean_tables_stay_unloaded(db, reopen):
+    restored = reopen(db, storage_format='segmented')
+    restored.get_table('users').delete_by_id(1)
+    restored.save()
+    assert not restored.get_table('logs').is_loaded
+
+    again = reopen(restored, storage_format='segmented')
+    assert again.get_table('users').count_data() == 299
+    assert again.get_table('logs').count_data() == 300
+
+
+def test_save_without_changes_appends_only_directory(db):
+    users_before, logs_before = segments(db, 'users'), segments(db, 'logs')
+    db.save()
+    assert (segments(db, 'users'), segments(db, 'logs')) == (users_before, logs_before)
+
+
+def test_garbage_triggers_full_rewrite(db):
+    users = db.get_table('users')
+    sizes = [os.path.getsize(db.file_path)]
+    for i in range(5):
+        users.update_data(lambda row: True, age=i)
+        db.save()
+        sizes.append(os.path.getsize(db.file_path))
+    # File ditulis ulang penuh (mengecil) begitu segmen lama mendominasi
+    assert any(after < before for before, after in zip(sizes, sizes[1:]))
+    assert Database.load_from_file(db.file_path, PASSWORD, storage_format='segmented').get_table('users').count_data() == 300
+
+
+def test_file_changed_elsewhere_is_rewritten_in_full(db):
+    other = Database.load_from_file(db.file_path, PASSWORD, storage_format='segmented')
+    other.get_table('logs').insert_data(name='dari proses lain')
+    other.save()
+
+    db.get_table('users').insert_data(name='baru')
+    db.save()
+    restored = Database.load_from_file(db.file_path, PASSWORD, storage_format='segmented')
+    assert restored.get_table('users').count_data() == 301
+    assert restored.get_table('logs').count_data() == 300
@@ -0,0 +1,78 @@
+import pytest
+
+from pydb import col, DatabaseValidationError, DatabaseTableError
+from pydb.sql import Statement
+from conftest import user_columns, user_rows
+
+
+@pytest.fixture
+def db(make_db):
+    db = make_db()
+    db.create_table('users', user_columns()).insert_many(user_rows(40))
+    return db
+
+
+def ids(rows):
+    return [row['id'] for row in rows]
+
+
+def test_select_matches_select_data(db):
+    users = db.get_table('users')
+    rows = db.execute("SELECT id, name FROM users WHERE age >= ? AND active = true ORDER BY age DESC LIMIT 5", (20,))
+    expected = users.select_data(
+        (col('age') >= 20) & (col('active') == True), ['id', 'name'],  # noqa: E712
+        order_by=('age', 'desc'), limit=5
+    )
+    assert rows == expected
+
+
+def test_named_parameters_and_cache(db):
+    query = "SELECT * FROM users WHERE id = :id"
+    assert ids(db.execute(query, {'id': 3})) == [3]
+    assert ids(db.execute(query, {'id': 7})) == [7]
+
+
+def test_aggregate_group_by(db):
+    rows = db.execute("SELECT name, COUNT(*) AS total FROM users GROUP BY name ORDER BY total DESC, name")
+    users = db.get_table('users')
+    expected = {}
+    for row in users.data:
+        expected[row['name']] = expected.get(row['name'], 0) + 1
+    assert {row['name']: row['total'] for row in rows} == expected
+
+
+def test_insert_update_delete(db):
+    assert db.execute("INSERT INTO users (name, age) VALUES ('Eka', 21), ('Fajar', 22)") == 2
+    assert db.execute("UPDATE users SET age = 99 WHERE name = 'Eka'") == 1
+    assert db.execute("SELECT age FROM users WHERE name = 'Eka'") == [{'age': 99}]
+    assert db.execute("DELETE FROM users WHERE age = 99") == 1
+    assert db.execute("SELECT COUNT(*) AS n FROM users") == [{'n': 41}]
+
+
+def test_update_and_delete_without_where_affect_every_row(db):
+    assert db.execute("UPDATE users SET active = false") == 40
+    assert db.execute("SELECT COUNT(*) AS n FROM users WHERE active = true") == [{'n': 0}]
+    assert db.execute("DELETE FROM users") == 40
+    assert db.get_table('users').count_data() == 0
+
+
+@pytest.mark.parametrize('query, params', [
+    ("SELECT * FROM users WHERE zz = 1", None),
+    ("SELECT * FROM users WHERE age = ?", None),
+    ("SELECT * FROM users WHERE age = ?", ('x',)),
+    ("SELECT * FROM users WHERE age = 1", (1,)),
+    ("SELEC * FROM users", None),
+])
+def test_invalid_queries_are_rejected(db, query, params):
+    with pytest.raises(DatabaseValidationError):
+        db.execute(query, params)
+
+
+def test_unknown_table(db):
+    with pytest.raises(DatabaseTableError):
+        db.execute("SELECT * FROM tidak_ada")
+
+
+def test_statement_is_abstract():
+    with pytest.raises(TypeError):
+        Statement('users')
@@ -0,0 +1,67 @@
+import io
+
+import pytest
+
+from pydb import col
+from pydb.encrypted import encrypt_stream, decrypt_stream, DEFAULT_CHUNK_SIZE, PasswordValueError
+from pydb.storage import StreamedFile
+from conftest import PASSWORD, user_columns, user_rows
+
+
+@pytest.mark.parametrize('compression', ['none', 'zlib', 'lzma', 'bz2'])
+def test_decrypt_stream_bounds_decompressed_pieces(compression):
+    data = [b'a' * (1 << 20)] * 8 + [b'ujung']
+    buffer = io.BytesIO()
+    encrypt_stream(iter(data), buffer, PASSWORD, compression=compression)
+    buffer.seek(0)
+
+    pieces = list(decrypt_stream(buffer, PASSWORD))
+    assert b''.join(pieces) == b''.join(data)
+    assert max(map(len, pieces)) <= DEFAULT_CHUNK_SIZE
+
+
+def test_decrypt_stream_rejects_truncated_stream():
+    buffer = io.BytesIO()
+    encrypt_stream(iter([b'x' * 200000]), buffer, PASSWORD, compression='zlib')
+    truncated = io.BytesIO(buffer.getvalue()[:-10])
+    with pytest.raises(PasswordValueError):
+        list(decrypt_stream(truncated, PASSWORD))
+
+
+def test_iter_tables_reports_truncated_rows(tmp_path):
+    path = str(tmp_path / 'potong.pydb')
+    header = {'tables': {'users': {'columns': {}}}}
+    # Header mencatat 5 baris tetapi stream hanya berisi 3
+    StreamedFile.write(path, PASSWORD, header, {'users': [{'id': i} for i in range(3)]}, {'users': 5})
+
+    stream = StreamedFile(path, PASSWORD)
+    name, entry, rows = next(stream.iter_tables())
+    assert (name, entry['rows']) == ('users', 5)
+    with pytest.raises(ValueError, match='terpotong'):
+        list(rows)
+    with pytest.raises(ValueError, match='terpotong'):
+        list(stream.iter_table('users'))
+
+
+def test_stream_tables_are_read_lazily(make_db, reopen):
+    db = make_db(storage_format='stream')
+    for name in ('users', 'others'):
+        db.create_table(name, user_columns()).insert_many(user_rows(300))
+    db.save()
+    expected = db.get_table('users')
+
+    restored = reopen(db)
+    users = restored.get_table('users')
+    assert list(users.iter_data(limit=5)) == expected.data[:5]
+    assert users.select_data(col('age') == 30) == expected.select_data(col('age') == 30)
+    assert users.select_data(order_by=('age', 'desc'), limit=7) == \
+        expected.select_data(order_by=('age', 'desc'), limit=7)
+    assert not users.is_loaded
+
+    # Tabel yang belum dimuat disalin dari file lama saat save
+    restored.get_table('others').insert_data(name='Eka')
+    restored.save()
+    assert not users.is_loaded
+    again = reopen(restored)
+    assert again.get_table('users').data == expected.data
+    assert again.get_table('others').count_data() == 301
@@ -0,0 +1,67 @@
+import pytest
+
+from pydb import col
+from conftest import user_columns, user_rows
+
+
+def snapshot(db):
+    return {name: [dict(row) for row in table.data] for name, table in db.tables.items()}
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_rollback_restores_every_mutation(make_db, columnar):
+    db = make_db()
+    table = db.create_table('users', user_columns(), columnar=columnar)
+    table.insert_many(user_rows(30))
+    before = snapshot(db)
+
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            table.insert_data(name='Dewi', age=30)
+            table.insert_many(user_rows(5))
+            table.update_data(col('age') >= 40, active=False)
+            table.delete_by_id(2)
+            table.delete_data(col('name') == 'Ani')
+            db.create_table('tmp', user_columns())
+            raise RuntimeError('batal')
+
+    assert snapshot(db) == before
+    assert table.insert_data(name='Eka') == 31
+
+
+def test_nested_transaction_is_a_savepoint(make_db):
+    db = make_db()
+    table = db.create_table('users', user_columns())
+    with db.transaction():
+        table.insert_data(name='luar')
+        with pytest.raises(ValueError):
+            with db.transaction():
+                table.insert_data(name='dalam')
+                raise ValueError('savepoint')
+    assert [row['name'] for row in table.data] == ['luar']
+
+
+def test_commit_saves_once(make_db, reopen):
+    db = make_db()
+    table = db.create_table('users', user_columns())
+    with db.transaction():
+        table.insert_many(user_rows(10))
+        table.update_data(col('id') == 3, name='Tiga')
+    assert reopen(db).get_table('users').data == table.data
+
+
+def test_rollback_restores_indexes(make_db):
+    db = make_db()
+    table = db.create_table('users', user_columns())
+    table.insert_many(user_rows(20))
+    table.create_index('name')
+    expected = table.find(name='Ani')
+
+    with pytest.raises(KeyError):
+        with db.transaction():
+            table.update_data(col('name') == 'Ani', name='Dini')
+            table.drop_index('name')
+            raise KeyError('batal')
+
+    assert table.find(name='Ani') == expected
+    assert table.find(name='Dini') == []
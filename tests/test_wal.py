@@ -0,0 +1,64 @@
+import os
+
+import pytest
+
+from pydb import DatabaseError
+from conftest import user_columns, user_rows
+
+
+def populated(make_db, **options):
+    db = make_db(wal=True, **options)
+    table = db.create_table('users', user_columns())
+    table.insert_many(user_rows(50))
+    db.save()
+    return db, table
+
+
+@pytest.mark.parametrize('options', [
+    {},
+    {'row_encoding': 'binary'},
+    {'storage_format': 'segmented'},
+    {'storage_format': 'stream'},
+])
+def test_replay_after_crash_without_save(make_db, reopen, options):
+    db, table = populated(make_db, **options)
+    table.insert_data(name='Dewi', age=30)
+    table.update_data(lambda row: row['id'] == 2, age=77)
+    table.delete_by_id(3)
+    table.create_index('name')
+    expected = [dict(row) for row in table.data]
+
+    # Proses mati tanpa save(): hanya WAL yang memuat mutasi terakhir
+    restored = reopen(db, wal=True).get_table('users')
+    assert restored.data == expected
+    assert restored.find(name='Dewi')[0]['age'] == 30
+
+
+@pytest.mark.parametrize('options', [{}, {'row_encoding': 'binary'}])
+def test_crash_during_checkpoint_keeps_main_file_and_wal(make_db, reopen, monkeypatch, options):
+    db, table = populated(make_db, **options)
+    with open(db.file_path, 'rb') as f:
+        before = f.read()
+    table.insert_data(name='Eka', age=21)
+    expected = [dict(row) for row in table.data]
+
+    def crash(source, target):
+        raise OSError('crash sebelum rename')
+
+    monkeypatch.setattr(os, 'replace', crash)
+    with pytest.raises(DatabaseError):
+        db.save()
+    monkeypatch.undo()
+
+    with open(db.file_path, 'rb') as f:
+        assert f.read() == before
+    assert reopen(db, wal=True).get_table('users').data == expected
+
+
+def test_rolled_back_transaction_is_not_replayed(make_db, reopen):
+    db, table = populated(make_db)
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            table.insert_data(name='Fajar')
+            raise RuntimeError
+    assert reopen(db, wal=True).get_table('users').find(name='Fajar') == []
@@ -0,0 +1,67 @@
+import pytest
+
+from pydb import DatabaseValidationError, Column, String
+from pydb.sql import parse_where
+from conftest import user_columns, user_rows
+
+TYPES = {'id': 'Integer', 'name': 'String', 'email': 'String', 'age': 'Integer', 'active': 'Boolean'}
+
+
+@pytest.mark.parametrize('clause, expected', [
+    ("age >= 30 AND name IN ('Ani', 'Budi')", "(col('age') >= 30) & col('name').isin(['Ani', 'Budi'])"),
+    ("id = '5'", "(col('id') == 5)"),
+    ("name = Ani", "(col('name') == 'Ani')"),
+    ("email=u1@ex.com", "(col('email') == 'u1@ex.com')"),
+    ("name=John Doe", "(col('name') == 'John Doe')"),
+    ("active=yes", "(col('active') == True)"),
+    ("name=null", "col('name').is_null()"),
+])
+def test_parse_where(clause, expected):
+    assert repr(parse_where(clause, TYPES)) == expected
+
+
+def test_legacy_equality_without_types():
+    assert repr(parse_where("email=u1@ex.com")) == "(col('email') == 'u1@ex.com')"
+    assert repr(parse_where("price=2.5 kg")) == "(col('price') == '2.5 kg')"
+
+
+@pytest.mark.parametrize('clause', [
+    "",
+    "age = 30 AND",
+    "age = abc def",
+    "unknown=u1@ex.com",
+    "age >> 3",
+])
+def test_invalid_where_is_rejected(clause):
+    with pytest.raises(ValueError):
+        parse_where(clause, TYPES)
+
+
+@pytest.mark.parametrize('clause', [
+    "age >= 30 AND age < 50",
+    "name = 'Ani' OR age IS NULL",
+    "NOT active = true",
+    "score BETWEEN 1 AND 3",
+    "name LIKE 'B%'",
+    "id IN (1, 5, 9)",
+])
+def test_where_matches_full_scan(make_db, clause):
+    db = make_db()
+    table = db.create_table('users', user_columns())
+    table.insert_many(user_rows(60))
+    expr = table.parse_where(clause)
+    expected = [row for row in table.data if expr(row)]
+
+    table.create_index('age')
+    table.create_index('name')
+    assert table.select_data(expr) == expected
+
+
+def test_table_parse_where_legacy_email(make_db):
+    db = make_db()
+    table = db.create_table('users', {**user_columns(), 'email': Column('email', String)})
+    table.insert_data(name='u1', email='u1@ex.com')
+    table.insert_data(name='u2', email='u2@ex.com')
+    assert [row['name'] for row in table.select_data(table.parse_where('email=u1@ex.com'))] == ['u1']
+    with pytest.raises(DatabaseValidationError):
+        table.parse_where('age = 30 AND')
@@ -0,0 +1,77 @@
+import pytest
+
+from pydb import Column, Integer, String, col
+from pydb.zonemap import summarize, ZoneMap
+
+
+def log_table(db, count=5000):
+    table = db.create_table('log', {
+        'id': Column('id', Integer),
+        'ts': Column('ts', Integer),
+        'rid': Column('rid', String),
+    })
+    table.insert_many([{'ts': i, 'rid': f'r{i}'} for i in range(count)])
+    return table
+
+
+def test_summary_of_inserted_rows_has_base_typed_extremes(make_db):
+    table = log_table(make_db())
+    zone = summarize(table.data[:3], ['ts', 'rid'])
+    assert zone['min'] == {'ts': 0, 'rid': 'r0'}
+    assert zone['max'] == {'ts': 2, 'rid': 'r2'}
+    assert type(zone['min']['ts']) is int and type(zone['min']['rid']) is str
+
+
+def test_range_query_on_inserted_rows_prunes_segments(make_db):
+    table = log_table(make_db())
+    table.create_zone_map(segment_rows=100)
+    expr = col('ts') < 50
+    info = table.explain(expr)
+    assert info['segments'] == {'scanned': 1, 'total': 50}
+    assert table.select_data(expr) == [row for row in table.data if row['ts'] < 50]
+
+
+def test_appended_rows_keep_extremes(make_db):
+    table = log_table(make_db(), count=150)
+    table.create_zone_map(segment_rows=100)
+    table.select_data(col('ts') > 0)
+    table.insert_data(ts=1000, rid='late')
+    last = table._zone_map.zones[-1]
+    assert last['max']['ts'] == 1000 and last['min']['ts'] == 100
+    assert table.explain(col('ts') >= 1000)['segments'] == {'scanned': 1, 'total': 2}
+
+
+@pytest.mark.parametrize('expr', [
+    col('ts').between(1200, 1400),
+    col('ts') == 4321,
+    col('rid') == 'r777',
+    col('rid').isin(['r1', 'r4999', 'none']),
+    (col('ts') < 100) | (col('ts') > 4900),
+    col('rid').startswith('r12'),
+    col('rid').is_null(),
+    ~(col('ts') < 10),
+])
+def test_pruned_results_match_full_scan(make_db, expr):
+    table = log_table(make_db())
+    table.create_zone_map(segment_rows=128, bloom_columns=['rid'])
+    assert table.select_data(expr) == expr.filter(table.data)
+
+
+def test_unloaded_segmented_table_reads_only_matching_segments(make_db, reopen):
+    db = make_db(storage_format='segmented', segment_rows=1000)
+    table = log_table(db, count=10000)
+    table.create_zone_map()
+    db.save()
+
+    table = reopen(db).get_table('log')
+    rows = table.select_data(col('ts').between(2500, 2510))
+    assert [row['ts'] for row in rows] == list(range(2500, 2511))
+    assert not table.is_loaded
+    assert table._last_pruning == (1, 10)
+
+
+def test_invalid_zone_map_arguments():
+    with pytest.raises(ValueError):
+        ZoneMap(['ts'], segment_rows=0)
+    with pytest.raises(ValueError):
+        ZoneMap(['ts'], error_rate=1.5)